@@ -0,0 +1,124 @@
+# benchmarks/datos_sinteticos.py
+#
+# Generador reproducible de datos de prueba: clientes y vehículos con nombres
+# en español (con tildes y eñes), DNI de 8 dígitos y placas "ABC-123", todos
+# únicos. La misma semilla produce siempre las mismas filas, para que los
+# resultados de dos corridas sean comparables.
+
+import random
+import unicodedata
+from typing import Iterator, List, Tuple
+
+from src.data import migrations
+from src.data.datasources.sqlite_datasource import SQLiteDataSource
+
+NOMBRES = [
+    "José", "María", "Ángel", "Sofía", "Lucía", "Martín", "Raúl", "Inés", "Begoña", "Íñigo",
+    "Andrés", "Mónica", "Héctor", "Verónica", "Óscar", "Rocío", "Joaquín", "Valentina", "Sebastián", "Camila",
+    "Nicolás", "Ximena", "Tomás", "Renata", "Julián", "Aitana", "Adrián", "Mariana", "Víctor", "Zoe",
+    "Hernán", "Dolores", "Germán", "Leonor", "Rubén", "Amparo", "Iván", "Noemí", "Fermín", "Araceli",
+]
+APELLIDOS = [
+    "Pérez", "Gómez", "Núñez", "Ibáñez", "Muñoz", "Díaz", "Sánchez", "Rodríguez", "Fernández", "Martínez",
+    "Álvarez", "Jiménez", "Hernández", "Ramírez", "Gutiérrez", "Quispe", "Mamani", "Huamán", "Flores", "Chávez",
+    "Castañeda", "Peña", "Ordóñez", "Vásquez", "Rojas", "Benítez", "Cáceres", "Domínguez", "Espinoza", "Zúñiga",
+    "Montaño", "Salazar", "Ríos", "Valdés", "Cárdenas", "Paredes", "León", "Bermúdez", "Yáñez", "Muñiz",
+]
+DISTRITOS = [
+    "Miraflores", "San Isidro", "Santiago de Surco", "Jesús María", "San Martín de Porres", "Breña",
+    "Pueblo Libre", "La Molina", "Barranco", "Magdalena del Mar", "Lince", "Chorrillos", "Ate",
+    "San Juan de Lurigancho", "Comas", "Los Olivos", "Surquillo", "San Borja", "Rímac", "Independencia",
+]
+CALLES = ["Av. Arequipa", "Jr. de la Unión", "Av. Petit Thouars", "Calle Los Álamos", "Av. Javier Prado",
+          "Jr. Huancavelica", "Av. Angamos", "Calle Las Begonias", "Av. Túpac Amaru", "Pasaje Santa Rosa"]
+
+MODELOS = {
+    "Toyota": ["Yaris", "Corolla", "RAV4", "Hilux", "Land Cruiser Prado"],
+    "Hyundai": ["Accent", "Elantra", "Tucson", "Santa Fe", "H-1"],
+    "Kia": ["Rio", "Cerato", "Sportage", "Sorento", "Carnival"],
+    "Nissan": ["Versa", "Sentra", "Kicks", "X-Trail", "Frontier"],
+    "Chevrolet": ["Onix", "Sail", "Tracker", "Captiva", "Colorado"],
+    "Suzuki": ["Swift", "Dzire", "Vitara", "Jimny", "Ertiga"],
+    "Mitsubishi": ["Mirage", "ASX", "Outlander", "Montero Sport", "L200"],
+    "Volkswagen": ["Gol", "Virtus", "T-Cross", "Tiguan", "Amarok"],
+}
+TIPOS = [("Sedán", 800.0), ("Hatchback", 600.0), ("SUV", 1500.0), ("Camioneta", 1800.0), ("Minivan", 1200.0)]
+ESTADOS = ["Disponible", "Alquilado", "En Mantenimiento", "Fuera de Servicio"]
+PESOS_ESTADO = [70, 20, 8, 2]
+
+_LETRAS = "ABCDEFGHJKLMNPRSTUVWXYZ"  # Sin I, O ni Q, como en las placas reales
+
+def _unicos(rng: random.Random, n: int, universo: int) -> List[int]:
+    if n > universo:
+        raise ValueError(f"No hay {n} valores únicos posibles (máximo {universo}).")
+    return rng.sample(range(universo), n)
+
+def _placa(codigo: int) -> str:
+    letras, numero = divmod(codigo, 1000)
+    l3 = _LETRAS[letras % len(_LETRAS)]; letras //= len(_LETRAS)
+    l2 = _LETRAS[letras % len(_LETRAS)]; letras //= len(_LETRAS)
+    return f"{_LETRAS[letras]}{l2}{l3}-{numero:03d}"
+
+def _ascii(texto: str) -> str:
+    """Quita tildes y eñes (los correos no las admiten)."""
+    return unicodedata.normalize("NFKD", texto).encode("ascii", "ignore").decode("ascii")
+
+def generar_clientes(n: int, semilla: int = 42) -> Iterator[Tuple]:
+    """(Nombre, Apellido, DNI, Licencia, Telefono, Email, Direccion, Distrito) por cliente."""
+    rng = random.Random(semilla)
+    for dni in _unicos(rng, n, 90_000_000):
+        dni = f"{dni + 10_000_000:08d}"
+        nombre, apellido = rng.choice(NOMBRES), rng.choice(APELLIDOS)
+        segundo = rng.choice(APELLIDOS)
+        usuario = _ascii(f"{nombre}.{apellido}{dni[-3:]}").lower()
+        yield (
+            nombre, f"{apellido} {segundo}", dni, f"Q{dni}",
+            f"9{rng.randrange(10_000_000, 99_999_999)}" if rng.random() < 0.9 else None,
+            f"{usuario}@correo.pe" if rng.random() < 0.8 else None,
+            f"{rng.choice(CALLES)} {rng.randrange(100, 3000)}" if rng.random() < 0.7 else None,
+            rng.choice(DISTRITOS),
+        )
+
+def generar_vehiculos(n: int, tipo_ids: List[int], estado_ids: List[int], semilla: int = 42) -> Iterator[Tuple]:
+    """(Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath) por vehículo."""
+    rng = random.Random(semilla + 1)
+    marcas = list(MODELOS)
+    for codigo in _unicos(rng, n, len(_LETRAS) ** 3 * 1000):
+        marca = rng.choice(marcas)
+        anio = rng.randrange(2008, 2026)
+        yield (
+            marca, rng.choice(MODELOS[marca]), anio, _placa(codigo),
+            rng.choice(tipo_ids), rng.choices(estado_ids, PESOS_ESTADO[:len(estado_ids)])[0],
+            round(rng.uniform(80, 450), 2), rng.randrange(0, 250_000) if rng.random() < 0.95 else None, None,
+        )
+
+def _en_lotes(filas: Iterator[Tuple], tamano: int) -> Iterator[List[Tuple]]:
+    lote = []
+    for fila in filas:
+        lote.append(fila)
+        if len(lote) >= tamano:
+            yield lote; lote = []
+    if lote:
+        yield lote
+
+def crear_base(clientes: int, vehiculos: int, semilla: int = 42, path: str = ":memory:") -> SQLiteDataSource:
+    """
+    SQLiteDataSource nuevo (no el singleton) con el esquema migrado, los
+    catálogos y las filas sintéticas.
+    """
+    datasource = SQLiteDataSource(path)
+    migrations.aplicar_migraciones(datasource)
+    datasource.execute_many("INSERT INTO TiposVehiculo (NombreTipo, GarantiaBase) VALUES (?, ?)", TIPOS)
+    datasource.execute_many("INSERT INTO EstadosVehiculo (NombreEstado) VALUES (?)", [(e,) for e in ESTADOS])
+    tipo_ids = [fila[0] for fila in datasource.execute_query("SELECT TipoID FROM TiposVehiculo", cache=False)]
+    estado_ids = [fila[0] for fila in datasource.execute_query("SELECT EstadoID FROM EstadosVehiculo ORDER BY EstadoID", cache=False)]
+
+    for lote in _en_lotes(generar_clientes(clientes, semilla), 50_000):
+        datasource.execute_many(
+            "INSERT INTO Clientes (Nombre, Apellido, DNI, Licencia, Telefono, Email, Direccion, Distrito) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", lote)
+    for lote in _en_lotes(generar_vehiculos(vehiculos, tipo_ids, estado_ids, semilla), 50_000):
+        datasource.execute_many(
+            "INSERT INTO Vehiculos (Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", lote)
+    return datasource
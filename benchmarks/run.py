@@ -0,0 +1,315 @@
+# benchmarks/run.py
+#
+# Benchmarks de las capas de datos, dominio e IU sobre una base SQLite en
+# memoria con datos sintéticos (ver datos_sinteticos.py). Guarda los
+# resultados en JSON y, con --base, los compara contra una corrida anterior.
+#
+# Uso (desde la raíz del repositorio):
+#   python -m benchmarks.run                                   # 10.000 clientes y vehículos
+#   python -m benchmarks.run --clientes 1000000 --vehiculos 100000 --repeticiones 3
+#   python -m benchmarks.run --base benchmarks/resultados/base.json --umbral 0.15
+#   python -m benchmarks.run --solo busqueda
+#   xvfb-run python -m benchmarks.run                          # incluye el Treeview sin pantalla
+#
+# Código de salida: 0 ok, 1 si alguna medición empeoró más que --umbral respecto de --base.
+
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+from benchmarks.datos_sinteticos import crear_base
+from src.data.repositories.busqueda import CONTIENE, PREFIJO
+from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
+from src.data.repositories.estado_vehiculo_repository_impl import EstadoVehiculoRepositoryImpl
+from src.data.repositories.tipo_vehiculo_repository_impl import TipoVehiculoRepositoryImpl
+from src.data.repositories.vehiculo_repository_impl import VehiculoRepositoryImpl
+from src.domain.usecases import cliente_usecases as cu
+from src.domain.usecases import vehiculo_usecases as vu
+
+DIRECTORIO_RESULTADOS = os.path.join(os.path.dirname(__file__), "resultados")
+
+SELECT_CLIENTES = ("SELECT ClienteID, Nombre, Apellido, DNI, Licencia, Telefono, Email, ISNULL(Direccion, ''), "
+                   "ISNULL(Distrito, '') FROM Clientes ORDER BY Apellido, Nombre")
+SELECT_VEHICULOS = ("SELECT VehiculoID, Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, "
+                    "ImagenPath FROM Vehiculos ORDER BY Marca, Modelo")
+
+TERMINOS_CLIENTES = ["pér", "mira", "núñez", "1234", "zz"]
+TERMINOS_VEHICULOS = [("toy", None), ("abc", None), ("", "Disponible"), ("hilux", "Alquilado")]
+
+class Omitido(Exception):
+    """El benchmark no puede correr en este entorno (p. ej. sin pantalla para Tk)."""
+
+# --- Medición ---
+
+def medir(funcion: Callable[[], Any], repeticiones: int, preparar: Optional[Callable[[], Any]] = None) -> Dict[str, float]:
+    """
+    Ejecuta 'funcion' una vez de calentamiento y luego 'repeticiones' veces.
+    'preparar' corre antes de cada repetición, fuera del tiempo medido.
+    """
+    if preparar: preparar()
+    funcion()
+    tiempos = []
+    for _ in range(repeticiones):
+        if preparar: preparar()
+        inicio = time.perf_counter()
+        resultado = funcion()
+        tiempos.append((time.perf_counter() - inicio) * 1000)
+        del resultado  # Liberar las entidades fuera del tiempo medido
+    return {
+        "mediana_ms": round(statistics.median(tiempos), 3),
+        "min_ms": round(min(tiempos), 3),
+        "max_ms": round(max(tiempos), 3),
+        "repeticiones": repeticiones,
+    }
+
+# --- Armado ---
+
+class Entorno:
+    """Base sintética, repositorios y ViewModels compartidos por los benchmarks."""
+
+    def __init__(self, clientes: int, vehiculos: int, semilla: int):
+        inicio = time.perf_counter()
+        self.datasource = crear_base(clientes, vehiculos, semilla)
+        self.segundos_carga = time.perf_counter() - inicio
+        self.clientes, self.vehiculos = clientes, vehiculos
+        self.tipo_repo = TipoVehiculoRepositoryImpl(self.datasource)
+        self.estado_repo = EstadoVehiculoRepositoryImpl(self.datasource)
+        self.mapa_tipos = {t.id: t for t in self.tipo_repo.get_all()}
+        self.mapa_estados = {e.id: e for e in self.estado_repo.get_all()}
+        self.estado_por_nombre = {e.nombre_estado: e.id for e in self.mapa_estados.values()}
+
+    def repo_clientes(self, modo: str = CONTIENE) -> ClienteRepositoryImpl:
+        return ClienteRepositoryImpl(self.datasource, modo)
+
+    def repo_vehiculos(self, modo: str = CONTIENE) -> VehiculoRepositoryImpl:
+        return VehiculoRepositoryImpl(self.datasource, self.tipo_repo, self.estado_repo, modo)
+
+    def viewmodel_clientes(self):
+        from src.ui.viewmodels.cliente_viewmodel import ClienteViewModel
+        repo = self.repo_clientes()
+        return ClienteViewModel(
+            cu.ObtenerClientesUseCase(repo), cu.GuardarClienteUseCase(repo), cu.EliminarClienteUseCase(repo),
+            cu.ValidarClienteUseCase(), cu.BuscarClientesUseCase(repo),
+        )
+
+    def viewmodel_vehiculos(self):
+        from src.ui.viewmodels.vehiculo_viewmodel import VehiculoViewModel
+        repo = self.repo_vehiculos()
+        return VehiculoViewModel(
+            vu.ObtenerVehiculosUseCase(repo), vu.ObtenerTiposVehiculoUseCase(self.tipo_repo),
+            vu.ObtenerEstadosVehiculoUseCase(self.estado_repo), vu.GuardarVehiculoUseCase(repo),
+            vu.EliminarVehiculoUseCase(repo), vu.ValidarVehiculoUseCase(), vu.BuscarYFiltrarVehiculosUseCase(repo),
+        )
+
+# --- Benchmarks (cada uno retorna el resultado de medir() y las filas procesadas) ---
+
+def bench_hidratacion_clientes(entorno: Entorno, repeticiones: int):
+    filas = entorno.datasource.execute_query(SELECT_CLIENTES, cache=False)
+    estado = {}
+    def preparar(): estado["repo"] = entorno.repo_clientes()
+    def hidratar():
+        mapear = estado["repo"]._mapear_a_cliente
+        return [mapear(fila) for fila in filas]
+    return medir(hidratar, repeticiones, preparar), len(filas)
+
+def bench_hidratacion_clientes_recarga(entorno: Entorno, repeticiones: int):
+    """Misma lectura con el mapa de identidad ya poblado (refresco de una lista abierta)."""
+    filas = entorno.datasource.execute_query(SELECT_CLIENTES, cache=False)
+    mapear = entorno.repo_clientes()._mapear_a_cliente
+    vivos = [mapear(fila) for fila in filas]  # El mapa guarda referencias débiles: la lista las mantiene
+    resultado = medir(lambda: [mapear(fila) for fila in filas], repeticiones)
+    del vivos
+    return resultado, len(filas)
+
+def bench_hidratacion_vehiculos(entorno: Entorno, repeticiones: int):
+    filas = entorno.datasource.execute_query(SELECT_VEHICULOS, cache=False)
+    tipos, estados, estado = entorno.mapa_tipos, entorno.mapa_estados, {}
+    def preparar(): estado["repo"] = entorno.repo_vehiculos()
+    def hidratar():
+        mapear = estado["repo"]._mapear_a_vehiculo
+        return [mapear(fila, tipos, estados) for fila in filas]
+    return medir(hidratar, repeticiones, preparar), len(filas)
+
+def bench_hidratacion_vehiculos_recarga(entorno: Entorno, repeticiones: int):
+    filas = entorno.datasource.execute_query(SELECT_VEHICULOS, cache=False)
+    tipos, estados = entorno.mapa_tipos, entorno.mapa_estados
+    mapear = entorno.repo_vehiculos()._mapear_a_vehiculo
+    vivos = [mapear(fila, tipos, estados) for fila in filas]
+    resultado = medir(lambda: [mapear(fila, tipos, estados) for fila in filas], repeticiones)
+    del vivos
+    return resultado, len(filas)
+
+def _bench_busqueda_clientes(modo: str):
+    def bench(entorno: Entorno, repeticiones: int):
+        repo, total = entorno.repo_clientes(modo), {}
+        def buscar():
+            total["filas"] = sum(len(repo.search(termino)) for termino in TERMINOS_CLIENTES)
+        resultado = medir(buscar, repeticiones)
+        return resultado, total["filas"]
+    return bench
+
+def _bench_busqueda_vehiculos(modo: str):
+    def bench(entorno: Entorno, repeticiones: int):
+        repo, total = entorno.repo_vehiculos(modo), {}
+        tipos, estados = entorno.mapa_tipos, entorno.mapa_estados
+        consultas = [(termino, entorno.estado_por_nombre.get(estado) if estado else None) for termino, estado in TERMINOS_VEHICULOS]
+        def buscar():
+            total["filas"] = sum(len(repo.search_and_filter(t, e, tipos, estados)) for t, e in consultas)
+        resultado = medir(buscar, repeticiones)
+        return resultado, total["filas"]
+    return bench
+
+def bench_viewmodel_clientes(entorno: Entorno, repeticiones: int):
+    """Recarga completa: SQL + hidratación + notificación (sin vistas conectadas)."""
+    vm = entorno.viewmodel_clientes()
+    return medir(vm.cargar_clientes, repeticiones), entorno.clientes
+
+def bench_viewmodel_vehiculos(entorno: Entorno, repeticiones: int):
+    vm = entorno.viewmodel_vehiculos()
+    return medir(vm.cargar_datos_iniciales, repeticiones), entorno.vehiculos
+
+def _tk_raiz():
+    import tkinter as tk
+    try:
+        raiz = tk.Tk()
+    except tk.TclError as e:
+        raise Omitido(f"Tk sin pantalla ({e}); use xvfb-run") from e
+    raiz.withdraw()
+    return raiz
+
+def bench_treeview_clientes(entorno: Entorno, repeticiones: int):
+    """ClienteView.update_view con la lista completa, hasta que Tk procesa lo pendiente."""
+    from src.ui.views.cliente_view import ClienteView
+    import tkinter as tk
+    raiz = _tk_raiz()
+    try:
+        vm = entorno.viewmodel_clientes()
+        vm.clientes = vm.obtener_clientes_usecase.execute()
+        vista = ClienteView(tk.Toplevel(raiz), vm)
+        def poblar():
+            vista.update_view(); raiz.update_idletasks()
+        return medir(poblar, repeticiones), len(vm.clientes)
+    finally:
+        raiz.destroy()
+
+def bench_treeview_vehiculos(entorno: Entorno, repeticiones: int):
+    """VehiculoView.update_ui con la flota completa, hasta que Tk procesa lo pendiente."""
+    from src.ui.views.vehiculo_view import VehiculoView
+    import tkinter as tk
+    raiz = _tk_raiz()
+    try:
+        vm = entorno.viewmodel_vehiculos()
+        vm.cargar_datos_iniciales()
+        vista = VehiculoView(tk.Toplevel(raiz), vm)
+        def poblar():
+            vista.update_ui(); raiz.update_idletasks()
+        return medir(poblar, repeticiones), len(vm.vehiculos)
+    finally:
+        raiz.destroy()
+
+BENCHMARKS: Dict[str, Callable[[Entorno, int], Any]] = {
+    "hidratacion.clientes": bench_hidratacion_clientes,
+    "hidratacion.clientes_recarga": bench_hidratacion_clientes_recarga,
+    "hidratacion.vehiculos": bench_hidratacion_vehiculos,
+    "hidratacion.vehiculos_recarga": bench_hidratacion_vehiculos_recarga,
+    f"busqueda.clientes.{CONTIENE}": _bench_busqueda_clientes(CONTIENE),
+    f"busqueda.clientes.{PREFIJO}": _bench_busqueda_clientes(PREFIJO),
+    f"busqueda.vehiculos.{CONTIENE}": _bench_busqueda_vehiculos(CONTIENE),
+    f"busqueda.vehiculos.{PREFIJO}": _bench_busqueda_vehiculos(PREFIJO),
+    "viewmodel.clientes_recarga": bench_viewmodel_clientes,
+    "viewmodel.vehiculos_recarga": bench_viewmodel_vehiculos,
+    "treeview.clientes": bench_treeview_clientes,
+    "treeview.vehiculos": bench_treeview_vehiculos,
+}
+
+# --- Resultados ---
+
+def _commit() -> Optional[str]:
+    try:
+        salida = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+        return salida.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any], umbral: float) -> List[str]:
+    """Imprime la comparación por benchmark; retorna los nombres que empeoraron más que 'umbral'."""
+    regresiones = []
+    if base.get("parametros", {}).get("clientes") != actual["parametros"]["clientes"] or \
+       base.get("parametros", {}).get("vehiculos") != actual["parametros"]["vehiculos"]:
+        print("Aviso: la base se midió con otra cantidad de filas; la comparación es orientativa.")
+    print(f"\n{'benchmark':34} {'base ms':>10} {'actual ms':>10} {'cambio':>8}")
+    for nombre, resultado in actual["resultados"].items():
+        anterior = base.get("resultados", {}).get(nombre)
+        if not anterior or "mediana_ms" not in anterior or "mediana_ms" not in resultado:
+            continue
+        cambio = resultado["mediana_ms"] / anterior["mediana_ms"] - 1 if anterior["mediana_ms"] else 0.0
+        marca = "  << REGRESIÓN" if cambio > umbral else ""
+        print(f"{nombre:34} {anterior['mediana_ms']:10.2f} {resultado['mediana_ms']:10.2f} {cambio:+8.1%}{marca}")
+        if cambio > umbral:
+            regresiones.append(nombre)
+    return regresiones
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de DriveFlow con datos sintéticos")
+    parser.add_argument("--clientes", type=int, default=10_000)
+    parser.add_argument("--vehiculos", type=int, default=10_000)
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--semilla", type=int, default=42)
+    parser.add_argument("--solo", default=None, help="Corre solo los benchmarks cuyo nombre contiene este texto")
+    parser.add_argument("--salida", default=None, help="JSON de resultados (por defecto benchmarks/resultados/<fecha>.json)")
+    parser.add_argument("--base", default=None, help="JSON de una corrida anterior para comparar")
+    parser.add_argument("--umbral", type=float, default=0.20, help="Empeoramiento tolerado de la mediana (0.20 = 20%%)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, format="%(levelname)s %(name)s: %(message)s")
+
+    print(f"Generando {args.clientes} clientes y {args.vehiculos} vehículos (semilla {args.semilla})...")
+    entorno = Entorno(args.clientes, args.vehiculos, args.semilla)
+    print(f"Base lista en {entorno.segundos_carga:.1f} s\n")
+
+    resultados: Dict[str, Any] = {}
+    for nombre, bench in BENCHMARKS.items():
+        if args.solo and args.solo not in nombre:
+            continue
+        try:
+            medicion, filas = bench(entorno, args.repeticiones)
+        except Omitido as e:
+            resultados[nombre] = {"omitido": str(e)}
+            print(f"{nombre:34} omitido: {e}")
+            continue
+        medicion["filas"] = filas
+        resultados[nombre] = medicion
+        print(f"{nombre:34} {medicion['mediana_ms']:10.2f} ms  (min {medicion['min_ms']:.2f}, {filas} filas)")
+
+    salida = {
+        "fecha": datetime.now().isoformat(timespec="seconds"),
+        "commit": _commit(),
+        "python": platform.python_version(),
+        "plataforma": platform.platform(),
+        "parametros": {"clientes": args.clientes, "vehiculos": args.vehiculos,
+                       "repeticiones": args.repeticiones, "semilla": args.semilla},
+        "resultados": resultados,
+    }
+    ruta = args.salida or os.path.join(DIRECTORIO_RESULTADOS, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(ruta)), exist_ok=True)
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump(salida, archivo, indent=2, ensure_ascii=False)
+    print(f"\nResultados: {ruta}")
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            regresiones = comparar(salida, json.load(archivo), args.umbral)
+        if regresiones:
+            print(f"\n{len(regresiones)} regresión(es) sobre el umbral de {args.umbral:.0%}: {', '.join(regresiones)}")
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
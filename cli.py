@@ -0,0 +1,427 @@
+# cli.py
+#
+# Punto de entrada de línea de comandos para tareas de mantenimiento y
+# trabajos por lotes (p. ej. nocturnos en un servidor sin pantalla).
+# Reutiliza los repositorios y casos de uso sin cargar Tk: cada subcomando
+# importa solo lo que usa, y los errores de la BD llegan como excepciones o
+# por logging (stderr). Códigos de salida: 0 ok, 1 error, 2 hubo rechazos/problemas.
+#
+# Uso:
+#   python cli.py imagenes                 # Reporte (dry-run)
+#   python cli.py imagenes --aplicar --eliminar-huerfanas --limpiar-referencias
+#   python cli.py migrar                   # Aplica las migraciones de esquema pendientes
+#   python cli.py importar clientes sucursal.csv [--rechazos errores.csv]
+#   python cli.py exportar vehiculos flota.parquet [--buscar toyota] [--estado Disponible]
+#   python cli.py precios 5 --tipo SUV --anio-hasta 2018   # Ajuste porcentual de PrecioPorDia
+#   python cli.py verificar [--listar]     # Chequeos de integridad (solo lectura)
+#   python cli.py purgar-eliminaciones [--dias 30]   # Lápidas de sincronización viejas
+#   API_TOKEN=... python cli.py servir --host 0.0.0.0 --puerto 8000   # API HTTP/JSON para los mostradores (API_URL)
+#   python cli.py reproducir mostrador.jsonl.gz --velocidad 10 --hilos 4 [--base anterior.json]
+#   python cli.py import-budget            # Falla si el arranque importa de más
+#   python cli.py import-budget --modulo cli --prohibidos tkinter pyodbc pandas numpy
+
+import argparse
+import os
+import sys
+from dotenv import load_dotenv
+from src.utils.registro import configurar_logging
+
+def _crear_datasource():
+    """Crea el DataSource con la misma configuración (.env) que main.py."""
+    from src.data.datasources.factory import crear_datasource
+    return crear_datasource(
+        server=os.environ.get('DB_SERVER', 'localhost'),
+        database=os.environ.get('DB_NAME', 'AlquilerAutos'),
+        username=os.environ.get('DB_USERNAME'),
+        password=os.environ.get('DB_PASSWORD')
+    )
+
+def _repositorios_vehiculo(datasource):
+    """(vehiculo_repo, tipo_repo, estado_repo) sobre el mismo DataSource."""
+    from src.data.repositories.tipo_vehiculo_repository_impl import TipoVehiculoRepositoryImpl
+    from src.data.repositories.estado_vehiculo_repository_impl import EstadoVehiculoRepositoryImpl
+    from src.data.repositories.vehiculo_repository_impl import VehiculoRepositoryImpl
+    tipo_repo, estado_repo = TipoVehiculoRepositoryImpl(datasource), EstadoVehiculoRepositoryImpl(datasource)
+    return VehiculoRepositoryImpl(datasource, tipo_repo, estado_repo), tipo_repo, estado_repo
+
+def _por_nombre(catalogo, atributo: str, nombre: str, que: str):
+    """Busca en un catálogo (tipos, estados) por nombre, sin distinguir mayúsculas."""
+    item = next((c for c in catalogo if getattr(c, atributo).lower() == nombre.strip().lower()), None)
+    if item is None:
+        raise ValueError(f"{que} desconocido: '{nombre}'.")
+    return item
+
+# --- Subcomandos ---
+
+def _cmd_imagenes(args) -> int:
+    from src.data.repositories.imagen_repository_impl import ImagenRepositoryImpl
+    from src.domain.usecases.mantenimiento_usecases import AuditarImagenesUseCase
+
+    datasource = _crear_datasource()
+    try:
+        vehiculo_repo, _, _ = _repositorios_vehiculo(datasource)
+        usecase = AuditarImagenesUseCase(vehiculo_repo, ImagenRepositoryImpl(args.directorio, max_workers=args.hilos))
+        reporte = usecase.execute(
+            eliminar_huerfanas=args.eliminar_huerfanas,
+            limpiar_referencias=args.limpiar_referencias,
+            dry_run=not args.aplicar,
+            antiguedad_minima=args.antiguedad_minima
+        )
+    finally:
+        datasource.close()
+
+    print(f"Archivos escaneados:    {reporte.archivos_escaneados}")
+    print(f"Referencias en BD:      {reporte.referencias}")
+    print(f"Imágenes huérfanas:     {len(reporte.huerfanas)} ({reporte.bytes_huerfanos / 1_048_576:.1f} MB)")
+    print(f"Huérfanas recientes:    {reporte.recientes_omitidas} (omitidas)")
+    print(f"Referencias colgantes:  {len(reporte.referencias_colgantes)}")
+    if args.listar:
+        for nombre in reporte.huerfanas:
+            print(f"  huérfana  {nombre}")
+        for vehiculo_id, path in reporte.referencias_colgantes:
+            print(f"  colgante  VehiculoID={vehiculo_id} {path}")
+    if reporte.dry_run:
+        print("Modo dry-run: no se modificó nada (use --aplicar).")
+    else:
+        print(f"Imágenes eliminadas:    {reporte.eliminadas}")
+        print(f"Referencias limpiadas:  {reporte.referencias_limpiadas}")
+    return 0
+
+def _cmd_migrar(args) -> int:
+    from src.data import migrations
+
+    datasource = _crear_datasource()
+    try:
+        if args.estado:
+            print(f"Versión de esquema: {migrations.version_actual(datasource)}")
+            for version, descripcion in migrations.pendientes(datasource):
+                print(f"  pendiente {version}: {descripcion}")
+            return 0
+        aplicadas = migrations.aplicar_migraciones(datasource)
+        print(f"Migraciones aplicadas: {aplicadas or 'ninguna (esquema al día)'}")
+        return 0
+    finally:
+        datasource.close()
+
+def _cmd_importar(args) -> int:
+    from src.data.repositories.archivo_tabular_repository_impl import ArchivoTabularRepositoryImpl
+    from src.domain.usecases.importacion_usecases import ImportarClientesUseCase, ImportarVehiculosUseCase
+
+    datasource = _crear_datasource()
+    try:
+        archivos = ArchivoTabularRepositoryImpl(separador=args.separador)
+        if args.entidad == "clientes":
+            from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
+            usecase = ImportarClientesUseCase(ClienteRepositoryImpl(datasource), archivos)
+        else:
+            vehiculo_repo, tipo_repo, estado_repo = _repositorios_vehiculo(datasource)
+            usecase = ImportarVehiculosUseCase(vehiculo_repo, tipo_repo, estado_repo, archivos)
+
+        def _progreso(parcial):
+            print(f"  {parcial.leidas} filas leídas ({parcial.insertadas} insertadas, {parcial.rechazadas} rechazadas)")
+
+        reporte = usecase.execute(args.archivo, args.rechazos, args.lote, on_progreso=_progreso)
+    finally:
+        datasource.close()
+
+    print(f"Filas leídas:      {reporte.leidas}")
+    print(f"Insertadas:        {reporte.insertadas}")
+    print(f"Rechazadas:        {reporte.rechazadas}")
+    if reporte.archivo_rechazos:
+        print(f"Detalle de rechazos: {reporte.archivo_rechazos}")
+    print(f"Tiempo:            {reporte.segundos:.1f} s ({reporte.filas_por_segundo:.0f} filas/s)")
+    return 0 if reporte.rechazadas == 0 else 2
+
+def _cmd_exportar(args) -> int:
+    from src.data.repositories.archivo_tabular_repository_impl import ArchivoTabularRepositoryImpl
+    from src.domain.usecases.exportacion_usecases import ExportarClientesUseCase, ExportarVehiculosUseCase
+
+    def _progreso(filas: int):
+        print(f"  {filas} filas escritas")
+
+    datasource = _crear_datasource()
+    try:
+        archivos = ArchivoTabularRepositoryImpl()
+        if args.entidad == "clientes":
+            from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
+            usecase = ExportarClientesUseCase(ClienteRepositoryImpl(datasource), archivos)
+            reporte = usecase.execute(args.archivo, args.buscar, on_progreso=_progreso)
+        else:
+            vehiculo_repo, tipo_repo, estado_repo = _repositorios_vehiculo(datasource)
+            estado_id = _por_nombre(estado_repo.get_all(), "nombre_estado", args.estado, "Estado").id if args.estado else None
+            usecase = ExportarVehiculosUseCase(vehiculo_repo, tipo_repo, estado_repo, archivos)
+            reporte = usecase.execute(args.archivo, args.buscar, estado_id, on_progreso=_progreso)
+    finally:
+        datasource.close()
+
+    print(f"Filas exportadas:  {reporte.filas}")
+    print(f"Archivo:           {reporte.path}")
+    print(f"Tiempo:            {reporte.segundos:.1f} s")
+    return 0
+
+def _cmd_precios(args) -> int:
+    from src.domain.usecases.vehiculo_usecases import AjustarPreciosUseCase
+
+    datasource = _crear_datasource()
+    try:
+        vehiculo_repo, tipo_repo, _ = _repositorios_vehiculo(datasource)
+        tipo_id = _por_nombre(tipo_repo.get_all(), "nombre_tipo", args.tipo, "Tipo").id if args.tipo else None
+        ids = AjustarPreciosUseCase(vehiculo_repo).execute(args.porcentaje, tipo_id, args.anio_desde, args.anio_hasta, args.marca)
+    finally:
+        datasource.close()
+
+    print(f"Precios ajustados un {args.porcentaje:+g}% en {len(ids)} vehículos.")
+    return 0
+
+def _cmd_verificar(args) -> int:
+    from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
+    from src.data.repositories.reserva_repository_impl import ReservaRepositoryImpl
+    from src.domain.usecases.mantenimiento_usecases import VerificarIntegridadUseCase
+    from src.domain.services.validacion import mensaje
+
+    datasource = _crear_datasource()
+    try:
+        vehiculo_repo, tipo_repo, estado_repo = _repositorios_vehiculo(datasource)
+        reporte = VerificarIntegridadUseCase(
+            vehiculo_repo, tipo_repo, estado_repo, ClienteRepositoryImpl(datasource), ReservaRepositoryImpl(datasource)
+        ).execute()
+    finally:
+        datasource.close()
+
+    print(f"Revisados: {reporte.vehiculos} vehículos, {reporte.clientes} clientes, {reporte.reservas} reservas activas")
+    print(f"Vehículos con tipo inexistente:    {len(reporte.vehiculos_sin_tipo)}")
+    print(f"Vehículos con estado inexistente:  {len(reporte.vehiculos_sin_estado)}")
+    print(f"Clientes que no pasan validación:  {len(reporte.clientes_invalidos)}")
+    print(f"Reservas de vehículos inexistentes: {len(reporte.reservas_sin_vehiculo)}")
+    print(f"Reservas solapadas:                {len(reporte.reservas_solapadas)}")
+    if args.listar:
+        for vehiculo_id, placa in reporte.vehiculos_sin_tipo:
+            print(f"  sin tipo    VehiculoID={vehiculo_id} {placa}")
+        for vehiculo_id, placa in reporte.vehiculos_sin_estado:
+            print(f"  sin estado  VehiculoID={vehiculo_id} {placa}")
+        for cliente_id, codigo in reporte.clientes_invalidos:
+            print(f"  cliente     ClienteID={cliente_id} {mensaje(codigo)}")
+        for reserva_id in reporte.reservas_sin_vehiculo:
+            print(f"  huérfana    ReservaID={reserva_id}")
+        for a, b in reporte.reservas_solapadas:
+            print(f"  solapada    ReservaID={a} con ReservaID={b}")
+    return 0 if reporte.problemas == 0 else 2
+
+def _cmd_purgar_eliminaciones(args) -> int:
+    from src.data.repositories.sincronizacion_repository_impl import SincronizacionRepositoryImpl
+    from src.domain.models.cambios import RETENCION_ELIMINACIONES_DIAS
+    from src.domain.usecases.mantenimiento_usecases import PurgarEliminacionesUseCase
+
+    datasource = _crear_datasource()
+    try:
+        usecase = PurgarEliminacionesUseCase(SincronizacionRepositoryImpl(datasource))
+        dias = args.dias if args.dias is not None else RETENCION_ELIMINACIONES_DIAS
+        purgadas = usecase.execute(dias)
+    finally:
+        datasource.close()
+    print(f"Lápidas de eliminación purgadas (más de {dias} días): {purgadas}")
+    return 0
+
+def _cmd_servir(args) -> int:
+    from src.api.servicio import Servicio, es_loopback, servir
+
+    datasource = _crear_datasource()
+    try:
+        cache_mb = args.cache_mb if args.cache_mb is not None else float(os.environ.get("QUERY_CACHE_MB") or 64)
+        if cache_mb > 0:
+            datasource.enable_cache(int(cache_mb * 1024 * 1024))
+        servicio = Servicio(
+            datasource, modo_busqueda=os.environ.get("SEARCH_MODE", "contiene"), tokens_ttl=args.tokens_ttl,
+            token=os.environ.get("API_TOKEN") or None
+        )
+        hosts = [h.strip() for h in os.environ.get("API_ALLOWED_HOSTS", "").split(",") if h.strip()]
+        if not es_loopback(args.host) and not servicio.token:
+            print(f"Error: --host {args.host} expone la API a la red; defina API_TOKEN "
+                  "(o use --host 127.0.0.1).", file=sys.stderr)
+            return 1
+        print(f"Sirviendo en http://{args.host}:{args.puerto}/api/ (Ctrl+C para detener)")
+        servir(servicio, args.host, args.puerto, hosts or None)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        datasource.close()
+    return 0
+
+def _cmd_reproducir(args) -> int:
+    """
+    Reproduce una grabación (DB_RECORD) contra el DataSource del .env
+    (DB_ENGINE/DB_NAME) e informa las latencias. Con --base, código 2 si
+    alguna sentencia empeoró más que --umbral.
+    """
+    import json
+    from src.data.datasources.grabacion import leer_grabacion
+    from src.data.datasources.reproduccion import comparar, reproducir
+
+    grabacion = leer_grabacion(args.grabacion)
+    os.environ.pop("DB_RECORD", None)  # No grabar la reproducción
+    datasource = _crear_datasource()
+    try:
+        if args.cache_mb:
+            datasource.enable_cache(int(args.cache_mb * 1024 * 1024))
+        informe = reproducir(datasource, grabacion, velocidad=args.velocidad, hilos=args.hilos,
+                             con_escrituras=args.con_escrituras, limite=args.limite)
+    finally:
+        datasource.close()
+
+    total, original = informe["total"], informe["original"]
+    print(f"{informe['consultas']} consultas en {informe['segundos']:.1f} s "
+          f"({informe['omitidas']} escrituras omitidas, {informe['errores']} errores)")
+    if informe["consultas"]:
+        print(f"{'':14} {'p50 ms':>9} {'p90 ms':>9} {'p99 ms':>9} {'max ms':>9}")
+        for nombre, d in (("reproducción", total), ("original", original), ("retraso", informe["retraso"])):
+            print(f"{nombre:14} {d['p50_ms']:9.2f} {d['p90_ms']:9.2f} {d['p99_ms']:9.2f} {d['max_ms']:9.2f}")
+        print("\nSentencias con más tiempo total:")
+        for clave, sentencia in list(informe["sentencias"].items())[:args.top]:
+            d = sentencia["reproduccion"]
+            errores = f"  ({sentencia['errores']} errores)" if sentencia["errores"] else ""
+            print(f"  {clave} n={d['n']:<6} p50={d['p50_ms']:.2f} p99={d['p99_ms']:.2f} "
+                  f"{sentencia['sql'][:70]}{errores}")
+
+    if args.salida:
+        with open(args.salida, "w", encoding="utf-8") as archivo:
+            json.dump(informe, archivo, indent=2, ensure_ascii=False)
+        print(f"\nInforme: {args.salida}")
+
+    if args.base:
+        with open(args.base, encoding="utf-8") as archivo:
+            filas = comparar(informe, json.load(archivo), args.umbral)
+        print(f"\n{'sentencia':14} {'base p50':>9} {'actual':>9} {'cambio':>8}")
+        for fila in filas:
+            marca = "  << REGRESIÓN" if fila["regresion"] else ""
+            print(f"{fila['clave']:14} {fila['base']:9.2f} {fila['actual']:9.2f} {fila['cambio']:+8.1%}{marca}")
+        if any(fila["regresion"] for fila in filas):
+            return 2
+    return 0
+
+def _cmd_import_budget(args) -> int:
+    """
+    Mide con 'python -X importtime' lo que cuesta importar el módulo de arranque
+    y falla (código 1) si supera el presupuesto o si carga módulos que deben
+    ser perezosos (driver de BD, PIL, vistas...). tests/test_import_budget.py
+    hace la misma verificación sobre main.
+    """
+    from src.utils.presupuesto_importacion import PROHIBIDOS_DEFECTO, medir_importacion, presupuesto_ms
+
+    limite_ms = args.presupuesto_ms if args.presupuesto_ms is not None else presupuesto_ms()
+    try:
+        medicion = medir_importacion(args.modulo)
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        return 1
+    prohibidos = medicion.prohibidos(args.prohibidos if args.prohibidos is not None else PROHIBIDOS_DEFECTO)
+
+    print(f"Importar '{args.modulo}': {medicion.total_ms:.1f} ms (presupuesto: {limite_ms:.0f} ms)")
+    for us, nombre in medicion.mas_lentos(args.top):
+        print(f"  {us / 1000:8.1f} ms  {nombre}")
+
+    ok = medicion.total_ms <= limite_ms
+    if not ok:
+        print("FALLO: el arranque supera el presupuesto de importación.")
+    if prohibidos:
+        print(f"FALLO: módulos que deben cargarse de forma perezosa: {', '.join(prohibidos)}")
+    return 0 if ok and not prohibidos else 1
+
+# --- Parser ---
+
+def _crear_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="cli.py", description="DriveFlow - tareas de mantenimiento")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Mostrar también los mensajes informativos")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    p = subparsers.add_parser("imagenes", help="Audita vehicle_images/ contra los ImagenPath de la BD")
+    p.add_argument("--directorio", default="vehicle_images", help="Directorio de imágenes")
+    p.add_argument("--aplicar", action="store_true", help="Aplicar cambios (por defecto solo dry-run)")
+    p.add_argument("--eliminar-huerfanas", action="store_true", help="Borrar archivos sin vehículo")
+    p.add_argument("--limpiar-referencias", action="store_true", help="Poner a NULL ImagenPath sin archivo")
+    p.add_argument("--antiguedad-minima", type=float, default=3600.0, help="Segundos mínimos antes de borrar una huérfana")
+    p.add_argument("--hilos", type=int, default=16, help="Hilos para los stat en paralelo")
+    p.add_argument("--listar", action="store_true", help="Listar cada archivo/referencia detectado")
+    p.set_defaults(func=_cmd_imagenes)
+
+    p = subparsers.add_parser("migrar", help="Aplica las migraciones de esquema pendientes")
+    p.add_argument("--estado", action="store_true", help="Solo mostrar la versión actual y las pendientes")
+    p.set_defaults(func=_cmd_migrar)
+
+    p = subparsers.add_parser("importar", help="Importa clientes o vehículos desde CSV/Excel")
+    p.add_argument("entidad", choices=["clientes", "vehiculos"])
+    p.add_argument("archivo", help="Archivo .csv o .xlsx con encabezados")
+    p.add_argument("--rechazos", default=None, help="CSV de filas rechazadas (por defecto <archivo>.rechazos.csv)")
+    p.add_argument("--lote", type=int, default=5000, help="Filas por lote")
+    p.add_argument("--separador", default=None, help="Separador del CSV (por defecto se detecta)")
+    p.set_defaults(func=_cmd_importar)
+
+    p = subparsers.add_parser("exportar", help="Exporta clientes o vehículos a CSV/Parquet en streaming")
+    p.add_argument("entidad", choices=["clientes", "vehiculos"])
+    p.add_argument("archivo", help="Archivo .csv o .parquet de salida")
+    p.add_argument("--buscar", default="", help="Exportar solo lo que coincide con la búsqueda")
+    p.add_argument("--estado", default=None, help="Solo vehículos en este estado (ej. Disponible)")
+    p.set_defaults(func=_cmd_exportar)
+
+    p = subparsers.add_parser("precios", help="Ajusta PrecioPorDia en bloque (una sola sentencia)")
+    p.add_argument("porcentaje", type=float, help="Porcentaje de ajuste (ej. 5 o -10)")
+    p.add_argument("--tipo", default=None, help="Solo vehículos de este tipo")
+    p.add_argument("--anio-desde", type=int, default=None)
+    p.add_argument("--anio-hasta", type=int, default=None)
+    p.add_argument("--marca", default=None)
+    p.set_defaults(func=_cmd_precios)
+
+    p = subparsers.add_parser("verificar", help="Chequeos de integridad de los datos (solo lectura)")
+    p.add_argument("--listar", action="store_true", help="Listar cada problema detectado")
+    p.set_defaults(func=_cmd_verificar)
+
+    p = subparsers.add_parser("purgar-eliminaciones", help="Borra las lápidas de sincronización (Eliminaciones) viejas")
+    p.add_argument("--dias", type=int, default=None,
+                   help="Retención en días (por defecto y como mínimo, RETENCION_ELIMINACIONES_DIAS: 7)")
+    p.set_defaults(func=_cmd_purgar_eliminaciones)
+
+    ayuda = ("Servicio HTTP/JSON con pool y caché compartidos (servidor de desarrollo de Django, "
+             "django.core.servers.basehttp.run: solo para la red interna)")
+    p = subparsers.add_parser("servir", help=ayuda, description=ayuda)
+    p.add_argument("--host", default="127.0.0.1",
+                   help="Interfaz de escucha (0.0.0.0 para la red local; fuera de loopback exige API_TOKEN)")
+    p.add_argument("--puerto", type=int, default=8000)
+    p.add_argument("--cache-mb", type=float, default=None, help="Caché de consultas en MB (por defecto QUERY_CACHE_MB o 64)")
+    p.add_argument("--tokens-ttl", type=float, default=1.0, help="Segundos que se reutilizan los tokens de cambio")
+    p.set_defaults(func=_cmd_servir)
+
+    p = subparsers.add_parser("reproducir", help="Reproduce una grabación de consultas (DB_RECORD) y mide latencias")
+    p.add_argument("grabacion", help="Archivo grabado con DB_RECORD (.jsonl o .jsonl.gz)")
+    p.add_argument("--velocidad", type=float, default=1.0, help="1 = ritmo original, 10 = diez veces más rápido, 0 = sin esperas")
+    p.add_argument("--hilos", type=int, default=1, help="Consultas en vuelo a la vez")
+    p.add_argument("--con-escrituras", action="store_true", help="Repetir también INSERT/UPDATE/DELETE (solo contra una copia)")
+    p.add_argument("--cache-mb", type=float, default=0, help="Caché de consultas del DataSource de destino en MB")
+    p.add_argument("--limite", type=int, default=None, help="Reproducir solo las primeras N consultas")
+    p.add_argument("--salida", default=None, help="JSON con el informe completo")
+    p.add_argument("--base", default=None, help="Informe JSON anterior para comparar")
+    p.add_argument("--umbral", type=float, default=0.20, help="Empeoramiento tolerado del p50 (0.20 = 20%%)")
+    p.add_argument("--top", type=int, default=10, help="Sentencias a listar")
+    p.set_defaults(func=_cmd_reproducir)
+
+    p = subparsers.add_parser("import-budget", help="Verifica el tiempo de importación del arranque (-X importtime)")
+    p.add_argument("--modulo", default="main", help="Módulo de arranque a medir")
+    p.add_argument("--presupuesto-ms", type=float, default=None, help="Presupuesto en ms (por defecto IMPORT_BUDGET_MS o 150)")
+    p.add_argument("--prohibidos", nargs="*", default=None,
+                   help="Módulos que no deben importarse al arrancar (por defecto driver de BD, PIL, numpy, pandas, vistas, repositorios)")
+    p.add_argument("--top", type=int, default=10, help="Cantidad de módulos más lentos a listar")
+    p.set_defaults(func=_cmd_import_budget)
+
+    return parser
+
+def main(argv=None) -> int:
+    load_dotenv()
+    args = _crear_parser().parse_args(argv)
+    # Sin Tk: los errores del DataSource se registran por logging en stderr
+    configurar_logging(nivel="INFO" if args.verbose else os.environ.get("LOG_LEVEL", "WARNING"))
+    try:
+        return args.func(args)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,69 +3,120 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
+import importlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 from dotenv import load_dotenv
-from typing import Optional, Dict, Any, Tuple # <-- Imports de typing añadidos
+from typing import Optional, Dict, Any, Tuple, TYPE_CHECKING # <-- Imports de typing añadidos
 
 # --- Cargar Variables de Entorno ---
 load_dotenv()
 
 # --- Importaciones de la Arquitectura ---
+# Solo lo necesario para pintar el dashboard. Repositorios, casos de uso y
+# ViewModels se importan en el hilo de arranque (setup_dependencies); cada
+# Vista se importa al abrir su módulo (_load_view_class); PIL y pyodbc se
+# cargan en el primer uso. Ver 'python cli.py import-budget'.
 
-# Capa de Datos
-from src.data.datasources.sql_server_datasource import SQLServerDataSource
-from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
-# Importaciones de Vehículo
-from src.data.repositories.tipo_vehiculo_repository_impl import TipoVehiculoRepositoryImpl
-from src.data.repositories.estado_vehiculo_repository_impl import EstadoVehiculoRepositoryImpl
-from src.data.repositories.vehiculo_repository_impl import VehiculoRepositoryImpl
-
-# Capa de Dominio (Casos de Uso)
-from src.domain.usecases.cliente_usecases import (
-    ObtenerClientesUseCase, GuardarClienteUseCase, EliminarClienteUseCase,
-    ValidarClienteUseCase, BuscarClientesUseCase
-)
-# Importaciones de Vehículo
-from src.domain.usecases.vehiculo_usecases import (
-    ObtenerVehiculosUseCase, ObtenerTiposVehiculoUseCase, ObtenerEstadosVehiculoUseCase,
-    GuardarVehiculoUseCase, EliminarVehiculoUseCase, ValidarVehiculoUseCase,
-    BuscarYFiltrarVehiculosUseCase
-)
-
-# Capa de IU
-from src.ui.viewmodels.cliente_viewmodel import ClienteViewModel
-from src.ui.viewmodels.vehiculo_viewmodel import VehiculoViewModel
-from src.ui.views.cliente_view import ClienteView # <-- Importar la Vista refactorizada
-from src.ui.views.vehiculo_view import VehiculoView
 from src.ui.theme import setup_theme, PALETTE
+from src.ui.utils.background import run_in_background
+from src.utils.registro import configurar_logging
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from src.data.datasources.sql_server_datasource import SQLServerDataSource
 
 # --- Ensamblador de Dependencias (DI) ---
 
-def setup_dependencies() -> Optional[Dict[str, Any]]:
+def setup_dependencies() -> Dict[str, Any]:
     """
     Inicializa y conecta todas las dependencias de la aplicación.
+    Se ejecuta en segundo plano: los errores se relanzan para que
+    el hilo de Tk los muestre.
     """
+    # Capa de Datos
+    from src.data.datasources.factory import crear_datasource
+    from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
+    from src.data.repositories.tipo_vehiculo_repository_impl import TipoVehiculoRepositoryImpl
+    from src.data.repositories.estado_vehiculo_repository_impl import EstadoVehiculoRepositoryImpl
+    from src.data.repositories.vehiculo_repository_impl import VehiculoRepositoryImpl
+    from src.data.repositories.snapshot_repository_impl import SnapshotRepositoryImpl
+    from src.data.repositories.sincronizacion_repository_impl import SincronizacionRepositoryImpl
+    from src.data.repositories.reserva_repository_impl import ReservaRepositoryImpl
+    from src.data.repositories.archivo_tabular_repository_impl import ArchivoTabularRepositoryImpl
+
+    # Capa de Dominio (Casos de Uso)
+    from src.domain.usecases.cliente_usecases import (
+        ObtenerClientesUseCase, GuardarClienteUseCase, EliminarClienteUseCase,
+        ValidarClienteUseCase, BuscarClientesUseCase, ObtenerPaginaClientesUseCase,
+        SincronizarClientesUseCase
+    )
+    from src.domain.usecases.vehiculo_usecases import (
+        ObtenerVehiculosUseCase, ObtenerTiposVehiculoUseCase, ObtenerEstadosVehiculoUseCase,
+        GuardarVehiculoUseCase, EliminarVehiculoUseCase, ValidarVehiculoUseCase,
+        BuscarYFiltrarVehiculosUseCase, CargarSnapshotFlotaUseCase, SincronizarSnapshotFlotaUseCase,
+        SincronizarVehiculosUseCase, AjustarPreciosUseCase, CambiarEstadoVehiculosUseCase, RecargarVehiculosUseCase
+    )
+    from src.domain.usecases.sincronizacion_usecases import ObtenerTokensCambioUseCase
+    from src.domain.usecases.reserva_usecases import CargarDisponibilidadUseCase
+    from src.domain.usecases.exportacion_usecases import ExportarClientesUseCase, ExportarVehiculosUseCase
+
+    # Capa de IU (ViewModels)
+    from src.ui.viewmodels.cliente_viewmodel import ClienteViewModel
+    from src.ui.viewmodels.vehiculo_viewmodel import VehiculoViewModel
+
     try:
-        # 1. Leer Configuración
-        server = os.environ.get('DB_SERVER', 'localhost')
-        database = os.environ.get('DB_NAME', 'AlquilerAutos')
-        username = os.environ.get('DB_USERNAME')
-        password = os.environ.get('DB_PASSWORD')
-        
-        if not server or not database:
-            raise ValueError("Las variables de entorno DB_SERVER y DB_NAME deben estar definidas en .env")
+        api_url = os.environ.get('API_URL')
+        if api_url:
+            # Modo servicio: los repositorios hablan HTTP con 'cli.py servir', que
+            # mantiene el pool de conexiones y la caché compartida por todos los mostradores
+            from src.data.datasources.api_client import ApiClient
+            from src.data.repositories.http import (
+                ClienteRepositoryHttp, TipoVehiculoRepositoryHttp, EstadoVehiculoRepositoryHttp,
+                VehiculoRepositoryHttp, SincronizacionRepositoryHttp, ReservaRepositoryHttp
+            )
+            datasource = ApiClient(api_url, token=os.environ.get('API_TOKEN'))
+            datasource.get("api/estado") # Falla aquí (y no en la precarga) si el servicio no responde
+            cliente_repo = ClienteRepositoryHttp(datasource)
+            tipo_repo = TipoVehiculoRepositoryHttp(datasource)
+            estado_repo = EstadoVehiculoRepositoryHttp(datasource)
+            vehiculo_repo = VehiculoRepositoryHttp(datasource)
+            sincronizacion_repo = SincronizacionRepositoryHttp(datasource)
+            reserva_repo = ReservaRepositoryHttp(datasource)
+            snapshot_repo = SnapshotRepositoryImpl(clave=api_url)
+        else:
+            # 1. Leer Configuración
+            server = os.environ.get('DB_SERVER', 'localhost')
+            database = os.environ.get('DB_NAME', 'AlquilerAutos')
+            username = os.environ.get('DB_USERNAME')
+            password = os.environ.get('DB_PASSWORD')
 
-        # 2. Inicializar DataSource (Única)
-        datasource = SQLServerDataSource.get_instance(
-            server=server, database=database,
-            username=username, password=password
-        )
-        
-        # 3. Inicializar Repositorios
-        cliente_repo = ClienteRepositoryImpl(datasource)
-        tipo_repo = TipoVehiculoRepositoryImpl(datasource)
-        estado_repo = EstadoVehiculoRepositoryImpl(datasource)
-        vehiculo_repo = VehiculoRepositoryImpl(datasource, tipo_repo, estado_repo)
+            if not server or not database:
+                raise ValueError("Las variables de entorno DB_SERVER y DB_NAME deben estar definidas en .env")
+
+            # 2. Inicializar DataSource (Única)
+            datasource = crear_datasource(
+                server=server, database=database,
+                username=username, password=password
+            )
+            cache_mb = float(os.environ.get('QUERY_CACHE_MB', '0') or 0)
+            if cache_mb > 0:
+                datasource.enable_cache(int(cache_mb * 1024 * 1024))
+
+            # 3. Inicializar Repositorios
+            modo_busqueda = os.environ.get('SEARCH_MODE', 'contiene')
+            cliente_repo = ClienteRepositoryImpl(datasource, modo_busqueda=modo_busqueda)
+            tipo_repo = TipoVehiculoRepositoryImpl(datasource)
+            estado_repo = EstadoVehiculoRepositoryImpl(datasource)
+            vehiculo_repo = VehiculoRepositoryImpl(datasource, tipo_repo, estado_repo, modo_busqueda=modo_busqueda)
+            snapshot_repo = SnapshotRepositoryImpl(clave=f"{server}/{database}")
+            sincronizacion_repo = SincronizacionRepositoryImpl(datasource)
+            reserva_repo = ReservaRepositoryImpl(datasource)
+        obtener_tokens_usecase = ObtenerTokensCambioUseCase(sincronizacion_repo)
+        archivos = ArchivoTabularRepositoryImpl()
         
         # 4. Inicializar ViewModel de Cliente
         cliente_viewmodel = ClienteViewModel(
@@ -73,7 +124,11 @@ def setup_dependencies() -> Optional[Dict[str, Any]]:
             guardar_cliente_usecase=GuardarClienteUseCase(cliente_repo),
             eliminar_cliente_usecase=EliminarClienteUseCase(cliente_repo),
             validar_cliente_usecase=ValidarClienteUseCase(),
-            buscar_clientes_usecase=BuscarClientesUseCase(cliente_repo)
+            buscar_clientes_usecase=BuscarClientesUseCase(cliente_repo),
+            obtener_pagina_usecase=ObtenerPaginaClientesUseCase(cliente_repo),
+            sincronizar_clientes_usecase=SincronizarClientesUseCase(cliente_repo),
+            obtener_tokens_usecase=obtener_tokens_usecase,
+            exportar_clientes_usecase=ExportarClientesUseCase(cliente_repo, archivos)
         )
         
         # 5. Inicializar ViewModel de Vehículo
@@ -84,7 +139,18 @@ def setup_dependencies() -> Optional[Dict[str, Any]]:
             guardar_vehiculo_usecase=GuardarVehiculoUseCase(vehiculo_repo),
             eliminar_vehiculo_usecase=EliminarVehiculoUseCase(vehiculo_repo),
             validar_vehiculo_usecase=ValidarVehiculoUseCase(),
-            buscar_y_filtrar_usecase=BuscarYFiltrarVehiculosUseCase(vehiculo_repo)
+            buscar_y_filtrar_usecase=BuscarYFiltrarVehiculosUseCase(vehiculo_repo),
+            cargar_snapshot_usecase=CargarSnapshotFlotaUseCase(snapshot_repo),
+            sincronizar_snapshot_usecase=SincronizarSnapshotFlotaUseCase(
+                snapshot_repo, sincronizacion_repo, tipo_repo, estado_repo, vehiculo_repo
+            ),
+            sincronizar_vehiculos_usecase=SincronizarVehiculosUseCase(vehiculo_repo),
+            obtener_tokens_usecase=obtener_tokens_usecase,
+            cargar_disponibilidad_usecase=CargarDisponibilidadUseCase(reserva_repo),
+            ajustar_precios_usecase=AjustarPreciosUseCase(vehiculo_repo),
+            cambiar_estado_usecase=CambiarEstadoVehiculosUseCase(vehiculo_repo),
+            recargar_vehiculos_usecase=RecargarVehiculosUseCase(vehiculo_repo),
+            exportar_vehiculos_usecase=ExportarVehiculosUseCase(vehiculo_repo, tipo_repo, estado_repo, archivos)
         )
         
         # 6. Retornar todas las dependencias en un diccionario
@@ -97,46 +163,70 @@ def setup_dependencies() -> Optional[Dict[str, Any]]:
         }
 
     except (ValueError, Exception) as e:
-        messagebox.showerror(
-            "Error Crítico de Inicio",
-            f"No se pudo iniciar la aplicación:\n{e}\n\nRevise su archivo .env y la conexión a la base de datos."
-        )
-        return None
+        raise Exception(f"No se pudo iniciar la aplicación:\n{e}\n\nRevise su archivo .env y la conexión a la base de datos.")
+
+def preload_data(viewmodels: Dict[str, Any]) -> None:
+    """
+    Precarga en paralelo los datos de los módulos (tipos, estados y vehículos
+    por un lado; primera página de clientes por otro) para que las ventanas
+    se abran con datos ya disponibles. Un fallo aquí no es crítico: la vista
+    hará su carga normal al abrirse.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = {
+            key: executor.submit(viewmodels[key].precargar)
+            for key in ("vehiculo", "cliente")
+        }
+        for key, future in futures.items():
+            try:
+                future.result()
+            except Exception as e:
+                logger.warning("Falló la precarga de '%s': %s", key, e)
+
+def startup() -> Dict[str, Any]:
+    """Arranque en segundo plano: conexión + precarga."""
+    dependencies = setup_dependencies()
+    preload_data(dependencies["viewmodels"])
+    return dependencies
 
 # --- Clase Principal de la Aplicación (Vista Principal) ---
 
 class MainApplication(ttk.Frame):
-    def __init__(self, master, viewmodels: Dict[str, Any], datasource: SQLServerDataSource):
+    def __init__(self, master, viewmodels: Optional[Dict[str, Any]] = None, datasource: Optional["SQLServerDataSource"] = None):
         
         super().__init__(master, style="TFrame")
         self.master = master
         self.master.title("DriveFlow - Sistema de Gestión de Alquiler")
         self.master.geometry("900x600")
         
-        self.viewmodels = viewmodels
+        self.viewmodels = viewmodels or {}
         self.datasource = datasource
         self.open_windows = {} # Diccionario para rastrear ventanas abiertas
+        self.module_buttons = [] # (botón, requiere_datos)
+        self.status_var = tk.StringVar()
         
         self.dashboard_modules = [
             {
                 "title": "Gestionar Clientes",
                 "command": lambda: self._open_toplevel_window(
-                    ViewClass=ClienteView,
+                    view=("src.ui.views.cliente_view", "ClienteView"),
                     viewmodel=self.viewmodels["cliente"],
                     key="cliente",
                     title="Gestión de Clientes",
                     geometry="900x600"
-                )
+                ),
+                "requires_data": True
             },
             {
                 "title": "Gestionar Vehículos",
                 "command": lambda: self._open_toplevel_window(
-                    ViewClass=VehiculoView,
+                    view=("src.ui.views.vehiculo_view", "VehiculoView"),
                     viewmodel=self.viewmodels["vehiculo"],
                     key="vehiculo",
                     title="Gestión de Vehículos",
                     geometry="1100x700"
-                )
+                ),
+                "requires_data": True
             },
             { "title": "Gestionar Reservas", "command": partial(self.open_dummy, "Reservas") },
             { "title": "Gestionar Contratos", "command": partial(self.open_dummy, "Contratos") },
@@ -149,13 +239,17 @@ class MainApplication(ttk.Frame):
 
     def on_close_app(self):
         """Maneja el cierre de la ventana principal."""
-        print("Cerrando aplicación...")
+        logger.info("Cerrando aplicación...")
         try:
             if self.datasource:
+                stats = self.datasource.cache_stats()
+                if stats:
+                    logger.info("Caché de consultas: %d aciertos, %d fallos (%.0f%%), %d desalojos, %.0f KB",
+                                stats['hits'], stats['misses'], stats['hit_rate'] * 100, stats['evictions'], stats['bytes'] / 1024)
                 self.datasource.close()
-                print("Conexión a base de datos cerrada.")
+                logger.info("Conexión a base de datos cerrada.")
         except Exception as e:
-            print(f"Error al cerrar datasource: {e}")
+            logger.error("Error al cerrar datasource: %s", e)
         finally:
             self.master.quit()
             self.master.destroy()
@@ -169,7 +263,7 @@ class MainApplication(ttk.Frame):
         try:
             ttk.Label(title_frame, text="Dashboard Principal", style="Heading.TLabel").pack()
         except tk.TclError:
-            print("Advertencia: Estilo 'Heading.TLabel' no encontrado. Usando estilo por defecto.")
+            logger.warning("Estilo 'Heading.TLabel' no encontrado. Usando estilo por defecto.")
             ttk.Label(title_frame, text="Dashboard Principal", font=("Arial", 24, "bold"), foreground=PALETTE["primary"]).pack()
         
         buttons_frame = ttk.Frame(self, style="TFrame")
@@ -181,11 +275,52 @@ class MainApplication(ttk.Frame):
             btn = ttk.Button(buttons_frame, text=module["title"], command=module["command"])
             btn.grid(row=row, column=col, padx=15, pady=15, sticky="nsew")
             buttons_frame.rowconfigure(row, weight=1)
+            requires_data = module.get("requires_data", False)
+            if requires_data and not self.viewmodels:
+                btn.state(["disabled"])
+            self.module_buttons.append((btn, requires_data))
+
+        ttk.Label(self, textvariable=self.status_var, style="TLabel").pack(pady=(0, 10))
+
+    # --- Arranque escalonado ---
+
+    def start_background_startup(self):
+        """
+        Conecta y precarga en segundo plano mientras el dashboard ya es visible.
+        Los módulos que requieren datos se habilitan al terminar.
+        """
+        self.status_var.set("Conectando a la base de datos...")
+        run_in_background(self, startup, on_success=self.on_startup_done, on_error=self.on_startup_error)
+
+    def on_startup_done(self, dependencies: Dict[str, Any]):
+        self.viewmodels = dependencies["viewmodels"]
+        self.datasource = dependencies["datasource"]
+        self.datasource.on_error = self.on_datasource_error
+        for btn, requires_data in self.module_buttons:
+            if requires_data:
+                btn.state(["!disabled"])
+        self.status_var.set("")
+
+    def on_datasource_error(self, title: str, message: str):
+        """Errores de la BD: diálogo solo desde el hilo de Tk (en segundo plano ya quedan en el log)."""
+        if threading.current_thread() is threading.main_thread():
+            messagebox.showerror(title, message, parent=self.master)
+
+    def on_startup_error(self, error: BaseException):
+        self.status_var.set("Sin conexión a la base de datos.")
+        messagebox.showerror("Error Crítico de Inicio", str(error), parent=self.master)
+        self.on_close_app()
     
-    def _open_toplevel_window(self, ViewClass, viewmodel, key: str, title: str, geometry: str):
+    @staticmethod
+    def _load_view_class(view: Tuple[str, str]):
+        """Importa la clase de la Vista la primera vez que se abre su módulo."""
+        module_name, class_name = view
+        return getattr(importlib.import_module(module_name), class_name)
+
+    def _open_toplevel_window(self, view: Tuple[str, str], viewmodel, key: str, title: str, geometry: str):
         """
         Función genérica y robusta para abrir ventanas Toplevel modulares.
-        ASUNCIÓN: ViewClass (ClienteView, VehiculoView) hereda de ttk.Frame.
+        ASUNCIÓN: la Vista (ClienteView, VehiculoView) hereda de ttk.Frame.
         """
         try:
             # 1. Comprobar si la ventana ya existe
@@ -193,7 +328,7 @@ class MainApplication(ttk.Frame):
                 window = self.open_windows[key]
                 if window and window.winfo_exists():
                     window.lift() # Traer al frente
-                    print(f"Ventana '{title}' ya existe. Trayendo al frente.")
+                    logger.debug("Ventana '%s' ya existe. Trayendo al frente.", title)
                     return
                 else:
                     # La referencia es inválida (ventana cerrada), la eliminamos
@@ -208,6 +343,7 @@ class MainApplication(ttk.Frame):
             window.grab_set()
 
             # 3. Crear la Vista (el Frame) y empaquetarla
+            ViewClass = self._load_view_class(view)
             view_frame = ViewClass(window, viewmodel)
             view_frame.pack(fill="both", expand=True)
             
@@ -218,7 +354,7 @@ class MainApplication(ttk.Frame):
             window.protocol("WM_DELETE_WINDOW", lambda: self.on_window_close(window, key))
 
         except Exception as e:
-            print(f"Error fatal al abrir ventana {ViewClass.__name__}: {e}")
+            logger.exception("Error fatal al abrir ventana %s", view[1])
             messagebox.showerror("Error", f"No se pudo abrir la ventana:\n{e}")
             if 'window' in locals() and window.winfo_exists():
                 window.destroy()
@@ -226,7 +362,7 @@ class MainApplication(ttk.Frame):
 
     def on_window_close(self, window: tk.Toplevel, key: str):
         """Maneja el cierre de una ventana Toplevel."""
-        print(f"Cerrando ventana '{key}'...")
+        logger.debug("Cerrando ventana '%s'...", key)
         if key in self.open_windows:
             del self.open_windows[key]
         if window and window.winfo_exists():
@@ -238,18 +374,17 @@ class MainApplication(ttk.Frame):
 # --- Punto de Entrada ---
 
 if __name__ == "__main__":
-    
-    dependencies = setup_dependencies()
-    
-    if dependencies:
-        root = tk.Tk()
-        setup_theme(root)
-        
-        app = MainApplication(
-            root,
-            viewmodels=dependencies["viewmodels"], # Pasar el diccionario de ViewModels
-            datasource=dependencies["datasource"]
-        )
-        
-        root.mainloop()
+
+    # Niveles por módulo, archivo en cola, formato JSON: ver src/utils/registro.py
+    configurar_logging()
+
+    # El dashboard se muestra de inmediato; la conexión y la precarga
+    # de datos ocurren en segundo plano (ver MainApplication.start_background_startup).
+    root = tk.Tk()
+    setup_theme(root)
+
+    app = MainApplication(root)
+    app.start_background_startup()
+
+    root.mainloop()
 
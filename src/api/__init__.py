@@ -0,0 +1,6 @@
+# src/api/__init__.py
+#
+# Servicio HTTP/JSON opcional (Django) que expone los casos de uso a los
+# clientes Tk de los mostradores: un solo proceso mantiene el pool de
+# conexiones y las cachés, y los N clientes comparten esa caché caliente.
+# Ver src/api/servicio.py y 'python cli.py servir'.
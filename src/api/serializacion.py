@@ -0,0 +1,83 @@
+# src/api/serializacion.py
+#
+# Formato JSON de las entidades, compartido por el servicio (src/api) y los
+# repositorios HTTP (src/data/repositories/http). Los vehículos viajan con
+# tipo_id/estado_id: cada lado los enlaza con sus propios catálogos.
+
+import json
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict
+
+from src.domain.models.cliente import Cliente
+from src.domain.models.estado_vehiculo import EstadoVehiculo
+from src.domain.models.reserva import Reserva, ESTADO_ACTIVA
+from src.domain.models.tipo_vehiculo import TipoVehiculo
+from src.domain.models.vehiculo import Vehiculo
+
+CAMPOS_CLIENTE = ("id", "nombre", "apellido", "dni", "licencia", "telefono", "email", "direccion", "distrito")
+CAMPOS_VEHICULO = ("id", "marca", "modelo", "anio", "placa", "tipo_id", "estado_id", "precio_por_dia", "kilometraje", "imagen_path")
+
+def _por_defecto(valor: Any) -> Any:
+    # DECIMAL de SQL Server (PrecioPorDia) y fechas de las reservas
+    if isinstance(valor, Decimal): return float(valor)
+    if isinstance(valor, (date, datetime)): return valor.isoformat()
+    raise TypeError(f"Tipo no serializable: {type(valor).__name__}")
+
+def a_json(datos: Any) -> bytes:
+    return json.dumps(datos, ensure_ascii=False, separators=(",", ":"), default=_por_defecto).encode("utf-8")
+
+# --- Entidad -> dict ---
+
+def cliente_a_dict(cliente: Cliente) -> Dict[str, Any]:
+    return {campo: getattr(cliente, campo) for campo in CAMPOS_CLIENTE}
+
+def vehiculo_a_dict(vehiculo: Vehiculo) -> Dict[str, Any]:
+    return {
+        "id": vehiculo.id, "marca": vehiculo.marca, "modelo": vehiculo.modelo, "anio": vehiculo.anio,
+        "placa": vehiculo.placa, "tipo_id": vehiculo.tipo.id, "estado_id": vehiculo.estado.id,
+        "precio_por_dia": vehiculo.precio_por_dia, "kilometraje": vehiculo.kilometraje, "imagen_path": vehiculo.imagen_path
+    }
+
+def tipo_a_dict(tipo: TipoVehiculo) -> Dict[str, Any]:
+    return {"id": tipo.id, "nombre_tipo": tipo.nombre_tipo, "garantia_base": tipo.garantia_base}
+
+def estado_a_dict(estado: EstadoVehiculo) -> Dict[str, Any]:
+    return {"id": estado.id, "nombre_estado": estado.nombre_estado}
+
+def reserva_a_dict(reserva: Reserva) -> Dict[str, Any]:
+    return {
+        "id": reserva.id, "cliente_id": reserva.cliente_id, "vehiculo_id": reserva.vehiculo_id,
+        "fecha_inicio": reserva.fecha_inicio.isoformat(), "fecha_fin": reserva.fecha_fin.isoformat(),
+        "estado": reserva.estado
+    }
+
+# --- dict -> entidad (valida como el constructor de cada modelo) ---
+
+def dict_a_cliente(datos: Dict[str, Any]) -> Cliente:
+    return Cliente(**{campo: datos.get(campo) for campo in CAMPOS_CLIENTE})
+
+def dict_a_vehiculo(datos: Dict[str, Any], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Vehiculo:
+    tipo_id, estado_id = datos.get("tipo_id"), datos.get("estado_id")
+    return Vehiculo(
+        id=datos.get("id"), marca=datos.get("marca") or "", modelo=datos.get("modelo") or "",
+        anio=int(datos["anio"]) if datos.get("anio") else 1900, placa=datos.get("placa") or "",
+        tipo=mapa_tipos.get(tipo_id) or TipoVehiculo(id=tipo_id, nombre_tipo="Tipo Desconocido", garantia_base=0.0),
+        estado=mapa_estados.get(estado_id) or EstadoVehiculo(id=estado_id, nombre_estado="Estado Desconocido"),
+        precio_por_dia=float(datos["precio_por_dia"]) if datos.get("precio_por_dia") else 0.0,
+        kilometraje=int(datos["kilometraje"]) if datos.get("kilometraje") is not None else None,
+        imagen_path=datos.get("imagen_path") or None
+    )
+
+def dict_a_tipo(datos: Dict[str, Any]) -> TipoVehiculo:
+    return TipoVehiculo(id=datos["id"], nombre_tipo=datos["nombre_tipo"], garantia_base=float(datos["garantia_base"] or 0.0))
+
+def dict_a_estado(datos: Dict[str, Any]) -> EstadoVehiculo:
+    return EstadoVehiculo(id=datos["id"], nombre_estado=datos["nombre_estado"])
+
+def dict_a_reserva(datos: Dict[str, Any]) -> Reserva:
+    return Reserva(
+        id=datos.get("id"), cliente_id=int(datos["cliente_id"]), vehiculo_id=int(datos["vehiculo_id"]),
+        fecha_inicio=date.fromisoformat(datos["fecha_inicio"]), fecha_fin=date.fromisoformat(datos["fecha_fin"]),
+        estado=datos.get("estado") or ESTADO_ACTIVA
+    )
@@ -0,0 +1,208 @@
+# src/api/servicio.py
+#
+# Servicio HTTP/JSON (Django) que comparte un DataSource entre los clientes.
+#
+#   - Un solo pool de conexiones y una sola QueryCache para todos.
+#   - GET condicionales: el ETag sale de los tokens de cambio de las tablas
+#     que lee cada recurso, así un "304 Not Modified" no toca los datos.
+#     Los tokens se consultan como mucho una vez por TOKENS_TTL segundos
+#     (los comparten todas las peticiones) y las escrituras hechas por el
+#     servicio los invalidan al instante.
+#   - Las respuestas ya serializadas se guardan por ETag: tras un cambio, el
+#     primer cliente que pregunta arma el JSON y los demás lo reciben hecho.
+#
+# Django se configura aquí mismo (settings.configure): no hay proyecto, ORM
+# ni apps; las vistas están en src/api/vistas.py. Se sirve con el servidor de
+# desarrollo de Django (django.core.servers.basehttp.run): pensado para la red
+# interna de la sucursal, no para exponerlo a Internet. Fuera de loopback se
+# exige API_TOKEN.
+
+import hashlib
+import ipaddress
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Optional, Tuple
+
+from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
+from src.data.repositories.tipo_vehiculo_repository_impl import TipoVehiculoRepositoryImpl
+from src.data.repositories.estado_vehiculo_repository_impl import EstadoVehiculoRepositoryImpl
+from src.data.repositories.vehiculo_repository_impl import VehiculoRepositoryImpl
+from src.data.repositories.reserva_repository_impl import ReservaRepositoryImpl
+from src.data.repositories.sincronizacion_repository_impl import SincronizacionRepositoryImpl
+from src.domain.usecases.cliente_usecases import (
+    ObtenerClientesUseCase, ObtenerPaginaClientesUseCase, BuscarClientesUseCase,
+    GuardarClienteUseCase, EliminarClienteUseCase
+)
+from src.domain.usecases.vehiculo_usecases import (
+    ObtenerVehiculosUseCase, ObtenerTiposVehiculoUseCase, ObtenerEstadosVehiculoUseCase,
+    GuardarVehiculoUseCase, EliminarVehiculoUseCase, BuscarYFiltrarVehiculosUseCase,
+    AjustarPreciosUseCase, CambiarEstadoVehiculosUseCase, RecargarVehiculosUseCase
+)
+from src.domain.usecases.sincronizacion_usecases import ObtenerTokensCambioUseCase
+
+class CacheRespuestas:
+    """Cuerpos JSON por clave (ETag), con presupuesto en bytes y desalojo LRU."""
+    def __init__(self, max_bytes: int = 32 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entradas: "OrderedDict[str, bytes]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def obtener(self, clave: str, producir: Callable[[], bytes]) -> bytes:
+        with self._lock:
+            cuerpo = self._entradas.get(clave)
+            if cuerpo is not None:
+                self._entradas.move_to_end(clave)
+                self.hits += 1
+                return cuerpo
+            self.misses += 1
+        cuerpo = producir() # Fuera del lock: dos clientes a la vez pueden producirlo, no se bloquean
+        if len(cuerpo) <= self.max_bytes:
+            with self._lock:
+                if clave not in self._entradas:
+                    self._entradas[clave] = cuerpo
+                    self._bytes += len(cuerpo)
+                while self._bytes > self.max_bytes:
+                    _, viejo = self._entradas.popitem(last=False)
+                    self._bytes -= len(viejo)
+        return cuerpo
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entradas": len(self._entradas), "bytes": self._bytes, "hits": self.hits, "misses": self.misses}
+
+class Servicio:
+    """Repositorios y casos de uso sobre un único DataSource, más las cachés compartidas."""
+
+    # Tablas de las que dependen los recursos de vehículos (para su ETag)
+    TABLAS_FLOTA = ("TiposVehiculo", "EstadosVehiculo", "Vehiculos")
+
+    def __init__(self, datasource, modo_busqueda: str = "contiene", tokens_ttl: float = 1.0,
+                 respuestas_max_bytes: int = 32 * 1024 * 1024, token: Optional[str] = None):
+        """
+        Args:
+            datasource: SQLServerDataSource o SQLiteDataSource compartido.
+            tokens_ttl: Segundos que se reutilizan los tokens de cambio.
+            respuestas_max_bytes: Presupuesto de CacheRespuestas.
+            token: Si se indica, las peticiones deben traer 'Authorization: Bearer <token>'.
+        """
+        self.datasource = datasource
+        self.token = token
+        self.tokens_ttl = tokens_ttl
+        self.respuestas = CacheRespuestas(respuestas_max_bytes)
+        self._tokens: Dict[str, Tuple[float, tuple]] = {} # tabla -> (leído en, token)
+        self._tokens_lock = threading.Lock()
+
+        self.cliente_repo = ClienteRepositoryImpl(datasource, modo_busqueda=modo_busqueda)
+        self.tipo_repo = TipoVehiculoRepositoryImpl(datasource)
+        self.estado_repo = EstadoVehiculoRepositoryImpl(datasource)
+        self.vehiculo_repo = VehiculoRepositoryImpl(datasource, self.tipo_repo, self.estado_repo, modo_busqueda=modo_busqueda)
+        self.reserva_repo = ReservaRepositoryImpl(datasource)
+
+        self.obtener_clientes = ObtenerClientesUseCase(self.cliente_repo)
+        self.obtener_pagina_clientes = ObtenerPaginaClientesUseCase(self.cliente_repo)
+        self.buscar_clientes = BuscarClientesUseCase(self.cliente_repo)
+        self.guardar_cliente = GuardarClienteUseCase(self.cliente_repo)
+        self.eliminar_cliente = EliminarClienteUseCase(self.cliente_repo)
+        self.obtener_tipos = ObtenerTiposVehiculoUseCase(self.tipo_repo)
+        self.obtener_estados = ObtenerEstadosVehiculoUseCase(self.estado_repo)
+        self.obtener_vehiculos = ObtenerVehiculosUseCase(self.vehiculo_repo)
+        self.buscar_vehiculos = BuscarYFiltrarVehiculosUseCase(self.vehiculo_repo)
+        self.guardar_vehiculo = GuardarVehiculoUseCase(self.vehiculo_repo)
+        self.eliminar_vehiculo = EliminarVehiculoUseCase(self.vehiculo_repo)
+        self.ajustar_precios = AjustarPreciosUseCase(self.vehiculo_repo)
+        self.cambiar_estado = CambiarEstadoVehiculosUseCase(self.vehiculo_repo)
+        self.recargar_vehiculos = RecargarVehiculosUseCase(self.vehiculo_repo)
+        self.obtener_tokens = ObtenerTokensCambioUseCase(SincronizacionRepositoryImpl(datasource))
+
+    def catalogos(self):
+        """(mapa_tipos, mapa_estados) vigentes (salen de la QueryCache)."""
+        return ({t.id: t for t in self.obtener_tipos.execute()},
+                {e.id: e for e in self.obtener_estados.execute()})
+
+    # --- Tokens de cambio y ETag ---
+
+    def tokens(self, tablas: Iterable[str]) -> Dict[str, tuple]:
+        """Tokens por tabla, reutilizando los leídos hace menos de tokens_ttl segundos."""
+        tablas = list(tablas)
+        ahora = time.monotonic()
+        with self._tokens_lock:
+            vigentes = {t: v[1] for t, v in self._tokens.items() if t in tablas and ahora - v[0] < self.tokens_ttl}
+        faltan = [t for t in tablas if t not in vigentes]
+        if faltan:
+            # Releer los tokens también invalida la QueryCache de las tablas que otro equipo modificó
+            nuevos = self.obtener_tokens.execute(faltan)
+            with self._tokens_lock:
+                for tabla, token in nuevos.items():
+                    self._tokens[tabla] = (ahora, tuple(token))
+            vigentes.update({t: tuple(v) for t, v in nuevos.items()})
+        return vigentes
+
+    def invalidar_tokens(self) -> None:
+        """Tras una escritura del propio servicio: el próximo GET relee los tokens."""
+        with self._tokens_lock:
+            self._tokens.clear()
+
+    def etag(self, recurso: str, tablas: Iterable[str]) -> str:
+        tokens = self.tokens(tablas)
+        huella = repr((recurso, sorted(tokens.items()))).encode("utf-8")
+        return hashlib.sha1(huella).hexdigest()
+
+    def stats(self) -> Dict[str, object]:
+        return {"respuestas": self.respuestas.stats(), "consultas": self.datasource.cache_stats()}
+
+# --- Arranque ---
+
+# Host permitidos por defecto (cabecera Host) cuando no se indica API_ALLOWED_HOSTS
+HOSTS_LOCALES = ["127.0.0.1", "localhost", "[::1]"]
+
+def es_loopback(host: str) -> bool:
+    """True si la interfaz de escucha solo es alcanzable desde la propia máquina."""
+    if host.lower() == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host.strip("[]")).is_loopback
+    except ValueError:
+        return False   # Nombres de host y 0.0.0.0/:: escuchan en la red
+
+def configurar_django(hosts: Optional[Iterable[str]] = None, debug: bool = False) -> None:
+    import django
+    from django.conf import settings
+    if not settings.configured:
+        settings.configure(
+            DEBUG=debug,
+            # Sin sesiones ni firmas: la clave solo existe porque Django la exige
+            SECRET_KEY=os.environ.get("API_SECRET_KEY") or secrets.token_urlsafe(32),
+            ALLOWED_HOSTS=list(hosts) if hosts else list(HOSTS_LOCALES),
+            ROOT_URLCONF="src.api.urls",
+            INSTALLED_APPS=[],
+            MIDDLEWARE=[],
+            DATABASES={},
+            USE_TZ=True,
+        )
+    django.setup()
+
+def servir(servicio: Servicio, host: str = "127.0.0.1", puerto: int = 8000, hosts: Optional[Iterable[str]] = None) -> None:
+    """
+    Sirve la API con el servidor de desarrollo multihilo de Django
+    (django.core.servers.basehttp.run; bloquea hasta Ctrl+C).
+
+    Raises:
+        ValueError: Si host no es loopback y el servicio no exige token: la API
+            escribe en la BD y no debe quedar abierta a la red sin autenticación.
+    """
+    if not es_loopback(host) and not servicio.token:
+        raise ValueError(f"Escuchar en {host} sin API_TOKEN dejaría la API abierta a la red; defina API_TOKEN.")
+    # Sin API_ALLOWED_HOSTS: loopback acepta solo nombres locales; en la red, cualquier
+    # Host (el token ya autentica cada petición)
+    configurar_django(hosts or (None if es_loopback(host) else ["*"]))
+    from django.core.servers.basehttp import run
+    from django.core.wsgi import get_wsgi_application
+    from src.api import vistas
+    vistas.instalar(servicio)
+    run(host, puerto, get_wsgi_application(), threading=True)
@@ -0,0 +1,27 @@
+# src/api/urls.py
+from django.urls import path
+from src.api import vistas
+
+urlpatterns = [
+    path("api/estado", vistas.estado_servicio),
+    path("api/tokens", vistas.tokens),
+    path("api/tipos", vistas.tipos),
+    path("api/estados", vistas.estados),
+    path("api/clientes", vistas.clientes),
+    path("api/clientes/lote", vistas.clientes_lote),
+    path("api/clientes/existentes", vistas.clientes_existentes),
+    path("api/clientes/insertar", vistas.clientes_insertar),
+    path("api/clientes/exportar", vistas.clientes_exportar),
+    path("api/clientes/<int:cliente_id>", vistas.cliente),
+    path("api/vehiculos", vistas.vehiculos),
+    path("api/vehiculos/lote", vistas.vehiculos_lote),
+    path("api/vehiculos/precios", vistas.vehiculos_precios),
+    path("api/vehiculos/estado", vistas.vehiculos_estado),
+    path("api/vehiculos/existentes", vistas.vehiculos_existentes),
+    path("api/vehiculos/insertar", vistas.vehiculos_insertar),
+    path("api/vehiculos/exportar", vistas.vehiculos_exportar),
+    path("api/vehiculos/<int:vehiculo_id>", vistas.vehiculo),
+    path("api/reservas", vistas.reservas),
+    path("api/reservas/<int:reserva_id>", vistas.reserva),
+    path("api/reservas/<int:reserva_id>/cancelar", vistas.reserva_cancelar),
+]
@@ -0,0 +1,326 @@
+# src/api/vistas.py
+#
+# Vistas de la API (Django, sin ORM). Cada recurso de lectura declara las
+# tablas de las que depende: su ETag sale de los tokens de cambio de esas
+# tablas (ver Servicio.etag) y el cuerpo se comparte entre clientes por ETag.
+# Las escrituras pasan por los mismos casos de uso que la aplicación Tk.
+
+import json
+import logging
+import math
+from datetime import date
+from functools import wraps
+from typing import Any, Callable, List, Optional
+
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.views.decorators.http import condition
+
+from src.api.servicio import Servicio
+from src.api.serializacion import (
+    a_json, cliente_a_dict, vehiculo_a_dict, tipo_a_dict, estado_a_dict, reserva_a_dict,
+    dict_a_cliente, dict_a_vehiculo, dict_a_reserva
+)
+
+logger = logging.getLogger(__name__)
+
+JSON = "application/json; charset=utf-8"
+NDJSON = "application/x-ndjson; charset=utf-8"
+
+_servicio: Optional[Servicio] = None
+
+def instalar(servicio: Servicio) -> None:
+    """Asigna el Servicio que usan las vistas (una vez, al arrancar)."""
+    global _servicio
+    _servicio = servicio
+
+class NoEncontrado(Exception):
+    pass
+
+class Conflicto(Exception):
+    pass
+
+# --- Utilidades ---
+
+def _respuesta(datos: Any, status: int = 200) -> HttpResponse:
+    return HttpResponse(a_json(datos), content_type=JSON, status=status)
+
+def _error(mensaje: str, status: int) -> HttpResponse:
+    return _respuesta({"error": mensaje}, status)
+
+def _cuerpo(request: HttpRequest) -> dict:
+    try:
+        return json.loads(request.body or b"{}")
+    except ValueError:
+        raise ValueError("El cuerpo de la petición no es JSON válido.")
+
+def _entero(valor: Any, nombre: str, requerido: bool = False) -> Optional[int]:
+    if valor in (None, ""):
+        if requerido:
+            raise ValueError(f"Falta '{nombre}'.")
+        return None
+    try:
+        return int(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{nombre}' debe ser un número entero.")
+
+def _ids(valores: Any, nombre: str = "ids") -> List[int]:
+    if valores is None:
+        return []
+    if not isinstance(valores, list):
+        raise ValueError(f"'{nombre}' debe ser una lista de enteros.")
+    return [_entero(v, nombre, requerido=True) for v in valores]
+
+def _numero(valor: Any, nombre: str) -> float:
+    try:
+        numero = float(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"'{nombre}' debe ser un número.")
+    if not math.isfinite(numero):
+        raise ValueError(f"'{nombre}' debe ser un número finito.")
+    return numero
+
+def _api(metodos: tuple):
+    """Método permitido, token opcional y errores como JSON."""
+    def decorador(vista: Callable) -> Callable:
+        @wraps(vista)
+        def envoltura(request: HttpRequest, *args, **kwargs):
+            if request.method not in metodos:
+                respuesta = _error(f"Método {request.method} no permitido.", 405)
+                respuesta["Allow"] = ", ".join(metodos)
+                return respuesta
+            if _servicio.token and request.headers.get("Authorization") != f"Bearer {_servicio.token}":
+                return _error("No autorizado.", 401)
+            try:
+                return vista(request, *args, **kwargs)
+            except NoEncontrado as e:
+                return _error(str(e), 404)
+            except Conflicto as e:
+                return _error(str(e), 409)
+            except ValueError as e:
+                return _error(str(e), 400)
+            except Exception as e:
+                logger.exception("Error en %s %s", request.method, request.path)
+                return _error(str(e), 500)
+        return envoltura
+    return decorador
+
+def _lectura(*tablas: str):
+    """
+    GET condicional: ETag por tokens de cambio de 'tablas' (304 sin tocar los
+    datos) y cuerpo JSON compartido entre clientes con el mismo ETag.
+    """
+    def decorador(producir: Callable[..., Any]) -> Callable:
+        def _etag(request: HttpRequest, *args, **kwargs) -> str:
+            request.etag = _servicio.etag(request.get_full_path(), tablas)
+            return request.etag
+
+        @condition(etag_func=_etag)
+        @wraps(producir)
+        def vista(request: HttpRequest, *args, **kwargs):
+            cuerpo = _servicio.respuestas.obtener(request.etag, lambda: a_json(producir(request, *args, **kwargs)))
+            return HttpResponse(cuerpo, content_type=JSON)
+        return vista
+    return decorador
+
+def _escritura(resultado: Any, status: int = 200) -> HttpResponse:
+    # Lo escrito por el servicio debe verse en el próximo GET (no esperar tokens_ttl)
+    _servicio.invalidar_tokens()
+    return _respuesta(resultado, status)
+
+def _exportar(columnas, filas) -> StreamingHttpResponse:
+    """Una línea JSON con las columnas y luego una por fila (el cliente la lee en streaming)."""
+    def _lineas():
+        yield a_json(columnas) + b"\n"
+        for fila in filas:
+            yield a_json(list(fila)) + b"\n"
+    return StreamingHttpResponse(_lineas(), content_type=NDJSON)
+
+# --- Catálogos y tokens ---
+
+@_api(("GET",))
+@_lectura("TiposVehiculo")
+def tipos(request):
+    return [tipo_a_dict(t) for t in _servicio.obtener_tipos.execute()]
+
+@_api(("GET",))
+@_lectura("EstadosVehiculo")
+def estados(request):
+    return [estado_a_dict(e) for e in _servicio.obtener_estados.execute()]
+
+@_api(("GET",))
+def tokens(request):
+    tablas = [t for t in request.GET.get("tablas", "").split(",") if t]
+    return _respuesta({tabla: list(token) for tabla, token in _servicio.tokens(tablas).items()})
+
+@_api(("GET",))
+def estado_servicio(request):
+    return _respuesta(_servicio.stats())
+
+# --- Clientes ---
+
+@_lectura("Clientes")
+def _listar_clientes(request):
+    if "buscar" in request.GET:
+        clientes = _servicio.buscar_clientes.execute(request.GET["buscar"])
+    elif "dni" in request.GET:
+        cliente = _servicio.cliente_repo.get_by_dni(request.GET["dni"])
+        clientes = [cliente] if cliente else []
+    elif "limit" in request.GET:
+        clientes = _servicio.obtener_pagina_clientes.execute(_entero(request.GET.get("offset"), "offset") or 0,
+                                                             _entero(request.GET["limit"], "limit"))
+    else:
+        clientes = _servicio.obtener_clientes.execute()
+    return [cliente_a_dict(c) for c in clientes]
+
+@_api(("GET", "POST"))
+def clientes(request):
+    if request.method == "POST":
+        if not _servicio.guardar_cliente.execute(dict_a_cliente(_cuerpo(request))):
+            raise Conflicto("No se pudo guardar el cliente (¿DNI duplicado?).")
+        return _escritura({"ok": True})
+    return _listar_clientes(request)
+
+@_lectura("Clientes")
+def _leer_cliente(request, cliente_id: int):
+    cliente = _servicio.cliente_repo.get_by_id(cliente_id)
+    if cliente is None:
+        raise NoEncontrado(f"Cliente {cliente_id} no encontrado.")
+    return cliente_a_dict(cliente)
+
+@_api(("GET", "DELETE"))
+def cliente(request, cliente_id: int):
+    if request.method == "DELETE":
+        if not _servicio.eliminar_cliente.execute(cliente_id):
+            raise Conflicto(f"No se pudo eliminar el cliente {cliente_id}.")
+        return _escritura({"ok": True})
+    return _leer_cliente(request, cliente_id)
+
+@_api(("POST",))
+def clientes_lote(request):
+    ids = _ids(_cuerpo(request).get("ids"))
+    return _respuesta([cliente_a_dict(c) for c in _servicio.cliente_repo.get_many(ids).values()])
+
+@_api(("POST",))
+def clientes_existentes(request):
+    return _respuesta(sorted(_servicio.cliente_repo.existing_dnis(_cuerpo(request).get("dnis", []))))
+
+@_api(("POST",))
+def clientes_insertar(request):
+    filas = [tuple(f) for f in _cuerpo(request).get("filas", [])]
+    return _escritura({"insertadas": _servicio.cliente_repo.insert_many(filas)})
+
+@_api(("GET",))
+def clientes_exportar(request):
+    return _exportar(*_servicio.cliente_repo.iter_export(request.GET.get("buscar", "")))
+
+# --- Vehículos ---
+
+@_lectura(*Servicio.TABLAS_FLOTA)
+def _listar_vehiculos(request):
+    mapa_tipos, mapa_estados = _servicio.catalogos()
+    if "buscar" in request.GET or "estado_id" in request.GET:
+        vehiculos = _servicio.buscar_vehiculos.execute(request.GET.get("buscar", ""), _entero(request.GET.get("estado_id"), "estado_id"),
+                                                       mapa_tipos, mapa_estados)
+    else:
+        vehiculos = _servicio.obtener_vehiculos.execute(mapa_tipos, mapa_estados)
+    return [vehiculo_a_dict(v) for v in vehiculos]
+
+@_api(("GET", "POST"))
+def vehiculos(request):
+    if request.method == "POST":
+        vehiculo = dict_a_vehiculo(_cuerpo(request), *_servicio.catalogos())
+        if not _servicio.guardar_vehiculo.execute(vehiculo):
+            raise Conflicto("No se pudo guardar el vehículo (¿placa duplicada?).")
+        return _escritura({"ok": True})
+    return _listar_vehiculos(request)
+
+@_lectura(*Servicio.TABLAS_FLOTA)
+def _leer_vehiculo(request, vehiculo_id: int):
+    vehiculo = _servicio.vehiculo_repo.get_by_id(vehiculo_id, *_servicio.catalogos())
+    if vehiculo is None:
+        raise NoEncontrado(f"Vehículo {vehiculo_id} no encontrado.")
+    return vehiculo_a_dict(vehiculo)
+
+@_api(("GET", "DELETE"))
+def vehiculo(request, vehiculo_id: int):
+    if request.method == "DELETE":
+        if not _servicio.eliminar_vehiculo.execute(vehiculo_id):
+            raise Conflicto(f"No se pudo eliminar el vehículo {vehiculo_id}.")
+        return _escritura({"ok": True})
+    return _leer_vehiculo(request, vehiculo_id)
+
+@_api(("POST",))
+def vehiculos_lote(request):
+    datos = _cuerpo(request)
+    ids = _ids(datos.get("ids"))
+    if datos.get("recargar"):
+        encontrados = _servicio.recargar_vehiculos.execute(ids, *_servicio.catalogos())
+    else:
+        encontrados = _servicio.vehiculo_repo.get_many(ids, *_servicio.catalogos())
+    return _respuesta([vehiculo_a_dict(v) for v in encontrados.values()])
+
+@_api(("POST",))
+def vehiculos_precios(request):
+    datos = _cuerpo(request)
+    # El cliente envía el factor (IVehiculoRepository.bulk_update_price); las
+    # reglas del ajuste están en el caso de uso, que recibe el porcentaje
+    porcentaje = round((_numero(datos.get("factor"), "factor") - 1) * 100, 9)
+    marca = datos.get("marca")
+    ids = _servicio.ajustar_precios.execute(
+        porcentaje, _entero(datos.get("tipo_id"), "tipo_id"), _entero(datos.get("anio_desde"), "anio_desde"),
+        _entero(datos.get("anio_hasta"), "anio_hasta"), str(marca) if marca is not None else None
+    )
+    return _escritura({"ids": ids})
+
+@_api(("POST",))
+def vehiculos_estado(request):
+    datos = _cuerpo(request)
+    ids = _servicio.cambiar_estado.execute(
+        _ids(datos.get("ids")), _entero(datos.get("estado_id"), "estado_id", requerido=True),
+        _entero(datos.get("estado_origen_id"), "estado_origen_id")
+    )
+    return _escritura({"ids": ids})
+
+@_api(("POST",))
+def vehiculos_existentes(request):
+    return _respuesta(sorted(_servicio.vehiculo_repo.existing_placas(_cuerpo(request).get("placas", []))))
+
+@_api(("POST",))
+def vehiculos_insertar(request):
+    filas = [tuple(f) for f in _cuerpo(request).get("filas", [])]
+    return _escritura({"insertadas": _servicio.vehiculo_repo.insert_many(filas)})
+
+@_api(("GET",))
+def vehiculos_exportar(request):
+    return _exportar(*_servicio.vehiculo_repo.iter_export(request.GET.get("buscar", ""), _entero(request.GET.get("estado_id"), "estado_id")))
+
+# --- Reservas ---
+
+@_lectura("Reservas")
+def _listar_reservas(request):
+    desde = request.GET.get("desde")
+    return [reserva_a_dict(r) for r in _servicio.reserva_repo.get_activas(date.fromisoformat(desde) if desde else None)]
+
+@_api(("GET", "POST"))
+def reservas(request):
+    if request.method == "POST":
+        reserva_id = _servicio.reserva_repo.create(dict_a_reserva(_cuerpo(request)))
+        if reserva_id is None:
+            raise Conflicto("El vehículo ya está reservado en esas fechas.")
+        return _escritura({"id": reserva_id}, 201)
+    return _listar_reservas(request)
+
+@_lectura("Reservas")
+def _leer_reserva(request, reserva_id: int):
+    reserva = _servicio.reserva_repo.get_by_id(reserva_id)
+    if reserva is None:
+        raise NoEncontrado(f"Reserva {reserva_id} no encontrada.")
+    return reserva_a_dict(reserva)
+
+@_api(("GET",))
+def reserva(request, reserva_id: int):
+    return _leer_reserva(request, reserva_id)
+
+@_api(("POST",))
+def reserva_cancelar(request, reserva_id: int):
+    return _escritura({"ok": _servicio.reserva_repo.cancel(reserva_id)})
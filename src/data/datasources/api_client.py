@@ -0,0 +1,165 @@
+# src/data/datasources/api_client.py
+#
+# Capa de Datos (DataSource).
+# Cliente del servicio HTTP/JSON (src/api), con la biblioteca estándar
+# (urllib): los mostradores no necesitan Django ni el driver de la BD.
+#
+# Los GET guardan el ETag y el cuerpo de cada URL y se reenvían con
+# If-None-Match: si nada cambió, el servidor responde 304 sin cuerpo y se
+# reutiliza lo ya descargado. Misma interfaz de errores y caché que los
+# DataSource de BD (on_error, cache_stats, close) para que main.py los trate igual.
+
+import json
+import logging
+import threading
+import urllib.error
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, Optional, Tuple
+from src.data.datasources.errores import DataSourceError, ManejadorErrores
+from src.utils.consultas import contado
+from src.utils.tracing import trazado
+
+logger = logging.getLogger(__name__)
+
+class ApiError(DataSourceError):
+    """Respuesta de error del servicio (status HTTP y mensaje)."""
+    def __init__(self, status: int, mensaje: str):
+        super().__init__(mensaje)
+        self.status = status
+
+class ApiClient:
+
+    dialect = "http"
+
+    def __init__(self, base_url: str, token: Optional[str] = None, timeout: float = 30.0, max_entradas: int = 256):
+        """
+        Args:
+            base_url: URL del servicio (ej. http://servidor:8000).
+            token: Token del servicio (API_TOKEN), si lo exige.
+            timeout: Segundos por petición.
+            max_entradas: URLs con ETag que se recuerdan (LRU).
+        """
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.max_entradas = max_entradas
+        self.on_error: ManejadorErrores = None
+        self._etags: "OrderedDict[str, Tuple[str, Any, int]]" = OrderedDict() # url -> (ETag, datos, bytes)
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0    # 304: datos reutilizados
+        self.misses = 0  # 200: datos descargados
+        self.evictions = 0
+
+    def _report_error(self, title: str, message: str):
+        """Registra el error y avisa al gancho 'on_error', si la UI asignó uno."""
+        logger.error("%s: %s", title, message)
+        if self.on_error is not None:
+            try:
+                self.on_error(title, message)
+            except Exception:
+                logger.exception("Fallo el manejador de errores del cliente HTTP")
+
+    # --- Peticiones ---
+
+    def _url(self, ruta: str, params: Optional[Dict[str, Any]] = None) -> str:
+        url = f"{self.base_url}/{ruta.lstrip('/')}"
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        return f"{url}?{urllib.parse.urlencode(params)}" if params else url
+
+    def _abrir(self, metodo: str, url: str, cuerpo: Any = None, encabezados: Optional[Dict[str, str]] = None):
+        datos = json.dumps(cuerpo).encode("utf-8") if cuerpo is not None else None
+        peticion = urllib.request.Request(url, data=datos, method=metodo, headers={"Accept": "application/json", **(encabezados or {})})
+        if datos is not None:
+            peticion.add_header("Content-Type", "application/json")
+        if self.token:
+            peticion.add_header("Authorization", f"Bearer {self.token}")
+        try:
+            return urllib.request.urlopen(peticion, timeout=self.timeout)
+        except urllib.error.HTTPError as e:
+            if e.code == 304:
+                return e # Lo resuelve get()
+            try:
+                mensaje = json.loads(e.read()).get("error") or e.reason
+            except ValueError:
+                mensaje = e.reason
+            raise ApiError(e.code, str(mensaje)) from e
+        except (urllib.error.URLError, OSError) as e:
+            raise DataSourceError(f"No se pudo conectar con el servicio {self.base_url}: {e}") from e
+
+    @trazado("http", argumentos=lambda _cliente, ruta, params=None: {"ruta": ruta})
+    @contado(lambda _cliente, ruta, params=None: f"GET {ruta}")
+    def get(self, ruta: str, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET condicional. Los datos retornados se comparten entre llamadas: no modificarlos."""
+        url = self._url(ruta, params)
+        with self._lock:
+            guardado = self._etags.get(url)
+        respuesta = self._abrir("GET", url, encabezados={"If-None-Match": guardado[0]} if guardado else None)
+        with respuesta:
+            if respuesta.status == 304 and guardado:
+                with self._lock:
+                    self._etags.move_to_end(url)
+                    self.hits += 1
+                return guardado[1]
+            cuerpo = respuesta.read()
+            etag = respuesta.headers.get("ETag")
+        datos = json.loads(cuerpo)
+        with self._lock:
+            self.misses += 1
+            if etag:
+                anterior = self._etags.pop(url, None)
+                if anterior: self._bytes -= anterior[2]
+                self._etags[url] = (etag, datos, len(cuerpo))
+                self._bytes += len(cuerpo)
+                while len(self._etags) > self.max_entradas:
+                    _, (_, _, tamano) = self._etags.popitem(last=False)
+                    self._bytes -= tamano
+                    self.evictions += 1
+        return datos
+
+    @trazado("http", argumentos=lambda _cliente, metodo, ruta, *_a, **_k: {"metodo": metodo, "ruta": ruta})
+    @contado(lambda _cliente, metodo, ruta, *_a, **_k: f"{metodo} {ruta}")
+    def enviar(self, metodo: str, ruta: str, cuerpo: Any = None, reportar: bool = False) -> Any:
+        """
+        POST/DELETE; retorna el JSON de la respuesta. Lanza ApiError/DataSourceError,
+        salvo con 'reportar': entonces registra el error y retorna None (como
+        execute_non_query de los DataSource de BD).
+        """
+        try:
+            with self._abrir(metodo, self._url(ruta), cuerpo if cuerpo is not None else {}) as respuesta:
+                return json.loads(respuesta.read() or b"null")
+        except DataSourceError as e:
+            if not reportar:
+                raise
+            self._report_error("Error de Operación", str(e))
+            return None
+
+    @contado(lambda _cliente, ruta, params=None: f"GET {ruta}")
+    def iter_lineas(self, ruta: str, params: Optional[Dict[str, Any]] = None) -> Iterator[Any]:
+        """Recorre una respuesta NDJSON (una línea JSON por fila) sin cargarla entera."""
+        with self._abrir("GET", self._url(ruta, params)) as respuesta:
+            for linea in respuesta:
+                if linea.strip():
+                    yield json.loads(linea)
+
+    # --- Misma interfaz que los DataSource de BD ---
+
+    def enable_cache(self, max_bytes: int = 0):
+        """La caché de consultas vive en el servicio; aquí solo se guardan los ETag."""
+
+    def invalidate_cache(self, tablas=None):
+        with self._lock:
+            self._etags.clear()
+            self._bytes = 0
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        """Mismas claves que QueryCache.stats(); un acierto es un 304."""
+        with self._lock:
+            total = self.hits + self.misses
+            return {"entries": len(self._etags), "bytes": self._bytes, "hits": self.hits, "misses": self.misses,
+                    "hit_rate": self.hits / total if total else 0.0, "evictions": self.evictions}
+
+    def close(self):
+        self.invalidate_cache()
@@ -0,0 +1,15 @@
+# src/data/datasources/errores.py
+#
+# Capa de Datos (DataSource).
+# Errores de acceso a datos, independientes de la interfaz: el DataSource
+# lanza DataSourceError (conexión, streaming, lotes) o registra el fallo con
+# logging y retorna None/False (consultas sueltas). La UI decide si además lo
+# muestra en un diálogo (ver el atributo 'on_error' de los DataSource).
+
+from typing import Callable, Optional
+
+class DataSourceError(Exception):
+    """Fallo de conexión o de ejecución en la base de datos."""
+
+# on_error(titulo, mensaje): gancho opcional para mostrar el error al usuario
+ManejadorErrores = Optional[Callable[[str, str], None]]
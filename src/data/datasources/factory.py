@@ -0,0 +1,28 @@
+# src/data/datasources/factory.py
+#
+# Capa de Datos (DataSource).
+# Elige el DataSource según DB_ENGINE: "sqlserver" (por defecto) o "sqlite"
+# (SQLiteDataSource local; DB_NAME es la ruta del archivo o ":memory:").
+# Los módulos se importan aquí dentro para no cargar el driver que no se usa.
+# Con DB_RECORD=<ruta> el DataSource queda envuelto en un DataSourceGrabador
+# que graba cada consulta (ver grabacion.py y "python cli.py reproducir").
+
+import os
+
+MOTORES = ("sqlserver", "sqlite")
+
+def crear_datasource(server: str, database: str, username: str = None, password: str = None, motor: str = None):
+    motor = (motor or os.environ.get("DB_ENGINE") or "sqlserver").lower()
+    if motor == "sqlite":
+        from src.data.datasources.sqlite_datasource import SQLiteDataSource
+        datasource = SQLiteDataSource.get_instance(database)
+    elif motor == "sqlserver":
+        from src.data.datasources.sql_server_datasource import SQLServerDataSource
+        datasource = SQLServerDataSource.get_instance(server=server, database=database, username=username, password=password)
+    else:
+        raise ValueError(f"DB_ENGINE inválido: '{motor}' (use {' o '.join(MOTORES)}).")
+    grabacion = os.environ.get("DB_RECORD")
+    if grabacion:
+        from src.data.datasources.grabacion import grabar
+        datasource = grabar(datasource, grabacion)
+    return datasource
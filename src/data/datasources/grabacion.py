@@ -0,0 +1,263 @@
+# src/data/datasources/grabacion.py
+#
+# Capa de Datos (DataSource).
+# Grabación de la carga de consultas real de un mostrador: DataSourceGrabador
+# envuelve cualquier DataSource (SQL Server o SQLite) y escribe cada llamada
+# execute_* / iter_query con su SQL, parámetros, duración y filas. La
+# grabación se reproduce después con reproduccion.py (python cli.py reproducir).
+#
+# Se activa con DB_RECORD=<ruta> (ver factory.py). Formato: JSON Lines,
+# comprimido con gzip si la ruta termina en ".gz". Cada SQL distinto se
+# escribe una sola vez y los eventos lo referencian por número:
+#
+#   {"formato": "driveflow-grabacion", "version": 1, "dialecto": "mssql", "inicio": "..."}
+#   {"s": 0, "sql": "SELECT ... WHERE EstadoID = ?"}
+#   {"t": 12.3041, "s": 0, "op": "q", "p": [1], "ms": 3.412, "n": 120, "h": 1}
+#
+# 't' son segundos desde el inicio, 'h' el hilo que la emitió y 'e' marca un
+# error. La grabación se ubica antes de la caché: registra lo que pidió la
+# aplicación, no lo que llegó al servidor, para que la reproducción pueda
+# evaluar otra configuración de caché.
+
+import atexit
+import base64
+import gzip
+import json
+import logging
+import threading
+import time
+from datetime import date, datetime, time as hora
+from decimal import Decimal
+from typing import Any, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+FORMATO = "driveflow-grabacion"
+VERSION = 1
+
+# Código de operación -> método del DataSource
+OPERACIONES = {
+    "q": "execute_query",
+    "it": "iter_query",
+    "n": "execute_non_query",
+    "i": "execute_insert",
+    "m": "execute_many",
+    "r": "execute_returning",
+}
+LECTURAS = ("q", "it")
+
+# --- Codificación de parámetros ---
+
+def _codificar(valor: Any) -> Any:
+    """Tipos de parámetro que JSON no representa, marcados para decodificarlos igual."""
+    if isinstance(valor, datetime):
+        return {"$dt": valor.isoformat()}
+    if isinstance(valor, date):
+        return {"$d": valor.isoformat()}
+    if isinstance(valor, hora):
+        return {"$t": valor.isoformat()}
+    if isinstance(valor, Decimal):
+        return {"$dec": str(valor)}
+    if isinstance(valor, (bytes, bytearray, memoryview)):
+        return {"$b": base64.b64encode(bytes(valor)).decode("ascii")}
+    return str(valor)
+
+def _decodificar(valor: Any) -> Any:
+    if isinstance(valor, list):
+        return [_decodificar(v) for v in valor]
+    if isinstance(valor, dict) and len(valor) == 1:
+        (marca, texto), = valor.items()
+        if marca == "$dt": return datetime.fromisoformat(texto)
+        if marca == "$d": return date.fromisoformat(texto)
+        if marca == "$t": return hora.fromisoformat(texto)
+        if marca == "$dec": return Decimal(texto)
+        if marca == "$b": return base64.b64decode(texto)
+    return valor
+
+def _params(params) -> Optional[list]:
+    if params is None:
+        return None
+    return [list(p) if isinstance(p, (list, tuple)) else p for p in params]
+
+def _abrir(ruta: str, modo: str):
+    if ruta.endswith(".gz"):
+        return gzip.open(ruta, modo + "t", encoding="utf-8")
+    return open(ruta, modo, encoding="utf-8")
+
+# --- Grabación ---
+
+class DataSourceGrabador:
+    """
+    Envuelve un DataSource y graba cada consulta. Todo lo demás (caché,
+    metadatos, on_error, dialect) se delega al DataSource original, así que
+    los repositorios no notan la diferencia.
+    """
+
+    __slots__ = ("_datasource", "_archivo", "_lock", "_sentencias", "_hilos", "_inicio", "ruta", "eventos")
+
+    def __init__(self, datasource, ruta: str):
+        object.__setattr__(self, "_datasource", datasource)
+        object.__setattr__(self, "_archivo", _abrir(ruta, "w"))
+        object.__setattr__(self, "_lock", threading.Lock())
+        object.__setattr__(self, "_sentencias", {})   # SQL -> número
+        object.__setattr__(self, "_hilos", {})        # ident -> número corto
+        object.__setattr__(self, "_inicio", time.perf_counter())
+        object.__setattr__(self, "ruta", ruta)
+        object.__setattr__(self, "eventos", 0)
+        self._escribir({
+            "formato": FORMATO, "version": VERSION,
+            "dialecto": getattr(datasource, "dialect", None),
+            "inicio": datetime.now().isoformat(timespec="seconds"),
+        })
+        atexit.register(self.cerrar_grabacion)
+        logger.info("Grabando las consultas en %s", ruta)
+
+    def __getattr__(self, nombre):
+        return getattr(self._datasource, nombre)
+
+    def __setattr__(self, nombre, valor):
+        # p. ej. datasource.on_error = ... desde la UI
+        setattr(self._datasource, nombre, valor)
+
+    def _escribir(self, registro: Dict[str, Any]) -> None:
+        self._archivo.write(json.dumps(registro, ensure_ascii=False, separators=(",", ":"), default=_codificar))
+        self._archivo.write("\n")
+
+    def _grabar(self, op: str, query: str, params, inicio: float, fin: float, filas: Optional[int],
+                error: bool, **extra) -> None:
+        evento = {
+            "t": round(inicio - self._inicio, 4), "s": None, "op": op, "p": _params(params),
+            "ms": round((fin - inicio) * 1000, 3),
+        }
+        if filas is not None:
+            evento["n"] = filas
+        if error:
+            evento["e"] = 1
+        evento.update(extra)
+        with self._lock:
+            if self._archivo.closed:
+                return
+            numero = self._sentencias.get(query)
+            if numero is None:
+                numero = self._sentencias[query] = len(self._sentencias)
+                self._escribir({"s": numero, "sql": query})
+            evento["s"] = numero
+            evento["h"] = self._hilos.setdefault(threading.get_ident(), len(self._hilos))
+            self._escribir(evento)
+            object.__setattr__(self, "eventos", self.eventos + 1)
+
+    def execute_query(self, query, params=None, cache: bool = True):
+        inicio = time.perf_counter()
+        rows = self._datasource.execute_query(query, params, cache=cache)
+        extra = {} if cache else {"c": 0}
+        self._grabar("q", query, params, inicio, time.perf_counter(),
+                     len(rows) if rows is not None else None, rows is None, **extra)
+        return rows
+
+    def iter_query(self, query, params=None, batch_size: int = 1000):
+        # Solo cuenta el tiempo dentro del DataSource, no el del consumidor
+        filas, ocupado, error = 0, 0.0, True
+        inicio = time.perf_counter()
+        iterador = self._datasource.iter_query(query, params, batch_size=batch_size)
+        try:
+            while True:
+                desde = time.perf_counter()
+                try:
+                    fila = next(iterador)
+                except StopIteration:
+                    ocupado += time.perf_counter() - desde
+                    error = False
+                    break
+                ocupado += time.perf_counter() - desde
+                filas += 1
+                yield fila
+        finally:
+            self._grabar("it", query, params, inicio, inicio + ocupado, filas, error, b=batch_size)
+
+    def _escritura(self, op: str, metodo: str, query, params):
+        inicio = time.perf_counter()
+        resultado = getattr(self._datasource, metodo)(query, params)
+        # execute_insert / execute_returning señalan el error con None; execute_non_query, con False
+        error = resultado is None if op in ("i", "r") else resultado is False
+        filas = len(resultado) if op == "r" and resultado is not None else None
+        self._grabar(op, query, params, inicio, time.perf_counter(), filas, error)
+        return resultado
+
+    def execute_non_query(self, query, params=None):
+        return self._escritura("n", "execute_non_query", query, params)
+
+    def execute_insert(self, query, params=None):
+        return self._escritura("i", "execute_insert", query, params)
+
+    def execute_returning(self, query, params=None):
+        return self._escritura("r", "execute_returning", query, params)
+
+    def execute_many(self, query, filas) -> int:
+        filas = [tuple(fila) for fila in filas]
+        inicio = time.perf_counter()
+        try:
+            enviadas = self._datasource.execute_many(query, filas)
+        except Exception:
+            self._grabar("m", query, filas, inicio, time.perf_counter(), len(filas), True)
+            raise
+        self._grabar("m", query, filas, inicio, time.perf_counter(), enviadas, False)
+        return enviadas
+
+    def cerrar_grabacion(self) -> None:
+        with self._lock:
+            if not self._archivo.closed:
+                self._archivo.close()
+                logger.info("Grabación cerrada: %d consultas en %s", self.eventos, self.ruta)
+
+    def close(self):
+        self.cerrar_grabacion()
+        self._datasource.close()
+
+def grabar(datasource, ruta: str) -> DataSourceGrabador:
+    """Envuelve 'datasource' para grabar su carga en 'ruta' (no lo envuelve dos veces)."""
+    if isinstance(datasource, DataSourceGrabador):
+        return datasource
+    return DataSourceGrabador(datasource, ruta)
+
+# --- Lectura ---
+
+class Grabacion:
+    """Contenido de un archivo de grabación: cabecera, SQL por número y eventos en orden."""
+
+    def __init__(self, cabecera: Dict[str, Any], sentencias: Dict[int, str], eventos: list):
+        self.cabecera = cabecera
+        self.sentencias = sentencias
+        self.eventos = eventos
+
+    @property
+    def duracion(self) -> float:
+        return self.eventos[-1]["t"] if self.eventos else 0.0
+
+def _registros(ruta: str) -> Iterator[Dict[str, Any]]:
+    with _abrir(ruta, "r") as archivo:
+        for numero, linea in enumerate(archivo, 1):
+            if not linea.strip():
+                continue
+            try:
+                yield json.loads(linea)
+            except json.JSONDecodeError:
+                # Un cierre abrupto puede dejar la última línea a medias
+                logger.warning("%s: línea %d ilegible, se ignora", ruta, numero)
+
+def leer_grabacion(ruta: str) -> Grabacion:
+    registros = _registros(ruta)
+    cabecera = next(registros, None)
+    if not cabecera or cabecera.get("formato") != FORMATO:
+        raise ValueError(f"'{ruta}' no es una grabación de consultas de DriveFlow.")
+    if cabecera.get("version", 0) > VERSION:
+        raise ValueError(f"Grabación versión {cabecera['version']}; esta versión lee hasta la {VERSION}.")
+    sentencias: Dict[int, str] = {}
+    eventos = []
+    for registro in registros:
+        if "sql" in registro:
+            sentencias[registro["s"]] = registro["sql"]
+        else:
+            registro["p"] = _decodificar(registro.get("p"))
+            eventos.append(registro)
+    eventos.sort(key=lambda e: e["t"])  # Varios hilos pueden escribir fuera de orden
+    return Grabacion(cabecera, sentencias, eventos)
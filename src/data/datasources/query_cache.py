@@ -0,0 +1,136 @@
+# src/data/datasources/query_cache.py
+#
+# Capa de Datos (DataSource).
+# Caché de resultados de consultas SELECT, con clave (SQL, parámetros) y
+# etiquetada con las tablas que lee cada consulta. Cualquier escritura sobre
+# una tabla invalida las entradas que la leen. Presupuesto en bytes con
+# desalojo LRU.
+
+import re
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, Hashable, Iterable, List, Optional, Tuple
+
+_NOMBRE = r"((?:\[?\w+\]?\.)*\[?\w+\]?)"
+_TABLAS_LEIDAS = re.compile(r"\b(?:FROM|JOIN)\s+" + _NOMBRE, re.IGNORECASE)
+_TABLA_ESCRITA = re.compile(
+    r"^\s*(?:INSERT\s+(?:INTO\s+)?|UPDATE\s+|DELETE\s+(?:FROM\s+)?|MERGE\s+(?:INTO\s+)?|TRUNCATE\s+TABLE\s+)" + _NOMBRE,
+    re.IGNORECASE
+)
+
+def _normalizar(nombre: str) -> str:
+    """'dbo.[Clientes]' -> 'clientes'."""
+    return nombre.split(".")[-1].strip("[]").lower()
+
+def tablas_leidas(query: str) -> FrozenSet[str]:
+    """Tablas que aparecen tras FROM/JOIN (incluidas subconsultas)."""
+    return frozenset(_normalizar(nombre) for nombre in _TABLAS_LEIDAS.findall(query))
+
+def tabla_escrita(query: str) -> Optional[str]:
+    """Tabla destino de un INSERT/UPDATE/DELETE/MERGE; None si no se reconoce (p. ej. DDL)."""
+    match = _TABLA_ESCRITA.match(query)
+    return _normalizar(match.group(1)) if match else None
+
+def _estimar_bytes(rows: List[Any]) -> int:
+    total = sys.getsizeof(rows)
+    for row in rows:
+        total += sys.getsizeof(row)
+        for valor in row:
+            total += sys.getsizeof(valor)
+    return total
+
+class QueryCache:
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._entradas: "OrderedDict[Tuple[str, Tuple], Tuple[List[Any], FrozenSet[str], int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        # Se incrementa en cada invalidación: un resultado leído antes de una
+        # escritura concurrente no debe guardarse después de ella.
+        self._generacion = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def clave(query: str, params) -> Optional[Tuple[str, Tuple]]:
+        """Clave de caché; None si los parámetros no son hashables."""
+        params = tuple(params) if params is not None else ()
+        if not all(isinstance(p, Hashable) for p in params):
+            return None
+        return (query, params)
+
+    @property
+    def generacion(self) -> int:
+        return self._generacion
+
+    def get(self, clave: Tuple[str, Tuple]) -> Optional[List[Any]]:
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None:
+                self.misses += 1
+                return None
+            self._entradas.move_to_end(clave)
+            self.hits += 1
+            return list(entrada[0]) # Copia superficial: el llamador puede modificar la lista
+
+    def put(self, clave: Tuple[str, Tuple], rows: List[Any], generacion: int) -> None:
+        tablas = tablas_leidas(clave[0])
+        if not tablas:
+            return # Sin tablas reconocibles no se puede invalidar: no se cachea
+        tamano = _estimar_bytes(rows)
+        if tamano > self.max_bytes:
+            return
+        with self._lock:
+            if generacion != self._generacion:
+                return
+            anterior = self._entradas.pop(clave, None)
+            if anterior is not None:
+                self._bytes -= anterior[2]
+            self._entradas[clave] = (list(rows), tablas, tamano)
+            self._bytes += tamano
+            while self._bytes > self.max_bytes:
+                _, (_, _, liberado) = self._entradas.popitem(last=False)
+                self._bytes -= liberado
+                self.evictions += 1
+
+    def invalidate(self, tablas: Optional[Iterable[str]] = None) -> int:
+        """
+        Elimina las entradas que leen alguna de las tablas (todas si es None).
+        Retorna la cantidad de entradas eliminadas.
+        """
+        with self._lock:
+            self._generacion += 1
+            if tablas is None:
+                eliminadas = len(self._entradas)
+                self._entradas.clear()
+                self._bytes = 0
+            else:
+                objetivo = {_normalizar(t) for t in tablas}
+                claves = [c for c, (_, leidas, _) in self._entradas.items() if leidas & objetivo]
+                for c in claves:
+                    self._bytes -= self._entradas.pop(c)[2]
+                eliminadas = len(claves)
+            self.invalidations += eliminadas
+            return eliminadas
+
+    def invalidate_for_write(self, query: str) -> None:
+        """Invalida según la sentencia de escritura; si no se reconoce, vacía todo."""
+        tabla = tabla_escrita(query)
+        self.invalidate([tabla] if tabla else None)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            consultas = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / consultas if consultas else 0.0,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entradas),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes
+            }
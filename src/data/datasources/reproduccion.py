@@ -0,0 +1,196 @@
+# src/data/datasources/reproduccion.py
+#
+# Capa de Datos (DataSource).
+# Reproduce una grabación (ver grabacion.py) contra cualquier DataSource para
+# medir el efecto de un cambio de caché, índices o tamaño del pool con la
+# carga real de los mostradores:
+#
+#   velocidad  1 = ritmo original, 10 = diez veces más rápido, 0 = sin esperas.
+#   hilos      cuántas consultas pueden estar en vuelo a la vez. Con 1 el
+#              orden es exactamente el grabado.
+#
+# Por defecto solo se reproducen las lecturas: las escrituras cambian la base
+# de destino y solo deben repetirse contra una copia (con_escrituras=True).
+# Las latencias se agregan por operación y por sentencia (percentiles e
+# histograma), junto a las originales de la grabación.
+
+import hashlib
+import logging
+import math
+import queue
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from src.data.datasources.grabacion import LECTURAS, OPERACIONES, Grabacion
+
+logger = logging.getLogger(__name__)
+
+# Límites superiores (ms) de las columnas del histograma; la última es "más"
+CUBETAS_MS = [0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000]
+
+def clave_sentencia(sql: str) -> str:
+    """Identificador estable de una sentencia entre grabaciones distintas."""
+    return hashlib.sha1(" ".join(sql.split()).encode("utf-8")).hexdigest()[:12]
+
+def _percentil(ordenados: List[float], p: float) -> float:
+    """Percentil por rango más cercano sobre una lista ya ordenada."""
+    if not ordenados:
+        return 0.0
+    indice = max(0, min(len(ordenados) - 1, math.ceil(p / 100 * len(ordenados)) - 1))
+    return ordenados[indice]
+
+def distribucion(latencias: List[float]) -> Dict[str, Any]:
+    ordenados = sorted(latencias)
+    if not ordenados:
+        return {"n": 0}
+    histograma = [0] * (len(CUBETAS_MS) + 1)
+    cubeta = 0
+    for valor in ordenados:
+        while cubeta < len(CUBETAS_MS) and valor > CUBETAS_MS[cubeta]:
+            cubeta += 1
+        histograma[cubeta] += 1
+    return {
+        "n": len(ordenados),
+        "media_ms": round(sum(ordenados) / len(ordenados), 3),
+        "p50_ms": round(_percentil(ordenados, 50), 3),
+        "p90_ms": round(_percentil(ordenados, 90), 3),
+        "p99_ms": round(_percentil(ordenados, 99), 3),
+        "max_ms": round(ordenados[-1], 3),
+        "histograma": histograma,
+    }
+
+def _ejecutar(datasource, evento: Dict[str, Any], sql: str) -> bool:
+    """Repite un evento; retorna False si el DataSource reportó un error."""
+    op, params = evento["op"], evento.get("p")
+    if op == "q":
+        return datasource.execute_query(sql, params, cache=bool(evento.get("c", 1))) is not None
+    if op == "it":
+        for _ in datasource.iter_query(sql, params, batch_size=evento.get("b", 1000)):
+            pass
+        return True
+    if op == "m":
+        datasource.execute_many(sql, params or [])
+        return True
+    resultado = getattr(datasource, OPERACIONES[op])(sql, params)
+    return resultado is not None if op in ("i", "r") else resultado is not False
+
+class _Medicion:
+    """Latencias y errores acumulados por los hilos de la reproducción."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.por_sentencia: Dict[int, List[float]] = {}
+        self.por_operacion: Dict[str, List[float]] = {}
+        self.retrasos: List[float] = []
+        self.errores: Dict[int, int] = {}
+
+    def agregar(self, evento: Dict[str, Any], ms: float, retraso_ms: float, ok: bool) -> None:
+        with self.lock:
+            self.por_sentencia.setdefault(evento["s"], []).append(ms)
+            self.por_operacion.setdefault(evento["op"], []).append(ms)
+            self.retrasos.append(retraso_ms)
+            if not ok:
+                self.errores[evento["s"]] = self.errores.get(evento["s"], 0) + 1
+
+def reproducir(datasource, grabacion: Grabacion, velocidad: float = 1.0, hilos: int = 1,
+               con_escrituras: bool = False, limite: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Repite los eventos de 'grabacion' contra 'datasource' y retorna el
+    informe (serializable a JSON). 'retraso' mide cuánto después de su
+    momento programado empezó cada consulta: si crece, los hilos no dan abasto.
+    """
+    eventos = [e for e in grabacion.eventos if con_escrituras or e["op"] in LECTURAS]
+    omitidas = len(grabacion.eventos) - len(eventos)
+    if limite is not None:
+        eventos = eventos[:limite]
+    medicion = _Medicion()
+    cola: "queue.Queue[Optional[tuple]]" = queue.Queue(maxsize=max(1, hilos) * 4)
+
+    def trabajador():
+        while True:
+            item = cola.get()
+            if item is None:
+                return
+            evento, programado = item
+            inicio = time.perf_counter()
+            try:
+                ok = _ejecutar(datasource, evento, grabacion.sentencias[evento["s"]])
+            except Exception as e:
+                logger.debug("Reproducción: falló la sentencia %s: %s", evento["s"], e)
+                ok = False
+            fin = time.perf_counter()
+            medicion.agregar(evento, (fin - inicio) * 1000, max(0.0, inicio - programado) * 1000, ok)
+
+    trabajadores = [threading.Thread(target=trabajador, name=f"reproduccion-{i}", daemon=True)
+                    for i in range(max(1, hilos))]
+    for hilo in trabajadores:
+        hilo.start()
+
+    logger.info("Reproduciendo %d consultas (%d escrituras omitidas), velocidad %s, %d hilo(s)",
+                len(eventos), omitidas, velocidad or "máxima", len(trabajadores))
+    inicio = time.perf_counter()
+    origen = eventos[0]["t"] if eventos else 0.0
+    for evento in eventos:
+        programado = inicio + (evento["t"] - origen) / velocidad if velocidad else time.perf_counter()
+        espera = programado - time.perf_counter()
+        if espera > 0:
+            time.sleep(espera)
+        cola.put((evento, programado))
+    for _ in trabajadores:
+        cola.put(None)
+    for hilo in trabajadores:
+        hilo.join()
+    segundos = time.perf_counter() - inicio
+
+    original_por_sentencia: Dict[int, List[float]] = {}
+    for evento in eventos:
+        original_por_sentencia.setdefault(evento["s"], []).append(evento["ms"])
+
+    sentencias = {}
+    for numero, latencias in medicion.por_sentencia.items():
+        sql = grabacion.sentencias[numero]
+        sentencias[clave_sentencia(sql)] = {
+            "sql": " ".join(sql.split())[:200],
+            "errores": medicion.errores.get(numero, 0),
+            "total_ms": round(sum(latencias), 3),
+            "reproduccion": distribucion(latencias),
+            "original": distribucion(original_por_sentencia.get(numero, [])),
+        }
+    todas = [ms for latencias in medicion.por_operacion.values() for ms in latencias]
+    return {
+        "grabacion": {"dialecto": grabacion.cabecera.get("dialecto"), "inicio": grabacion.cabecera.get("inicio"),
+                      "eventos": len(grabacion.eventos), "duracion_s": round(grabacion.duracion, 3)},
+        "parametros": {"velocidad": velocidad, "hilos": len(trabajadores), "con_escrituras": con_escrituras,
+                       "dialecto": getattr(datasource, "dialect", None)},
+        "segundos": round(segundos, 3),
+        "consultas": len(todas),
+        "omitidas": omitidas,
+        "errores": sum(medicion.errores.values()),
+        "total": distribucion(todas),
+        "original": distribucion([e["ms"] for e in eventos]),
+        "retraso": distribucion(medicion.retrasos),
+        "operaciones": {OPERACIONES[op]: distribucion(latencias) for op, latencias in medicion.por_operacion.items()},
+        "sentencias": dict(sorted(sentencias.items(), key=lambda par: -par[1]["total_ms"])),
+    }
+
+def comparar(actual: Dict[str, Any], base: Dict[str, Any], umbral: float = 0.20,
+             metrica: str = "p50_ms") -> List[Dict[str, Any]]:
+    """
+    Compara dos informes sentencia por sentencia (y el total). Retorna una
+    fila por sentencia presente en ambos, con 'regresion' si la métrica
+    empeoró más que 'umbral'.
+    """
+    filas = []
+    pares = [("(total)", "", actual.get("total", {}), base.get("total", {}))]
+    for clave, sentencia in actual.get("sentencias", {}).items():
+        anterior = base.get("sentencias", {}).get(clave)
+        if anterior:
+            pares.append((clave, sentencia["sql"], sentencia["reproduccion"], anterior["reproduccion"]))
+    for clave, sql, ahora, antes in pares:
+        if metrica not in ahora or metrica not in antes:
+            continue
+        cambio = ahora[metrica] / antes[metrica] - 1 if antes[metrica] else 0.0
+        filas.append({"clave": clave, "sql": sql, "base": antes[metrica], "actual": ahora[metrica],
+                      "cambio": cambio, "regresion": cambio > umbral})
+    return filas
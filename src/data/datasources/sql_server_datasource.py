@@ -2,41 +2,80 @@
 #
 # Capa de Datos (DataSource).
 # Implementación concreta del acceso a la base de datos (SQL Server).
-# Implementa el patrón Singleton para asegurar una única conexión.
+# Implementa el patrón Singleton para asegurar un único punto de acceso.
+# Internamente mantiene un pequeño pool de conexiones para que la carga
+# en segundo plano pueda ejecutar consultas en paralelo (pyodbc no permite
+# compartir una conexión entre hilos de forma segura).
 
-import pyodbc
-from tkinter import messagebox
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterable, Optional
+from src.data.datasources.errores import DataSourceError, ManejadorErrores
+from src.data.datasources.query_cache import QueryCache
+from src.utils.consultas import contado
+from src.utils.tracing import args_sql, instante, span, trazado
+
+logger = logging.getLogger(__name__)
+
+# El driver se importa al conectar (ver _load_driver): es de los módulos más
+# pesados del arranque y la ventana principal no lo necesita para mostrarse.
+pyodbc = None
+
+def _load_driver():
+    global pyodbc
+    if pyodbc is None:
+        import pyodbc as _pyodbc
+        pyodbc = _pyodbc
+    return pyodbc
 
 class SQLServerDataSource:
-    
+
+    dialect = "mssql"
+
     _instance = None
-    
+    _instance_lock = threading.Lock()
+
     @classmethod
     def get_instance(cls, server: str, database: str, username: str = None, password: str = None):
         """
         Método estático para obtener la instancia única (Singleton).
+        Es seguro llamarlo desde un hilo en segundo plano.
         """
-        if cls._instance is None:
-            # Si no existe instancia, crea una nueva pasándole los parámetros.
-            cls._instance = cls(
-                server=server,
-                database=database,
-                username=username,
-                password=password
-            )
+        with cls._instance_lock:
+            if cls._instance is None:
+                # Si no existe instancia, crea una nueva pasándole los parámetros.
+                cls._instance = cls(
+                    server=server,
+                    database=database,
+                    username=username,
+                    password=password
+                )
         return cls._instance
 
-    def __init__(self, server: str, database: str, username: str = None, password: str = None):
+    def __init__(self, server: str, database: str, username: str = None, password: str = None, pool_size: int = 4):
         """
         Constructor privado. Es llamado solo por get_instance() la primera vez.
         """
         if SQLServerDataSource._instance is not None:
             raise Exception("Esta clase es un Singleton. Use get_instance().")
-        
-        self.connection = None
-        self.cursor = None
+
         self.sql_driver = None
-        
+        self._connection_string = None
+
+        # Pool de conexiones
+        self._pool_size = max(1, pool_size)
+        self._idle = []          # Conexiones libres (LIFO: la última usada sigue "caliente")
+        self._total = 0          # Conexiones abiertas (libres + en uso)
+        self._pool_cond = threading.Condition()
+        self._closed = False
+
+        # Caché de resultados (opcional, ver enable_cache)
+        self._cache: Optional[QueryCache] = None
+
+        # Gancho para mostrar errores al usuario (la UI lo asigna; en la CLI solo se registran)
+        self.on_error: ManejadorErrores = None
+
         # Conectar usando los parámetros recibidos
         self._connect(server, database, username, password)
 
@@ -44,23 +83,24 @@ class SQLServerDataSource:
         """
         Establece la conexión con la base de datos SQL Server.
         """
+        _load_driver()
         try:
             available_drivers = pyodbc.drivers()
             preferred_drivers = [
                 "ODBC Driver 18 for SQL Server",
-                "ODBC Driver 17 for SQL Server", 
+                "ODBC Driver 17 for SQL Server",
                 "ODBC Driver 13 for SQL Server",
                 "SQL Server"
             ]
-            
+
             for driver in preferred_drivers:
                 if driver in available_drivers:
                     self.sql_driver = driver
                     break
-            
+
             if not self.sql_driver:
                 raise Exception("No se encontró ningún driver SQL Server compatible (ej. ODBC Driver 17/18).")
-            
+
             # Construir cadena de conexión
             if username and password:
                 connection_string = (
@@ -69,7 +109,7 @@ class SQLServerDataSource:
                     f"DATABASE={database};"
                     f"UID={username};"
                     f"PWD={password};"
-                    f"TrustServerCertificate=yes;" 
+                    f"TrustServerCertificate=yes;"
                 )
             else:
                 # Autenticación de Windows
@@ -78,62 +118,289 @@ class SQLServerDataSource:
                     f"SERVER={server};"
                     f"DATABASE={database};"
                     f"Trusted_Connection=yes;"
-                    f"TrustServerCertificate=yes;" 
+                    f"TrustServerCertificate=yes;"
                 )
-            
-            self.connection = pyodbc.connect(connection_string)
-            self.cursor = self.connection.cursor()
-            print(f"Conectado exitosamente usando: {self.sql_driver}")
-            
+
+            self._connection_string = connection_string
+            # La primera conexión valida las credenciales y queda libre en el pool
+            self._idle.append(pyodbc.connect(connection_string))
+            self._total = 1
+            logger.info("Conectado exitosamente usando: %s", self.sql_driver)
+
         except (pyodbc.Error, Exception) as e:
-            # Relanzar la excepción para que main.py la capture
-            raise Exception(f"Error al conectar a la DB: {e}")
-    
-    def execute_query(self, query, params=None):
+            # Relanzar la excepción para que main.py / cli.py la capture
+            raise DataSourceError(f"Error al conectar a la DB: {e}") from e
+
+    # --- Pool de conexiones ---
+
+    def _acquire(self):
+        """Toma una conexión libre, abre una nueva o espera a que se libere una."""
+        with self._pool_cond:
+            while True:
+                if self._closed:
+                    raise DataSourceError("No hay conexión a la base de datos.")
+                if self._idle:
+                    return self._idle.pop()
+                if self._total < self._pool_size:
+                    self._total += 1
+                    break
+                self._pool_cond.wait()
+        try:
+            return pyodbc.connect(self._connection_string)
+        except Exception:
+            with self._pool_cond:
+                self._total -= 1
+                self._pool_cond.notify()
+            raise
+
+    def _release(self, connection, discard: bool = False):
+        """Devuelve la conexión al pool (o la cierra si está rota o el pool se cerró)."""
+        with self._pool_cond:
+            if discard or self._closed:
+                self._total -= 1
+                try: connection.close()
+                except pyodbc.Error: pass
+            else:
+                self._idle.append(connection)
+            self._pool_cond.notify()
+
+    @contextmanager
+    def _connection(self):
+        connection = self._acquire()
+        discard = False
+        try:
+            yield connection
+        except pyodbc.Error as ex:
+            # SQLSTATE 08xxx: error de comunicación, la conexión no es reutilizable
+            discard = str(ex.args[0]).startswith("08") if ex.args else True
+            raise
+        finally:
+            self._release(connection, discard)
+
+    def _report_error(self, title: str, message: str):
+        """Registra el error y avisa al gancho 'on_error', si la UI asignó uno."""
+        logger.error("%s: %s", title, message.replace("\n", " "))
+        if self.on_error is not None:
+            try:
+                self.on_error(title, message)
+            except Exception:
+                logger.exception("Fallo el manejador de errores del DataSource")
+
+    # --- Caché de resultados ---
+
+    def enable_cache(self, max_bytes: int = 16 * 1024 * 1024):
+        """
+        Activa la caché de resultados de execute_query. Las escrituras hechas
+        por este DataSource la invalidan; las de otros equipos se detectan con
+        los tokens de cambio (ver SincronizacionRepositoryImpl).
+        """
+        if self._cache is None:
+            self._cache = QueryCache(max_bytes)
+        else:
+            self._cache.max_bytes = max_bytes
+
+    def invalidate_cache(self, tablas: Optional[Iterable[str]] = None):
+        """Descarta los resultados que leen esas tablas (todos si es None)."""
+        if self._cache is not None:
+            self._cache.invalidate(tablas)
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        return self._cache.stats() if self._cache is not None else None
+
+    # --- Metadatos ---
+
+    def column_exists(self, tabla: str, columna: str) -> bool:
+        results = self.execute_query("SELECT COL_LENGTH(?, ?)", (tabla, columna), cache=False)
+        return bool(results and results[0][0] is not None)
+
+    # --- Ejecución ---
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_query(self, query, params=None, cache: bool = True):
         """
         Ejecuta una consulta SELECT y retorna todos los resultados.
+        Con la caché activa, una consulta idéntica (mismo SQL y parámetros)
+        se responde sin ir al servidor. 'cache=False' fuerza la lectura
+        (tokens de cambio, marcas de agua, metadatos).
         """
+        clave = QueryCache.clave(query, params) if cache and self._cache is not None else None
+        if clave is not None:
+            rows = self._cache.get(clave)
+            if rows is not None:
+                instante("cache.hit", "db")
+                return rows
+            generacion = self._cache.generacion
         try:
-            if self.cursor:
-                self.cursor.execute(query, params if params is not None else [])
-                return self.cursor.fetchall()
-            else:
-                raise Exception("No hay conexión a la base de datos.")
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, params if params is not None else [])
+                    rows = cursor.fetchall()
+                finally:
+                    cursor.close()
+            if clave is not None:
+                self._cache.put(clave, rows, generacion)
+            return rows
         except pyodbc.Error as ex:
             sqlstate = ex.args[0]
-            messagebox.showerror("Error de Consulta", f"Error al ejecutar consulta:\nSQLSTATE: {sqlstate}\nMensaje: {ex.args[1]}")
+            self._report_error("Error de Consulta", f"Error al ejecutar consulta:\nSQLSTATE: {sqlstate}\nMensaje: {ex.args[1]}")
             return None
         except Exception as e:
-            messagebox.showerror("Error de Consulta", f"Ocurrió un error inesperado al ejecutar consulta:\n{str(e)}")
+            self._report_error("Error de Consulta", f"Ocurrió un error inesperado al ejecutar consulta:\n{str(e)}")
             return None
-    
+
+    @contado()
+    def iter_query(self, query, params=None, batch_size: int = 1000):
+        """
+        Ejecuta una consulta SELECT y entrega las filas por lotes (fetchmany),
+        sin materializar todo el resultado en memoria.
+        La conexión queda reservada mientras se consume el generador.
+        """
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, params if params is not None else [])
+                    while True:
+                        with span("fetchmany", "db", lote=batch_size):
+                            rows = cursor.fetchmany(batch_size)
+                        if not rows:
+                            break
+                        yield from rows
+                finally:
+                    cursor.close()
+        except pyodbc.Error as ex:
+            raise DataSourceError(f"Error al ejecutar consulta: {ex}") from ex
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
     def execute_non_query(self, query, params=None):
         """
         Ejecuta una consulta INSERT, UPDATE o DELETE y confirma los cambios.
         """
         try:
-            if self.cursor:
-                self.cursor.execute(query, params if params is not None else [])
-                self.connection.commit()
-                return True
-            else:
-                raise Exception("No hay conexión a la base de datos.")
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(query, params if params is not None else [])
+                    connection.commit()
+                    if self._cache is not None:
+                        self._cache.invalidate_for_write(query)
+                    return True
+                except Exception:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
         except pyodbc.Error as ex:
             sqlstate = ex.args[0]
-            messagebox.showerror("Error de Operación", f"Error al ejecutar operación:\nSQLSTATE: {sqlstate}\nMensaje: {ex.args[1]}")
-            self.connection.rollback()
+            self._report_error("Error de Operación", f"Error al ejecutar operación:\nSQLSTATE: {sqlstate}\nMensaje: {ex.args[1]}")
             return False
         except Exception as e:
-            messagebox.showerror("Error de Operación", f"Ocurrió un error inesperado al ejecutar operación:\n{str(e)}")
-            self.connection.rollback()
+            self._report_error("Error de Operación", f"Ocurrió un error inesperado al ejecutar operación:\n{str(e)}")
             return False
-            
-    def close(self):
-        """Cierra la conexión y el cursor de la base de datos."""
-        if self.cursor:
-            self.cursor.close()
-            self.cursor = None
-        if self.connection:
-            self.connection.close()
-            self.connection = None
 
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_insert(self, query, params=None):
+        """
+        Ejecuta un INSERT y retorna el IDENTITY generado (SCOPE_IDENTITY),
+        o None si no se insertó ninguna fila o hubo un error.
+        """
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(f"SET NOCOUNT ON; {query}; SELECT CAST(SCOPE_IDENTITY() AS INT)", params if params is not None else [])
+                    while cursor.description is None and cursor.nextset():
+                        pass
+                    row = cursor.fetchone()
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
+            if self._cache is not None:
+                self._cache.invalidate_for_write(query)
+            return row[0] if row and row[0] is not None else None
+        except pyodbc.Error as ex:
+            self._report_error("Error de Operación", f"Error al ejecutar operación:\nSQLSTATE: {ex.args[0]}\nMensaje: {ex.args[1]}")
+            return None
+        except Exception as e:
+            self._report_error("Error de Operación", f"Ocurrió un error inesperado al ejecutar operación:\n{str(e)}")
+            return None
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_many(self, query, filas) -> int:
+        """
+        Ejecuta la misma sentencia para cada fila (executemany con
+        fast_executemany: un solo viaje por lote) en una transacción.
+        Retorna la cantidad de filas enviadas. A diferencia de
+        execute_non_query, lanza la excepción: el llamador decide si reintenta
+        fila por fila.
+        """
+        filas = list(filas)
+        if not filas:
+            return 0
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.fast_executemany = True
+                    cursor.executemany(query, filas)
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
+        except pyodbc.Error as ex:
+            raise DataSourceError(f"Error al ejecutar operación por lotes: {ex.args[1] if len(ex.args) > 1 else ex}") from ex
+        if self._cache is not None:
+            self._cache.invalidate_for_write(query)
+        return len(filas)
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_returning(self, query, params=None):
+        """
+        Ejecuta una escritura con OUTPUT (p. ej. UPDATE ... OUTPUT inserted.ID INTO @ids; SELECT ...)
+        en una transacción y retorna las filas que produce, o None si falló.
+        """
+        try:
+            with self._connection() as connection:
+                cursor = connection.cursor()
+                try:
+                    cursor.execute(f"SET NOCOUNT ON; {query}", params if params is not None else [])
+                    while cursor.description is None and cursor.nextset():
+                        pass
+                    rows = cursor.fetchall() if cursor.description is not None else []
+                    connection.commit()
+                except Exception:
+                    connection.rollback()
+                    raise
+                finally:
+                    cursor.close()
+            if self._cache is not None:
+                self._cache.invalidate_for_write(query)
+            return rows
+        except pyodbc.Error as ex:
+            self._report_error("Error de Operación", f"Error al ejecutar operación:\nSQLSTATE: {ex.args[0]}\nMensaje: {ex.args[1]}")
+            return None
+        except Exception as e:
+            self._report_error("Error de Operación", f"Ocurrió un error inesperado al ejecutar operación:\n{str(e)}")
+            return None
+
+    def close(self):
+        """Cierra todas las conexiones del pool."""
+        with self._pool_cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._total -= len(idle)
+            self._pool_cond.notify_all()
+        for connection in idle:
+            try: connection.close()
+            except pyodbc.Error: pass
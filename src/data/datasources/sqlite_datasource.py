@@ -0,0 +1,281 @@
+# src/data/datasources/sqlite_datasource.py
+#
+# Capa de Datos (DataSource).
+# Sustituto local de SQLServerDataSource sobre sqlite3 (biblioteca estándar),
+# para pruebas, benchmarks y desarrollo sin servidor. Expone la misma
+# interfaz y traduce las pocas construcciones T-SQL que usan los
+# repositorios (ISNULL, OFFSET ... FETCH NEXT).
+#
+# No hay rowversion: la sincronización incremental no está disponible y los
+# repositorios recargan todo (ver SeguimientoCambios.disponible).
+
+import logging
+import re
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, Optional
+from src.data.datasources.errores import DataSourceError, ManejadorErrores
+from src.data.datasources.query_cache import QueryCache, tabla_escrita
+from src.utils.consultas import contado
+from src.utils.tracing import args_sql, instante, span, trazado
+
+logger = logging.getLogger(__name__)
+
+_PAGINACION = re.compile(r"OFFSET\s+\?\s+ROWS\s+FETCH\s+NEXT\s+\?\s+ROWS\s+ONLY", re.IGNORECASE)
+_ISNULL = re.compile(r"\bISNULL\s*\(", re.IGNORECASE)
+
+# Mismas tablas y columnas que usa la aplicación sobre SQL Server
+ESQUEMA_BASE = [
+    """
+    CREATE TABLE IF NOT EXISTS TiposVehiculo (
+        TipoID INTEGER PRIMARY KEY AUTOINCREMENT,
+        NombreTipo TEXT NOT NULL,
+        GarantiaBase REAL NOT NULL DEFAULT 0
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS EstadosVehiculo (
+        EstadoID INTEGER PRIMARY KEY AUTOINCREMENT,
+        NombreEstado TEXT NOT NULL
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Vehiculos (
+        VehiculoID INTEGER PRIMARY KEY AUTOINCREMENT,
+        Marca TEXT NOT NULL,
+        Modelo TEXT NOT NULL,
+        Anio INTEGER NOT NULL,
+        Placa TEXT NOT NULL UNIQUE,
+        TipoID INTEGER NOT NULL REFERENCES TiposVehiculo (TipoID),
+        EstadoID INTEGER NOT NULL REFERENCES EstadosVehiculo (EstadoID),
+        PrecioPorDia REAL NOT NULL,
+        Kilometraje INTEGER,
+        ImagenPath TEXT
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS Clientes (
+        ClienteID INTEGER PRIMARY KEY AUTOINCREMENT,
+        Nombre TEXT NOT NULL,
+        Apellido TEXT NOT NULL,
+        DNI TEXT NOT NULL UNIQUE,
+        Licencia TEXT NOT NULL,
+        Telefono TEXT,
+        Email TEXT,
+        Direccion TEXT,
+        Distrito TEXT
+    )
+    """,
+]
+
+def traducir(query: str, params) -> tuple:
+    """Adapta una consulta T-SQL de los repositorios al dialecto de SQLite."""
+    params = tuple(params) if params is not None else ()
+    if _PAGINACION.search(query):
+        # OFFSET ? ROWS FETCH NEXT ? ROWS ONLY -> LIMIT ? OFFSET ? (se invierten los dos últimos parámetros)
+        query = _PAGINACION.sub("LIMIT ? OFFSET ?", query)
+        params = params[:-2] + (params[-1], params[-2])
+    query = _ISNULL.sub("IFNULL(", query)
+    return query, params
+
+class SQLiteDataSource:
+
+    dialect = "sqlite"
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def get_instance(cls, path: str = ":memory:"):
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = cls(path)
+        return cls._instance
+
+    def __init__(self, path: str = ":memory:", crear_esquema: bool = True):
+        """
+        Args:
+            path: Archivo de la base de datos (":memory:" para una base efímera).
+            crear_esquema: Crea las tablas base si no existen.
+        """
+        # Una sola conexión compartida entre hilos, serializada con un lock:
+        # una base ":memory:" solo existe dentro de su conexión.
+        self._conexion = sqlite3.connect(path, check_same_thread=False)
+        self._conexion.execute("PRAGMA foreign_keys = ON")
+        self._lock = threading.RLock()
+        self._cache: Optional[QueryCache] = None
+        self._escrituras: Dict[str, int] = {}  # tabla -> escrituras (tokens de cambio)
+        self.on_error: ManejadorErrores = None
+        self.path = path
+        if crear_esquema:
+            for sentencia in ESQUEMA_BASE:
+                self._conexion.execute(sentencia)
+            self._conexion.commit()
+
+    def _report_error(self, title: str, message: str):
+        """Registra el error y avisa al gancho 'on_error', si la UI asignó uno."""
+        logger.error("%s: %s", title, message)
+        if self.on_error is not None:
+            try:
+                self.on_error(title, message)
+            except Exception:
+                logger.exception("Fallo el manejador de errores del DataSource")
+
+    # --- Caché de resultados (misma interfaz que SQLServerDataSource) ---
+
+    def enable_cache(self, max_bytes: int = 16 * 1024 * 1024):
+        if self._cache is None:
+            self._cache = QueryCache(max_bytes)
+        else:
+            self._cache.max_bytes = max_bytes
+
+    def invalidate_cache(self, tablas: Optional[Iterable[str]] = None):
+        if self._cache is not None:
+            self._cache.invalidate(tablas)
+
+    def cache_stats(self) -> Optional[Dict[str, Any]]:
+        return self._cache.stats() if self._cache is not None else None
+
+    # --- Metadatos ---
+
+    def column_exists(self, tabla: str, columna: str) -> bool:
+        with self._lock:
+            # table_xinfo incluye las columnas generadas (table_info las oculta)
+            filas = self._conexion.execute(f"PRAGMA table_xinfo({tabla})").fetchall()
+        return any(fila[1].lower() == columna.lower() for fila in filas)
+
+    def contador_escrituras(self, tabla: str) -> int:
+        """Escrituras confirmadas sobre la tabla desde que se abrió la base."""
+        return self._escrituras.get(tabla.lower(), 0)
+
+    def _despues_de_escribir(self, query: str) -> None:
+        """Tras confirmar una escritura: avanza el token de cambio de la tabla e invalida la caché."""
+        tabla = tabla_escrita(query)
+        if tabla:
+            with self._lock:
+                self._escrituras[tabla] = self._escrituras.get(tabla, 0) + 1
+        if self._cache is not None:
+            self._cache.invalidate_for_write(query)
+
+    # --- Ejecución ---
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_query(self, query, params=None, cache: bool = True):
+        clave = QueryCache.clave(query, params) if cache and self._cache is not None else None
+        if clave is not None:
+            rows = self._cache.get(clave)
+            if rows is not None:
+                instante("cache.hit", "db")
+                return rows
+            generacion = self._cache.generacion
+        sql, valores = traducir(query, params)
+        try:
+            with self._lock:
+                rows = self._conexion.execute(sql, valores).fetchall()
+        except sqlite3.Error as e:
+            self._report_error("Error de Consulta", str(e))
+            return None
+        if clave is not None:
+            self._cache.put(clave, rows, generacion)
+        return rows
+
+    @contado()
+    def iter_query(self, query, params=None, batch_size: int = 1000):
+        sql, valores = traducir(query, params)
+        try:
+            with self._lock:
+                cursor = self._conexion.execute(sql, valores)
+            try:
+                while True:
+                    with self._lock, span("fetchmany", "db", lote=batch_size):
+                        rows = cursor.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    yield from rows
+            finally:
+                cursor.close()
+        except sqlite3.Error as e:
+            raise DataSourceError(f"Error al ejecutar consulta: {e}") from e
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_non_query(self, query, params=None):
+        sql, valores = traducir(query, params)
+        try:
+            with self._lock:
+                try:
+                    self._conexion.execute(sql, valores)
+                    self._conexion.commit()
+                except Exception:
+                    self._conexion.rollback()
+                    raise
+        except sqlite3.Error as e:
+            self._report_error("Error de Operación", str(e))
+            return False
+        self._despues_de_escribir(query)
+        return True
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_insert(self, query, params=None):
+        """INSERT que retorna el ROWID generado, o None si no insertó filas o falló."""
+        sql, valores = traducir(query, params)
+        try:
+            with self._lock:
+                try:
+                    cursor = self._conexion.execute(sql, valores)
+                    nuevo_id = cursor.lastrowid if cursor.rowcount > 0 else None
+                    self._conexion.commit()
+                except Exception:
+                    self._conexion.rollback()
+                    raise
+        except sqlite3.Error as e:
+            self._report_error("Error de Operación", str(e))
+            return None
+        self._despues_de_escribir(query)
+        return nuevo_id
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_many(self, query, filas) -> int:
+        """executemany en una transacción; lanza la excepción si falla."""
+        filas = [tuple(fila) for fila in filas]
+        if not filas:
+            return 0
+        sql, _ = traducir(query, None)
+        try:
+            with self._lock:
+                try:
+                    self._conexion.executemany(sql, filas)
+                    self._conexion.commit()
+                except Exception:
+                    self._conexion.rollback()
+                    raise
+        except sqlite3.Error as e:
+            raise DataSourceError(f"Error al ejecutar operación por lotes: {e}") from e
+        self._despues_de_escribir(query)
+        return len(filas)
+
+    @trazado("db", argumentos=args_sql)
+    @contado()
+    def execute_returning(self, query, params=None):
+        """Escritura con RETURNING; retorna sus filas, o None si falló."""
+        sql, valores = traducir(query, params)
+        try:
+            with self._lock:
+                try:
+                    rows = self._conexion.execute(sql, valores).fetchall()
+                    self._conexion.commit()
+                except Exception:
+                    self._conexion.rollback()
+                    raise
+        except sqlite3.Error as e:
+            self._report_error("Error de Operación", str(e))
+            return None
+        self._despues_de_escribir(query)
+        return rows
+
+    def close(self):
+        with self._lock:
+            self._conexion.close()
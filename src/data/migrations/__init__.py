@@ -0,0 +1,81 @@
+# src/data/migrations/__init__.py
+#
+# Migraciones versionadas del esquema.
+# Cada módulo mNNNN_*.py define VERSION, DESCRIPCION y SQL (lista de
+# sentencias que se ejecutan en orden; un CREATE TRIGGER debe ir solo).
+# Opcionalmente SQL_SQLITE con la variante para SQLiteDataSource.
+# Una sentencia puede ser (tabla, columna, sql): solo se ejecuta si la columna
+# no existe, para los ALTER TABLE ADD COLUMN que el dialecto no sabe condicionar.
+# La versión aplicada se registra en la tabla SchemaVersion.
+
+import logging
+from typing import List, Tuple, Union
+from src.data.migrations import m0001_rowversion, m0002_indices_busqueda, m0003_reservas
+
+logger = logging.getLogger(__name__)
+
+MIGRACIONES = [m0001_rowversion, m0002_indices_busqueda, m0003_reservas]
+
+_CREAR_TABLA_VERSION = """
+IF OBJECT_ID('SchemaVersion') IS NULL
+    CREATE TABLE SchemaVersion (
+        Version INT NOT NULL PRIMARY KEY,
+        Descripcion NVARCHAR(200) NOT NULL,
+        AplicadaEn DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME()
+    )
+"""
+
+_CREAR_TABLA_VERSION_SQLITE = """
+CREATE TABLE IF NOT EXISTS SchemaVersion (
+    Version INTEGER NOT NULL PRIMARY KEY,
+    Descripcion TEXT NOT NULL,
+    AplicadaEn TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+)
+"""
+
+def _es_sqlite(datasource) -> bool:
+    return getattr(datasource, "dialect", "mssql") == "sqlite"
+
+def _sentencias(migracion, datasource) -> List[Union[str, Tuple[str, str, str]]]:
+    """SQL de la migración para el dialecto del DataSource."""
+    if _es_sqlite(datasource):
+        return getattr(migracion, "SQL_SQLITE", [])
+    return migracion.SQL
+
+def version_actual(datasource) -> int:
+    """Versión de esquema aplicada (0 si nunca se migró)."""
+    if not datasource.execute_non_query(_CREAR_TABLA_VERSION_SQLITE if _es_sqlite(datasource) else _CREAR_TABLA_VERSION):
+        raise Exception("No se pudo crear la tabla SchemaVersion.")
+    results = datasource.execute_query("SELECT ISNULL(MAX(Version), 0) FROM SchemaVersion", cache=False)
+    return int(results[0][0]) if results else 0
+
+def pendientes(datasource) -> List[Tuple[int, str]]:
+    actual = version_actual(datasource)
+    return [(m.VERSION, m.DESCRIPCION) for m in MIGRACIONES if m.VERSION > actual]
+
+def aplicar_migraciones(datasource) -> List[int]:
+    """
+    Aplica en orden las migraciones pendientes. Las sentencias son idempotentes
+    (IF ... IS NULL / CREATE OR ALTER / IF NOT EXISTS, o columnas que se
+    omiten si ya existen), así que reintentar tras un fallo es seguro.
+    Retorna las versiones aplicadas.
+    """
+    actual = version_actual(datasource)
+    aplicadas = []
+    for migracion in MIGRACIONES:
+        if migracion.VERSION <= actual:
+            continue
+        for sentencia in _sentencias(migracion, datasource):
+            if isinstance(sentencia, tuple):
+                tabla, columna, sentencia = sentencia
+                if datasource.column_exists(tabla, columna):
+                    continue
+            if not datasource.execute_non_query(sentencia):
+                raise Exception(f"Falló la migración {migracion.VERSION} ({migracion.DESCRIPCION}).")
+        datasource.execute_non_query(
+            "INSERT INTO SchemaVersion (Version, Descripcion) VALUES (?, ?)",
+            (migracion.VERSION, migracion.DESCRIPCION)
+        )
+        aplicadas.append(migracion.VERSION)
+        logger.info("Migración %s aplicada: %s", migracion.VERSION, migracion.DESCRIPCION)
+    return aplicadas
@@ -0,0 +1,45 @@
+# src/data/migrations/m0001_rowversion.py
+#
+# Seguimiento de cambios para la sincronización incremental:
+# - Columna RowVer (rowversion) en Clientes y Vehiculos: el servidor la
+#   incrementa en cada INSERT/UPDATE, en orden global de la base de datos.
+# - Tabla Eliminaciones + triggers AFTER DELETE: "lápidas" de las filas
+#   borradas, con su propio RowVer para pedirlas de forma incremental.
+
+VERSION = 1
+DESCRIPCION = "RowVer y lápidas de eliminación para sincronización incremental"
+
+SQL = [
+    "IF COL_LENGTH('Clientes', 'RowVer') IS NULL ALTER TABLE Clientes ADD RowVer ROWVERSION NOT NULL",
+    "IF COL_LENGTH('Vehiculos', 'RowVer') IS NULL ALTER TABLE Vehiculos ADD RowVer ROWVERSION NOT NULL",
+    "IF INDEXPROPERTY(OBJECT_ID('Clientes'), 'IX_Clientes_RowVer', 'IndexID') IS NULL CREATE INDEX IX_Clientes_RowVer ON Clientes (RowVer)",
+    "IF INDEXPROPERTY(OBJECT_ID('Vehiculos'), 'IX_Vehiculos_RowVer', 'IndexID') IS NULL CREATE INDEX IX_Vehiculos_RowVer ON Vehiculos (RowVer)",
+    """
+    IF OBJECT_ID('Eliminaciones') IS NULL
+        CREATE TABLE Eliminaciones (
+            EliminacionID BIGINT IDENTITY(1,1) NOT NULL PRIMARY KEY,
+            Tabla SYSNAME NOT NULL,
+            EntidadID INT NOT NULL,
+            RowVer ROWVERSION NOT NULL,
+            EliminadoEn DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME()
+        )
+    """,
+    "IF INDEXPROPERTY(OBJECT_ID('Eliminaciones'), 'IX_Eliminaciones_Tabla_RowVer', 'IndexID') IS NULL CREATE INDEX IX_Eliminaciones_Tabla_RowVer ON Eliminaciones (Tabla, RowVer) INCLUDE (EntidadID)",
+    """
+    CREATE OR ALTER TRIGGER TR_Clientes_Eliminacion ON Clientes AFTER DELETE AS
+    BEGIN
+        SET NOCOUNT ON;
+        INSERT INTO Eliminaciones (Tabla, EntidadID) SELECT 'Clientes', ClienteID FROM deleted;
+    END
+    """,
+    """
+    CREATE OR ALTER TRIGGER TR_Vehiculos_Eliminacion ON Vehiculos AFTER DELETE AS
+    BEGIN
+        SET NOCOUNT ON;
+        INSERT INTO Eliminaciones (Tabla, EntidadID) SELECT 'Vehiculos', VehiculoID FROM deleted;
+    END
+    """,
+]
+
+# SQLite no tiene rowversion: la sincronización incremental no aplica
+SQL_SQLITE = []
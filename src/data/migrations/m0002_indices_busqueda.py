@@ -0,0 +1,56 @@
+# src/data/migrations/m0002_indices_busqueda.py
+#
+# Índices para las búsquedas y los ordenamientos de las pantallas:
+# - Columnas calculadas persistidas con el texto normalizado (minúsculas)
+#   para que la búsqueda por prefijo (LIKE 'abc%') pueda hacer seek sin
+#   envolver la columna en LOWER(...).
+# - DNI y Placa (búsqueda exacta), EstadoID (filtro de la flota) y las claves
+#   de orden de las listas (Apellido, Nombre / Marca, Modelo).
+
+VERSION = 2
+DESCRIPCION = "Columnas de búsqueda normalizadas e índices de búsqueda y orden"
+
+# (tabla, columna, expresión)
+COLUMNAS = [
+    ("Clientes", "NombreBusq", "LOWER(Nombre)"),
+    ("Clientes", "ApellidoBusq", "LOWER(Apellido)"),
+    ("Clientes", "DistritoBusq", "LOWER(ISNULL(Distrito, ''))"),
+    ("Vehiculos", "MarcaBusq", "LOWER(Marca)"),
+    ("Vehiculos", "ModeloBusq", "LOWER(Modelo)"),
+    ("Vehiculos", "PlacaBusq", "LOWER(Placa)"),
+]
+
+# (tabla, índice, columnas)
+INDICES = [
+    ("Clientes", "IX_Clientes_DNI", "DNI"),
+    ("Clientes", "IX_Clientes_Apellido_Nombre", "Apellido, Nombre"),
+    ("Clientes", "IX_Clientes_NombreBusq", "NombreBusq"),
+    ("Clientes", "IX_Clientes_ApellidoBusq", "ApellidoBusq"),
+    ("Clientes", "IX_Clientes_DistritoBusq", "DistritoBusq"),
+    ("Vehiculos", "IX_Vehiculos_Placa", "Placa"),
+    ("Vehiculos", "IX_Vehiculos_EstadoID_Marca_Modelo", "EstadoID, Marca, Modelo"),
+    ("Vehiculos", "IX_Vehiculos_Marca_Modelo", "Marca, Modelo"),
+    ("Vehiculos", "IX_Vehiculos_MarcaBusq", "MarcaBusq"),
+    ("Vehiculos", "IX_Vehiculos_ModeloBusq", "ModeloBusq"),
+    ("Vehiculos", "IX_Vehiculos_PlacaBusq", "PlacaBusq"),
+]
+
+SQL = [
+    f"IF COL_LENGTH('{tabla}', '{columna}') IS NULL ALTER TABLE {tabla} ADD {columna} AS {expresion} PERSISTED"
+    for tabla, columna, expresion in COLUMNAS
+] + [
+    f"IF INDEXPROPERTY(OBJECT_ID('{tabla}'), '{indice}', 'IndexID') IS NULL CREATE INDEX {indice} ON {tabla} ({columnas})"
+    for tabla, indice, columnas in INDICES
+]
+
+# SQLite: columnas generadas VIRTUAL (ALTER TABLE no admite STORED), indexadas.
+# ADD COLUMN no admite IF NOT EXISTS: van como (tabla, columna, sentencia) y
+# el ejecutor las omite si la columna ya existe, así reintentar tras un fallo
+# a mitad de camino es seguro. (SQLiteDataSource traduce ISNULL a IFNULL.)
+SQL_SQLITE = [
+    (tabla, columna, f"ALTER TABLE {tabla} ADD COLUMN {columna} TEXT GENERATED ALWAYS AS ({expresion}) VIRTUAL")
+    for tabla, columna, expresion in COLUMNAS
+] + [
+    f"CREATE INDEX IF NOT EXISTS {indice} ON {tabla} ({columnas})"
+    for tabla, indice, columnas in INDICES
+]
@@ -0,0 +1,43 @@
+# src/data/migrations/m0003_reservas.py
+#
+# Tabla de reservas. El periodo es semiabierto [FechaInicio, FechaFin).
+# El índice (VehiculoID, FechaInicio) sirve a la verificación de solapamiento
+# al insertar; (Estado, FechaFin) a la carga de las reservas activas vigentes.
+
+VERSION = 3
+DESCRIPCION = "Tabla Reservas"
+
+SQL = [
+    """
+    IF OBJECT_ID('Reservas') IS NULL
+        CREATE TABLE Reservas (
+            ReservaID INT IDENTITY(1,1) NOT NULL PRIMARY KEY,
+            ClienteID INT NOT NULL REFERENCES Clientes (ClienteID),
+            VehiculoID INT NOT NULL REFERENCES Vehiculos (VehiculoID),
+            FechaInicio DATE NOT NULL,
+            FechaFin DATE NOT NULL,
+            Estado NVARCHAR(20) NOT NULL DEFAULT 'Activa',
+            CreadaEn DATETIME2 NOT NULL DEFAULT SYSUTCDATETIME(),
+            CONSTRAINT CK_Reservas_Fechas CHECK (FechaFin > FechaInicio)
+        )
+    """,
+    "IF INDEXPROPERTY(OBJECT_ID('Reservas'), 'IX_Reservas_Vehiculo_Inicio', 'IndexID') IS NULL CREATE INDEX IX_Reservas_Vehiculo_Inicio ON Reservas (VehiculoID, FechaInicio) INCLUDE (FechaFin, Estado)",
+    "IF INDEXPROPERTY(OBJECT_ID('Reservas'), 'IX_Reservas_Estado_Fin', 'IndexID') IS NULL CREATE INDEX IX_Reservas_Estado_Fin ON Reservas (Estado, FechaFin)",
+]
+
+SQL_SQLITE = [
+    """
+    CREATE TABLE IF NOT EXISTS Reservas (
+        ReservaID INTEGER PRIMARY KEY AUTOINCREMENT,
+        ClienteID INTEGER NOT NULL REFERENCES Clientes (ClienteID),
+        VehiculoID INTEGER NOT NULL REFERENCES Vehiculos (VehiculoID),
+        FechaInicio TEXT NOT NULL,
+        FechaFin TEXT NOT NULL,
+        Estado TEXT NOT NULL DEFAULT 'Activa',
+        CreadaEn TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP,
+        CHECK (FechaFin > FechaInicio)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS IX_Reservas_Vehiculo_Inicio ON Reservas (VehiculoID, FechaInicio)",
+    "CREATE INDEX IF NOT EXISTS IX_Reservas_Estado_Fin ON Reservas (Estado, FechaFin)",
+]
@@ -0,0 +1,155 @@
+# src/data/repositories/archivo_tabular_repository_impl.py
+#
+# Capa de Datos (Implementación del Repositorio).
+# Lectura en streaming de CSV y Excel con pandas, y exportación en streaming
+# a CSV (módulo csv) o Parquet (pyarrow, opcional): los archivos nunca se
+# cargan enteros en memoria. pandas, openpyxl y pyarrow se importan al usarse.
+
+import csv
+import os
+import unicodedata
+from itertools import islice
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional
+from src.domain.repositories.archivo_tabular_repository import IArchivoTabularRepository
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+EXTENSIONES_EXCEL = (".xlsx", ".xlsm")
+SEPARADORES_CSV = ",;\t|"
+FORMATOS_EXPORTACION = (".csv", ".parquet")
+
+def normalizar_encabezado(nombre) -> str:
+    """' Año de Fabricación' -> 'ano_de_fabricacion'."""
+    texto = unicodedata.normalize("NFKD", str(nombre)).encode("ascii", "ignore").decode("ascii")
+    return "_".join(texto.strip().lower().split())
+
+class ArchivoTabularRepositoryImpl(IArchivoTabularRepository):
+    def __init__(self, encoding: str = "utf-8-sig", separador: str = None):
+        """
+        Args:
+            encoding: Codificación de los CSV ("utf-8-sig" acepta el BOM de Excel).
+            separador: Separador de los CSV; None lo detecta en el encabezado
+                (',', ';', tabulador o '|').
+        """
+        self.encoding = encoding
+        self.separador = separador
+
+    def leer_por_lotes(self, path: str, tamano_lote: int) -> Iterator["pd.DataFrame"]:
+        if not os.path.isfile(path):
+            raise FileNotFoundError(f"No existe el archivo '{path}'.")
+        if path.lower().endswith(EXTENSIONES_EXCEL):
+            yield from self._leer_excel(path, tamano_lote)
+        else:
+            yield from self._leer_csv(path, tamano_lote)
+
+    def _leer_csv(self, path: str, tamano_lote: int) -> Iterator["pd.DataFrame"]:
+        import pandas as pd
+        # Separador explícito: el motor C es varias veces más rápido que el de
+        # Python, que es el único que acepta sep=None
+        lector = pd.read_csv(
+            path, dtype=str, keep_default_na=False, chunksize=tamano_lote,
+            encoding=self.encoding, sep=self.separador or self._detectar_separador(path), engine="c"
+        )
+        with lector:
+            for lote in lector:
+                lote.columns = [normalizar_encabezado(c) for c in lote.columns]
+                yield lote
+
+    def _detectar_separador(self, path: str) -> str:
+        """Separador del CSV según su línea de encabezado (',' si no se puede deducir)."""
+        with open(path, encoding=self.encoding, newline="") as f:
+            encabezado = f.readline()
+        try:
+            return csv.Sniffer().sniff(encabezado, delimiters=SEPARADORES_CSV).delimiter
+        except csv.Error:
+            return "," # Una sola columna o encabezado vacío
+
+    def _leer_excel(self, path: str, tamano_lote: int) -> Iterator["pd.DataFrame"]:
+        # read_excel no lee por partes: openpyxl en modo read_only recorre las filas sin cargar la hoja
+        import pandas as pd
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise Exception("Para importar Excel instale 'openpyxl' (o exporte la hoja a CSV).")
+        libro = load_workbook(path, read_only=True, data_only=True)
+        try:
+            filas = libro.active.iter_rows(values_only=True)
+            encabezado = next(filas, None)
+            if encabezado is None:
+                return
+            columnas = [normalizar_encabezado(c) for c in encabezado]
+            lote: List[tuple] = []
+            for fila in filas:
+                lote.append(tuple("" if v is None else str(v) for v in fila))
+                if len(lote) == tamano_lote:
+                    yield pd.DataFrame(lote, columns=columnas, dtype=str)
+                    lote = []
+            if lote:
+                yield pd.DataFrame(lote, columns=columnas, dtype=str)
+        finally:
+            libro.close()
+
+    def escribir_lote(self, path: str, lote: "pd.DataFrame", anexar: bool) -> None:
+        lote.to_csv(path, mode="a" if anexar else "w", header=not anexar, index=False, encoding="utf-8-sig" if not anexar else "utf-8")
+
+    def exportar(self, path: str, columnas: List[str], filas: Iterable[tuple], tamano_lote: int = 10000,
+                 on_lote: Optional[Callable[[int], None]] = None) -> int:
+        extension = os.path.splitext(path)[1].lower()
+        if extension not in FORMATOS_EXPORTACION:
+            raise ValueError(f"Formato no soportado: '{extension}' (use {' o '.join(FORMATOS_EXPORTACION)}).")
+        escribir = self._exportar_parquet if extension == ".parquet" else self._exportar_csv
+        temporal = f"{path}.tmp"
+        try:
+            total = escribir(temporal, columnas, iter(filas), tamano_lote, on_lote)
+            os.replace(temporal, path)
+            return total
+        except BaseException:
+            try: os.remove(temporal)
+            except OSError: pass
+            raise
+
+    def _exportar_csv(self, path, columnas, filas, tamano_lote, on_lote) -> int:
+        total = 0
+        # utf-8-sig: Excel reconoce las tildes al abrir el CSV
+        with open(path, "w", newline="", encoding="utf-8-sig") as f:
+            writer = csv.writer(f)
+            writer.writerow(columnas)
+            while True:
+                lote = list(islice(filas, tamano_lote))
+                if not lote:
+                    break
+                writer.writerows(lote)
+                total += len(lote)
+                if on_lote: on_lote(total)
+        return total
+
+    def _exportar_parquet(self, path, columnas, filas, tamano_lote, on_lote) -> int:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise Exception("Para exportar a Parquet instale 'pyarrow' (o exporte a CSV).")
+        total, writer, esquema = 0, None, None
+        try:
+            while True:
+                lote = list(islice(filas, tamano_lote))
+                if not lote and writer is not None:
+                    break
+                tabla = pa.table({c: [fila[i] for fila in lote] for i, c in enumerate(columnas)})
+                if writer is None:
+                    # Esquema del primer lote; una columna toda NULL se guarda como texto
+                    esquema = pa.schema([
+                        pa.field(campo.name, pa.string() if pa.types.is_null(campo.type) else campo.type)
+                        for campo in tabla.schema
+                    ])
+                    writer = pq.ParquetWriter(path, esquema)
+                if not lote:
+                    break # Exportación vacía: solo el esquema
+                writer.write_table(tabla.cast(esquema)) # Un row group por lote
+                total += len(lote)
+                if on_lote: on_lote(total)
+        finally:
+            if writer is not None:
+                writer.close()
+        return total
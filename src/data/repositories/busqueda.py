@@ -0,0 +1,46 @@
+# src/data/repositories/busqueda.py
+#
+# Capa de Datos.
+# Modos de búsqueda de texto de los repositorios:
+# - "contiene": LIKE '%texto%' sobre LOWER(columna). Encuentra el texto en
+#   cualquier posición, pero no puede usar índices (recorre la tabla).
+# - "prefijo": LIKE 'texto%' sobre las columnas normalizadas de la migración
+#   m0002 (NombreBusq, MarcaBusq, ...). Solo coincide al inicio de cada
+#   campo, a cambio de resolverse con seeks de índice.
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+CONTIENE = "contiene"
+PREFIJO = "prefijo"
+MODOS = (CONTIENE, PREFIJO)
+
+ESCAPE = "!"
+
+def patron_prefijo(termino: str, dialect: str = "mssql") -> str:
+    """'Ana_' -> 'ana!_%' (los comodines del usuario se toman literalmente, con ESCAPE '!')."""
+    especiales = "!%_[" if dialect == "mssql" else "!%_"
+    texto = "".join(ESCAPE + c if c in especiales else c for c in termino.strip().lower())
+    return texto + "%"
+
+class ModoBusqueda:
+    """Resuelve el modo efectivo: "prefijo" requiere la migración m0002 aplicada."""
+    def __init__(self, datasource, modo: str, tabla: str, columna_requerida: str):
+        if modo not in MODOS:
+            raise ValueError(f"Modo de búsqueda inválido: '{modo}' (use {' o '.join(MODOS)}).")
+        self.datasource = datasource
+        self.modo = modo
+        self.tabla = tabla
+        self.columna_requerida = columna_requerida
+        self._prefijo_disponible: Optional[bool] = None
+
+    def usar_prefijo(self) -> bool:
+        if self.modo != PREFIJO:
+            return False
+        if self._prefijo_disponible is None:
+            self._prefijo_disponible = self.datasource.column_exists(self.tabla, self.columna_requerida)
+            if not self._prefijo_disponible:
+                logger.warning("Falta la migración m0002 en %s; se usa la búsqueda '%s'.", self.tabla, CONTIENE)
+        return self._prefijo_disponible
@@ -3,27 +3,40 @@
 # Capa de Datos (Implementación del Repositorio).
 # Conecta la interfaz del dominio con el DataSource.
 
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from src.domain.models.cliente import Cliente
 from src.domain.repositories.cliente_repository import IClienteRepository
 from src.data.datasources.sql_server_datasource import SQLServerDataSource
+from src.data.repositories.seguimiento_cambios import SeguimientoCambios
+from src.data.repositories.identity_map import IdentityMap
+from src.data.repositories.lotes import consultar_por_ids
+from src.data.repositories.busqueda import CONTIENE, ESCAPE, ModoBusqueda, patron_prefijo
+from src.domain.models.cambios import Cambios
+from src.utils.tracing import span, trazado
+
+COLUMNAS_EXPORTACION = ("ClienteID", "Nombre", "Apellido", "DNI", "Licencia", "Telefono", "Email", "Direccion", "Distrito")
 
 class ClienteRepositoryImpl(IClienteRepository):
     
-    def __init__(self, datasource: SQLServerDataSource):
+    def __init__(self, datasource: SQLServerDataSource, modo_busqueda: str = CONTIENE):
         """
         Constructor que recibe la inyección de dependencia del DataSource.
         
         Args:
             datasource (SQLServerDataSource): La instancia única del DataSource.
+            modo_busqueda (str): "contiene" o "prefijo" (ver busqueda.py).
         """
         self.datasource = datasource
+        self.busqueda = ModoBusqueda(datasource, modo_busqueda, "Clientes", "ApellidoBusq")
+        self.seguimiento = SeguimientoCambios(datasource, "Clientes")
+        self.identidad: IdentityMap[Cliente] = IdentityMap(instantanea=self._valores_columnas)
 
     def _mapear_a_cliente(self, row: tuple) -> Cliente:
         """
         Convierte una fila de la base de datos en un objeto Cliente.
+        Si el cliente ya está en memoria se reutiliza la misma instancia.
         """
-        return Cliente(
+        return self.identidad.obtener(row[0], row, lambda: Cliente(
             id=row[0],
             nombre=row[1],
             apellido=row[2],
@@ -33,13 +46,49 @@ class ClienteRepositoryImpl(IClienteRepository):
             email=row[6],
             direccion=row[7],
             distrito=row[8]
-        )
+        ))
+
+    @staticmethod
+    def _valores_columnas(cliente: Cliente) -> Dict[str, Any]:
+        """Columnas editables de Clientes con su valor en la entidad."""
+        return {
+            "Nombre": cliente.nombre,
+            "Apellido": cliente.apellido,
+            "DNI": cliente.dni,
+            "Licencia": cliente.licencia,
+            "Telefono": cliente.telefono,
+            "Email": cliente.email,
+            "Direccion": cliente.direccion,
+            "Distrito": cliente.distrito
+        }
 
+    @trazado("repo")
     def get_all(self) -> List[Cliente]:
+        self.seguimiento.iniciar() # Marca de agua para get_changes()
         query = "SELECT ClienteID, Nombre, Apellido, DNI, Licencia, Telefono, Email, ISNULL(Direccion, ''), ISNULL(Distrito, '') FROM Clientes ORDER BY Apellido, Nombre"
-        results = self.datasource.execute_query(query)
-        return [self._mapear_a_cliente(row) for row in results]
+        # Sin caché: la lectura debe ser posterior a la marca de agua
+        results = self.datasource.execute_query(query, cache=False)
+        with span("hidratar", "repo", filas=len(results or ())):
+            return [self._mapear_a_cliente(row) for row in results]
+
+    @trazado("repo")
+    def get_changes(self) -> Optional[Cambios]:
+        """Clientes modificados/eliminados desde la última lectura (ver SeguimientoCambios)."""
+        select = "SELECT ClienteID, Nombre, Apellido, DNI, Licencia, Telefono, Email, ISNULL(Direccion, ''), ISNULL(Distrito, '')"
+        cambios = self.seguimiento.leer_cambios(select, self._mapear_a_cliente)
+        if cambios:
+            for cliente_id in cambios.eliminados:
+                self.identidad.descartar(cliente_id)
+        return cambios
 
+    @trazado("repo")
+    def get_page(self, offset: int, limit: int) -> List[Cliente]:
+        query = "SELECT ClienteID, Nombre, Apellido, DNI, Licencia, Telefono, Email, ISNULL(Direccion, ''), ISNULL(Distrito, '') FROM Clientes ORDER BY Apellido, Nombre OFFSET ? ROWS FETCH NEXT ? ROWS ONLY"
+        results = self.datasource.execute_query(query, (offset, limit))
+        with span("hidratar", "repo", filas=len(results or ())):
+            return [self._mapear_a_cliente(row) for row in results]
+
+    @trazado("repo")
     def get_by_id(self, id: int) -> Optional[Cliente]:
         query = "SELECT ClienteID, Nombre, Apellido, DNI, Licencia, Telefono, Email, ISNULL(Direccion, ''), ISNULL(Distrito, '') FROM Clientes WHERE ClienteID = ?"
         params = (id,)
@@ -48,8 +97,26 @@ class ClienteRepositoryImpl(IClienteRepository):
             return self._mapear_a_cliente(results[0])
         return None
 
+    @trazado("repo")
+    def get_many(self, cliente_ids: Iterable[int]) -> Dict[int, Cliente]:
+        """
+        Los clientes ya cargados en esta sesión salen del mapa de identidad;
+        solo los faltantes se piden a la BD, en lotes de IN (...).
+        """
+        encontrados, faltantes = {}, []
+        for cliente_id in dict.fromkeys(cliente_ids):
+            cliente = self.identidad.get(cliente_id)
+            if cliente is not None: encontrados[cliente_id] = cliente
+            elif cliente_id is not None: faltantes.append(cliente_id)
+        if faltantes:
+            query = "SELECT ClienteID, Nombre, Apellido, DNI, Licencia, Telefono, Email, ISNULL(Direccion, ''), ISNULL(Distrito, '') FROM Clientes WHERE ClienteID IN ({})"
+            for row in consultar_por_ids(self.datasource, query, faltantes):
+                encontrados[row[0]] = self._mapear_a_cliente(row)
+        return encontrados
+
     # --- INICIO DE LA CORRECCIÓN (MÉTODO AÑADIDO) ---
 
+    @trazado("repo")
     def get_by_dni(self, dni: str) -> Optional[Cliente]:
         """
         Busca un cliente por su DNI.
@@ -62,19 +129,20 @@ class ClienteRepositoryImpl(IClienteRepository):
         return None
 
 
+    @trazado("repo")
     def save(self, cliente: Cliente) -> bool:
         if cliente.id:
-            # Actualizar (UPDATE)
-            query = """
-            UPDATE Clientes 
-            SET Nombre=?, Apellido=?, DNI=?, Licencia=?, Telefono=?, Email=?, Direccion=?, Distrito=?
-            WHERE ClienteID=?
-            """
-            params = (
-                cliente.nombre, cliente.apellido, cliente.dni, cliente.licencia,
-                cliente.telefono, cliente.email, cliente.direccion, cliente.distrito,
-                cliente.id
-            )
+            # Actualizar (UPDATE) solo las columnas que cambiaron desde la última lectura
+            modificadas = self.identidad.columnas_modificadas(cliente.id, self._valores_columnas(cliente))
+            if not modificadas:
+                return True # Nada que enviar
+            asignaciones = ", ".join(f"{columna}=?" for columna in modificadas)
+            query = f"UPDATE Clientes SET {asignaciones} WHERE ClienteID=?"
+            params = tuple(modificadas.values()) + (cliente.id,)
+            if not self.datasource.execute_non_query(query, params):
+                return False
+            self.identidad.marcar_guardadas(cliente.id, modificadas)
+            return True
         else:
             # Insertar (INSERT)
             query = """
@@ -89,25 +157,60 @@ class ClienteRepositoryImpl(IClienteRepository):
         return self.datasource.execute_non_query(query, params)
 
     
+    @trazado("repo")
     def delete(self, id: int) -> bool:
         """
         Elimina un cliente por su ID.
         """
         query = "DELETE FROM Clientes WHERE ClienteID = ?"
         params = (id,)
-        return self.datasource.execute_non_query(query, params)
+        if self.datasource.execute_non_query(query, params):
+            self.identidad.descartar(id)
+            return True
+        return False
 
     # --- FIN DE LA CORRECCIÓN ---
 
-    def search(self, term: str) -> List[Cliente]:
+    def _filtro_busqueda(self, term: str) -> Tuple[str, tuple]:
+        """Condición WHERE y parámetros de la búsqueda (compartida por search e iter_export)."""
+        if self.busqueda.usar_prefijo():
+            # Seek sobre las columnas normalizadas (migración m0002)
+            patron = patron_prefijo(term, self.datasource.dialect)
+            condicion = f"""
+            ApellidoBusq LIKE ? ESCAPE '{ESCAPE}' OR NombreBusq LIKE ? ESCAPE '{ESCAPE}'
+               OR DNI LIKE ? ESCAPE '{ESCAPE}' OR DistritoBusq LIKE ? ESCAPE '{ESCAPE}'
+            """
+            return condicion, (patron, patron, patron, patron)
         search_text = f"%{term.lower()}%"
-        query = """
+        condicion = "LOWER(Nombre) LIKE ? OR LOWER(Apellido) LIKE ? OR DNI LIKE ? OR LOWER(ISNULL(Distrito, '')) LIKE ?"
+        return condicion, (search_text, search_text, search_text, search_text)
+
+    @trazado("repo")
+    def search(self, term: str) -> List[Cliente]:
+        condicion, params = self._filtro_busqueda(term)
+        query = f"""
         SELECT ClienteID, Nombre, Apellido, DNI, Licencia, Telefono, Email, ISNULL(Direccion, ''), ISNULL(Distrito, '')
-        FROM Clientes 
-        WHERE LOWER(Nombre) LIKE ? OR LOWER(Apellido) LIKE ? OR DNI LIKE ? OR LOWER(ISNULL(Distrito, '')) LIKE ?
+        FROM Clientes
+        WHERE {condicion}
         ORDER BY Apellido, Nombre
         """
-        params = (search_text, search_text, search_text, search_text)
         results = self.datasource.execute_query(query, params)
-        return [self._mapear_a_cliente(row) for row in results]
+        with span("hidratar", "repo", filas=len(results or ())):
+            return [self._mapear_a_cliente(row) for row in results]
+
+    def iter_export(self, term: str = "") -> Tuple[List[str], Iterator[tuple]]:
+        condicion, params = self._filtro_busqueda(term) if term else ("1 = 1", ())
+        query = f"""
+        SELECT {", ".join(COLUMNAS_EXPORTACION)}
+        FROM Clientes
+        WHERE {condicion}
+        ORDER BY Apellido, Nombre
+        """
+        return list(COLUMNAS_EXPORTACION), self.datasource.iter_query(query, params, batch_size=5000)
+
+    def existing_dnis(self, dnis: Iterable[str]) -> Set[str]:
+        return {row[0] for row in consultar_por_ids(self.datasource, "SELECT DNI FROM Clientes WHERE DNI IN ({})", dnis)}
 
+    def insert_many(self, filas: List[tuple]) -> int:
+        query = "INSERT INTO Clientes (Nombre, Apellido, DNI, Licencia, Telefono, Email, Direccion, Distrito) VALUES (?, ?, ?, ?, ?, ?, ?, ?)"
+        return self.datasource.execute_many(query, filas)
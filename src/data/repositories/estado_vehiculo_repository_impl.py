@@ -1,8 +1,12 @@
 # src/data/repositories/estado_vehiculo_repository_impl.py
-from typing import List, Optional
+import logging
+from typing import Dict, Iterable, List, Optional
 from src.domain.models.estado_vehiculo import EstadoVehiculo
 from src.domain.repositories.estado_vehiculo_repository import IEstadoVehiculoRepository
 from src.data.datasources.sql_server_datasource import SQLServerDataSource
+from src.data.repositories.lotes import consultar_por_ids
+
+logger = logging.getLogger(__name__)
 
 class EstadoVehiculoRepositoryImpl(IEstadoVehiculoRepository):
     def __init__(self, datasource: SQLServerDataSource):
@@ -21,7 +25,7 @@ class EstadoVehiculoRepositoryImpl(IEstadoVehiculoRepository):
         if results:
             for row in results:
                 try: estados.append(self._mapear_a_estado(row))
-                except Exception as e: print(f"Error al mapear EstadoVehiculo (fila: {row}): {e}")
+                except Exception as e: logger.error("Error al mapear EstadoVehiculo (fila: %s): %s", row, e)
         return estados
 
     def get_by_id(self, id: int) -> Optional[EstadoVehiculo]:
@@ -29,6 +33,13 @@ class EstadoVehiculoRepositoryImpl(IEstadoVehiculoRepository):
         results = self.datasource.execute_query(query, (id,))
         if results:
             try: return self._mapear_a_estado(results[0])
-            except Exception as e: print(f"Error al mapear EstadoVehiculo ID {id}: {e}")
+            except Exception as e: logger.error("Error al mapear EstadoVehiculo ID %s: %s", id, e)
         return None
 
+    def get_many(self, ids: Iterable[int]) -> Dict[int, EstadoVehiculo]:
+        query = "SELECT EstadoID, NombreEstado FROM EstadosVehiculo WHERE EstadoID IN ({})"
+        encontrados = {}
+        for row in consultar_por_ids(self.datasource, query, ids):
+            try: encontrados[row[0]] = self._mapear_a_estado(row)
+            except Exception as e: logger.error("Error al mapear EstadoVehiculo ID %s: %s", row[0], e)
+        return encontrados
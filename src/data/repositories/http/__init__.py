@@ -0,0 +1,12 @@
+# src/data/repositories/http/__init__.py
+#
+# Capa de Datos (Implementaciones HTTP de los Repositorios).
+# Misma interfaz que las implementaciones de BD, pero contra el servicio
+# HTTP/JSON (src/api) a través de ApiClient. Se eligen con API_URL (ver main.py).
+
+from src.data.repositories.http.cliente_repository_http import ClienteRepositoryHttp
+from src.data.repositories.http.tipo_vehiculo_repository_http import TipoVehiculoRepositoryHttp
+from src.data.repositories.http.estado_vehiculo_repository_http import EstadoVehiculoRepositoryHttp
+from src.data.repositories.http.vehiculo_repository_http import VehiculoRepositoryHttp
+from src.data.repositories.http.sincronizacion_repository_http import SincronizacionRepositoryHttp
+from src.data.repositories.http.reserva_repository_http import ReservaRepositoryHttp
@@ -0,0 +1,77 @@
+# src/data/repositories/http/cliente_repository_http.py
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from src.api.serializacion import CAMPOS_CLIENTE, cliente_a_dict, dict_a_cliente
+from src.data.datasources.api_client import ApiClient, ApiError
+from src.data.repositories.identity_map import IdentityMap
+from src.utils.tracing import trazado
+from src.domain.models.cambios import Cambios
+from src.domain.models.cliente import Cliente
+from src.domain.repositories.cliente_repository import IClienteRepository
+
+class ClienteRepositoryHttp(IClienteRepository):
+    def __init__(self, api: ApiClient):
+        self.api = api
+        self.identidad: IdentityMap[Cliente] = IdentityMap()
+
+    def _mapear_a_cliente(self, datos: Dict[str, Any]) -> Cliente:
+        """Misma instancia por ClienteID mientras los datos no cambien (como en la implementación de BD)."""
+        fila = tuple(datos.get(campo) for campo in CAMPOS_CLIENTE)
+        return self.identidad.obtener(datos["id"], fila, lambda: dict_a_cliente(datos))
+
+    @trazado("repo", nombre="hidratar", argumentos=lambda _repo, lista, *_a: {"filas": len(lista)})
+    def _mapear_lista(self, lista: List[Dict[str, Any]]) -> List[Cliente]:
+        return [self._mapear_a_cliente(datos) for datos in lista]
+
+    def get_all(self) -> List[Cliente]:
+        return self._mapear_lista(self.api.get("api/clientes"))
+
+    def get_changes(self) -> Optional[Cambios]:
+        # Sin seguimiento incremental por HTTP: get_all() es un 304 si nada cambió
+        return None
+
+    def get_page(self, offset: int, limit: int) -> List[Cliente]:
+        return self._mapear_lista(self.api.get("api/clientes", {"offset": offset, "limit": limit}))
+
+    def get_by_id(self, cliente_id: int) -> Optional[Cliente]:
+        try:
+            return self._mapear_a_cliente(self.api.get(f"api/clientes/{cliente_id}"))
+        except ApiError as e:
+            if e.status == 404: return None
+            raise
+
+    def get_many(self, cliente_ids: Iterable[int]) -> Dict[int, Cliente]:
+        encontrados, faltantes = {}, []
+        for cliente_id in dict.fromkeys(cliente_ids):
+            cliente = self.identidad.get(cliente_id)
+            if cliente is not None: encontrados[cliente_id] = cliente
+            elif cliente_id is not None: faltantes.append(cliente_id)
+        if faltantes:
+            for datos in self.api.enviar("POST", "api/clientes/lote", {"ids": faltantes}):
+                encontrados[datos["id"]] = self._mapear_a_cliente(datos)
+        return encontrados
+
+    def get_by_dni(self, dni: str) -> Optional[Cliente]:
+        clientes = self._mapear_lista(self.api.get("api/clientes", {"dni": dni}))
+        return clientes[0] if clientes else None
+
+    def search(self, term: str) -> List[Cliente]:
+        return self._mapear_lista(self.api.get("api/clientes", {"buscar": term}))
+
+    def iter_export(self, term: str = "") -> Tuple[List[str], Iterator[tuple]]:
+        lineas = self.api.iter_lineas("api/clientes/exportar", {"buscar": term})
+        columnas = next(lineas)
+        return columnas, (tuple(fila) for fila in lineas)
+
+    def save(self, cliente: Cliente) -> bool:
+        return self.api.enviar("POST", "api/clientes", cliente_a_dict(cliente), reportar=True) is not None
+
+    def delete(self, cliente_id: int) -> bool:
+        if self.api.enviar("DELETE", f"api/clientes/{cliente_id}", reportar=True) is not None:
+            self.identidad.descartar(cliente_id); return True
+        return False
+
+    def existing_dnis(self, dnis: Iterable[str]) -> Set[str]:
+        return set(self.api.enviar("POST", "api/clientes/existentes", {"dnis": list(dnis)}))
+
+    def insert_many(self, filas: List[tuple]) -> int:
+        return self.api.enviar("POST", "api/clientes/insertar", {"filas": [list(fila) for fila in filas]})["insertadas"]
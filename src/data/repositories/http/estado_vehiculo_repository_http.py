@@ -0,0 +1,21 @@
+# src/data/repositories/http/estado_vehiculo_repository_http.py
+from typing import Dict, Iterable, List, Optional
+from src.api.serializacion import dict_a_estado
+from src.data.datasources.api_client import ApiClient
+from src.domain.models.estado_vehiculo import EstadoVehiculo
+from src.domain.repositories.estado_vehiculo_repository import IEstadoVehiculoRepository
+
+class EstadoVehiculoRepositoryHttp(IEstadoVehiculoRepository):
+    """Catálogo pequeño: get_by_id/get_many salen de get_all (un 304 si no cambió)."""
+    def __init__(self, api: ApiClient):
+        self.api = api
+
+    def get_all(self) -> List[EstadoVehiculo]:
+        return [dict_a_estado(datos) for datos in self.api.get("api/estados")]
+
+    def get_by_id(self, id: int) -> Optional[EstadoVehiculo]:
+        return next((estado for estado in self.get_all() if estado.id == id), None)
+
+    def get_many(self, ids: Iterable[int]) -> Dict[int, EstadoVehiculo]:
+        buscados = set(ids)
+        return {estado.id: estado for estado in self.get_all() if estado.id in buscados}
@@ -0,0 +1,33 @@
+# src/data/repositories/http/reserva_repository_http.py
+from datetime import date
+from typing import List, Optional
+from src.api.serializacion import dict_a_reserva, reserva_a_dict
+from src.data.datasources.api_client import ApiClient, ApiError
+from src.domain.models.reserva import Reserva
+from src.domain.repositories.reserva_repository import IReservaRepository
+
+class ReservaRepositoryHttp(IReservaRepository):
+    def __init__(self, api: ApiClient):
+        self.api = api
+
+    def get_activas(self, desde: Optional[date] = None) -> List[Reserva]:
+        lista = self.api.get("api/reservas", {"desde": desde.isoformat() if desde else None})
+        return [dict_a_reserva(datos) for datos in lista]
+
+    def get_by_id(self, reserva_id: int) -> Optional[Reserva]:
+        try:
+            return dict_a_reserva(self.api.get(f"api/reservas/{reserva_id}"))
+        except ApiError as e:
+            if e.status == 404: return None
+            raise
+
+    def create(self, reserva: Reserva) -> Optional[int]:
+        try:
+            return self.api.enviar("POST", "api/reservas", reserva_a_dict(reserva))["id"]
+        except ApiError as e:
+            if e.status == 409: return None # Solapada: mismo contrato que la guarda de la BD
+            raise
+
+    def cancel(self, reserva_id: int) -> bool:
+        resultado = self.api.enviar("POST", f"api/reservas/{reserva_id}/cancelar", reportar=True)
+        return bool(resultado and resultado.get("ok"))
@@ -0,0 +1,25 @@
+# src/data/repositories/http/sincronizacion_repository_http.py
+import logging
+from typing import Dict, List, Tuple
+from src.data.datasources.api_client import ApiClient
+from src.data.datasources.errores import DataSourceError
+from src.domain.repositories.sincronizacion_repository import ISincronizacionRepository
+
+logger = logging.getLogger(__name__)
+
+class SincronizacionRepositoryHttp(ISincronizacionRepository):
+    """Tokens de cambio leídos por el servicio (compartidos entre todos los clientes)."""
+    def __init__(self, api: ApiClient):
+        self.api = api
+
+    def get_change_tokens(self, tablas: List[str]) -> Dict[str, Tuple]:
+        try:
+            tokens = self.api.get("api/tokens", {"tablas": ",".join(tablas)})
+        except DataSourceError as e:
+            logger.warning("No se pudieron obtener los tokens de cambio: %s", e)
+            return {}
+        # JSON no tiene tuplas: se restauran para comparar con los tokens guardados (snapshot)
+        return {tabla: tuple(token) for tabla, token in tokens.items()}
+
+    def purge_tombstones(self, retencion_dias: int) -> int:
+        raise NotImplementedError("La purga de lápidas requiere acceso directo a la BD (python cli.py purgar-eliminaciones).")
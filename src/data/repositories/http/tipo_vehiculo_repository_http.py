@@ -0,0 +1,21 @@
+# src/data/repositories/http/tipo_vehiculo_repository_http.py
+from typing import Dict, Iterable, List, Optional
+from src.api.serializacion import dict_a_tipo
+from src.data.datasources.api_client import ApiClient
+from src.domain.models.tipo_vehiculo import TipoVehiculo
+from src.domain.repositories.tipo_vehiculo_repository import ITipoVehiculoRepository
+
+class TipoVehiculoRepositoryHttp(ITipoVehiculoRepository):
+    """Catálogo pequeño: get_by_id/get_many salen de get_all (un 304 si no cambió)."""
+    def __init__(self, api: ApiClient):
+        self.api = api
+
+    def get_all(self) -> List[TipoVehiculo]:
+        return [dict_a_tipo(datos) for datos in self.api.get("api/tipos")]
+
+    def get_by_id(self, id: int) -> Optional[TipoVehiculo]:
+        return next((tipo for tipo in self.get_all() if tipo.id == id), None)
+
+    def get_many(self, ids: Iterable[int]) -> Dict[int, TipoVehiculo]:
+        buscados = set(ids)
+        return {tipo.id: tipo for tipo in self.get_all() if tipo.id in buscados}
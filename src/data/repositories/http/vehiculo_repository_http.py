@@ -0,0 +1,101 @@
+# src/data/repositories/http/vehiculo_repository_http.py
+import logging
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from src.api.serializacion import CAMPOS_VEHICULO, dict_a_vehiculo, vehiculo_a_dict
+from src.data.datasources.api_client import ApiClient, ApiError
+from src.data.repositories.identity_map import IdentityMap
+from src.utils.tracing import trazado
+from src.domain.models.cambios import Cambios
+from src.domain.models.vehiculo import Vehiculo, TipoVehiculo, EstadoVehiculo
+from src.domain.repositories.vehiculo_repository import IVehiculoRepository
+
+logger = logging.getLogger(__name__)
+
+class VehiculoRepositoryHttp(IVehiculoRepository):
+    def __init__(self, api: ApiClient):
+        self.api = api
+        self.identidad: IdentityMap[Vehiculo] = IdentityMap()
+
+    def _mapear_a_vehiculo(self, datos: Dict[str, Any], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Vehiculo:
+        fila = tuple(datos.get(campo) for campo in CAMPOS_VEHICULO)
+        vehiculo = self.identidad.obtener(datos["id"], fila, lambda: dict_a_vehiculo(datos, mapa_tipos, mapa_estados))
+        # Misma fila pero catálogos recargados: apuntar a los objetos vigentes
+        tipo_obj, estado_obj = mapa_tipos.get(datos["tipo_id"]), mapa_estados.get(datos["estado_id"])
+        if tipo_obj is not None and vehiculo.tipo is not tipo_obj: vehiculo.tipo = tipo_obj
+        if estado_obj is not None and vehiculo.estado is not estado_obj: vehiculo.estado = estado_obj
+        return vehiculo
+
+    @trazado("repo", nombre="hidratar", argumentos=lambda _repo, lista, *_a: {"filas": len(lista)})
+    def _mapear_lista(self, lista: List[Dict[str, Any]], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]:
+        vehiculos = []
+        for datos in lista:
+            try: vehiculos.append(self._mapear_a_vehiculo(datos, mapa_tipos, mapa_estados))
+            except Exception as e: logger.error("Error al mapear vehículo: %s - Error: %s", datos, e)
+        return vehiculos
+
+    def get_all(self, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]:
+        return self._mapear_lista(self.api.get("api/vehiculos"), mapa_tipos, mapa_estados)
+
+    def get_by_id(self, vehiculo_id: int, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Optional[Vehiculo]:
+        try:
+            return self._mapear_a_vehiculo(self.api.get(f"api/vehiculos/{vehiculo_id}"), mapa_tipos, mapa_estados)
+        except ApiError as e:
+            if e.status == 404: return None
+            raise
+
+    def get_many(self, vehiculo_ids: Iterable[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo], recargar: bool = False) -> Dict[int, Vehiculo]:
+        encontrados, faltantes = {}, []
+        for vehiculo_id in dict.fromkeys(vehiculo_ids):
+            vehiculo = None if recargar else self.identidad.get(vehiculo_id)
+            if vehiculo is not None: encontrados[vehiculo_id] = vehiculo
+            elif vehiculo_id is not None: faltantes.append(vehiculo_id)
+        if faltantes:
+            lista = self.api.enviar("POST", "api/vehiculos/lote", {"ids": faltantes, "recargar": recargar})
+            for vehiculo in self._mapear_lista(lista, mapa_tipos, mapa_estados):
+                encontrados[vehiculo.id] = vehiculo
+        return encontrados
+
+    def get_changes(self, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Optional[Cambios]:
+        # Sin seguimiento incremental por HTTP: get_all() es un 304 si nada cambió
+        return None
+
+    def save(self, vehiculo: Vehiculo) -> bool:
+        return self.api.enviar("POST", "api/vehiculos", vehiculo_a_dict(vehiculo), reportar=True) is not None
+
+    def delete(self, vehiculo_id: int) -> bool:
+        if self.api.enviar("DELETE", f"api/vehiculos/{vehiculo_id}", reportar=True) is not None:
+            self.identidad.descartar(vehiculo_id); return True
+        return False
+
+    def search_and_filter(self, term: str, estado_id: Optional[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]:
+        return self._mapear_lista(self.api.get("api/vehiculos", {"buscar": term, "estado_id": estado_id}), mapa_tipos, mapa_estados)
+
+    def iter_export(self, term: str = "", estado_id: Optional[int] = None) -> Tuple[List[str], Iterator[tuple]]:
+        lineas = self.api.iter_lineas("api/vehiculos/exportar", {"buscar": term, "estado_id": estado_id})
+        columnas = next(lineas)
+        return columnas, (tuple(fila) for fila in lineas)
+
+    # --- Operaciones masivas (una petición, una sentencia en el servicio) ---
+
+    def existing_placas(self, placas: Iterable[str]) -> Set[str]:
+        return set(self.api.enviar("POST", "api/vehiculos/existentes", {"placas": list(placas)}))
+
+    def insert_many(self, filas: List[tuple]) -> int:
+        return self.api.enviar("POST", "api/vehiculos/insertar", {"filas": [list(fila) for fila in filas]})["insertadas"]
+
+    def bulk_update_price(self, factor: float, tipo_id: Optional[int] = None, anio_desde: Optional[int] = None,
+                          anio_hasta: Optional[int] = None, marca: Optional[str] = None) -> List[int]:
+        cuerpo = {"factor": factor, "tipo_id": tipo_id, "anio_desde": anio_desde, "anio_hasta": anio_hasta, "marca": marca}
+        return self.api.enviar("POST", "api/vehiculos/precios", cuerpo)["ids"]
+
+    def bulk_update_estado(self, vehiculo_ids: Iterable[int], estado_id: int, estado_origen_id: Optional[int] = None) -> List[int]:
+        cuerpo = {"ids": [int(i) for i in dict.fromkeys(vehiculo_ids) if i is not None], "estado_id": estado_id, "estado_origen_id": estado_origen_id}
+        return self.api.enviar("POST", "api/vehiculos/estado", cuerpo)["ids"]
+
+    # --- Mantenimiento de imágenes: solo con acceso directo a la BD (cli.py imagenes) ---
+
+    def iter_imagen_paths(self) -> Iterator[Tuple[int, str]]:
+        raise NotImplementedError("La auditoría de imágenes requiere acceso directo a la BD (python cli.py imagenes).")
+
+    def clear_imagen_paths(self, vehiculo_ids: List[int]) -> int:
+        raise NotImplementedError("La auditoría de imágenes requiere acceso directo a la BD (python cli.py imagenes).")
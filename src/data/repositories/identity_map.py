@@ -0,0 +1,124 @@
+# src/data/repositories/identity_map.py
+#
+# Capa de Datos.
+# Mapa de identidad por sesión: cada fila de la BD (por su clave) corresponde
+# a una única instancia en memoria. Las lecturas repetidas (get_all, search,
+# sincronización) reutilizan la instancia si la fila no cambió, y la
+# actualizan en el lugar si cambió, de modo que las referencias que ya tiene
+# la UI (selección, listas) siguen siendo válidas.
+#
+# Las referencias son débiles: una entidad que nadie usa se libera sola.
+#
+# Opcionalmente guarda una instantánea "limpia" de cada entidad (los valores
+# por columna tal como se leyeron) para que save() envíe solo lo modificado.
+
+import threading
+import weakref
+from dataclasses import fields
+from typing import Any, Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+def _sin_vacio(valor: Any) -> Any:
+    return None if valor == "" else valor
+
+class IdentityMap(Generic[T]):
+    def __init__(self, instantanea: Optional[Callable[[T], Dict[str, Any]]] = None):
+        """
+        Args:
+            instantanea: Convierte la entidad en {columna: valor}. Si se indica,
+                se guarda al cargar cada fila (ver valores_limpios).
+        """
+        self.instantanea = instantanea
+        # clave -> (referencia débil a la entidad, fila con la que se cargó, valores limpios)
+        self._entradas: Dict[Hashable, Tuple[weakref.ref, tuple, Optional[Dict[str, Any]]]] = {}
+        # RLock: el callback de una referencia débil puede ejecutarse durante
+        # una recolección disparada dentro de la sección crítica
+        self._lock = threading.RLock()
+
+    def _referencia(self, clave: Hashable, instancia: T) -> weakref.ref:
+        def _al_liberar(ref, clave=clave):
+            with self._lock:
+                entrada = self._entradas.get(clave)
+                if entrada is not None and entrada[0] is ref:
+                    del self._entradas[clave]
+        return weakref.ref(instancia, _al_liberar)
+
+    def obtener(self, clave: Hashable, fila: tuple, crear: Callable[[], T]) -> T:
+        """
+        Retorna la instancia de la clave. 'crear' solo se llama si la fila
+        es nueva o cambió respecto de la última lectura.
+        """
+        fila = tuple(fila)
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            existente = entrada[0]() if entrada is not None else None
+            if existente is not None and entrada[1] == fila:
+                return existente
+
+        nueva = crear() # Puede lanzar (fila inválida): no se registra nada
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            existente = entrada[0]() if entrada is not None else None
+            if existente is not None:
+                # Misma entidad, datos nuevos: actualizar en el lugar
+                for campo in fields(existente):
+                    setattr(existente, campo.name, getattr(nueva, campo.name))
+                self._entradas[clave] = (entrada[0], fila, self._limpios(existente))
+                return existente
+            self._entradas[clave] = (self._referencia(clave, nueva), fila, self._limpios(nueva))
+            return nueva
+
+    def _limpios(self, instancia: T) -> Optional[Dict[str, Any]]:
+        return self.instantanea(instancia) if self.instantanea else None
+
+    def valores_limpios(self, clave: Hashable) -> Optional[Dict[str, Any]]:
+        """
+        Valores por columna de la última lectura de la fila, o None si la
+        entidad no está en memoria (el llamador debe asumir todo modificado).
+        """
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is None or entrada[0]() is None:
+                return None
+            return entrada[2]
+
+    def columnas_modificadas(self, clave: Hashable, actuales: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Subconjunto de 'actuales' que difiere de la última lectura (todo si no
+        hay lectura). '' y NULL se consideran iguales: el formulario entrega
+        cadenas vacías para los campos opcionales que en la BD son NULL.
+        """
+        limpios = self.valores_limpios(clave)
+        if limpios is None:
+            return dict(actuales)
+        return {
+            columna: valor for columna, valor in actuales.items()
+            if _sin_vacio(limpios.get(columna)) != _sin_vacio(valor)
+        }
+
+    def marcar_guardadas(self, clave: Hashable, valores: Dict[str, Any]) -> None:
+        """
+        Incorpora a los valores limpios las columnas recién escritas en la BD.
+        Sin esto, volver al valor leído antes del save() no contaría como cambio.
+        """
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            if entrada is not None and entrada[2] is not None:
+                # La fila leída ya no es la de la BD: la próxima lectura refresca la entidad
+                self._entradas[clave] = (entrada[0], (), {**entrada[2], **valores})
+
+    def get(self, clave: Hashable) -> Optional[T]:
+        """Instancia ya cargada, o None."""
+        with self._lock:
+            entrada = self._entradas.get(clave)
+            return entrada[0]() if entrada is not None else None
+
+    def descartar(self, clave: Hashable) -> None:
+        """Olvida la clave (fila eliminada)."""
+        with self._lock:
+            self._entradas.pop(clave, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entradas)
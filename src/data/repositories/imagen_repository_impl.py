@@ -0,0 +1,55 @@
+# src/data/repositories/imagen_repository_impl.py
+#
+# Capa de Datos (Implementación del Repositorio).
+# Acceso al directorio de imágenes de vehículos (vehicle_images/).
+
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+from src.domain.repositories.imagen_repository import IImagenRepository
+
+logger = logging.getLogger(__name__)
+
+class ImagenRepositoryImpl(IImagenRepository):
+    def __init__(self, images_dir: str = "vehicle_images", max_workers: int = 16):
+        """
+        Args:
+            images_dir (str): Directorio de imágenes (relativo al directorio actual).
+            max_workers (int): Hilos usados para los stat en paralelo.
+        """
+        self.images_dir = os.path.join(os.getcwd(), images_dir)
+        self.max_workers = max_workers
+
+    def iter_nombres(self) -> Iterator[str]:
+        # os.scandir evita un stat por entrada para saber si es archivo
+        if not os.path.isdir(self.images_dir):
+            return
+        with os.scandir(self.images_dir) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    yield entry.name
+
+    def _stat(self, nombre: str) -> Optional[Tuple[int, float]]:
+        try:
+            st = os.stat(os.path.join(self.images_dir, nombre))
+            return st.st_size, st.st_mtime
+        except OSError:
+            return None
+
+    def stat_many(self, nombres: Iterable[str]) -> Dict[str, Tuple[int, float]]:
+        nombres = list(nombres)
+        if not nombres:
+            return {}
+        # El stat es I/O puro: en discos de red el paralelismo oculta la latencia
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            resultados = executor.map(self._stat, nombres, chunksize=256)
+            return {nombre: st for nombre, st in zip(nombres, resultados) if st is not None}
+
+    def delete(self, nombre: str) -> bool:
+        try:
+            os.remove(os.path.join(self.images_dir, nombre))
+            return True
+        except OSError as e:
+            logger.error("Error al eliminar imagen %s: %s", nombre, e)
+            return False
@@ -0,0 +1,34 @@
+# src/data/repositories/lotes.py
+#
+# Capa de Datos.
+# Consultas "WHERE <columna> IN (...)" por lotes. SQL Server admite como
+# máximo 2100 parámetros por sentencia; se usan lotes de 1000.
+
+from typing import Any, Iterable, Iterator, List
+
+TAMANO_LOTE = 1000
+
+def lotes(valores: Iterable[Any], tamano: int = TAMANO_LOTE) -> Iterator[List[Any]]:
+    """Parte 'valores' en listas de como mucho 'tamano' elementos."""
+    lote = []
+    for valor in valores:
+        lote.append(valor)
+        if len(lote) == tamano:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+def consultar_por_ids(datasource, query: str, ids: Iterable[int], tamano: int = TAMANO_LOTE) -> List[tuple]:
+    """
+    Ejecuta 'query' (con un "{}" donde van los marcadores del IN) una vez por
+    lote de ids y concatena las filas. Los ids repetidos o None se descartan.
+    """
+    unicos = list(dict.fromkeys(i for i in ids if i is not None))
+    filas = []
+    for lote in lotes(unicos, tamano):
+        results = datasource.execute_query(query.format(", ".join("?" * len(lote))), tuple(lote))
+        if results is None:
+            raise Exception("Error al consultar por lotes de IDs.")
+        filas.extend(results)
+    return filas
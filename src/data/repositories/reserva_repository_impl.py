@@ -0,0 +1,85 @@
+# src/data/repositories/reserva_repository_impl.py
+import logging
+from datetime import date, datetime
+from typing import List, Optional
+from src.domain.models.reserva import Reserva, ESTADO_ACTIVA, ESTADO_CANCELADA
+from src.domain.repositories.reserva_repository import IReservaRepository
+from src.data.datasources.errores import DataSourceError
+from src.data.datasources.sql_server_datasource import SQLServerDataSource
+
+logger = logging.getLogger(__name__)
+
+_COLUMNAS = "ReservaID, ClienteID, VehiculoID, FechaInicio, FechaFin, Estado"
+
+def _a_fecha(valor) -> date:
+    """DATE de SQL Server llega como date; en SQLite como texto ISO."""
+    if isinstance(valor, datetime): return valor.date()
+    if isinstance(valor, date): return valor
+    return date.fromisoformat(str(valor)[:10])
+
+class ReservaRepositoryImpl(IReservaRepository):
+    def __init__(self, datasource: SQLServerDataSource):
+        self.datasource = datasource
+
+    def _fecha(self, valor: date):
+        # sqlite3 ya no adapta date por defecto: se guarda como texto ISO (ordena igual)
+        return valor.isoformat() if self.datasource.dialect == "sqlite" else valor
+
+    def _mapear_a_reserva(self, row: tuple) -> Reserva:
+        return Reserva(
+            id=row[0], cliente_id=row[1], vehiculo_id=row[2],
+            fecha_inicio=_a_fecha(row[3]), fecha_fin=_a_fecha(row[4]),
+            estado=row[5]
+        )
+
+    def _mapear_filas(self, results) -> List[Reserva]:
+        reservas = []
+        for row in results or []:
+            try: reservas.append(self._mapear_a_reserva(row))
+            except Exception as e: logger.error("Error al mapear reserva: %s - Error: %s", row, e)
+        return reservas
+
+    def get_activas(self, desde: Optional[date] = None) -> List[Reserva]:
+        query = f"SELECT {_COLUMNAS} FROM Reservas WHERE Estado = ?"
+        params = [ESTADO_ACTIVA]
+        if desde is not None:
+            query += " AND FechaFin > ?"
+            params.append(self._fecha(desde))
+        results = self.datasource.execute_query(query + " ORDER BY VehiculoID, FechaInicio", tuple(params))
+        if results is None:
+            raise Exception("No se pudieron cargar las reservas.")
+        return self._mapear_filas(results)
+
+    def get_by_id(self, reserva_id: int) -> Optional[Reserva]:
+        results = self.datasource.execute_query(f"SELECT {_COLUMNAS} FROM Reservas WHERE ReservaID = ?", (reserva_id,))
+        reservas = self._mapear_filas(results)
+        return reservas[0] if reservas else None
+
+    def create(self, reserva: Reserva) -> Optional[int]:
+        # Verificación y alta en una sola sentencia; en SQL Server el UPDLOCK/HOLDLOCK
+        # bloquea el rango del índice para que dos mostradores no reserven a la vez.
+        # OUTPUT/RETURNING distingue "no insertó" (sin filas) de un error (None).
+        mssql = self.datasource.dialect == "mssql"
+        bloqueo = " WITH (UPDLOCK, HOLDLOCK)" if mssql else ""
+        query = (
+            "INSERT INTO Reservas (ClienteID, VehiculoID, FechaInicio, FechaFin, Estado) "
+            + ("OUTPUT inserted.ReservaID " if mssql else "")
+            + "SELECT ?, ?, ?, ?, ? "
+            f"WHERE NOT EXISTS (SELECT 1 FROM Reservas{bloqueo} WHERE VehiculoID = ? AND Estado = ? AND FechaInicio < ? AND FechaFin > ?)"
+            + ("" if mssql else " RETURNING ReservaID")
+        )
+        inicio, fin = self._fecha(reserva.fecha_inicio), self._fecha(reserva.fecha_fin)
+        params = (
+            reserva.cliente_id, reserva.vehiculo_id, inicio, fin, ESTADO_ACTIVA,
+            reserva.vehiculo_id, ESTADO_ACTIVA, fin, inicio
+        )
+        results = self.datasource.execute_returning(query, params)
+        if results is None:
+            raise DataSourceError("No se pudo registrar la reserva (error de base de datos).")
+        return results[0][0] if results else None
+
+    def cancel(self, reserva_id: int) -> bool:
+        return self.datasource.execute_non_query(
+            "UPDATE Reservas SET Estado = ? WHERE ReservaID = ? AND Estado = ?",
+            (ESTADO_CANCELADA, reserva_id, ESTADO_ACTIVA)
+        )
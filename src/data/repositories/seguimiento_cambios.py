@@ -0,0 +1,89 @@
+# src/data/repositories/seguimiento_cambios.py
+#
+# Capa de Datos.
+# Marca de agua de rowversion por tabla, compartida por los repositorios
+# que soportan sincronización incremental (ver migración m0001_rowversion).
+
+import logging
+import time
+from typing import Callable, Optional
+from src.domain.models.cambios import RETENCION_ELIMINACIONES_DIAS, Cambios
+from src.data.datasources.sql_server_datasource import SQLServerDataSource
+
+logger = logging.getLogger(__name__)
+
+class SeguimientoCambios:
+    """
+    Recuerda el mayor rowversion ya leído de una tabla y pide solo lo posterior.
+    Se usa MIN_ACTIVE_ROWVERSION() como límite superior: los valores por debajo
+    están confirmados, así una transacción abierta de otro mostrador no se pierde.
+
+    Las lápidas de Eliminaciones se purgan tras RETENCION_ELIMINACIONES_DIAS:
+    si la última lectura es más vieja (con una hora de margen), alguna
+    eliminación pudo perderse y se pide una recarga completa.
+    """
+    VIGENCIA_SEGUNDOS = RETENCION_ELIMINACIONES_DIAS * 86400 - 3600
+
+    def __init__(self, datasource: SQLServerDataSource, tabla: str):
+        self.datasource = datasource
+        self.tabla = tabla
+        self.ultima_version: Optional[int] = None
+        self._leido_en = 0.0 # time.monotonic() de la última lectura
+        self._disponible: Optional[bool] = None
+
+    def disponible(self) -> bool:
+        """True si la migración está aplicada (columna RowVer y tabla Eliminaciones)."""
+        if self._disponible is None:
+            if getattr(self.datasource, "dialect", "mssql") != "mssql":
+                self._disponible = False # Sin rowversion (p. ej. SQLiteDataSource)
+                return False
+            results = self.datasource.execute_query(
+                "SELECT CASE WHEN COL_LENGTH(?, 'RowVer') IS NOT NULL AND OBJECT_ID('Eliminaciones') IS NOT NULL THEN 1 ELSE 0 END",
+                (self.tabla,)
+            )
+            self._disponible = bool(results and results[0][0])
+        return self._disponible
+
+    def _limite(self) -> Optional[int]:
+        results = self.datasource.execute_query("SELECT CONVERT(BIGINT, MIN_ACTIVE_ROWVERSION())")
+        return int(results[0][0]) if results else None
+
+    def iniciar(self) -> None:
+        """Llamar ANTES de una lectura completa: fija la marca de agua desde la que seguir."""
+        if self.disponible():
+            limite = self._limite()
+            self.ultima_version = limite - 1 if limite is not None else None
+            self._leido_en = time.monotonic()
+
+    def leer_cambios(self, select: str, mapear: Callable[[tuple], object]) -> Optional[Cambios]:
+        """
+        Args:
+            select (str): "SELECT <columnas>" de la tabla (sin FROM).
+            mapear: Convierte una fila en la entidad de dominio.
+        Retorna:
+            Optional[Cambios]: None si el seguimiento no está disponible o aún
+            no hubo una lectura completa (el llamador debe recargar todo).
+        """
+        if self.ultima_version is None or not self.disponible():
+            return None
+        if time.monotonic() - self._leido_en > self.VIGENCIA_SEGUNDOS:
+            logger.info("Marca de agua de %s más vieja que la retención de lápidas: recarga completa", self.tabla)
+            return None
+        leido_en = time.monotonic()
+        desde, hasta = self.ultima_version, self._limite()
+        if hasta is None:
+            return None
+        rango = "RowVer > CONVERT(BINARY(8), CAST(? AS BIGINT)) AND RowVer < CONVERT(BINARY(8), CAST(? AS BIGINT))"
+        filas = self.datasource.execute_query(f"{select} FROM {self.tabla} WHERE {rango}", (desde, hasta), cache=False)
+        eliminados = self.datasource.execute_query(
+            f"SELECT EntidadID FROM Eliminaciones WHERE Tabla = ? AND {rango}", (self.tabla, desde, hasta), cache=False
+        )
+        if filas is None or eliminados is None:
+            return None
+        self.ultima_version = hasta - 1
+        self._leido_en = leido_en
+        cambios = Cambios(eliminados=[row[0] for row in eliminados])
+        for row in filas:
+            try: cambios.modificados.append(mapear(row))
+            except Exception as e: logger.error("Error al mapear cambio de %s: %s - Error: %s", self.tabla, row, e)
+        return cambios
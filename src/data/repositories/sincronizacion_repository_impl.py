@@ -0,0 +1,112 @@
+# src/data/repositories/sincronizacion_repository_impl.py
+#
+# Capa de Datos (Implementación del Repositorio).
+# Tokens de cambio por tabla para validar cachés locales sin descargar los datos.
+
+from typing import Dict, List, Tuple
+from src.domain.repositories.sincronizacion_repository import ISincronizacionRepository
+from src.data.datasources.sql_server_datasource import SQLServerDataSource
+
+class SincronizacionRepositoryImpl(ISincronizacionRepository):
+
+    # Solo estas tablas pueden consultarse (el nombre se interpola en el SQL)
+    TABLAS = ("TiposVehiculo", "EstadosVehiculo", "Vehiculos", "Clientes", "Reservas")
+
+    def __init__(self, datasource: SQLServerDataSource):
+        self.datasource = datasource
+        self._existentes = None     # Tablas de TABLAS presentes en la base (Reservas llega con m0003)
+        self._con_rowversion = None # Tablas con columna RowVer (migración m0001)
+        self._ultimos_tokens: Dict[str, Tuple] = {}
+
+    def _es_sqlite(self) -> bool:
+        return getattr(self.datasource, "dialect", "mssql") == "sqlite"
+
+    def _tablas_existentes(self, tablas: List[str]) -> set:
+        # Se vuelve a mirar el catálogo solo si falta alguna tabla pedida (p. ej. se migró en caliente)
+        if self._existentes is None or not self._existentes.issuperset(tablas):
+            nombres = ", ".join(f"'{tabla}'" for tabla in self.TABLAS)
+            catalogo = "sqlite_master WHERE type = 'table' AND" if self._es_sqlite() else "sys.tables WHERE"
+            results = self.datasource.execute_query(f"SELECT name FROM {catalogo} name IN ({nombres})", cache=False)
+            if results is None:
+                return set(tablas) # Sin catálogo: que falle la consulta de tokens, no se oculta el error
+            self._existentes = {row[0] for row in results}
+        return self._existentes
+
+    def _tablas_con_rowversion(self) -> set:
+        if self._con_rowversion is None:
+            # system_type_id 189 = rowversion/timestamp
+            results = self.datasource.execute_query("SELECT OBJECT_NAME(object_id) FROM sys.columns WHERE name = 'RowVer' AND system_type_id = 189", cache=False)
+            self._con_rowversion = {row[0] for row in results} if results else set()
+        return self._con_rowversion
+
+    def get_change_tokens(self, tablas: List[str]) -> Dict[str, Tuple]:
+        """
+        Token = (cantidad de filas, sello de modificación), todas las tablas en
+        una sola consulta. El sello es MAX(RowVer) si la tabla tiene rowversion
+        (búsqueda en índice); si no, CHECKSUM_AGG(BINARY_CHECKSUM(*)), que el
+        servidor calcula recorriendo la tabla pero del que solo viaja un número.
+        Las tablas que aún no existen (migración pendiente) no tienen token:
+        una sola tabla faltante haría fallar todo el UNION ALL.
+        """
+        tablas = [t for t in tablas if t in self.TABLAS]
+        if tablas:
+            existentes = self._tablas_existentes(tablas)
+            tablas = [t for t in tablas if t in existentes]
+        if not tablas:
+            return {}
+        if self._es_sqlite():
+            return self._tokens_sqlite(tablas)
+        con_rowversion = self._tablas_con_rowversion()
+        query = " UNION ALL ".join(
+            f"SELECT '{tabla}', COUNT_BIG(*), "
+            + ("CONVERT(BIGINT, MAX(RowVer))" if tabla in con_rowversion else "CHECKSUM_AGG(BINARY_CHECKSUM(*))")
+            + f" FROM {tabla}"
+            for tabla in tablas
+        )
+        results = self.datasource.execute_query(query, cache=False)
+        if not results:
+            return {}
+        tokens = {row[0]: (row[1], row[2]) for row in results}
+
+        # Un token distinto al último visto significa que otro equipo escribió
+        # en la tabla: sus resultados en la caché del DataSource ya no valen.
+        cambiadas = [t for t, token in tokens.items() if t in self._ultimos_tokens and self._ultimos_tokens[t] != token]
+        self._ultimos_tokens.update(tokens)
+        if cambiadas:
+            self.datasource.invalidate_cache(cambiadas)
+        return tokens
+
+    def purge_tombstones(self, retencion_dias: int) -> int:
+        """
+        Borra de Eliminaciones las lápidas con más de 'retencion_dias', en
+        lotes de 5000 para no escalar a un bloqueo de tabla mientras los
+        mostradores leen cambios. Sin la migración m0001 (o en SQLite) no hay nada que purgar.
+        """
+        if getattr(self.datasource, "dialect", "mssql") != "mssql":
+            return 0
+        query = """
+            IF OBJECT_ID('Eliminaciones') IS NULL
+                SELECT 0
+            ELSE
+            BEGIN
+                DELETE TOP (5000) FROM Eliminaciones WHERE EliminadoEn < DATEADD(DAY, -?, SYSUTCDATETIME());
+                SELECT @@ROWCOUNT;
+            END
+        """
+        purgadas = 0
+        while True:
+            results = self.datasource.execute_returning(query, (retencion_dias,))
+            if results is None:
+                raise Exception("No se pudieron purgar las lápidas de Eliminaciones.")
+            borradas = int(results[0][0]) if results else 0
+            purgadas += borradas
+            if borradas < 5000:
+                return purgadas
+
+    def _tokens_sqlite(self, tablas: List[str]) -> Dict[str, Tuple]:
+        """Base local: (filas, escrituras hechas por el DataSource)."""
+        query = " UNION ALL ".join(f"SELECT '{tabla}', COUNT(*) FROM {tabla}" for tabla in tablas)
+        results = self.datasource.execute_query(query, cache=False)
+        if not results:
+            return {}
+        return {row[0]: (row[1], self.datasource.contador_escrituras(row[0])) for row in results}
@@ -0,0 +1,63 @@
+# src/data/repositories/snapshot_repository_impl.py
+#
+# Capa de Datos (Implementación del Repositorio).
+# Snapshot de la flota en un archivo binario versionado dentro del
+# directorio de datos del usuario (p. ej. %LOCALAPPDATA%\DriveFlow).
+
+import logging
+import hashlib
+import os
+import pickle
+from typing import Optional
+from src.domain.models.snapshot_flota import SnapshotFlota
+from src.domain.repositories.snapshot_repository import ISnapshotRepository
+
+logger = logging.getLogger(__name__)
+
+class SnapshotRepositoryImpl(ISnapshotRepository):
+
+    MAGIC = b"DFSNAP"
+    # Incrementar al cambiar los modelos: los snapshots antiguos se descartan
+    VERSION = 1
+
+    def __init__(self, clave: str, directorio: Optional[str] = None):
+        """
+        Args:
+            clave (str): Identifica la base de datos (ej. "servidor/AlquilerAutos"),
+                para no mezclar snapshots de distintos servidores.
+            directorio (str): Directorio destino. Por defecto, el de datos del usuario.
+        """
+        if directorio is None:
+            from platformdirs import user_data_dir
+            directorio = user_data_dir("DriveFlow", appauthor=False)
+        nombre = hashlib.sha1(clave.encode("utf-8")).hexdigest()[:16]
+        self.path = os.path.join(directorio, f"snapshot_{nombre}.bin")
+
+    def load(self) -> Optional[SnapshotFlota]:
+        try:
+            with open(self.path, "rb") as f:
+                if f.read(len(self.MAGIC)) != self.MAGIC:
+                    return None
+                if int.from_bytes(f.read(2), "little") != self.VERSION:
+                    return None
+                snapshot = pickle.load(f)
+            return snapshot if isinstance(snapshot, SnapshotFlota) else None
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning("Snapshot local ilegible, se descartará: %s", e)
+            return None
+
+    def save(self, snapshot: SnapshotFlota) -> bool:
+        tmp_path = self.path + ".tmp"
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(self.MAGIC)
+                f.write(self.VERSION.to_bytes(2, "little"))
+                pickle.dump(snapshot, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.path) # Reemplazo atómico
+            return True
+        except Exception as e:
+            logger.warning("No se pudo guardar el snapshot local: %s", e)
+            return False
@@ -1,8 +1,12 @@
 # src/data/repositories/tipo_vehiculo_repository_impl.py
-from typing import List, Optional
+import logging
+from typing import Dict, Iterable, List, Optional
 from src.domain.models.tipo_vehiculo import TipoVehiculo
 from src.domain.repositories.tipo_vehiculo_repository import ITipoVehiculoRepository
 from src.data.datasources.sql_server_datasource import SQLServerDataSource
+from src.data.repositories.lotes import consultar_por_ids
+
+logger = logging.getLogger(__name__)
 
 class TipoVehiculoRepositoryImpl(ITipoVehiculoRepository):
     def __init__(self, datasource: SQLServerDataSource):
@@ -27,7 +31,7 @@ class TipoVehiculoRepositoryImpl(ITipoVehiculoRepository):
         if results:
             for row in results:
                 try: tipos.append(self._mapear_a_tipo(row))
-                except Exception as e: print(f"Error al mapear TipoVehiculo (fila: {row}): {e}")
+                except Exception as e: logger.error("Error al mapear TipoVehiculo (fila: %s): %s", row, e)
         return tipos
 
     def get_by_id(self, id: int) -> Optional[TipoVehiculo]:
@@ -35,6 +39,13 @@ class TipoVehiculoRepositoryImpl(ITipoVehiculoRepository):
         results = self.datasource.execute_query(query, (id,))
         if results:
             try: return self._mapear_a_tipo(results[0])
-            except Exception as e: print(f"Error al mapear TipoVehiculo ID {id}: {e}")
+            except Exception as e: logger.error("Error al mapear TipoVehiculo ID %s: %s", id, e)
         return None
 
+    def get_many(self, ids: Iterable[int]) -> Dict[int, TipoVehiculo]:
+        query = "SELECT TipoID, NombreTipo, GarantiaBase FROM TiposVehiculo WHERE TipoID IN ({})"
+        encontrados = {}
+        for row in consultar_por_ids(self.datasource, query, ids):
+            try: encontrados[row[0]] = self._mapear_a_tipo(row)
+            except Exception as e: logger.error("Error al mapear TipoVehiculo ID %s: %s", row[0], e)
+        return encontrados
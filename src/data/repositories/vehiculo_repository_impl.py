@@ -1,16 +1,29 @@
 # src/data/repositories/vehiculo_repository_impl.py
-from typing import List, Optional, Dict
+import logging
+import json
+from typing import Any, List, Optional, Dict, Iterable, Iterator, Set, Tuple
 from src.domain.models.vehiculo import Vehiculo, TipoVehiculo, EstadoVehiculo
 from src.domain.repositories.vehiculo_repository import IVehiculoRepository
 from src.domain.repositories.tipo_vehiculo_repository import ITipoVehiculoRepository
 from src.domain.repositories.estado_vehiculo_repository import IEstadoVehiculoRepository
 from src.data.datasources.sql_server_datasource import SQLServerDataSource
+from src.data.repositories.seguimiento_cambios import SeguimientoCambios
+from src.data.repositories.identity_map import IdentityMap
+from src.data.repositories.lotes import consultar_por_ids, lotes
+from src.data.repositories.busqueda import CONTIENE, ESCAPE, ModoBusqueda, patron_prefijo
+from src.domain.models.cambios import Cambios
+from src.utils.tracing import span, trazado
+
+logger = logging.getLogger(__name__)
 
 class VehiculoRepositoryImpl(IVehiculoRepository):
-    def __init__(self, datasource: SQLServerDataSource, tipo_repo: ITipoVehiculoRepository, estado_repo: IEstadoVehiculoRepository):
+    def __init__(self, datasource: SQLServerDataSource, tipo_repo: ITipoVehiculoRepository, estado_repo: IEstadoVehiculoRepository, modo_busqueda: str = CONTIENE):
         self.datasource = datasource
+        self.busqueda = ModoBusqueda(datasource, modo_busqueda, "Vehiculos", "MarcaBusq") # "contiene" o "prefijo"
         self.tipo_repo = tipo_repo
         self.estado_repo = estado_repo
+        self.seguimiento = SeguimientoCambios(datasource, "Vehiculos")
+        self.identidad: IdentityMap[Vehiculo] = IdentityMap(instantanea=self._valores_columnas)
 
     def _mapear_a_vehiculo(self, row: tuple, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Vehiculo:
         tipo_id, estado_id = row[5], row[6]
@@ -21,7 +34,7 @@ class VehiculoRepositoryImpl(IVehiculoRepository):
         estado_obj = mapa_estados.get(estado_id)
         if not estado_obj: estado_obj = EstadoVehiculo(id=estado_id, nombre_estado="Estado Desconocido")
 
-        return Vehiculo(
+        vehiculo = self.identidad.obtener(row[0], row, lambda: Vehiculo(
             id=row[0],
             marca=row[1] or "",
             modelo=row[2] or "",
@@ -32,56 +45,198 @@ class VehiculoRepositoryImpl(IVehiculoRepository):
             precio_por_dia=float(row[7]) if row[7] else 0.0,
             kilometraje=int(row[8]) if row[8] else None,
             imagen_path=row[9] or None
-        )
+        ))
+        # Misma fila pero catálogos recargados: apuntar a los objetos vigentes
+        if vehiculo.tipo is not tipo_obj: vehiculo.tipo = tipo_obj
+        if vehiculo.estado is not estado_obj: vehiculo.estado = estado_obj
+        return vehiculo
+
+    @staticmethod
+    def _valores_columnas(vehiculo: Vehiculo) -> Dict[str, Any]:
+        """Columnas editables de Vehiculos con su valor en la entidad."""
+        return {
+            "Marca": vehiculo.marca, "Modelo": vehiculo.modelo, "Anio": vehiculo.anio, "Placa": vehiculo.placa,
+            "TipoID": vehiculo.tipo.id, "EstadoID": vehiculo.estado.id, "PrecioPorDia": vehiculo.precio_por_dia,
+            "Kilometraje": vehiculo.kilometraje, "ImagenPath": vehiculo.imagen_path
+        }
 
+    @trazado("repo")
     def get_all(self, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]:
+        self.seguimiento.iniciar() # Marca de agua para get_changes()
         query = "SELECT VehiculoID, Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath FROM Vehiculos ORDER BY Marca, Modelo"
-        results = self.datasource.execute_query(query)
+        # Sin caché: la lectura debe ser posterior a la marca de agua
+        results = self.datasource.execute_query(query, cache=False)
         vehiculos = []
-        if results:
-            for row in results:
+        with span("hidratar", "repo", filas=len(results or ())):
+            for row in results or ():
                 try: vehiculos.append(self._mapear_a_vehiculo(row, mapa_tipos, mapa_estados))
-                except Exception as e: print(f"Error al mapear vehículo: {row} - Error: {e}")
+                except Exception as e: logger.error("Error al mapear vehículo: %s - Error: %s", row, e)
         return vehiculos
 
+    @trazado("repo")
     def get_by_id(self, vehiculo_id: int, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Optional[Vehiculo]:
         # La consulta SQL debe ser genérica, el _mapear_a_vehiculo usa los índices
         query = "SELECT VehiculoID, Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath FROM Vehiculos WHERE VehiculoID = ?"
         results = self.datasource.execute_query(query, (vehiculo_id,))
         if results:
             try: return self._mapear_a_vehiculo(results[0], mapa_tipos, mapa_estados)
-            except Exception as e: print(f"Error al mapear vehículo ID {vehiculo_id}: {e}")
+            except Exception as e: logger.error("Error al mapear vehículo ID %s: %s", vehiculo_id, e)
         return None
 
+    @trazado("repo")
+    def get_many(self, vehiculo_ids: Iterable[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo], recargar: bool = False) -> Dict[int, Vehiculo]:
+        """
+        Primero el mapa de identidad; los faltantes se piden en lotes de IN (...).
+        Con 'recargar' se leen todos de la BD (tras una escritura masiva): las
+        instancias ya cargadas se actualizan en el lugar.
+        """
+        encontrados, faltantes = {}, []
+        for vehiculo_id in dict.fromkeys(vehiculo_ids):
+            vehiculo = None if recargar else self.identidad.get(vehiculo_id)
+            if vehiculo is not None: encontrados[vehiculo_id] = vehiculo
+            elif vehiculo_id is not None: faltantes.append(vehiculo_id)
+        if faltantes:
+            query = "SELECT VehiculoID, Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath FROM Vehiculos WHERE VehiculoID IN ({})"
+            for row in consultar_por_ids(self.datasource, query, faltantes):
+                try: encontrados[row[0]] = self._mapear_a_vehiculo(row, mapa_tipos, mapa_estados)
+                except Exception as e: logger.error("Error al mapear vehículo ID %s: %s", row[0], e)
+        return encontrados
+
+    @trazado("repo")
+    def get_changes(self, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Optional[Cambios]:
+        select = "SELECT VehiculoID, Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath"
+        cambios = self.seguimiento.leer_cambios(select, lambda row: self._mapear_a_vehiculo(row, mapa_tipos, mapa_estados))
+        if cambios:
+            for vehiculo_id in cambios.eliminados: self.identidad.descartar(vehiculo_id)
+        return cambios
+
+    @trazado("repo")
     def save(self, vehiculo: Vehiculo) -> bool:
         if vehiculo.id:
-            query = "UPDATE Vehiculos SET Marca=?, Modelo=?, Anio=?, Placa=?, TipoID=?, EstadoID=?, PrecioPorDia=?, Kilometraje=?, ImagenPath=? WHERE VehiculoID=?"
-            params = (vehiculo.marca, vehiculo.modelo, vehiculo.anio, vehiculo.placa, vehiculo.tipo.id, vehiculo.estado.id, vehiculo.precio_por_dia, vehiculo.kilometraje, vehiculo.imagen_path, vehiculo.id)
+            # Solo las columnas que cambiaron desde la última lectura; sin cambios no hay viaje a la BD
+            modificadas = self.identidad.columnas_modificadas(vehiculo.id, self._valores_columnas(vehiculo))
+            if not modificadas: return True
+            query = f"UPDATE Vehiculos SET {', '.join(f'{columna}=?' for columna in modificadas)} WHERE VehiculoID=?"
+            params = tuple(modificadas.values()) + (vehiculo.id,)
+            if not self.datasource.execute_non_query(query, params): return False
+            self.identidad.marcar_guardadas(vehiculo.id, modificadas); return True
         else:
             query = "INSERT INTO Vehiculos (Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
             params = (vehiculo.marca, vehiculo.modelo, vehiculo.anio, vehiculo.placa, vehiculo.tipo.id, vehiculo.estado.id, vehiculo.precio_por_dia, vehiculo.kilometraje, vehiculo.imagen_path)
         return self.datasource.execute_non_query(query, params)
 
+    @trazado("repo")
     def delete(self, vehiculo_id: int) -> bool:
-        return self.datasource.execute_non_query("DELETE FROM Vehiculos WHERE VehiculoID = ?", (vehiculo_id,))
+        if self.datasource.execute_non_query("DELETE FROM Vehiculos WHERE VehiculoID = ?", (vehiculo_id,)):
+            self.identidad.descartar(vehiculo_id); return True
+        return False
 
-    def search_and_filter(self, term: str, estado_id: Optional[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]:
-        base_query = "SELECT VehiculoID, Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath FROM Vehiculos"
+    def _filtros(self, term: str, estado_id: Optional[int]) -> Tuple[str, tuple]:
+        """Cláusula WHERE y parámetros de la búsqueda (compartida por search_and_filter e iter_export)."""
         conditions, params = [], []
-        if term:
+        if term and self.busqueda.usar_prefijo():
+            # Seek sobre las columnas normalizadas (migración m0002)
+            conditions.append(f"(MarcaBusq LIKE ? ESCAPE '{ESCAPE}' OR ModeloBusq LIKE ? ESCAPE '{ESCAPE}' OR PlacaBusq LIKE ? ESCAPE '{ESCAPE}')")
+            params.extend([patron_prefijo(term, self.datasource.dialect)] * 3)
+        elif term:
             term_like = f"%{term.lower()}%"
             conditions.append("(LOWER(Marca) LIKE ? OR LOWER(Modelo) LIKE ? OR LOWER(Placa) LIKE ?)")
             params.extend([term_like] * 3)
         if estado_id is not None:
             conditions.append("EstadoID = ?")
             params.append(estado_id)
-        
-        query = base_query + (" WHERE " + " AND ".join(conditions) if conditions else "") + " ORDER BY Marca, Modelo"
-        results = self.datasource.execute_query(query, tuple(params)) # Asegurarse que params sea tupla
+        return (" WHERE " + " AND ".join(conditions) if conditions else ""), tuple(params)
+
+    @trazado("repo")
+    def search_and_filter(self, term: str, estado_id: Optional[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]:
+        base_query = "SELECT VehiculoID, Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath FROM Vehiculos"
+        where, params = self._filtros(term, estado_id)
+        query = base_query + where + " ORDER BY Marca, Modelo"
+        results = self.datasource.execute_query(query, params)
         vehiculos = []
-        if results:
-            for row in results:
+        with span("hidratar", "repo", filas=len(results or ())):
+            for row in results or ():
                 try: vehiculos.append(self._mapear_a_vehiculo(row, mapa_tipos, mapa_estados))
-                except Exception as e: print(f"Error mapeando vehículo (búsqueda): {row} - Error: {e}")
+                except Exception as e: logger.error("Error mapeando vehículo (búsqueda): %s - Error: %s", row, e)
         return vehiculos
 
+    def iter_export(self, term: str = "", estado_id: Optional[int] = None) -> Tuple[List[str], Iterator[tuple]]:
+        """Filas crudas por lotes (TipoID/EstadoID sin traducir), con los filtros de search_and_filter."""
+        columnas = ["VehiculoID", "Marca", "Modelo", "Anio", "Placa", "TipoID", "EstadoID", "PrecioPorDia", "Kilometraje", "ImagenPath"]
+        where, params = self._filtros(term, estado_id)
+        query = f"SELECT {', '.join(columnas)} FROM Vehiculos{where} ORDER BY Marca, Modelo"
+        return columnas, self.datasource.iter_query(query, params, batch_size=5000)
+
+
+    # --- Operaciones masivas (una sentencia, una transacción) ---
+
+    def existing_placas(self, placas: Iterable[str]) -> Set[str]:
+        return {row[0] for row in consultar_por_ids(self.datasource, "SELECT Placa FROM Vehiculos WHERE Placa IN ({})", placas)}
+
+    def insert_many(self, filas: List[tuple]) -> int:
+        query = "INSERT INTO Vehiculos (Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        return self.datasource.execute_many(query, filas)
+
+    def _update_con_ids(self, set_clause: str, where: str, params: tuple) -> List[int]:
+        """UPDATE Vehiculos que retorna los VehiculoID afectados (OUTPUT / RETURNING)."""
+        if self.datasource.dialect == "mssql":
+            # OUTPUT sin INTO falla (error 334) en tablas con triggers habilitados
+            # (TR_Vehiculos_Eliminacion, migración m0001): se pasa por una variable de tabla
+            query = (
+                "DECLARE @ids TABLE (VehiculoID INT); "
+                f"UPDATE Vehiculos SET {set_clause} OUTPUT inserted.VehiculoID INTO @ids WHERE {where}; "
+                "SELECT VehiculoID FROM @ids"
+            )
+        else:
+            query = f"UPDATE Vehiculos SET {set_clause} WHERE {where} RETURNING VehiculoID"
+        results = self.datasource.execute_returning(query, params)
+        if results is None:
+            raise Exception("No se pudo completar la actualización masiva.")
+        return [row[0] for row in results]
+
+    @trazado("repo")
+    def bulk_update_price(self, factor: float, tipo_id: Optional[int] = None, anio_desde: Optional[int] = None,
+                          anio_hasta: Optional[int] = None, marca: Optional[str] = None) -> List[int]:
+        """Multiplica PrecioPorDia por 'factor' en los vehículos que cumplen los filtros."""
+        conditions, params = ["1 = 1"], [factor]
+        if tipo_id is not None: conditions.append("TipoID = ?"); params.append(tipo_id)
+        if anio_desde is not None: conditions.append("Anio >= ?"); params.append(anio_desde)
+        if anio_hasta is not None: conditions.append("Anio <= ?"); params.append(anio_hasta)
+        if marca: conditions.append("Marca = ?"); params.append(marca.strip().title()) # Igual que Vehiculo.__post_init__
+        return self._update_con_ids("PrecioPorDia = ROUND(PrecioPorDia * ?, 2)", " AND ".join(conditions), tuple(params))
+
+    @trazado("repo")
+    def bulk_update_estado(self, vehiculo_ids: Iterable[int], estado_id: int, estado_origen_id: Optional[int] = None) -> List[int]:
+        """
+        Cambia el estado de los vehículos indicados (solo los que están en
+        'estado_origen_id', si se indica). Los ids viajan como un único
+        parámetro JSON, así que cualquier cantidad es una sola sentencia.
+        """
+        ids = [int(i) for i in dict.fromkeys(vehiculo_ids) if i is not None]
+        if not ids: return []
+        if self.datasource.dialect == "mssql":
+            en_lista = "VehiculoID IN (SELECT CAST(value AS INT) FROM OPENJSON(?))"
+        else:
+            en_lista = "VehiculoID IN (SELECT value FROM json_each(?))"
+        conditions, params = [en_lista, "EstadoID <> ?"], [estado_id, json.dumps(ids), estado_id]
+        if estado_origen_id is not None: conditions.append("EstadoID = ?"); params.append(estado_origen_id)
+        return self._update_con_ids("EstadoID = ?", " AND ".join(conditions), tuple(params))
+
+    def iter_imagen_paths(self) -> Iterator[Tuple[int, str]]:
+        """Recorre (VehiculoID, ImagenPath) de los vehículos con imagen, por lotes."""
+        query = "SELECT VehiculoID, ImagenPath FROM Vehiculos WHERE ImagenPath IS NOT NULL AND ImagenPath <> ''"
+        for row in self.datasource.iter_query(query, batch_size=5000):
+            yield row[0], row[1]
+
+    def clear_imagen_paths(self, vehiculo_ids: List[int]) -> int:
+        """
+        Pone ImagenPath a NULL en los vehículos indicados. Retorna cuántos
+        cambiaron de verdad: los borrados o ya limpiados entre la auditoría y
+        este UPDATE no cuentan.
+        """
+        limpiados = 0
+        for lote in lotes(vehiculo_ids): # Límite de parámetros de SQL Server (2100)
+            placeholders = ", ".join("?" * len(lote))
+            where = f"VehiculoID IN ({placeholders}) AND ImagenPath IS NOT NULL"
+            limpiados += len(self._update_con_ids("ImagenPath = NULL", where, tuple(lote)))
+        return limpiados
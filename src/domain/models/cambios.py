@@ -0,0 +1,17 @@
+# src/domain/models/cambios.py
+from dataclasses import dataclass, field
+from typing import Any, List
+
+# Días que se conservan las lápidas de Eliminaciones (ver PurgarEliminacionesUseCase).
+# Un cliente cuya última lectura de cambios es más vieja debe recargar todo.
+RETENCION_ELIMINACIONES_DIAS = 7
+
+@dataclass
+class Cambios:
+    """Filas modificadas (altas y actualizaciones) y IDs eliminados desde la última lectura."""
+    modificados: List[Any] = field(default_factory=list)
+    eliminados: List[int] = field(default_factory=list)
+
+    @property
+    def vacio(self) -> bool:
+        return not self.modificados and not self.eliminados
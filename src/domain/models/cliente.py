@@ -6,7 +6,7 @@
 
 from dataclasses import dataclass, field
 from typing import Optional
-import re
+from src.domain.services.validacion import RE_EMAIL
 
 @dataclass
 class Cliente:
@@ -45,7 +45,7 @@ class Cliente:
         # Validación de formato (ejemplo para email)
         if self.email:
             self.email = self.email.strip()
-            if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', self.email):
+            if not RE_EMAIL.fullmatch(self.email):
                 raise ValueError(f"El email '{self.email}' no tiene un formato válido.")
         
         # Normalización de datos (ejemplo: capitalizar nombres)
@@ -0,0 +1,9 @@
+# src/domain/models/reporte_exportacion.py
+from dataclasses import dataclass
+
+@dataclass
+class ReporteExportacion:
+    """Resultado de una exportación."""
+    path: str
+    filas: int = 0
+    segundos: float = 0.0
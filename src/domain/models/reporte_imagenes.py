@@ -0,0 +1,16 @@
+# src/domain/models/reporte_imagenes.py
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+@dataclass
+class ReporteImagenes:
+    """Resultado de auditar el directorio de imágenes contra la base de datos."""
+    archivos_escaneados: int = 0
+    referencias: int = 0
+    huerfanas: List[str] = field(default_factory=list)           # Archivos sin vehículo
+    bytes_huerfanos: int = 0
+    recientes_omitidas: int = 0                                   # Huérfanas demasiado nuevas para borrar
+    referencias_colgantes: List[Tuple[int, str]] = field(default_factory=list)  # (VehiculoID, ImagenPath) sin archivo
+    eliminadas: int = 0
+    referencias_limpiadas: int = 0
+    dry_run: bool = True
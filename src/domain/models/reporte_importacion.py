@@ -0,0 +1,16 @@
+# src/domain/models/reporte_importacion.py
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class ReporteImportacion:
+    """Resultado de una importación masiva."""
+    leidas: int = 0
+    insertadas: int = 0
+    rechazadas: int = 0
+    archivo_rechazos: Optional[str] = None  # CSV con las filas rechazadas y su motivo
+    segundos: float = 0.0
+
+    @property
+    def filas_por_segundo(self) -> float:
+        return self.leidas / self.segundos if self.segundos else 0.0
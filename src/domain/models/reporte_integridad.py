@@ -0,0 +1,20 @@
+# src/domain/models/reporte_integridad.py
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+@dataclass
+class ReporteIntegridad:
+    """Resultado de verificar la consistencia de los datos (ver VerificarIntegridadUseCase)."""
+    vehiculos: int = 0
+    clientes: int = 0
+    reservas: int = 0
+    vehiculos_sin_tipo: List[Tuple[int, str]] = field(default_factory=list)      # (VehiculoID, Placa)
+    vehiculos_sin_estado: List[Tuple[int, str]] = field(default_factory=list)    # (VehiculoID, Placa)
+    clientes_invalidos: List[Tuple[int, str]] = field(default_factory=list)      # (ClienteID, código de validación)
+    reservas_sin_vehiculo: List[int] = field(default_factory=list)               # ReservaID
+    reservas_solapadas: List[Tuple[int, int]] = field(default_factory=list)      # (ReservaID, ReservaID) del mismo vehículo
+
+    @property
+    def problemas(self) -> int:
+        return (len(self.vehiculos_sin_tipo) + len(self.vehiculos_sin_estado) + len(self.clientes_invalidos)
+                + len(self.reservas_sin_vehiculo) + len(self.reservas_solapadas))
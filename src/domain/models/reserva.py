@@ -0,0 +1,35 @@
+# src/domain/models/reserva.py
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+ESTADO_ACTIVA = "Activa"
+ESTADO_CANCELADA = "Cancelada"
+
+@dataclass
+class Reserva:
+    """
+    Modelo de Dominio para Reserva.
+    El periodo es semiabierto [fecha_inicio, fecha_fin): el vehículo se
+    devuelve el día fecha_fin y puede volver a reservarse desde ese día.
+    """
+    cliente_id: int
+    vehiculo_id: int
+    fecha_inicio: date
+    fecha_fin: date
+    id: Optional[int] = None
+    estado: str = ESTADO_ACTIVA
+
+    def __post_init__(self):
+        if self.fecha_fin <= self.fecha_inicio:
+            raise ValueError("La fecha de fin debe ser posterior a la de inicio.")
+        if self.estado not in (ESTADO_ACTIVA, ESTADO_CANCELADA):
+            raise ValueError(f"Estado de reserva inválido: '{self.estado}'.")
+
+    @property
+    def activa(self) -> bool:
+        return self.estado == ESTADO_ACTIVA
+
+    @property
+    def dias(self) -> int:
+        return (self.fecha_fin - self.fecha_inicio).days
@@ -0,0 +1,18 @@
+# src/domain/models/snapshot_flota.py
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+from .tipo_vehiculo import TipoVehiculo
+from .estado_vehiculo import EstadoVehiculo
+from .vehiculo import Vehiculo
+
+@dataclass
+class SnapshotFlota:
+    """
+    Copia local de los datos de referencia y de la flota.
+    'tokens' guarda, por tabla, el token de cambios del servidor con el que
+    se descargaron los datos; si el token actual difiere, la tabla está obsoleta.
+    """
+    tokens: Dict[str, Tuple] = field(default_factory=dict)
+    tipos: List[TipoVehiculo] = field(default_factory=list)
+    estados: List[EstadoVehiculo] = field(default_factory=list)
+    vehiculos: List[Vehiculo] = field(default_factory=list)
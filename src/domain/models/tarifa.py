@@ -0,0 +1,62 @@
+# src/domain/models/tarifa.py
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Tuple
+
+@dataclass(frozen=True)
+class Temporada:
+    """Periodo [inicio, fin) con un multiplicador sobre el precio por día."""
+    inicio: date
+    fin: date
+    multiplicador: float
+    nombre: str = ""
+
+    def __post_init__(self):
+        if self.fin <= self.inicio:
+            raise ValueError("La temporada debe terminar después de empezar.")
+        if self.multiplicador <= 0:
+            raise ValueError("El multiplicador de temporada debe ser positivo.")
+
+@dataclass(frozen=True)
+class ReglasTarifa:
+    """
+    Reglas de cotización. Inmutable (y por tanto hashable): sirve de clave
+    para la caché de reglas compiladas del Cotizador.
+
+    - recargo_fin_de_semana: multiplicador para sábados y domingos.
+    - temporadas: si varias cubren un día, se aplica la de mayor multiplicador.
+    - descuentos_duracion: pares (días mínimos, fracción de descuento); se
+      aplica el del mayor mínimo alcanzado. Ej.: ((7, 0.10), (28, 0.25)).
+    - multiplicadores_tipo: pares (TipoID, multiplicador) por tipo de vehículo.
+    - factor_garantia: la garantía es garantia_base del tipo por este factor.
+    """
+    recargo_fin_de_semana: float = 1.0
+    temporadas: Tuple[Temporada, ...] = field(default_factory=tuple)
+    descuentos_duracion: Tuple[Tuple[int, float], ...] = field(default_factory=tuple)
+    multiplicadores_tipo: Tuple[Tuple[int, float], ...] = field(default_factory=tuple)
+    factor_garantia: float = 1.0
+
+    def __post_init__(self):
+        if self.recargo_fin_de_semana <= 0 or self.factor_garantia < 0:
+            raise ValueError("Recargo de fin de semana o factor de garantía inválido.")
+        for minimo, descuento in self.descuentos_duracion:
+            if minimo < 1 or not 0 <= descuento < 1:
+                raise ValueError(f"Descuento por duración inválido: ({minimo}, {descuento}).")
+        for _, multiplicador in self.multiplicadores_tipo:
+            if multiplicador <= 0:
+                raise ValueError("El multiplicador por tipo debe ser positivo.")
+
+    def descuento_para(self, dias: int) -> float:
+        """Descuento del mayor mínimo alcanzado (0 si no se alcanza ninguno)."""
+        alcanzados = [(minimo, descuento) for minimo, descuento in self.descuentos_duracion if dias >= minimo]
+        return max(alcanzados)[1] if alcanzados else 0.0
+
+@dataclass(frozen=True)
+class Cotizacion:
+    """Cotización de un vehículo para un periodo."""
+    vehiculo_id: int
+    dias: int
+    subtotal: float   # Precio por día con recargos de fin de semana, temporada y tipo
+    descuento: float  # Importe descontado por duración
+    total: float
+    garantia: float
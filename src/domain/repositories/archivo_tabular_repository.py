@@ -0,0 +1,35 @@
+# src/domain/repositories/archivo_tabular_repository.py
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+class IArchivoTabularRepository(ABC):
+    """Lectura y escritura por lotes de archivos tabulares (CSV / Excel)."""
+
+    @abstractmethod
+    def leer_por_lotes(self, path: str, tamano_lote: int) -> Iterator["pd.DataFrame"]:
+        """
+        Entrega el archivo en DataFrames de como mucho 'tamano_lote' filas,
+        todas las columnas como texto (sin perder ceros a la izquierda) y con
+        los encabezados normalizados (minúsculas, sin tildes, '_' por espacios).
+        """
+        pass
+
+    @abstractmethod
+    def escribir_lote(self, path: str, lote: "pd.DataFrame", anexar: bool) -> None:
+        """Escribe (o anexa) un lote a un CSV; el encabezado solo al crear."""
+        pass
+
+    @abstractmethod
+    def exportar(self, path: str, columnas: List[str], filas: Iterable[tuple], tamano_lote: int = 10000,
+                 on_lote: Optional[Callable[[int], None]] = None) -> int:
+        """
+        Escribe las filas en 'path' consumiéndolas por lotes (memoria
+        constante). El formato sale de la extensión (.csv o .parquet). El
+        archivo aparece completo o no aparece (se escribe en uno temporal).
+        'on_lote' recibe el total de filas escritas tras cada lote.
+        Retorna la cantidad de filas escritas.
+        """
+        pass
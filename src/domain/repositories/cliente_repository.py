@@ -5,8 +5,9 @@
 # implementación concreta de la base de datos.
 
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from src.domain.models.cliente import Cliente
+from src.domain.models.cambios import Cambios
 
 class IClienteRepository(ABC):
     """
@@ -24,6 +25,29 @@ class IClienteRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_changes(self) -> Optional[Cambios]:
+        """
+        Recupera solo los clientes modificados o eliminados desde la última
+        lectura (get_all o get_changes).
+        Retorna:
+            Optional[Cambios]: None si el seguimiento de cambios no está
+            disponible; en ese caso se debe recargar con get_all().
+        """
+        pass
+
+    @abstractmethod
+    def get_page(self, offset: int, limit: int) -> List[Cliente]:
+        """
+        Recupera una página de clientes, en el mismo orden que get_all().
+        Args:
+            offset (int): Cantidad de clientes a saltar.
+            limit (int): Cantidad máxima de clientes a retornar.
+        Retorna:
+            List[Cliente]: Los clientes de la página.
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, cliente_id: int) -> Optional[Cliente]:
         """
@@ -35,6 +59,18 @@ class IClienteRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_many(self, cliente_ids: Iterable[int]) -> Dict[int, Cliente]:
+        """
+        Recupera varios clientes por ID en pocas consultas.
+        Args:
+            cliente_ids (Iterable[int]): IDs a buscar (se ignoran repetidos).
+        Retorna:
+            Dict[int, Cliente]: Clientes encontrados por ID; los IDs
+            inexistentes no aparecen.
+        """
+        pass
+
     @abstractmethod
     def get_by_dni(self, dni: str) -> Optional[Cliente]:
         """
@@ -57,6 +93,16 @@ class IClienteRepository(ABC):
         """
         pass
 
+    @abstractmethod
+    def iter_export(self, term: str = "") -> Tuple[List[str], Iterator[tuple]]:
+        """
+        Recorre los clientes por lotes (sin cargarlos todos en memoria), con
+        el mismo filtro que search(); término vacío = todos.
+        Retorna:
+            Tuple[List[str], Iterator[tuple]]: Nombres de columna y filas.
+        """
+        pass
+
     @abstractmethod
     def save(self, cliente: Cliente) -> Cliente:
         """
@@ -80,3 +126,27 @@ class IClienteRepository(ABC):
             bool: True si la eliminación fue exitosa, False en caso contrario.
         """
         pass
+
+    @abstractmethod
+    def existing_dnis(self, dnis: Iterable[str]) -> Set[str]:
+        """
+        Indica cuáles de los DNI ya están registrados (en pocas consultas).
+        Args:
+            dnis (Iterable[str]): DNI a comprobar.
+        Retorna:
+            Set[str]: Los DNI que ya existen en la BD.
+        """
+        pass
+
+    @abstractmethod
+    def insert_many(self, filas: List[tuple]) -> int:
+        """
+        Inserta clientes en bloque, en una sola transacción (importación).
+        Args:
+            filas (List[tuple]): (Nombre, Apellido, DNI, Licencia, Telefono,
+                Email, Direccion, Distrito) ya validadas y normalizadas.
+        Retorna:
+            int: Cantidad de filas insertadas. Lanza una excepción si el lote
+            falla (no se inserta ninguna).
+        """
+        pass
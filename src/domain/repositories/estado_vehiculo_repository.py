@@ -1,6 +1,6 @@
 # src/domain/repositories/estado_vehiculo_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from src.domain.models.estado_vehiculo import EstadoVehiculo
 
 class IEstadoVehiculoRepository(ABC):
@@ -8,4 +8,6 @@ class IEstadoVehiculoRepository(ABC):
     def get_all(self) -> List[EstadoVehiculo]: pass
     @abstractmethod
     def get_by_id(self, id: int) -> Optional[EstadoVehiculo]: pass
+    @abstractmethod
+    def get_many(self, ids: Iterable[int]) -> Dict[int, EstadoVehiculo]: pass
 
@@ -0,0 +1,24 @@
+# src/domain/repositories/imagen_repository.py
+#
+# Contrato para el almacenamiento de las imágenes de vehículos.
+# Permite al dominio auditar los archivos sin depender del sistema de archivos.
+
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, Iterator, Tuple
+
+class IImagenRepository(ABC):
+    @abstractmethod
+    def iter_nombres(self) -> Iterator[str]:
+        """Recorre los nombres de los archivos de imagen almacenados."""
+        pass
+
+    @abstractmethod
+    def stat_many(self, nombres: Iterable[str]) -> Dict[str, Tuple[int, float]]:
+        """
+        Obtiene (tamaño en bytes, fecha de modificación) de cada archivo.
+        Los archivos que ya no existen se omiten del resultado.
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, nombre: str) -> bool: pass
@@ -0,0 +1,30 @@
+# src/domain/repositories/reserva_repository.py
+from abc import ABC, abstractmethod
+from datetime import date
+from typing import List, Optional
+from src.domain.models.reserva import Reserva
+
+class IReservaRepository(ABC):
+    @abstractmethod
+    def get_activas(self, desde: Optional[date] = None) -> List[Reserva]:
+        """
+        Reservas activas; con 'desde', solo las que terminan después de esa
+        fecha (las ya vencidas no afectan la disponibilidad futura).
+        """
+        pass
+
+    @abstractmethod
+    def get_by_id(self, reserva_id: int) -> Optional[Reserva]: pass
+
+    @abstractmethod
+    def create(self, reserva: Reserva) -> Optional[int]:
+        """
+        Inserta la reserva solo si el vehículo sigue libre en el periodo
+        (la verificación y el alta son una única sentencia).
+        Retorna el nuevo ID, o None si otra reserva lo ocupó. Un error de la
+        BD (p. ej. conexión perdida) lanza una excepción: no es un solapamiento.
+        """
+        pass
+
+    @abstractmethod
+    def cancel(self, reserva_id: int) -> bool: pass
@@ -0,0 +1,17 @@
+# src/domain/repositories/sincronizacion_repository.py
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+class ISincronizacionRepository(ABC):
+    @abstractmethod
+    def get_change_tokens(self, tablas: List[str]) -> Dict[str, Tuple]:
+        """
+        Obtiene un token barato por tabla que cambia cuando cambian sus datos.
+        Dos tokens iguales significan que la tabla no se modificó.
+        """
+        pass
+
+    @abstractmethod
+    def purge_tombstones(self, retencion_dias: int) -> int:
+        """Borra las lápidas de eliminación más viejas que 'retencion_dias'. Retorna cuántas."""
+        pass
@@ -0,0 +1,13 @@
+# src/domain/repositories/snapshot_repository.py
+from abc import ABC, abstractmethod
+from typing import Optional
+from src.domain.models.snapshot_flota import SnapshotFlota
+
+class ISnapshotRepository(ABC):
+    @abstractmethod
+    def load(self) -> Optional[SnapshotFlota]:
+        """Lee el snapshot local. Retorna None si no existe o es de otra versión."""
+        pass
+
+    @abstractmethod
+    def save(self, snapshot: SnapshotFlota) -> bool: pass
@@ -1,6 +1,6 @@
 # src/domain/repositories/tipo_vehiculo_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Optional
 from src.domain.models.tipo_vehiculo import TipoVehiculo
 
 class ITipoVehiculoRepository(ABC):
@@ -8,4 +8,6 @@ class ITipoVehiculoRepository(ABC):
     def get_all(self) -> List[TipoVehiculo]: pass
     @abstractmethod
     def get_by_id(self, id: int) -> Optional[TipoVehiculo]: pass
+    @abstractmethod
+    def get_many(self, ids: Iterable[int]) -> Dict[int, TipoVehiculo]: pass
 
@@ -1,7 +1,8 @@
 # src/domain/repositories/vehiculo_repository.py
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Iterable, Iterator, Set, Tuple
 from src.domain.models.vehiculo import Vehiculo, TipoVehiculo, EstadoVehiculo
+from src.domain.models.cambios import Cambios
 
 class IVehiculoRepository(ABC):
     @abstractmethod
@@ -10,6 +11,12 @@ class IVehiculoRepository(ABC):
     @abstractmethod
     def get_by_id(self, vehiculo_id: int, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Optional[Vehiculo]: pass
     
+    @abstractmethod
+    def get_many(self, vehiculo_ids: Iterable[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo], recargar: bool = False) -> Dict[int, Vehiculo]: pass
+
+    @abstractmethod
+    def get_changes(self, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Optional[Cambios]: pass
+
     @abstractmethod
     def save(self, vehiculo: Vehiculo) -> bool: pass
     
@@ -19,3 +26,29 @@ class IVehiculoRepository(ABC):
     @abstractmethod
     def search_and_filter(self, term: str, estado_id: Optional[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]: pass
 
+    @abstractmethod
+    def iter_export(self, term: str = "", estado_id: Optional[int] = None) -> Tuple[List[str], Iterator[tuple]]:
+        """Columnas y filas por lotes, con los filtros de search_and_filter; TipoID/EstadoID sin traducir."""
+        pass
+
+    @abstractmethod
+    def existing_placas(self, placas: Iterable[str]) -> Set[str]: pass
+
+    @abstractmethod
+    def insert_many(self, filas: List[tuple]) -> int:
+        """(Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia, Kilometraje, ImagenPath) en una transacción; lanza si falla."""
+        pass
+
+    @abstractmethod
+    def bulk_update_price(self, factor: float, tipo_id: Optional[int] = None, anio_desde: Optional[int] = None,
+                          anio_hasta: Optional[int] = None, marca: Optional[str] = None) -> List[int]: pass
+
+    @abstractmethod
+    def bulk_update_estado(self, vehiculo_ids: Iterable[int], estado_id: int, estado_origen_id: Optional[int] = None) -> List[int]: pass
+
+
+    @abstractmethod
+    def iter_imagen_paths(self) -> Iterator[Tuple[int, str]]: pass
+
+    @abstractmethod
+    def clear_imagen_paths(self, vehiculo_ids: List[int]) -> int: pass
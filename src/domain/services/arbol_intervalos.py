@@ -0,0 +1,182 @@
+# src/domain/services/arbol_intervalos.py
+#
+# Capa de Dominio (Servicios).
+# Árbol de intervalos: árbol AVL ordenado por inicio y aumentado con el
+# mayor fin de cada subárbol. Los intervalos son semiabiertos [inicio, fin).
+#
+#   - hay_solapamiento(a, b): O(log n)
+#   - solapados(a, b):        O(k + log n) para k resultados
+#   - insertar / eliminar:    O(log n)
+#   - construir(intervalos):  O(n log n) (ordena y arma el árbol balanceado)
+
+from typing import Any, Generic, Iterable, Iterator, List, Optional, Tuple, TypeVar
+
+K = TypeVar("K") # Tipo de los extremos (date, datetime, int...)
+
+class _Nodo:
+    __slots__ = ("inicio", "fin", "valor", "max_fin", "altura", "izq", "der")
+
+    def __init__(self, inicio, fin, valor):
+        self.inicio = inicio
+        self.fin = fin
+        self.valor = valor
+        self.max_fin = fin
+        self.altura = 1
+        self.izq: Optional["_Nodo"] = None
+        self.der: Optional["_Nodo"] = None
+
+    def clave(self) -> tuple:
+        return (self.inicio, self.fin)
+
+def _altura(nodo: Optional[_Nodo]) -> int:
+    return nodo.altura if nodo else 0
+
+def _actualizar(nodo: _Nodo) -> None:
+    nodo.altura = 1 + max(_altura(nodo.izq), _altura(nodo.der))
+    nodo.max_fin = nodo.fin
+    if nodo.izq and nodo.izq.max_fin > nodo.max_fin: nodo.max_fin = nodo.izq.max_fin
+    if nodo.der and nodo.der.max_fin > nodo.max_fin: nodo.max_fin = nodo.der.max_fin
+
+def _rotar_der(y: _Nodo) -> _Nodo:
+    x = y.izq
+    y.izq, x.der = x.der, y
+    _actualizar(y); _actualizar(x)
+    return x
+
+def _rotar_izq(x: _Nodo) -> _Nodo:
+    y = x.der
+    x.der, y.izq = y.izq, x
+    _actualizar(x); _actualizar(y)
+    return y
+
+def _balancear(nodo: _Nodo) -> _Nodo:
+    _actualizar(nodo)
+    factor = _altura(nodo.izq) - _altura(nodo.der)
+    if factor > 1:
+        if _altura(nodo.izq.izq) < _altura(nodo.izq.der):
+            nodo.izq = _rotar_izq(nodo.izq)
+        return _rotar_der(nodo)
+    if factor < -1:
+        if _altura(nodo.der.der) < _altura(nodo.der.izq):
+            nodo.der = _rotar_der(nodo.der)
+        return _rotar_izq(nodo)
+    return nodo
+
+class ArbolIntervalos(Generic[K]):
+    def __init__(self, intervalos: Iterable[Tuple[K, K, Any]] = ()):
+        self._raiz: Optional[_Nodo] = None
+        self._cantidad = 0
+        self.construir(intervalos)
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def construir(self, intervalos: Iterable[Tuple[K, K, Any]]) -> None:
+        """Reemplaza el contenido con (inicio, fin, valor) armando un árbol ya balanceado."""
+        ordenados = sorted(intervalos, key=lambda i: (i[0], i[1]))
+        for inicio, fin, _ in ordenados:
+            if not inicio < fin:
+                raise ValueError(f"Intervalo vacío o invertido: [{inicio}, {fin}).")
+
+        def _armar(desde: int, hasta: int) -> Optional[_Nodo]:
+            if desde >= hasta:
+                return None
+            medio = (desde + hasta) // 2
+            nodo = _Nodo(*ordenados[medio])
+            nodo.izq = _armar(desde, medio)
+            nodo.der = _armar(medio + 1, hasta)
+            _actualizar(nodo)
+            return nodo
+
+        self._raiz = _armar(0, len(ordenados))
+        self._cantidad = len(ordenados)
+
+    def insertar(self, inicio: K, fin: K, valor: Any = None) -> None:
+        if not inicio < fin:
+            raise ValueError(f"Intervalo vacío o invertido: [{inicio}, {fin}).")
+
+        def _insertar(nodo: Optional[_Nodo]) -> _Nodo:
+            if nodo is None:
+                return _Nodo(inicio, fin, valor)
+            if (inicio, fin) < nodo.clave():
+                nodo.izq = _insertar(nodo.izq)
+            else:
+                nodo.der = _insertar(nodo.der)
+            return _balancear(nodo)
+
+        self._raiz = _insertar(self._raiz)
+        self._cantidad += 1
+
+    def eliminar(self, inicio: K, fin: K, valor: Any = None) -> bool:
+        """Elimina el intervalo [inicio, fin) con ese valor. Retorna False si no estaba."""
+        eliminado = False
+
+        def _quitar_minimo(nodo: _Nodo) -> Tuple[Optional[_Nodo], _Nodo]:
+            if nodo.izq is None:
+                return nodo.der, nodo
+            nodo.izq, minimo = _quitar_minimo(nodo.izq)
+            return _balancear(nodo), minimo
+
+        def _eliminar(nodo: Optional[_Nodo]) -> Optional[_Nodo]:
+            nonlocal eliminado
+            if nodo is None:
+                return None
+            clave = (inicio, fin)
+            if clave == nodo.clave() and nodo.valor == valor:
+                eliminado = True
+                if nodo.izq is None: return nodo.der
+                if nodo.der is None: return nodo.izq
+                nodo.der, sucesor = _quitar_minimo(nodo.der)
+                sucesor.izq, sucesor.der = nodo.izq, nodo.der
+                return _balancear(sucesor)
+            # Claves iguales con otro valor pueden estar a ambos lados tras las rotaciones
+            if clave <= nodo.clave():
+                nodo.izq = _eliminar(nodo.izq)
+            if not eliminado and clave >= nodo.clave():
+                nodo.der = _eliminar(nodo.der)
+            return _balancear(nodo)
+
+        self._raiz = _eliminar(self._raiz)
+        if eliminado:
+            self._cantidad -= 1
+        return eliminado
+
+    def hay_solapamiento(self, inicio: K, fin: K) -> bool:
+        """True si algún intervalo se solapa con [inicio, fin). O(log n)."""
+        nodo = self._raiz
+        while nodo is not None:
+            if nodo.inicio < fin and inicio < nodo.fin:
+                return True
+            # Si el subárbol izquierdo termina después de 'inicio' y no se solapa,
+            # todos sus intervalos empiezan después de 'fin', y los del derecho también
+            if nodo.izq is not None and nodo.izq.max_fin > inicio:
+                nodo = nodo.izq
+            else:
+                nodo = nodo.der
+        return False
+
+    def solapados(self, inicio: K, fin: K) -> List[Tuple[K, K, Any]]:
+        """Intervalos que se solapan con [inicio, fin), ordenados por inicio."""
+        resultado = []
+
+        def _buscar(nodo: Optional[_Nodo]) -> None:
+            if nodo is None or nodo.max_fin <= inicio:
+                return
+            _buscar(nodo.izq)
+            if nodo.inicio >= fin:
+                return # Ni este ni los de la derecha empiezan antes de 'fin'
+            if inicio < nodo.fin:
+                resultado.append((nodo.inicio, nodo.fin, nodo.valor))
+            _buscar(nodo.der)
+
+        _buscar(self._raiz)
+        return resultado
+
+    def __iter__(self) -> Iterator[Tuple[K, K, Any]]:
+        pila, nodo = [], self._raiz
+        while pila or nodo is not None:
+            while nodo is not None:
+                pila.append(nodo); nodo = nodo.izq
+            nodo = pila.pop()
+            yield (nodo.inicio, nodo.fin, nodo.valor)
+            nodo = nodo.der
@@ -0,0 +1,191 @@
+# src/domain/services/calendario_flota.py
+#
+# Capa de Dominio (Servicios).
+# Calendario de ocupación de la flota con granularidad de día: una matriz
+# booleana vehículos x días (NumPy) donde True = reservado. Responde de forma
+# vectorizada "cuántos vehículos de cada tipo quedan libres cada día" sobre
+# cualquier ventana, y se actualiza por reserva (alta/cancelación) sin
+# reconstruirse.
+#
+# Complementa a DisponibilidadFlota (árboles de intervalos): el árbol responde
+# consultas puntuales exactas; el calendario, agregados por día y tipo.
+#
+# Memoria: 1 byte por vehículo y día (5000 vehículos x 1 año ~ 1,8 MB). No se
+# empaqueta a bits porque las consultas cortan columnas arbitrarias.
+
+import threading
+from datetime import date, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.models.reserva import Reserva
+from src.domain.models.vehiculo import Vehiculo
+from src.domain.services.disponibilidad_flota import ESTADO_DISPONIBLE
+
+class CalendarioFlota:
+    def __init__(self, desde: date, dias: int = 90, estado_nombre: Optional[str] = ESTADO_DISPONIBLE):
+        """
+        Args:
+            desde: Primer día del calendario.
+            dias: Días cubiertos inicialmente; se amplía solo si una consulta
+                o reserva cae fuera.
+            estado_nombre: Solo los vehículos en este estado cuentan como
+                reservables (None = todos).
+        """
+        if dias <= 0:
+            raise ValueError("El calendario debe cubrir al menos un día.")
+        self.desde = desde
+        self.estado_nombre = estado_nombre
+        self._lock = threading.RLock()
+        self._ocupacion = np.zeros((0, dias), dtype=bool)
+        self._fila: Dict[int, int] = {}             # vehiculo_id -> fila
+        self._vehiculos: List[Vehiculo] = []        # fila -> vehículo
+        self._tipos = np.zeros(0, dtype=np.int64)    # fila -> TipoID
+        self._reservable = np.zeros(0, dtype=bool)   # fila -> cuenta para disponibilidad
+        self._reservas: Dict[int, Reserva] = {}
+        self._por_vehiculo: Dict[int, Dict[int, Reserva]] = {}
+
+    @property
+    def dias(self) -> int:
+        return self._ocupacion.shape[1]
+
+    @property
+    def hasta(self) -> date:
+        """Día siguiente al último cubierto."""
+        return self.desde + timedelta(days=self.dias)
+
+    # --- Carga ---
+
+    def cargar(self, vehiculos: Iterable[Vehiculo], reservas: Iterable[Reserva]) -> None:
+        """Reemplaza flota y reservas."""
+        with self._lock:
+            self._reservas, self._por_vehiculo = {}, {}
+            for reserva in reservas:
+                if reserva.activa and reserva.id is not None:
+                    self._reservas[reserva.id] = reserva
+                    self._por_vehiculo.setdefault(reserva.vehiculo_id, {})[reserva.id] = reserva
+            self.actualizar_flota(vehiculos)
+
+    def actualizar_flota(self, vehiculos: Iterable[Vehiculo]) -> None:
+        """
+        Cambia la flota (altas, bajas, cambio de tipo o estado) conservando las
+        reservas. Solo se remarcan las filas: O(reservas), sin consultar la BD.
+        """
+        with self._lock:
+            self._vehiculos = list(vehiculos)
+            self._fila = {vehiculo.id: fila for fila, vehiculo in enumerate(self._vehiculos)}
+            self._tipos = np.fromiter((v.tipo.id for v in self._vehiculos), dtype=np.int64, count=len(self._vehiculos))
+            self._reservable = np.fromiter(
+                (self.estado_nombre is None or v.estado.nombre_estado == self.estado_nombre for v in self._vehiculos),
+                dtype=bool, count=len(self._vehiculos)
+            )
+            ultimo = max((r.fecha_fin for r in self._reservas.values()), default=self.hasta)
+            dias = max(self.dias, (ultimo - self.desde).days)
+            self._ocupacion = np.zeros((len(self._vehiculos), dias), dtype=bool)
+            for reserva in self._reservas.values():
+                self._marcar(reserva, True)
+
+    # --- Actualización incremental ---
+
+    def agregar(self, reserva: Reserva) -> None:
+        if not reserva.activa or reserva.id is None:
+            return
+        with self._lock:
+            if reserva.id in self._reservas:
+                return
+            self._reservas[reserva.id] = reserva
+            self._por_vehiculo.setdefault(reserva.vehiculo_id, {})[reserva.id] = reserva
+            self._ampliar(reserva.fecha_fin)
+            self._marcar(reserva, True)
+
+    def quitar(self, reserva_id: int) -> Optional[Reserva]:
+        with self._lock:
+            reserva = self._reservas.pop(reserva_id, None)
+            if reserva is None:
+                return None
+            otras = self._por_vehiculo.get(reserva.vehiculo_id, {})
+            otras.pop(reserva_id, None)
+            self._marcar(reserva, False)
+            # Si hubiera reservas solapadas (datos heredados), no liberar sus días
+            for otra in otras.values():
+                if otra.fecha_inicio < reserva.fecha_fin and reserva.fecha_inicio < otra.fecha_fin:
+                    self._marcar(otra, True)
+            return reserva
+
+    # --- Consultas ---
+
+    def fechas(self, inicio: date, fin: date) -> List[date]:
+        """Días de la ventana [inicio, fin), en el mismo orden que las columnas de los resultados."""
+        return [inicio + timedelta(days=i) for i in range((fin - inicio).days)]
+
+    def libres_por_dia(self, inicio: date, fin: date, tipo_id: Optional[int] = None) -> np.ndarray:
+        """Cantidad de vehículos reservables libres en cada día de [inicio, fin)."""
+        with self._lock:
+            libres = self._libres(inicio, fin)
+            filas = self._reservable if tipo_id is None else self._reservable & (self._tipos == tipo_id)
+            return libres[filas].sum(axis=0)
+
+    def libres_por_tipo(self, inicio: date, fin: date, tipo_ids: Iterable[int] = ()) -> Dict[int, np.ndarray]:
+        """
+        {TipoID: vehículos libres por día} para la ventana [inicio, fin), en una
+        sola pasada. Los tipos de 'tipo_ids' sin vehículos reservables aparecen
+        con ceros.
+        """
+        with self._lock:
+            libres = self._libres(inicio, fin)[self._reservable]
+            ids, codigos = np.unique(self._tipos[self._reservable], return_inverse=True)
+            # Suma por grupo como producto matricial: (tipos x vehículos) @ (vehículos x días)
+            pertenencia = np.zeros((len(ids), len(codigos)), dtype=np.int32)
+            pertenencia[codigos, np.arange(len(codigos))] = 1
+            conteos = pertenencia @ libres.astype(np.int32)
+        resultado = {int(tipo_id): conteos[i] for i, tipo_id in enumerate(ids)}
+        for tipo_id in tipo_ids:
+            resultado.setdefault(tipo_id, np.zeros(conteos.shape[1], dtype=conteos.dtype))
+        return resultado
+
+    def vehiculos_libres(self, inicio: date, fin: date, tipo_id: Optional[int] = None) -> List[Vehiculo]:
+        """Vehículos reservables libres durante toda la ventana [inicio, fin)."""
+        with self._lock:
+            filas = self._reservable & self._libres(inicio, fin).all(axis=1)
+            if tipo_id is not None:
+                filas &= self._tipos == tipo_id
+            return [self._vehiculos[i] for i in np.flatnonzero(filas)]
+
+    def ocupacion(self, inicio: date, fin: date) -> Tuple[List[Vehiculo], np.ndarray]:
+        """Copia de la matriz (vehículos x días) para la ventana, p. ej. para pintar un diagrama."""
+        with self._lock:
+            return list(self._vehiculos), ~self._libres(inicio, fin)
+
+    # --- Internos ---
+
+    def _columnas(self, inicio: date, fin: date) -> Tuple[int, int]:
+        return (inicio - self.desde).days, (fin - self.desde).days
+
+    def _ampliar(self, fin: date) -> None:
+        faltan = (fin - self.desde).days - self.dias
+        if faltan > 0:
+            # Se amplía al menos al doble para no copiar en cada reserva lejana
+            extra = max(faltan, self.dias)
+            self._ocupacion = np.concatenate(
+                [self._ocupacion, np.zeros((self._ocupacion.shape[0], extra), dtype=bool)], axis=1
+            )
+
+    def _marcar(self, reserva: Reserva, valor: bool) -> None:
+        fila = self._fila.get(reserva.vehiculo_id)
+        if fila is None:
+            return # Vehículo fuera de la flota cargada
+        a, b = self._columnas(reserva.fecha_inicio, reserva.fecha_fin)
+        a, b = max(a, 0), min(b, self.dias)
+        if a < b:
+            self._ocupacion[fila, a:b] = valor
+
+    def _libres(self, inicio: date, fin: date) -> np.ndarray:
+        """Matriz booleana (vehículos x días) de la ventana; True = libre."""
+        if fin <= inicio:
+            raise ValueError("La fecha de fin debe ser posterior a la de inicio.")
+        if inicio < self.desde:
+            raise ValueError(f"El calendario empieza el {self.desde:%d/%m/%Y}.")
+        self._ampliar(fin)
+        a, b = self._columnas(inicio, fin)
+        return ~self._ocupacion[:, a:b]
@@ -0,0 +1,111 @@
+# src/domain/services/cotizador.py
+#
+# Capa de Dominio (Servicios).
+# Motor de cotización vectorizado: calcula el total de un periodo para toda
+# la flota candidata de una vez con arreglos NumPy, en lugar de vehículo por
+# vehículo.
+#
+# Un juego de reglas se "compila" para un periodo en un factor por día
+# (fin de semana x temporada) y un descuento; el resultado se guarda en una
+# caché LRU con clave (reglas, inicio, fin), así que cotizar el mismo periodo
+# otra vez (otro tipo, otra ordenación) solo hace las operaciones sobre la flota.
+#
+#   subtotal = precio_por_dia * multiplicador_tipo * suma(factores por día)
+#   total    = subtotal * (1 - descuento por duración)
+#   garantía = garantia_base del tipo * factor_garantia
+
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from src.domain.models.tarifa import Cotizacion, ReglasTarifa
+from src.domain.models.vehiculo import Vehiculo
+
+@dataclass(frozen=True)
+class ReglasCompiladas:
+    dias: int
+    suma_factores: float   # Suma de los factores por día del periodo
+    descuento: float
+
+@lru_cache(maxsize=256)
+def compilar(reglas: ReglasTarifa, inicio: date, fin: date) -> ReglasCompiladas:
+    """Reduce las reglas a escalares para el periodo [inicio, fin)."""
+    dias = (fin - inicio).days
+    if dias <= 0:
+        raise ValueError("La fecha de fin debe ser posterior a la de inicio.")
+    fechas = np.arange(np.datetime64(inicio, "D"), np.datetime64(fin, "D"))
+    factores = np.ones(dias)
+    # datetime64[D] cuenta desde el jueves 01/01/1970: (d + 3) % 7 -> 0 = lunes ... 5 = sábado, 6 = domingo
+    dia_semana = (fechas.astype(np.int64) + 3) % 7
+    factores[dia_semana >= 5] *= reglas.recargo_fin_de_semana
+    if reglas.temporadas:
+        temporada = np.ones(dias)
+        for t in reglas.temporadas:
+            cubre = (fechas >= np.datetime64(t.inicio, "D")) & (fechas < np.datetime64(t.fin, "D"))
+            temporada[cubre] = np.maximum(temporada[cubre], t.multiplicador)
+        factores *= temporada
+    return ReglasCompiladas(dias, float(factores.sum()), reglas.descuento_para(dias))
+
+class CotizacionFlota:
+    """Resultados de cotizar una flota: arreglos alineados con 'vehiculos'."""
+    def __init__(self, vehiculos: List[Vehiculo], dias: int, subtotal: np.ndarray,
+                 descuento: np.ndarray, total: np.ndarray, garantia: np.ndarray):
+        self.vehiculos = vehiculos
+        self.dias = dias
+        self.subtotal = subtotal
+        self.descuento = descuento
+        self.total = total
+        self.garantia = garantia
+
+    def __len__(self) -> int:
+        return len(self.vehiculos)
+
+    def cotizacion(self, i: int) -> Cotizacion:
+        return Cotizacion(
+            vehiculo_id=self.vehiculos[i].id, dias=self.dias,
+            subtotal=float(self.subtotal[i]), descuento=float(self.descuento[i]),
+            total=float(self.total[i]), garantia=float(self.garantia[i])
+        )
+
+    def ranking(self, limite: Optional[int] = None, descendente: bool = False) -> List[tuple]:
+        """[(vehículo, Cotizacion)] ordenados por total (desempate: precio por día)."""
+        orden = np.lexsort((self.subtotal, self.total))
+        if descendente:
+            orden = orden[::-1]
+        if limite is not None:
+            orden = orden[:limite]
+        return [(self.vehiculos[i], self.cotizacion(i)) for i in orden]
+
+class Cotizador:
+    def __init__(self, reglas: Optional[ReglasTarifa] = None):
+        self.reglas = reglas or ReglasTarifa()
+
+    def cotizar(self, vehiculos: Sequence[Vehiculo], inicio: date, fin: date,
+                reglas: Optional[ReglasTarifa] = None) -> CotizacionFlota:
+        reglas = reglas or self.reglas
+        compiladas = compilar(reglas, inicio, fin)
+        vehiculos = list(vehiculos)
+        n = len(vehiculos)
+        precios = np.fromiter((v.precio_por_dia for v in vehiculos), dtype=float, count=n)
+        garantias = np.fromiter((v.tipo.garantia_base for v in vehiculos), dtype=float, count=n)
+        if reglas.multiplicadores_tipo:
+            por_tipo = dict(reglas.multiplicadores_tipo)
+            precios *= np.fromiter((por_tipo.get(v.tipo.id, 1.0) for v in vehiculos), dtype=float, count=n)
+
+        subtotal = np.round(precios * compiladas.suma_factores, 2)
+        descuento = np.round(subtotal * compiladas.descuento, 2)
+        return CotizacionFlota(
+            vehiculos, compiladas.dias,
+            subtotal=subtotal, descuento=descuento, total=subtotal - descuento,
+            garantia=np.round(garantias * reglas.factor_garantia, 2)
+        )
+
+    def cotizar_vehiculo(self, vehiculo: Vehiculo, inicio: date, fin: date) -> Cotizacion:
+        return self.cotizar([vehiculo], inicio, fin).cotizacion(0)
+
+    @staticmethod
+    def cache_info():
+        return compilar.cache_info()
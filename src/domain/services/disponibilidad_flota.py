@@ -0,0 +1,88 @@
+# src/domain/services/disponibilidad_flota.py
+#
+# Capa de Dominio (Servicios).
+# Disponibilidad de la flota en memoria: un árbol de intervalos por vehículo
+# con sus reservas activas. Se carga una vez y se actualiza con cada alta o
+# cancelación, sin consultar la BD por vehículo.
+
+import threading
+from datetime import date
+from typing import Dict, Iterable, List, Optional
+from src.domain.models.reserva import Reserva
+from src.domain.models.vehiculo import Vehiculo
+from src.domain.services.arbol_intervalos import ArbolIntervalos
+
+ESTADO_DISPONIBLE = "Disponible"
+
+class DisponibilidadFlota:
+    def __init__(self, reservas: Iterable[Reserva] = ()):
+        self._arboles: Dict[int, ArbolIntervalos[date]] = {}
+        self._reservas: Dict[int, Reserva] = {}
+        self._lock = threading.Lock()
+        self.cargar(reservas)
+
+    def cargar(self, reservas: Iterable[Reserva]) -> None:
+        """Reemplaza todo el contenido (solo cuentan las reservas activas)."""
+        por_vehiculo: Dict[int, list] = {}
+        activas = {}
+        for reserva in reservas:
+            if reserva.activa:
+                activas[reserva.id] = reserva
+                por_vehiculo.setdefault(reserva.vehiculo_id, []).append((reserva.fecha_inicio, reserva.fecha_fin, reserva.id))
+        arboles = {vehiculo_id: ArbolIntervalos(intervalos) for vehiculo_id, intervalos in por_vehiculo.items()}
+        with self._lock:
+            self._arboles, self._reservas = arboles, activas
+
+    def agregar(self, reserva: Reserva) -> None:
+        if not reserva.activa or reserva.id is None:
+            return
+        with self._lock:
+            if reserva.id in self._reservas:
+                return
+            self._reservas[reserva.id] = reserva
+            arbol = self._arboles.setdefault(reserva.vehiculo_id, ArbolIntervalos())
+            arbol.insertar(reserva.fecha_inicio, reserva.fecha_fin, reserva.id)
+
+    def quitar(self, reserva_id: int) -> Optional[Reserva]:
+        with self._lock:
+            reserva = self._reservas.pop(reserva_id, None)
+            if reserva is not None:
+                self._arboles[reserva.vehiculo_id].eliminar(reserva.fecha_inicio, reserva.fecha_fin, reserva.id)
+            return reserva
+
+    def esta_libre(self, vehiculo_id: int, inicio: date, fin: date) -> bool:
+        """¿El vehículo no tiene reservas activas que se solapen con [inicio, fin)? O(log n)."""
+        with self._lock:
+            arbol = self._arboles.get(vehiculo_id)
+            return arbol is None or not arbol.hay_solapamiento(inicio, fin)
+
+    def conflictos(self, vehiculo_id: int, inicio: date, fin: date) -> List[Reserva]:
+        """Reservas activas del vehículo que se solapan con [inicio, fin)."""
+        with self._lock:
+            arbol = self._arboles.get(vehiculo_id)
+            if arbol is None:
+                return []
+            return [self._reservas[reserva_id] for _, _, reserva_id in arbol.solapados(inicio, fin)]
+
+    def vehiculos_libres(self, vehiculos: Iterable[Vehiculo], inicio: date, fin: date,
+                         tipo_id: Optional[int] = None, estado_nombre: Optional[str] = ESTADO_DISPONIBLE) -> List[Vehiculo]:
+        """
+        Una pasada por la flota: filtra por tipo y estado (None = cualquiera)
+        y descarta los que tienen reservas solapadas. O(V log n).
+        """
+        with self._lock:
+            arboles = self._arboles
+            libres = []
+            for vehiculo in vehiculos:
+                if tipo_id is not None and vehiculo.tipo.id != tipo_id:
+                    continue
+                if estado_nombre is not None and vehiculo.estado.nombre_estado != estado_nombre:
+                    continue
+                arbol = arboles.get(vehiculo.id)
+                if arbol is None or not arbol.hay_solapamiento(inicio, fin):
+                    libres.append(vehiculo)
+            return libres
+
+    def reservas(self) -> List[Reserva]:
+        with self._lock:
+            return list(self._reservas.values())
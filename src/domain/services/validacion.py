@@ -0,0 +1,135 @@
+# src/domain/services/validacion.py
+#
+# Capa de Dominio (Servicios).
+# Reglas de validación de clientes y vehículos, en un solo lugar y en dos
+# formas que comparten expresiones regulares y orden de evaluación:
+#
+#   - validar_cliente / validar_vehiculo: un registro (dict del formulario).
+#   - validar_clientes_lote / validar_vehiculos_lote: un DataFrame completo,
+#     con operaciones de columna de pandas (una por regla, no una por fila).
+#
+# Ambas retornan códigos de error; el primero que falla gana, igual en las
+# dos formas. MENSAJES traduce el código al texto que ve el usuario.
+
+import re
+from typing import Any, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+RE_DNI = re.compile(r"[0-9]{8}")
+RE_EMAIL = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+RE_ENTERO = re.compile(r"[+-]?[0-9]+")
+RE_DECIMAL = re.compile(r"[+-]?(?:[0-9]+(?:\.[0-9]*)?|\.[0-9]+)")
+
+ANIO_MIN, ANIO_MAX = 1900, 2050
+
+# --- Códigos de error ---
+CLIENTE_OBLIGATORIOS = "CLI_OBLIGATORIOS"
+CLIENTE_DNI = "CLI_DNI"
+CLIENTE_EMAIL = "CLI_EMAIL"
+
+CAMPOS_CLIENTE_OBLIGATORIOS = ("nombre", "apellido", "dni", "licencia")
+CAMPOS_VEHICULO_OBLIGATORIOS = ("marca", "modelo", "placa", "tipo_nombre", "estado_nombre", "precio_por_dia", "anio")
+
+VEHICULO_OBLIGATORIO = {campo: f"VEH_OBLIGATORIO_{campo.upper()}" for campo in CAMPOS_VEHICULO_OBLIGATORIOS}
+VEHICULO_ANIO = "VEH_ANIO"
+VEHICULO_PRECIO = "VEH_PRECIO"
+VEHICULO_KM = "VEH_KM"
+
+MENSAJES: Dict[str, str] = {
+    CLIENTE_OBLIGATORIOS: "Nombre, Apellido, DNI y Licencia son obligatorios.",
+    CLIENTE_DNI: "El DNI debe tener 8 dígitos numéricos.",
+    CLIENTE_EMAIL: "El formato del email no es válido.",
+    **{codigo: f"El campo '{campo.replace('_', ' ').title()}' es obligatorio." for campo, codigo in VEHICULO_OBLIGATORIO.items()},
+    VEHICULO_ANIO: "El Año debe ser un número válido (ej. 2023).",
+    VEHICULO_PRECIO: "El Precio/Día debe ser un número positivo.",
+    VEHICULO_KM: "El Kilometraje debe ser un número entero positivo.",
+}
+
+def mensaje(codigo: Optional[str]) -> Optional[str]:
+    return MENSAJES.get(codigo, codigo) if codigo else None
+
+def _campo(data: Dict[str, Any], campo: str) -> str:
+    valor = data.get(campo, '')
+    return str(valor).strip() if valor is not None else ''
+
+# --- Un registro ---
+
+def validar_cliente(data: Dict[str, Any]) -> Optional[str]:
+    """Código del primer error, o None si el cliente es válido."""
+    if not all(_campo(data, campo) for campo in CAMPOS_CLIENTE_OBLIGATORIOS):
+        return CLIENTE_OBLIGATORIOS
+    if not RE_DNI.fullmatch(_campo(data, 'dni')):
+        return CLIENTE_DNI
+    email = _campo(data, 'email')
+    if email and not RE_EMAIL.fullmatch(email):
+        return CLIENTE_EMAIL
+    return None
+
+def validar_vehiculo(data: Dict[str, Any]) -> Optional[str]:
+    """Código del primer error, o None si el vehículo es válido."""
+    for campo in CAMPOS_VEHICULO_OBLIGATORIOS:
+        if not _campo(data, campo):
+            return VEHICULO_OBLIGATORIO[campo]
+    anio = _campo(data, 'anio')
+    if not RE_ENTERO.fullmatch(anio) or not ANIO_MIN <= int(anio) <= ANIO_MAX:
+        return VEHICULO_ANIO
+    precio = _campo(data, 'precio_por_dia')
+    if not RE_DECIMAL.fullmatch(precio) or float(precio) <= 0:
+        return VEHICULO_PRECIO
+    km = _campo(data, 'kilometraje')
+    if km and (not RE_ENTERO.fullmatch(km) or int(km) < 0):
+        return VEHICULO_KM
+    return None
+
+# --- Lotes (pandas) ---
+
+def _columna(lote: "pd.DataFrame", campo: str) -> "pd.Series":
+    import pandas as pd
+    if campo not in lote.columns:
+        return pd.Series("", index=lote.index, dtype=object)
+    return lote[campo].fillna("").astype(str).str.strip()
+
+class _Codigos:
+    def __init__(self, lote: "pd.DataFrame"):
+        import pandas as pd
+        self.serie = pd.Series("", index=lote.index, dtype=object)
+
+    def marcar(self, falla: "pd.Series", codigo: str):
+        """Asigna el código a las filas que fallan y aún no tenían error."""
+        self.serie = self.serie.mask((self.serie == "") & falla, codigo)
+
+def validar_clientes_lote(lote: "pd.DataFrame") -> "pd.Series":
+    """Código de error por fila ('' = válida), con las reglas de validar_cliente."""
+    codigos = _Codigos(lote)
+    columnas = {campo: _columna(lote, campo) for campo in CAMPOS_CLIENTE_OBLIGATORIOS + ("email",)}
+    vacio = False
+    for campo in CAMPOS_CLIENTE_OBLIGATORIOS:
+        vacio = vacio | (columnas[campo] == "")
+    codigos.marcar(vacio, CLIENTE_OBLIGATORIOS)
+    codigos.marcar(~columnas["dni"].str.fullmatch(RE_DNI), CLIENTE_DNI)
+    email = columnas["email"]
+    codigos.marcar((email != "") & ~email.str.fullmatch(RE_EMAIL), CLIENTE_EMAIL)
+    return codigos.serie
+
+def validar_vehiculos_lote(lote: "pd.DataFrame") -> "pd.Series":
+    """Código de error por fila ('' = válida), con las reglas de validar_vehiculo."""
+    import pandas as pd
+    codigos = _Codigos(lote)
+    columnas = {campo: _columna(lote, campo) for campo in CAMPOS_VEHICULO_OBLIGATORIOS + ("kilometraje",)}
+    for campo in CAMPOS_VEHICULO_OBLIGATORIOS:
+        codigos.marcar(columnas[campo] == "", VEHICULO_OBLIGATORIO[campo])
+
+    anio = columnas["anio"]
+    anio_num = pd.to_numeric(anio.where(anio.str.fullmatch(RE_ENTERO)), errors="coerce")
+    codigos.marcar(~((anio_num >= ANIO_MIN) & (anio_num <= ANIO_MAX)), VEHICULO_ANIO)
+
+    precio = columnas["precio_por_dia"]
+    precio_num = pd.to_numeric(precio.where(precio.str.fullmatch(RE_DECIMAL)), errors="coerce")
+    codigos.marcar(~(precio_num > 0), VEHICULO_PRECIO)
+
+    km = columnas["kilometraje"]
+    km_num = pd.to_numeric(km.where(km.str.fullmatch(RE_ENTERO)), errors="coerce")
+    codigos.marcar((km != "") & ~(km_num >= 0), VEHICULO_KM)
+    return codigos.serie
@@ -3,22 +3,46 @@
 # Capa de Dominio (Casos de Uso).
 # Contiene la lógica de negocio pura.
 
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, TYPE_CHECKING
 from src.domain.models.cliente import Cliente
+from src.domain.models.cambios import Cambios
 from src.domain.repositories.cliente_repository import IClienteRepository
-import re # Para validación de email
+from src.domain.services.validacion import mensaje, validar_cliente, validar_clientes_lote
+from src.utils.tracing import trazado
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class ObtenerClientesUseCase:
     def __init__(self, repository: IClienteRepository):
         self.repository = repository
     
+    @trazado("usecase")
     def execute(self) -> List[Cliente]:
         return self.repository.get_all()
 
+class ObtenerPaginaClientesUseCase:
+    def __init__(self, repository: IClienteRepository):
+        self.repository = repository
+
+    @trazado("usecase")
+    def execute(self, offset: int, limit: int) -> List[Cliente]:
+        return self.repository.get_page(offset, limit)
+
+class SincronizarClientesUseCase:
+    """Cambios desde la última lectura; None si hay que recargar todo."""
+    def __init__(self, repository: IClienteRepository):
+        self.repository = repository
+
+    @trazado("usecase")
+    def execute(self) -> Optional[Cambios]:
+        return self.repository.get_changes()
+
 class GuardarClienteUseCase:
     def __init__(self, repository: IClienteRepository):
         self.repository = repository
         
+    @trazado("usecase")
     def execute(self, cliente: Cliente) -> bool:
         return self.repository.save(cliente)
 
@@ -26,35 +50,34 @@ class EliminarClienteUseCase:
     def __init__(self, repository: IClienteRepository):
         self.repository = repository
         
+    @trazado("usecase")
     def execute(self, id: int) -> bool:
         return self.repository.delete(id)
 
 class ValidarClienteUseCase:
     """
     Valida los datos de un cliente antes de guardarlos.
+    Las reglas viven en services/validacion.py (compartidas con la validación por lotes).
     """
+    @trazado("usecase")
     def execute(self, data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-        nombre = data.get('nombre', '').strip()
-        apellido = data.get('apellido', '').strip()
-        dni = data.get('dni', '').strip()
-        licencia = data.get('licencia', '').strip()
-        email = data.get('email', '').strip()
-
-        if not all([nombre, apellido, dni, licencia]):
-            return False, "Nombre, Apellido, DNI y Licencia son obligatorios."
-        
-        if len(dni) != 8 or not dni.isdigit():
-            return False, "El DNI debe tener 8 dígitos numéricos."
+        codigo = validar_cliente(data)
+        return codigo is None, mensaje(codigo)
 
-        if email and not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', email):
-            return False, "El formato del email no es válido."
-            
-        return True, None
+class ValidarClientesLoteUseCase:
+    """
+    Valida un DataFrame de clientes (importaciones, revalidar la tabla tras
+    cambiar una regla). Retorna el código de error por fila ('' = válida).
+    """
+    @trazado("usecase")
+    def execute(self, lote: "pd.DataFrame") -> "pd.Series":
+        return validar_clientes_lote(lote)
 
 class BuscarClientesUseCase:
     def __init__(self, repository: IClienteRepository):
         self.repository = repository
     
+    @trazado("usecase")
     def execute(self, term: str) -> List[Cliente]:
         return self.repository.search(term)
 
@@ -0,0 +1,59 @@
+# src/domain/usecases/exportacion_usecases.py
+#
+# Capa de Dominio (Casos de Uso).
+# Exportación de clientes y flota a CSV o Parquet, con los mismos filtros que
+# la búsqueda de cada módulo. Las filas van de la BD (fetchmany) al archivo
+# por lotes: la memoria no crece con el tamaño de la tabla. Pensado para
+# ejecutarse fuera del hilo de la UI; el progreso se informa por callback.
+
+import time
+from typing import Callable, Iterator, Optional
+from src.domain.models.reporte_exportacion import ReporteExportacion
+from src.domain.repositories.archivo_tabular_repository import IArchivoTabularRepository
+from src.domain.repositories.cliente_repository import IClienteRepository
+from src.domain.repositories.vehiculo_repository import IVehiculoRepository
+from src.domain.repositories.tipo_vehiculo_repository import ITipoVehiculoRepository
+from src.domain.repositories.estado_vehiculo_repository import IEstadoVehiculoRepository
+from src.utils.tracing import trazado
+
+class ExportarClientesUseCase:
+    def __init__(self, repository: IClienteRepository, archivos: IArchivoTabularRepository):
+        self.repository = repository
+        self.archivos = archivos
+
+    @trazado("usecase")
+    def execute(self, path: str, termino: str = "", on_progreso: Optional[Callable[[int], None]] = None) -> ReporteExportacion:
+        """Exporta los clientes que coinciden con 'termino' (vacío = todos). on_progreso(filas escritas)."""
+        inicio = time.perf_counter()
+        columnas, filas = self.repository.iter_export(termino.strip())
+        total = self.archivos.exportar(path, columnas, filas, on_lote=on_progreso)
+        return ReporteExportacion(path, total, time.perf_counter() - inicio)
+
+class ExportarVehiculosUseCase:
+    def __init__(self, repository: IVehiculoRepository, tipo_repo: ITipoVehiculoRepository,
+                 estado_repo: IEstadoVehiculoRepository, archivos: IArchivoTabularRepository):
+        self.repository = repository
+        self.tipo_repo = tipo_repo
+        self.estado_repo = estado_repo
+        self.archivos = archivos
+
+    @trazado("usecase")
+    def execute(self, path: str, termino: str = "", estado_id: Optional[int] = None,
+                on_progreso: Optional[Callable[[int], None]] = None) -> ReporteExportacion:
+        """Exporta la flota filtrada como en search_and_filter, con tipo y estado por nombre."""
+        inicio = time.perf_counter()
+        tipos = {t.id: t.nombre_tipo for t in self.tipo_repo.get_all()}
+        estados = {e.id: e.nombre_estado for e in self.estado_repo.get_all()}
+        columnas, filas = self.repository.iter_export(termino.strip(), estado_id)
+        i_tipo, i_estado = columnas.index("TipoID"), columnas.index("EstadoID")
+
+        def _traducir(filas: Iterator[tuple]) -> Iterator[tuple]:
+            for fila in filas:
+                fila = list(fila)
+                fila[i_tipo] = tipos.get(fila[i_tipo], fila[i_tipo])
+                fila[i_estado] = estados.get(fila[i_estado], fila[i_estado])
+                yield tuple(fila)
+
+        columnas = ["Tipo" if c == "TipoID" else "Estado" if c == "EstadoID" else c for c in columnas]
+        total = self.archivos.exportar(path, columnas, _traducir(filas), on_lote=on_progreso)
+        return ReporteExportacion(path, total, time.perf_counter() - inicio)
@@ -0,0 +1,258 @@
+# src/domain/usecases/importacion_usecases.py
+#
+# Capa de Dominio (Casos de Uso).
+# Importación masiva de clientes y vehículos desde CSV/Excel (migración de
+# sucursales). El archivo se procesa por lotes con pandas:
+#
+#   1. Validación vectorizada con las mismas reglas que ValidarClienteUseCase /
+#      ValidarVehiculoUseCase (services/validacion.py).
+#   2. Duplicados contra el propio archivo y contra la BD (una consulta IN por lote).
+#   3. Inserción del lote en una transacción (executemany). Si el lote falla,
+#      se reintenta fila por fila para aislar la que rompe.
+#   4. Las filas rechazadas se escriben, con su motivo, en un CSV aparte.
+
+import logging
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional, Set, Tuple, TYPE_CHECKING
+from src.domain.models.reporte_importacion import ReporteImportacion
+from src.domain.repositories.archivo_tabular_repository import IArchivoTabularRepository
+from src.domain.repositories.cliente_repository import IClienteRepository
+from src.domain.repositories.vehiculo_repository import IVehiculoRepository
+from src.domain.repositories.tipo_vehiculo_repository import ITipoVehiculoRepository
+from src.domain.repositories.estado_vehiculo_repository import IEstadoVehiculoRepository
+from src.domain.services.validacion import MENSAJES, validar_clientes_lote, validar_vehiculos_lote
+from src.utils.tracing import trazado
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+COLUMNA_CODIGO = "codigo"
+COLUMNA_ERROR = "error"
+
+# Códigos propios de la importación (los de las reglas están en validacion.MENSAJES)
+IMP_DNI_REPETIDO = "IMP_DNI_REPETIDO"
+IMP_DNI_EXISTE = "IMP_DNI_EXISTE"
+IMP_PLACA_REPETIDA = "IMP_PLACA_REPETIDA"
+IMP_PLACA_EXISTE = "IMP_PLACA_EXISTE"
+IMP_TIPO = "IMP_TIPO"
+IMP_ESTADO = "IMP_ESTADO"
+IMP_BD = "IMP_BD"
+
+MENSAJES_IMPORTACION = {
+    IMP_DNI_REPETIDO: "DNI repetido en el archivo.",
+    IMP_DNI_EXISTE: "El DNI ya está registrado.",
+    IMP_PLACA_REPETIDA: "Placa repetida en el archivo.",
+    IMP_PLACA_EXISTE: "La placa ya está registrada.",
+    IMP_TIPO: "Tipo inválido.",
+    IMP_ESTADO: "Estado inválido.",
+}
+
+class _Errores:
+    """Primer código de rechazo de cada fila del lote ('' = válida) y su mensaje."""
+    def __init__(self, codigos: "pd.Series"):
+        self.codigos = codigos
+        self.detalle: Dict = {} # índice -> mensaje específico (errores de BD)
+
+    def marcar(self, falla: "pd.Series", codigo: str):
+        self.codigos = self.codigos.mask((self.codigos == "") & falla, codigo)
+
+    def marcar_fila(self, indice, codigo: str, detalle: str):
+        self.codigos[indice] = codigo
+        self.detalle[indice] = detalle
+
+    @property
+    def validas(self) -> "pd.Series":
+        return self.codigos == ""
+
+    def mensajes(self, filas: "pd.Series") -> "pd.Series":
+        mensajes = self.codigos[filas].map(lambda c: MENSAJES_IMPORTACION.get(c) or MENSAJES.get(c, c))
+        for indice, detalle in self.detalle.items():
+            mensajes[indice] = detalle
+        return mensajes
+
+def _texto(lote: "pd.DataFrame", columna: str) -> "pd.Series":
+    import pandas as pd
+    if columna not in lote.columns:
+        return pd.Series("", index=lote.index, dtype=object)
+    return lote[columna].fillna("").astype(str).str.strip()
+
+def _opcional(serie: "pd.Series") -> List[Optional[str]]:
+    """'' -> None, como hace el formulario al guardar."""
+    return [valor or None for valor in serie.tolist()]
+
+class _ImportarUseCase(ABC):
+    COLUMNAS_OBLIGATORIAS: Tuple[str, ...] = ()
+    POSICION_CLAVE: int # Posición del campo único (DNI, placa) en las filas a insertar
+
+    def __init__(self, archivos: IArchivoTabularRepository):
+        self.archivos = archivos
+
+    @trazado("usecase")
+    def execute(self, path: str, archivo_rechazos: Optional[str] = None, tamano_lote: int = 5000,
+                on_progreso: Optional[Callable[[ReporteImportacion], None]] = None) -> ReporteImportacion:
+        """
+        Args:
+            path: CSV o Excel con encabezados.
+            archivo_rechazos: CSV destino de las filas rechazadas (por defecto,
+                '<archivo>.rechazos.csv'); solo se crea si hay rechazos.
+            tamano_lote: Filas por lote (lectura, validación e inserción).
+            on_progreso: Se llama tras cada lote con el reporte parcial.
+        """
+        if tamano_lote <= 0: raise ValueError("El tamaño de lote debe ser positivo.")
+        archivo_rechazos = archivo_rechazos or f"{path}.rechazos.csv"
+        reporte = ReporteImportacion()
+        inicio = time.perf_counter()
+        self._preparar_importacion()
+        vistos: Set[str] = set()
+        for lote in self.archivos.leer_por_lotes(path, tamano_lote):
+            self._verificar_columnas(lote)
+            errores, filas = self._validar(lote, vistos)
+            insertadas = self._insertar(filas, errores)
+            # Solo lo que llegó a la BD: una fila rechazada por la BD no debe
+            # marcar como repetidas a las de lotes siguientes con la misma clave
+            vistos.update(fila[self.POSICION_CLAVE] for fila in insertadas)
+            rechazadas = ~errores.validas
+            rechazos = lote[rechazadas]
+            if len(rechazos):
+                rechazos = rechazos.assign(**{COLUMNA_CODIGO: errores.codigos[rechazadas], COLUMNA_ERROR: errores.mensajes(rechazadas)})
+                self.archivos.escribir_lote(archivo_rechazos, rechazos, anexar=reporte.rechazadas > 0)
+            reporte.leidas += len(lote)
+            reporte.insertadas += len(insertadas)
+            reporte.rechazadas += len(rechazos)
+            reporte.segundos = time.perf_counter() - inicio
+            if on_progreso: on_progreso(reporte)
+        reporte.archivo_rechazos = archivo_rechazos if reporte.rechazadas else None
+        reporte.segundos = time.perf_counter() - inicio
+        return reporte
+
+    def _insertar(self, filas: List[Tuple["pd.Index", tuple]], errores: _Errores) -> List[tuple]:
+        """Inserta las filas válidas del lote; retorna las que quedaron insertadas."""
+        if not filas: return []
+        try:
+            self._insert_many([fila for _, fila in filas])
+            return [fila for _, fila in filas]
+        except Exception as e:
+            logger.warning("Lote rechazado por la BD (%s); reintentando fila por fila.", e)
+        insertadas = []
+        for indice, fila in filas:
+            try:
+                self._insert_many([fila])
+                insertadas.append(fila)
+            except Exception as e:
+                errores.marcar_fila(indice, IMP_BD, f"Error de base de datos: {e}")
+        return insertadas
+
+    def _verificar_columnas(self, lote: "pd.DataFrame"):
+        faltantes = [c for c in self.COLUMNAS_OBLIGATORIAS if c not in lote.columns]
+        if faltantes:
+            raise ValueError(f"Faltan columnas en el archivo: {', '.join(faltantes)}.")
+
+    # --- A implementar por cada entidad ---
+    def _preparar_importacion(self): pass
+
+    @abstractmethod
+    def _validar(self, lote: "pd.DataFrame", vistos: Set[str]) -> Tuple[_Errores, List[Tuple["pd.Index", tuple]]]:
+        """Errores del lote y filas válidas (índice, fila); 'vistos' son las claves ya insertadas."""
+        pass
+
+    @abstractmethod
+    def _insert_many(self, filas: List[tuple]) -> int:
+        pass
+
+class ImportarClientesUseCase(_ImportarUseCase):
+    """Columnas: nombre, apellido, dni, licencia [, telefono, email, direccion, distrito]."""
+    COLUMNAS_OBLIGATORIAS = ("nombre", "apellido", "dni", "licencia")
+    POSICION_CLAVE = 2
+
+    def __init__(self, repository: IClienteRepository, archivos: IArchivoTabularRepository):
+        super().__init__(archivos)
+        self.repository = repository
+
+    def _insert_many(self, filas: List[tuple]) -> int:
+        return self.repository.insert_many(filas)
+
+    def _validar(self, lote, vistos):
+        errores = _Errores(validar_clientes_lote(lote))
+        nombre, apellido, dni, licencia = (_texto(lote, c) for c in self.COLUMNAS_OBLIGATORIAS)
+        telefono, email, direccion, distrito = (_texto(lote, c) for c in ("telefono", "email", "direccion", "distrito"))
+
+        # Únicos: primero contra el archivo (filas anteriores), luego contra la BD
+        candidatos = dni[errores.validas]
+        errores.marcar(dni.index.isin(candidatos.index[candidatos.duplicated() | candidatos.isin(vistos)]), IMP_DNI_REPETIDO)
+        existentes = self.repository.existing_dnis(dni[errores.validas].tolist())
+        errores.marcar(dni.isin(existentes), IMP_DNI_EXISTE)
+
+        ok = errores.validas
+        # Misma normalización que Cliente.__post_init__
+        filas = zip(
+            nombre[ok].str.title().tolist(), apellido[ok].str.title().tolist(), dni[ok].tolist(), licencia[ok].tolist(),
+            _opcional(telefono[ok]), _opcional(email[ok]), _opcional(direccion[ok]), _opcional(distrito[ok].str.title())
+        )
+        return errores, list(zip(lote.index[ok], filas))
+
+class ImportarVehiculosUseCase(_ImportarUseCase):
+    """
+    Columnas: marca, modelo, anio (o año), placa, tipo, estado, precio_por_dia (o precio)
+    [, kilometraje, imagen_path]. Tipo y estado van por nombre.
+    """
+    COLUMNAS_OBLIGATORIAS = ("marca", "modelo", "anio", "placa", "tipo_nombre", "estado_nombre", "precio_por_dia")
+    POSICION_CLAVE = 3
+    ALIAS = {"ano": "anio", "tipo": "tipo_nombre", "estado": "estado_nombre", "precio": "precio_por_dia", "precio_dia": "precio_por_dia"}
+
+    def __init__(self, repository: IVehiculoRepository, tipo_repo: ITipoVehiculoRepository,
+                 estado_repo: IEstadoVehiculoRepository, archivos: IArchivoTabularRepository):
+        super().__init__(archivos)
+        self.repository = repository
+        self.tipo_repo = tipo_repo
+        self.estado_repo = estado_repo
+        self._tipos: Dict[str, int] = {}
+        self._estados: Dict[str, int] = {}
+
+    def _preparar_importacion(self):
+        # Nombre -> ID una sola vez; cada lote se traduce con un map()
+        self._tipos = {t.nombre_tipo.casefold(): t.id for t in self.tipo_repo.get_all()}
+        self._estados = {e.nombre_estado.casefold(): e.id for e in self.estado_repo.get_all()}
+
+    def _verificar_columnas(self, lote):
+        lote.rename(columns=self.ALIAS, inplace=True)
+        super()._verificar_columnas(lote)
+
+    def _insert_many(self, filas: List[tuple]) -> int:
+        return self.repository.insert_many(filas)
+
+    def _validar(self, lote, vistos):
+        import pandas as pd
+        # Coma decimal de las hojas en español antes de validar
+        if "precio_por_dia" in lote.columns:
+            lote["precio_por_dia"] = lote["precio_por_dia"].str.replace(",", ".", regex=False)
+        errores = _Errores(validar_vehiculos_lote(lote))
+        texto = {c: _texto(lote, c) for c in self.COLUMNAS_OBLIGATORIAS + ("kilometraje", "imagen_path")}
+        anio = pd.to_numeric(texto["anio"], errors="coerce")
+        precio = pd.to_numeric(texto["precio_por_dia"], errors="coerce")
+        km = pd.to_numeric(texto["kilometraje"], errors="coerce")
+
+        tipo_id = texto["tipo_nombre"].str.casefold().map(self._tipos)
+        estado_id = texto["estado_nombre"].str.casefold().map(self._estados)
+        errores.marcar(tipo_id.isna(), IMP_TIPO)
+        errores.marcar(estado_id.isna(), IMP_ESTADO)
+
+        placa = texto["placa"].str.upper()
+        candidatos = placa[errores.validas]
+        errores.marcar(placa.index.isin(candidatos.index[candidatos.duplicated() | candidatos.isin(vistos)]), IMP_PLACA_REPETIDA)
+        existentes = self.repository.existing_placas(placa[errores.validas].tolist())
+        errores.marcar(placa.isin(existentes), IMP_PLACA_EXISTE)
+
+        ok = errores.validas
+        km_ok = km[ok]
+        # Misma normalización que Vehiculo.__post_init__
+        filas = zip(
+            texto["marca"][ok].str.title().tolist(), texto["modelo"][ok].tolist(), anio[ok].astype(int).tolist(),
+            placa[ok].tolist(), tipo_id[ok].astype(int).tolist(), estado_id[ok].astype(int).tolist(),
+            precio[ok].astype(float).tolist(),
+            [None if pd.isna(v) else int(v) for v in km_ok.tolist()],
+            _opcional(texto["imagen_path"][ok])
+        )
+        return errores, list(zip(lote.index[ok], filas))
@@ -0,0 +1,161 @@
+# src/domain/usecases/mantenimiento_usecases.py
+#
+# Capa de Dominio (Casos de Uso).
+# Tareas de mantenimiento que no forman parte del flujo de la UI.
+
+import time
+from typing import Dict, List
+from src.domain.models.cambios import RETENCION_ELIMINACIONES_DIAS
+from src.domain.models.reporte_imagenes import ReporteImagenes
+from src.domain.models.reporte_integridad import ReporteIntegridad
+from src.domain.models.reserva import Reserva
+from src.domain.repositories.vehiculo_repository import IVehiculoRepository
+from src.domain.repositories.imagen_repository import IImagenRepository
+from src.domain.repositories.cliente_repository import IClienteRepository
+from src.domain.repositories.reserva_repository import IReservaRepository
+from src.domain.repositories.tipo_vehiculo_repository import ITipoVehiculoRepository
+from src.domain.repositories.estado_vehiculo_repository import IEstadoVehiculoRepository
+from src.domain.repositories.sincronizacion_repository import ISincronizacionRepository
+from src.domain.services.validacion import validar_cliente
+from src.utils.tracing import trazado
+
+class AuditarImagenesUseCase:
+    """
+    Compara las imágenes en disco con los ImagenPath de la base de datos.
+    Detecta archivos huérfanos (sin vehículo) y referencias colgantes
+    (vehículos que apuntan a un archivo inexistente), y opcionalmente los corrige.
+    """
+    def __init__(self, vehiculo_repository: IVehiculoRepository, imagen_repository: IImagenRepository):
+        self.vehiculo_repository = vehiculo_repository
+        self.imagen_repository = imagen_repository
+
+    @trazado("usecase")
+    def execute(self, eliminar_huerfanas: bool = False, limpiar_referencias: bool = False,
+                dry_run: bool = True, antiguedad_minima: float = 3600.0) -> ReporteImagenes:
+        """
+        Args:
+            eliminar_huerfanas (bool): Borrar los archivos sin vehículo.
+            limpiar_referencias (bool): Poner a NULL los ImagenPath sin archivo.
+            dry_run (bool): Solo reportar, sin modificar disco ni base de datos.
+            antiguedad_minima (float): Segundos. Una imagen recién copiada por la
+                vista aún no está guardada en la BD; no se borra hasta que sea más antigua.
+        """
+        reporte = ReporteImagenes(dry_run=dry_run)
+
+        # 1. Referencias de la BD (en streaming) y archivos del directorio
+        referencias = {}
+        for vehiculo_id, imagen_path in self.vehiculo_repository.iter_imagen_paths():
+            referencias.setdefault(imagen_path, []).append(vehiculo_id)
+        reporte.referencias = sum(len(ids) for ids in referencias.values())
+
+        nombres = set(self.imagen_repository.iter_nombres())
+        reporte.archivos_escaneados = len(nombres)
+
+        # 2. Diferencias de conjuntos
+        reporte.referencias_colgantes = sorted(
+            (vehiculo_id, path)
+            for path, ids in referencias.items() if path not in nombres
+            for vehiculo_id in ids
+        )
+        candidatas = sorted(nombres.difference(referencias))
+
+        # 3. Solo las huérfanas necesitan stat (tamaño y antigüedad)
+        stats = self.imagen_repository.stat_many(candidatas)
+        limite = time.time() - antiguedad_minima
+        for nombre in candidatas:
+            if nombre not in stats:
+                continue # Desapareció durante el escaneo
+            size, mtime = stats[nombre]
+            if mtime > limite:
+                reporte.recientes_omitidas += 1
+                continue
+            reporte.huerfanas.append(nombre)
+            reporte.bytes_huerfanos += size
+
+        if dry_run:
+            return reporte
+
+        # 4. Correcciones
+        if eliminar_huerfanas:
+            reporte.eliminadas = sum(1 for nombre in reporte.huerfanas if self.imagen_repository.delete(nombre))
+        if limpiar_referencias and reporte.referencias_colgantes:
+            ids = [vehiculo_id for vehiculo_id, _ in reporte.referencias_colgantes]
+            reporte.referencias_limpiadas = self.vehiculo_repository.clear_imagen_paths(ids)
+        return reporte
+
+class VerificarIntegridadUseCase:
+    """
+    Revisa la consistencia de los datos sin modificarlos: vehículos con
+    TipoID/EstadoID inexistente, clientes que no pasan las reglas de
+    validación (p. ej. cargados antes de que existieran), reservas activas de
+    vehículos borrados y reservas activas solapadas del mismo vehículo.
+    Vehículos y clientes se recorren en streaming (iter_export).
+    """
+    def __init__(self, vehiculo_repository: IVehiculoRepository, tipo_repository: ITipoVehiculoRepository,
+                 estado_repository: IEstadoVehiculoRepository, cliente_repository: IClienteRepository,
+                 reserva_repository: IReservaRepository):
+        self.vehiculo_repository = vehiculo_repository
+        self.tipo_repository = tipo_repository
+        self.estado_repository = estado_repository
+        self.cliente_repository = cliente_repository
+        self.reserva_repository = reserva_repository
+
+    @trazado("usecase")
+    def execute(self) -> ReporteIntegridad:
+        reporte = ReporteIntegridad()
+
+        # 1. Vehículos contra los catálogos
+        tipos = {t.id for t in self.tipo_repository.get_all()}
+        estados = {e.id for e in self.estado_repository.get_all()}
+        columnas, filas = self.vehiculo_repository.iter_export()
+        i_id, i_placa = columnas.index("VehiculoID"), columnas.index("Placa")
+        i_tipo, i_estado = columnas.index("TipoID"), columnas.index("EstadoID")
+        vehiculo_ids = set()
+        for fila in filas:
+            vehiculo_ids.add(fila[i_id])
+            if fila[i_tipo] not in tipos: reporte.vehiculos_sin_tipo.append((fila[i_id], fila[i_placa]))
+            if fila[i_estado] not in estados: reporte.vehiculos_sin_estado.append((fila[i_id], fila[i_placa]))
+        reporte.vehiculos = len(vehiculo_ids)
+
+        # 2. Clientes contra las mismas reglas del formulario
+        columnas, filas = self.cliente_repository.iter_export()
+        claves = [c.lower() for c in columnas]
+        for fila in filas:
+            reporte.clientes += 1
+            data = dict(zip(claves, fila))
+            codigo = validar_cliente(data)
+            if codigo:
+                reporte.clientes_invalidos.append((data["clienteid"], codigo))
+
+        # 3. Reservas activas: vehículo existente y sin solapamientos (barrido por vehículo)
+        por_vehiculo: Dict[int, List[Reserva]] = {}
+        for reserva in self.reserva_repository.get_activas():
+            reporte.reservas += 1
+            if reserva.vehiculo_id not in vehiculo_ids:
+                reporte.reservas_sin_vehiculo.append(reserva.id)
+            por_vehiculo.setdefault(reserva.vehiculo_id, []).append(reserva)
+        for reservas in por_vehiculo.values():
+            reservas.sort(key=lambda r: (r.fecha_inicio, r.fecha_fin))
+            ultima = reservas[0] # La que termina más tarde entre las ya vistas
+            for reserva in reservas[1:]:
+                if reserva.fecha_inicio < ultima.fecha_fin:
+                    reporte.reservas_solapadas.append((ultima.id, reserva.id))
+                if reserva.fecha_fin > ultima.fecha_fin:
+                    ultima = reserva
+        return reporte
+
+class PurgarEliminacionesUseCase:
+    """
+    Borra las lápidas de eliminación viejas (la tabla crece con cada DELETE).
+    Los mostradores cuya última lectura de cambios es anterior a la retención
+    recargan todo (ver SeguimientoCambios), así que purgar no pierde bajas.
+    """
+    def __init__(self, sincronizacion_repository: ISincronizacionRepository):
+        self.sincronizacion_repository = sincronizacion_repository
+
+    @trazado("usecase")
+    def execute(self, retencion_dias: int = RETENCION_ELIMINACIONES_DIAS) -> int:
+        if retencion_dias < RETENCION_ELIMINACIONES_DIAS:
+            raise ValueError(f"La retención mínima es de {RETENCION_ELIMINACIONES_DIAS} días "
+                             "(los mostradores confían en las lápidas de ese período).")
+        return self.sincronizacion_repository.purge_tombstones(retencion_dias)
@@ -0,0 +1,94 @@
+# src/domain/usecases/reserva_usecases.py
+#
+# Capa de Dominio (Casos de Uso).
+# Reservas y disponibilidad. La disponibilidad se responde en memoria
+# (DisponibilidadFlota, un árbol de intervalos por vehículo); la BD solo se
+# consulta al cargar y al confirmar un alta.
+
+from datetime import date
+from typing import Iterable, List, Optional, TYPE_CHECKING
+from src.domain.models.reserva import Reserva
+from src.domain.models.tarifa import ReglasTarifa
+from src.domain.models.vehiculo import Vehiculo
+from src.domain.repositories.reserva_repository import IReservaRepository
+from src.domain.services.disponibilidad_flota import DisponibilidadFlota, ESTADO_DISPONIBLE
+from src.utils.tracing import trazado
+
+if TYPE_CHECKING:
+    from src.domain.services.cotizador import Cotizador
+
+class CargarDisponibilidadUseCase:
+    """Carga una vez las reservas activas vigentes y arma los árboles por vehículo."""
+    def __init__(self, repository: IReservaRepository): self.repository = repository
+    @trazado("usecase")
+    def execute(self, desde: Optional[date] = None) -> DisponibilidadFlota:
+        return DisponibilidadFlota(self.repository.get_activas(desde or date.today()))
+
+class VerificarDisponibilidadUseCase:
+    def __init__(self, disponibilidad: DisponibilidadFlota): self.disponibilidad = disponibilidad
+    @trazado("usecase")
+    def execute(self, vehiculo_id: int, inicio: date, fin: date) -> bool:
+        if fin <= inicio: raise ValueError("La fecha de fin debe ser posterior a la de inicio.")
+        return self.disponibilidad.esta_libre(vehiculo_id, inicio, fin)
+
+class BuscarVehiculosLibresUseCase:
+    """Vehículos del tipo indicado (o todos), en estado Disponible y sin reservas solapadas."""
+    def __init__(self, disponibilidad: DisponibilidadFlota): self.disponibilidad = disponibilidad
+    @trazado("usecase")
+    def execute(self, vehiculos: Iterable[Vehiculo], inicio: date, fin: date, tipo_id: Optional[int] = None) -> List[Vehiculo]:
+        if fin <= inicio: raise ValueError("La fecha de fin debe ser posterior a la de inicio.")
+        return self.disponibilidad.vehiculos_libres(vehiculos, inicio, fin, tipo_id=tipo_id, estado_nombre=ESTADO_DISPONIBLE)
+
+class CrearReservaUseCase:
+    def __init__(self, repository: IReservaRepository, disponibilidad: DisponibilidadFlota):
+        self.repository = repository
+        self.disponibilidad = disponibilidad
+
+    @trazado("usecase")
+    def execute(self, reserva: Reserva) -> Reserva:
+        """
+        Retorna la reserva con su ID. Lanza ValueError si el vehículo está
+        ocupado en el periodo (según la memoria o, si otro mostrador se
+        adelantó, según la BD). Los errores de la BD se propagan tal cual, para
+        no mostrarlos como una reserva duplicada.
+        """
+        conflictos = self.disponibilidad.conflictos(reserva.vehiculo_id, reserva.fecha_inicio, reserva.fecha_fin)
+        if conflictos:
+            ocupado = ", ".join(f"{r.fecha_inicio:%d/%m/%Y}-{r.fecha_fin:%d/%m/%Y}" for r in conflictos)
+            raise ValueError(f"El vehículo ya está reservado en ese periodo ({ocupado}).")
+        nuevo_id = self.repository.create(reserva)
+        if nuevo_id is None:
+            raise ValueError("No se pudo registrar la reserva: el vehículo ya no está libre en ese periodo.")
+        reserva.id = nuevo_id
+        self.disponibilidad.agregar(reserva)
+        return reserva
+
+class CancelarReservaUseCase:
+    def __init__(self, repository: IReservaRepository, disponibilidad: DisponibilidadFlota):
+        self.repository = repository
+        self.disponibilidad = disponibilidad
+
+    @trazado("usecase")
+    def execute(self, reserva_id: int) -> bool:
+        if not self.repository.cancel(reserva_id): return False
+        self.disponibilidad.quitar(reserva_id)
+        return True
+
+class CotizarFlotaUseCase:
+    """
+    Cotiza de una vez todos los vehículos libres del periodo (opcionalmente de
+    un tipo) y los retorna ordenados por total: [(vehículo, Cotizacion)].
+    """
+    def __init__(self, disponibilidad: DisponibilidadFlota, cotizador: Optional["Cotizador"] = None):
+        self.disponibilidad = disponibilidad
+        self.cotizador = cotizador
+
+    @trazado("usecase")
+    def execute(self, vehiculos: Iterable[Vehiculo], inicio: date, fin: date, tipo_id: Optional[int] = None,
+                reglas: Optional[ReglasTarifa] = None, limite: Optional[int] = None) -> list:
+        if fin <= inicio: raise ValueError("La fecha de fin debe ser posterior a la de inicio.")
+        if self.cotizador is None:
+            from src.domain.services.cotizador import Cotizador # NumPy solo si se cotiza
+            self.cotizador = Cotizador()
+        libres = self.disponibilidad.vehiculos_libres(vehiculos, inicio, fin, tipo_id=tipo_id, estado_nombre=ESTADO_DISPONIBLE)
+        return self.cotizador.cotizar(libres, inicio, fin, reglas).ranking(limite)
@@ -0,0 +1,23 @@
+# src/domain/usecases/sincronizacion_usecases.py
+#
+# Capa de Dominio (Casos de Uso).
+# Detección barata de cambios hechos por otros mostradores.
+
+from typing import Dict, List, Tuple
+from src.domain.repositories.sincronizacion_repository import ISincronizacionRepository
+from src.utils.tracing import trazado
+
+class ObtenerTokensCambioUseCase:
+    def __init__(self, repository: ISincronizacionRepository):
+        self.repository = repository
+
+    @trazado("usecase")
+    def execute(self, tablas: List[str]) -> Dict[str, Tuple]:
+        """
+        Retorna un token por tabla. Lanza una excepción si el servidor no
+        respondió, para que el llamador pueda distinguirlo de "sin cambios".
+        """
+        tokens = self.repository.get_change_tokens(tablas)
+        if not tokens:
+            raise Exception("No se pudieron obtener los tokens de cambio.")
+        return tokens
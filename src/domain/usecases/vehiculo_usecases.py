@@ -1,70 +1,150 @@
 # src/domain/usecases/vehiculo_usecases.py
-from typing import List, Optional, Tuple, Dict, Any
+from typing import List, Optional, Tuple, Dict, Any, TYPE_CHECKING
 from src.domain.models.vehiculo import Vehiculo, TipoVehiculo, EstadoVehiculo
 from src.domain.repositories.vehiculo_repository import IVehiculoRepository
 from src.domain.repositories.tipo_vehiculo_repository import ITipoVehiculoRepository
 from src.domain.repositories.estado_vehiculo_repository import IEstadoVehiculoRepository
+from src.domain.repositories.snapshot_repository import ISnapshotRepository
+from src.domain.repositories.sincronizacion_repository import ISincronizacionRepository
+from src.domain.models.snapshot_flota import SnapshotFlota
+from src.domain.models.cambios import Cambios
+from src.domain.services.validacion import mensaje, validar_vehiculo, validar_vehiculos_lote
+from src.utils.tracing import trazado
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 # --- Casos de Uso de Carga ---
 class ObtenerVehiculosUseCase:
     def __init__(self, repository: IVehiculoRepository): self.repository = repository
+    @trazado("usecase")
     def execute(self, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]:
         return self.repository.get_all(mapa_tipos, mapa_estados)
 
+class SincronizarVehiculosUseCase:
+    """Cambios desde la última lectura; None si hay que recargar todo."""
+    def __init__(self, repository: IVehiculoRepository): self.repository = repository
+    @trazado("usecase")
+    def execute(self, mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Optional[Cambios]:
+        return self.repository.get_changes(mapa_tipos, mapa_estados)
+
 class ObtenerTiposVehiculoUseCase:
     def __init__(self, repository: ITipoVehiculoRepository): self.repository = repository
+    @trazado("usecase")
     def execute(self) -> List[TipoVehiculo]: return self.repository.get_all()
 
 class ObtenerEstadosVehiculoUseCase:
     def __init__(self, repository: IEstadoVehiculoRepository): self.repository = repository
+    @trazado("usecase")
     def execute(self) -> List[EstadoVehiculo]: return self.repository.get_all()
 
+# --- Casos de Uso de Snapshot Local ---
+class CargarSnapshotFlotaUseCase:
+    """Lee el snapshot local (sin red). Puede estar obsoleto: ver SincronizarSnapshotFlotaUseCase."""
+    def __init__(self, snapshot_repository: ISnapshotRepository): self.snapshot_repository = snapshot_repository
+    @trazado("usecase")
+    def execute(self) -> Optional[SnapshotFlota]: return self.snapshot_repository.load()
+
+class SincronizarSnapshotFlotaUseCase:
+    """
+    Valida el snapshot contra los tokens de cambio del servidor y vuelve a
+    descargar solo las tablas obsoletas. Retorna (snapshot vigente, tablas refrescadas).
+    """
+    TABLAS = ["TiposVehiculo", "EstadosVehiculo", "Vehiculos"]
+
+    def __init__(self, snapshot_repository: ISnapshotRepository, sincronizacion_repository: ISincronizacionRepository,
+                 tipo_repository: ITipoVehiculoRepository, estado_repository: IEstadoVehiculoRepository,
+                 vehiculo_repository: IVehiculoRepository):
+        self.snapshot_repository = snapshot_repository
+        self.sincronizacion_repository = sincronizacion_repository
+        self.tipo_repository = tipo_repository
+        self.estado_repository = estado_repository
+        self.vehiculo_repository = vehiculo_repository
+
+    @trazado("usecase")
+    def execute(self, snapshot: Optional[SnapshotFlota]) -> Tuple[SnapshotFlota, List[str]]:
+        snapshot = snapshot or SnapshotFlota()
+        # Los tokens se leen ANTES que los datos: si algo cambia entre medio,
+        # el próximo arranque lo verá como obsoleto (nunca al revés).
+        tokens = self.sincronizacion_repository.get_change_tokens(self.TABLAS)
+        obsoletas = [t for t in self.TABLAS if not tokens.get(t) or snapshot.tokens.get(t) != tokens[t]]
+        if not obsoletas:
+            return snapshot, []
+
+        tipos = self.tipo_repository.get_all() if "TiposVehiculo" in obsoletas else snapshot.tipos
+        estados = self.estado_repository.get_all() if "EstadosVehiculo" in obsoletas else snapshot.estados
+        mapa_tipos = {tipo.id: tipo for tipo in tipos}
+        mapa_estados = {estado.id: estado for estado in estados}
+
+        if "Vehiculos" in obsoletas:
+            vehiculos = self.vehiculo_repository.get_all(mapa_tipos, mapa_estados)
+        else:
+            # Re-enlazar los vehículos cacheados a los tipos/estados recién cargados
+            vehiculos = snapshot.vehiculos
+            for vehiculo in vehiculos:
+                vehiculo.tipo = mapa_tipos.get(vehiculo.tipo.id) or TipoVehiculo(id=vehiculo.tipo.id, nombre_tipo="Tipo Desconocido", garantia_base=0.0)
+                vehiculo.estado = mapa_estados.get(vehiculo.estado.id) or EstadoVehiculo(id=vehiculo.estado.id, nombre_estado="Estado Desconocido")
+
+        nuevo = SnapshotFlota(tokens=tokens, tipos=tipos, estados=estados, vehiculos=vehiculos)
+        self.snapshot_repository.save(nuevo)
+        return nuevo, obsoletas
+
 # --- Casos de Uso de Acción ---
 class GuardarVehiculoUseCase:
     def __init__(self, repository: IVehiculoRepository): self.repository = repository
+    @trazado("usecase")
     def execute(self, vehiculo: Vehiculo) -> bool: return self.repository.save(vehiculo)
 
 class EliminarVehiculoUseCase:
     def __init__(self, repository: IVehiculoRepository): self.repository = repository
+    @trazado("usecase")
     def execute(self, id: int) -> bool: return self.repository.delete(id)
 
+# --- Casos de Uso de Operaciones Masivas ---
+class AjustarPreciosUseCase:
+    """Ajuste porcentual de PrecioPorDia por tipo/año/marca. Retorna los IDs afectados."""
+    def __init__(self, repository: IVehiculoRepository): self.repository = repository
+    @trazado("usecase")
+    def execute(self, porcentaje: float, tipo_id: Optional[int] = None, anio_desde: Optional[int] = None,
+                anio_hasta: Optional[int] = None, marca: Optional[str] = None) -> List[int]:
+        if porcentaje == 0: return []
+        if porcentaje <= -100: raise ValueError("El porcentaje debe ser mayor que -100 (el precio debe seguir siendo positivo).")
+        if anio_desde is not None and anio_hasta is not None and anio_desde > anio_hasta:
+            raise ValueError("El año inicial no puede ser mayor que el final.")
+        return self.repository.bulk_update_price(1 + porcentaje / 100, tipo_id, anio_desde, anio_hasta, marca)
+
+class CambiarEstadoVehiculosUseCase:
+    """Pasa un conjunto de vehículos a otro estado (opcionalmente solo desde un estado). Retorna los IDs afectados."""
+    def __init__(self, repository: IVehiculoRepository): self.repository = repository
+    @trazado("usecase")
+    def execute(self, vehiculo_ids: List[int], estado_id: int, estado_origen_id: Optional[int] = None) -> List[int]:
+        return self.repository.bulk_update_estado(vehiculo_ids, estado_id, estado_origen_id)
+
+class RecargarVehiculosUseCase:
+    """Relee de la BD los vehículos indicados (tras una operación masiva)."""
+    def __init__(self, repository: IVehiculoRepository): self.repository = repository
+    @trazado("usecase")
+    def execute(self, vehiculo_ids: List[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> Dict[int, Vehiculo]:
+        return self.repository.get_many(vehiculo_ids, mapa_tipos, mapa_estados, recargar=True)
+
 # --- Caso de Uso de Búsqueda ---
 class BuscarYFiltrarVehiculosUseCase:
     def __init__(self, repository: IVehiculoRepository): self.repository = repository
+    @trazado("usecase")
     def execute(self, term: str, estado_id: Optional[int], mapa_tipos: Dict[int, TipoVehiculo], mapa_estados: Dict[int, EstadoVehiculo]) -> List[Vehiculo]:
         return self.repository.search_and_filter(term, estado_id, mapa_tipos, mapa_estados)
 
-# --- Caso de Uso de Validación ---
+# --- Casos de Uso de Validación ---
+# Las reglas viven en services/validacion.py (compartidas con la validación por lotes).
 class ValidarVehiculoUseCase:
     """Valida los datos crudos que vienen de la Vista."""
+    @trazado("usecase")
     def execute(self, data: Dict[str, Any]) -> Tuple[bool, Optional[str]]:
-        # Validar campos obligatorios de string
-        obligatorios_str = ['marca', 'modelo', 'placa', 'tipo_nombre', 'estado_nombre', 'precio_por_dia', 'anio']
-        for campo in obligatorios_str:
-            if not data.get(campo, '').strip():
-                return False, f"El campo '{campo.replace('_', ' ').title()}' es obligatorio."
-        
-        # Validar números
-        try:
-            anio = int(data['anio'])
-            if anio < 1900 or anio > 2050: raise ValueError()
-        except (ValueError, TypeError):
-            return False, "El Año debe ser un número válido (ej. 2023)."
-        
-        try:
-            precio = float(data['precio_por_dia'])
-            if precio <= 0: raise ValueError()
-        except (ValueError, TypeError):
-            return False, "El Precio/Día debe ser un número positivo."
-
-        # Validar opcional (Kilometraje)
-        km_str = data.get('kilometraje', '').strip()
-        if km_str:
-            try:
-                km = int(km_str)
-                if km < 0: raise ValueError()
-            except (ValueError, TypeError):
-                return False, "El Kilometraje debe ser un número entero positivo."
-                
-        return True, None
+        codigo = validar_vehiculo(data)
+        return codigo is None, mensaje(codigo)
 
+class ValidarVehiculosLoteUseCase:
+    """Valida un DataFrame de vehículos. Retorna el código de error por fila ('' = válida)."""
+    @trazado("usecase")
+    def execute(self, lote: "pd.DataFrame") -> "pd.Series":
+        return validar_vehiculos_lote(lote)
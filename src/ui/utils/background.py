@@ -0,0 +1,47 @@
+# src/ui/utils/background.py
+#
+# Ejecución de tareas bloqueantes (red, disco) fuera del hilo de Tk.
+# Tk no es seguro entre hilos: el resultado se entrega de vuelta al hilo
+# principal consultando el Future con after(), nunca desde el hilo de trabajo.
+
+import logging
+import tkinter as tk
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="driveflow-bg")
+
+def run_in_background(
+    widget: tk.Misc,
+    task: Callable[[], Any],
+    on_success: Optional[Callable[[Any], None]] = None,
+    on_error: Optional[Callable[[BaseException], None]] = None,
+    poll_ms: int = 50
+) -> Future:
+    """
+    Ejecuta 'task' en un hilo de trabajo y llama a on_success(resultado) u
+    on_error(excepción) en el hilo de Tk cuando termina.
+    Si el widget se destruye antes, los callbacks se descartan.
+    """
+    future = _executor.submit(task)
+
+    def _poll():
+        try:
+            if not widget.winfo_exists():
+                return
+        except tk.TclError:
+            return
+        if not future.done():
+            widget.after(poll_ms, _poll)
+            return
+        error = future.exception()
+        if error is not None:
+            if on_error: on_error(error)
+            else: logger.error("Error en tarea en segundo plano: %s", error)
+        elif on_success:
+            on_success(future.result())
+
+    widget.after(poll_ms, _poll)
+    return future
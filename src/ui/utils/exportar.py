@@ -0,0 +1,62 @@
+# src/ui/utils/exportar.py
+#
+# Diálogo "Exportar..." compartido por las vistas: pide el archivo, ejecuta
+# la exportación en segundo plano (run_in_background) y muestra el avance en
+# el propio botón. El hilo de trabajo solo escribe un contador; el hilo de Tk
+# lo lee con after(), nunca al revés.
+
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+from typing import Callable
+
+from src.ui.utils.background import run_in_background
+
+TIPOS_ARCHIVO = [("CSV", "*.csv"), ("Parquet", "*.parquet")]
+
+def exportar_con_dialogo(parent: tk.Misc, boton: ttk.Button, nombre_sugerido: str,
+                         exportar: Callable[[str, Callable[[int], None]], object]) -> None:
+    """
+    Args:
+        parent: Ventana dueña de los diálogos.
+        boton: Botón que lanzó la exportación (se deshabilita mientras dura).
+        nombre_sugerido: Nombre de archivo propuesto.
+        exportar: exportar(path, on_progreso) -> ReporteExportacion (se ejecuta en segundo plano).
+    """
+    path = filedialog.asksaveasfilename(
+        parent=parent, title="Exportar", initialfile=nombre_sugerido,
+        defaultextension=".csv", filetypes=TIPOS_ARCHIVO
+    )
+    if not path:
+        return
+
+    texto_original = boton.cget("text")
+    progreso = {"filas": 0, "activo": True}
+
+    def _on_progreso(filas: int):
+        progreso["filas"] = filas # Hilo de trabajo: solo el contador
+
+    def _pintar():
+        if not progreso["activo"]:
+            return
+        try:
+            boton.configure(text=f"Exportando... {progreso['filas']:,} filas")
+            boton.after(250, _pintar)
+        except tk.TclError:
+            pass # La ventana se cerró
+
+    def _terminar():
+        progreso["activo"] = False
+        try: boton.configure(text=texto_original, state="normal")
+        except tk.TclError: pass
+
+    def _on_success(reporte):
+        _terminar()
+        messagebox.showinfo("Exportación", f"Se exportaron {reporte.filas:,} filas en {reporte.segundos:.1f} s a:\n{reporte.path}", parent=parent)
+
+    def _on_error(error: BaseException):
+        _terminar()
+        messagebox.showerror("Error de Exportación", str(error), parent=parent)
+
+    boton.configure(state="disabled")
+    _pintar()
+    run_in_background(parent, lambda: exportar(path, _on_progreso), _on_success, _on_error)
@@ -1,10 +1,17 @@
 # src/ui/utils/image_utils.py
+import logging
 import os
 import shutil
 import time
 from tkinter import filedialog, messagebox, Toplevel
-from typing import Optional, Dict, Tuple
-from PIL import Image, ImageTk, UnidentifiedImageError # <-- Importaciones completas
+from typing import Optional, Dict, Tuple, TYPE_CHECKING
+
+logger = logging.getLogger(__name__)
+
+# PIL se importa en el primer acceso a una imagen (seleccionar o previsualizar),
+# no al abrir la ventana de vehículos.
+if TYPE_CHECKING:
+    from PIL import ImageTk
 
 class ImageManager:
     def __init__(self, parent: Toplevel, images_dir: str = "vehicle_images"):
@@ -12,10 +19,10 @@ class ImageManager:
         self.images_dir = os.path.join(os.getcwd(), images_dir)
         if not os.path.exists(self.images_dir):
             try: os.makedirs(self.images_dir)
-            except OSError as e: print(f"Error al crear directorio de imágenes: {e}")
+            except OSError as e: logger.error("Error al crear directorio de imágenes: %s", e)
         
         # Caché para miniaturas
-        self._image_cache: Dict[str, ImageTk.PhotoImage] = {}
+        self._image_cache: Dict[str, "ImageTk.PhotoImage"] = {}
 
     def select_and_copy_image(self) -> Optional[str]:
         """Abre un diálogo para seleccionar una imagen y la copia al directorio."""
@@ -27,6 +34,7 @@ class ImageManager:
         )
         if not filename: return None
 
+        from PIL import Image, UnidentifiedImageError
         try:
             # Validar y generar nuevo nombre
             with Image.open(filename) as img:
@@ -49,7 +57,7 @@ class ImageManager:
             messagebox.showerror("Error", f"Error al procesar imagen: {e}", parent=self.parent)
         return None
 
-    def load_image_for_preview(self, image_name: str, size: Tuple[int, int] = (150, 150)) -> Optional[ImageTk.PhotoImage]:
+    def load_image_for_preview(self, image_name: str, size: Tuple[int, int] = (150, 150)) -> Optional["ImageTk.PhotoImage"]:
         """Carga una imagen desde el directorio, la redimensiona y la cachea."""
         if not image_name: return None
         
@@ -59,9 +67,10 @@ class ImageManager:
 
         full_path = os.path.join(self.images_dir, image_name)
         if not os.path.exists(full_path):
-            print(f"Advertencia: No se encontró la imagen en {full_path}")
+            logger.warning("No se encontró la imagen en %s", full_path)
             return None
         
+        from PIL import Image, ImageTk
         try:
             with Image.open(full_path) as img:
                 img.thumbnail(size) # Redimensiona (mantiene aspecto)
@@ -69,11 +78,11 @@ class ImageManager:
                 self._image_cache[image_name] = photo_image # Guardar en caché
                 return photo_image
         except Exception as e:
-            print(f"Error al cargar miniatura: {e}")
+            logger.error("Error al cargar miniatura: %s", e)
             return None
 
     def clear_cache(self):
         """Limpia la caché de imágenes para liberar memoria."""
-        print("Limpiando caché de ImageManager.")
+        logger.debug("Limpiando caché de ImageManager.")
         self._image_cache.clear()
 
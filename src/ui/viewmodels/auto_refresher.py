@@ -0,0 +1,152 @@
+# src/ui/viewmodels/auto_refresher.py
+#
+# Capa de IU (ViewModel).
+# Refresco automático: sondea un token de cambios con Tk after() y solo
+# pide datos cuando el token cambió. El intervalo se adapta al uso:
+# corto con la ventana enfocada y en uso, largo si está inactiva o
+# minimizada, y con retroceso exponencial si la BD no responde.
+
+import logging
+import time
+import tkinter as tk
+from typing import Any, Callable, Dict, List, Optional
+from src.ui.utils.background import run_in_background
+
+logger = logging.getLogger(__name__)
+
+class AutoRefresher:
+    def __init__(
+        self,
+        widget: tk.Misc,
+        obtener_tokens: Callable[[], Dict[str, Any]],
+        on_cambio: Callable[[List[str]], None],
+        intervalo_activo_ms: int = 5_000,
+        intervalo_inactivo_ms: int = 30_000,
+        intervalo_minimizado_ms: int = 120_000,
+        intervalo_max_error_ms: int = 300_000,
+        umbral_inactividad_s: float = 120.0
+    ):
+        """
+        Args:
+            widget: Widget de la vista (se escuchan los eventos de su Toplevel).
+            obtener_tokens: Consulta bloqueante; se ejecuta fuera del hilo de Tk.
+            on_cambio: Se llama en el hilo de Tk con las tablas cuyo token cambió.
+        """
+        self.widget = widget
+        self.obtener_tokens = obtener_tokens
+        self.on_cambio = on_cambio
+        self.intervalo_activo_ms = intervalo_activo_ms
+        self.intervalo_inactivo_ms = intervalo_inactivo_ms
+        self.intervalo_minimizado_ms = intervalo_minimizado_ms
+        self.intervalo_max_error_ms = intervalo_max_error_ms
+        self.umbral_inactividad_s = umbral_inactividad_s
+
+        self._tokens: Optional[Dict[str, Any]] = None
+        self._after_id: Optional[str] = None
+        self._programado_para: float = 0.0
+        self._consultando = False
+        self._activo = False
+        self._con_foco = True
+        self._visible = True
+        self._ultima_actividad = time.monotonic()
+        self.fallos = 0 # > 0: BD inalcanzable, sondeo en retroceso
+
+    # --- Ciclo de vida ---
+
+    def iniciar(self):
+        """Comienza a sondear. La primera consulta fija el token de referencia."""
+        if self._activo: return
+        self._activo = True
+        toplevel = self.widget.winfo_toplevel()
+        toplevel.bind("<FocusIn>", lambda e: self.set_foco(True), add="+")
+        toplevel.bind("<FocusOut>", lambda e: self.set_foco(False), add="+")
+        toplevel.bind("<Map>", lambda e: self.set_visible(True), add="+")
+        toplevel.bind("<Unmap>", lambda e: self.set_visible(False), add="+")
+        toplevel.bind("<KeyPress>", lambda e: self.notificar_actividad(), add="+")
+        toplevel.bind("<Motion>", lambda e: self.notificar_actividad(), add="+")
+        self._consultar()
+
+    def detener(self):
+        self._activo = False
+        self._cancelar()
+
+    # --- Señales de uso (llamadas por los bindings de la vista) ---
+
+    def set_foco(self, con_foco: bool):
+        if con_foco != self._con_foco:
+            self._con_foco = con_foco
+            if con_foco: self._ultima_actividad = time.monotonic()
+            self._reprogramar()
+
+    def set_visible(self, visible: bool):
+        if visible != self._visible:
+            self._visible = visible
+            self._reprogramar()
+
+    def notificar_actividad(self):
+        inactivo = time.monotonic() - self._ultima_actividad >= self.umbral_inactividad_s
+        self._ultima_actividad = time.monotonic()
+        if inactivo: self._reprogramar() # Volver al intervalo corto de inmediato
+
+    # --- Planificación ---
+
+    def intervalo_actual_ms(self) -> int:
+        if self.fallos:
+            return min(self.intervalo_activo_ms * (2 ** self.fallos), self.intervalo_max_error_ms)
+        if not self._visible:
+            return self.intervalo_minimizado_ms
+        if self._con_foco and time.monotonic() - self._ultima_actividad < self.umbral_inactividad_s:
+            return self.intervalo_activo_ms
+        return self.intervalo_inactivo_ms
+
+    def _cancelar(self):
+        if self._after_id is not None:
+            try: self.widget.after_cancel(self._after_id)
+            except tk.TclError: pass
+            self._after_id = None
+
+    def _programar(self):
+        if not self._activo or self._consultando: return
+        intervalo = self.intervalo_actual_ms()
+        try:
+            self._after_id = self.widget.after(intervalo, self._consultar)
+            self._programado_para = time.monotonic() + intervalo / 1000
+        except tk.TclError:
+            self._activo = False # Widget destruido
+
+    def _reprogramar(self):
+        """Adelanta el próximo sondeo si el nuevo intervalo es más corto que lo que falta."""
+        if not self._activo or self._consultando or self._after_id is None: return
+        restante_ms = (self._programado_para - time.monotonic()) * 1000
+        if self.intervalo_actual_ms() < restante_ms:
+            self._cancelar()
+            self._programar()
+
+    # --- Sondeo ---
+
+    def _consultar(self):
+        self._after_id = None
+        if not self._activo: return
+        self._consultando = True
+        run_in_background(self.widget, self.obtener_tokens, on_success=self._on_tokens, on_error=self._on_error)
+
+    def _on_tokens(self, tokens: Dict[str, Any]):
+        self._consultando = False
+        if self.fallos:
+            logger.info("Conexión recuperada, reanudando sondeo.")
+        self.fallos = 0
+        anteriores, self._tokens = self._tokens, tokens
+        if anteriores is not None:
+            # Una tabla que recién empieza a sondearse (p. ej. Reservas al abrir el calendario) no es un cambio
+            cambiadas = [tabla for tabla, token in tokens.items() if tabla in anteriores and anteriores[tabla] != token]
+            if cambiadas and self._activo:
+                try: self.on_cambio(cambiadas)
+                except Exception as e: logger.error("Error al refrescar: %s", e)
+        self._programar()
+
+    def _on_error(self, error: BaseException):
+        self._consultando = False
+        self.fallos += 1
+        if self.fallos == 1:
+            logger.warning("BD inalcanzable, sondeo en pausa con retroceso (%s).", error)
+        self._programar()
@@ -3,17 +3,35 @@
 # Capa de IU (ViewModel).
 # Intermediario entre la Vista y los Casos de Uso.
 
+import logging
 import tkinter as tk  # Importado solo para tk.TclError
-from typing import List, Optional, Callable, Tuple
+from typing import Dict, List, Optional, Callable, Tuple
 from src.domain.models.cliente import Cliente
 from src.domain.usecases.cliente_usecases import (
     ObtenerClientesUseCase,
     GuardarClienteUseCase,
     EliminarClienteUseCase,
     ValidarClienteUseCase,
-    BuscarClientesUseCase
+    BuscarClientesUseCase,
+    ObtenerPaginaClientesUseCase,
+    SincronizarClientesUseCase
 )
+from src.domain.usecases.sincronizacion_usecases import ObtenerTokensCambioUseCase
+from src.domain.usecases.exportacion_usecases import ExportarClientesUseCase
+from src.domain.models.reporte_exportacion import ReporteExportacion
+from src.ui.utils.background import run_in_background
+from src.ui.viewmodels.auto_refresher import AutoRefresher
+from src.utils.tracing import trazado
 
+logger = logging.getLogger(__name__)
+
+def _orden_cliente(cliente: Cliente) -> Tuple[str, str, int]:
+    """
+    Orden de la lista completa, tanto al cargarla como al aplicar cambios
+    incrementales. La intercalación del ORDER BY de la BD no se reproduce en
+    Python: si cada camino usara la suya, las filas saltarían al sincronizar.
+    """
+    return (cliente.apellido.casefold(), cliente.nombre.casefold(), cliente.id or 0)
 
 class ClienteViewModel:
     def __init__(
@@ -22,17 +40,30 @@ class ClienteViewModel:
         guardar_cliente_usecase: GuardarClienteUseCase,
         eliminar_cliente_usecase: EliminarClienteUseCase,
         validar_cliente_usecase: ValidarClienteUseCase,
-        buscar_clientes_usecase: BuscarClientesUseCase
+        buscar_clientes_usecase: BuscarClientesUseCase,
+        obtener_pagina_usecase: Optional[ObtenerPaginaClientesUseCase] = None,
+        sincronizar_clientes_usecase: Optional[SincronizarClientesUseCase] = None,
+        obtener_tokens_usecase: Optional[ObtenerTokensCambioUseCase] = None,
+        exportar_clientes_usecase: Optional[ExportarClientesUseCase] = None
     ):
         self.obtener_clientes_usecase = obtener_clientes_usecase
         self.guardar_cliente_usecase = guardar_cliente_usecase
         self.eliminar_cliente_usecase = eliminar_cliente_usecase
         self.validar_cliente_usecase = validar_cliente_usecase
         self.buscar_clientes_usecase = buscar_clientes_usecase
+        self.obtener_pagina_usecase = obtener_pagina_usecase
+        self.sincronizar_clientes_usecase = sincronizar_clientes_usecase
+        self.obtener_tokens_usecase = obtener_tokens_usecase
+        self.exportar_clientes_usecase = exportar_clientes_usecase
         
         # Estado de la UI
         self.clientes: List[Cliente] = []
         self.cliente_seleccionado: Optional[Cliente] = None
+        self.lista_completa: bool = False  # True si 'clientes' tiene toda la tabla
+        self.termino_busqueda: str = ""
+        self._precargado: bool = False
+        self._indice: Dict[int, Cliente] = {}   # id -> cliente de 'clientes'
+        self._indice_de: Optional[List[Cliente]] = None
         
         # Lista de observadores (callbacks de la vista)
         self._observers: List[Callable[[], None]] = []
@@ -61,31 +92,159 @@ class ClienteViewModel:
                 callback()
             except tk.TclError as e:
                 # Si el widget está destruido, eliminarlo de la lista
-                print(f"Error al notificar observador (probablemente ventana cerrada): {e}")
+                logger.warning("Error al notificar observador (probablemente ventana cerrada): %s", e)
                 if callback in self._observers:
                     self._observers.remove(callback)
 
+    @trazado("viewmodel")
     def cargar_clientes(self) -> None:
         """
         Carga la lista de clientes desde el repositorio.
         """
         try:
-            self.clientes = self.obtener_clientes_usecase.execute()
-            self._notify_observers()
+            self._publicar_lista_completa(self._leer_lista_completa())
         except Exception as e:
             # Manejo de error (ej. loggear, mostrar mensaje)
-            print(f"Error al cargar clientes: {e}")
+            logger.error("Error al cargar clientes: %s", e)
+
+    def completar_en_segundo_plano(self, widget: tk.Misc) -> None:
+        """
+        Como cargar_clientes, pero la consulta corre en un hilo de trabajo y la
+        lista se publica en el hilo de Tk. Si mientras tanto la lista cambió
+        (búsqueda, recarga), el resultado se descarta.
+        """
+        vigente = self.clientes
+
+        def _publicar(clientes: List[Cliente]) -> None:
+            if self.clientes is vigente:
+                self._publicar_lista_completa(clientes)
+
+        run_in_background(widget, self._leer_lista_completa, on_success=_publicar,
+                          on_error=lambda e: logger.error("Error al cargar clientes: %s", e))
+
+    def _leer_lista_completa(self) -> List[Cliente]:
+        return sorted(self.obtener_clientes_usecase.execute(), key=_orden_cliente)
+
+    def _publicar_lista_completa(self, clientes: List[Cliente]) -> None:
+        self.clientes = clientes
+        self.lista_completa = True
+        self.termino_busqueda = ""
+        self._notify_observers()
+
+    @trazado("viewmodel")
+    def sincronizar(self) -> None:
+        """
+        Aplica a la lista solo los cambios desde la última lectura (altas,
+        modificaciones y bajas de cualquier mostrador). Si la lista no es la
+        tabla completa o el seguimiento no está disponible, recarga todo.
+        """
+        cambios = None
+        if self.lista_completa and self.sincronizar_clientes_usecase:
+            try:
+                cambios = self.sincronizar_clientes_usecase.execute()
+            except Exception as e:
+                logger.error("Error al sincronizar clientes: %s", e)
+        if cambios is None:
+            self.cargar_clientes()
+            return
+        if cambios.vacio:
+            return
+
+        por_id = {cliente.id: cliente for cliente in self.clientes}
+        for cliente in cambios.modificados:
+            por_id[cliente.id] = cliente
+        for cliente_id in cambios.eliminados:
+            por_id.pop(cliente_id, None)
+        # Mismo orden que la carga completa; la lista ya viene casi ordenada
+        self.clientes = sorted(por_id.values(), key=_orden_cliente)
+        if self.cliente_seleccionado and self.cliente_seleccionado.id in cambios.eliminados:
+            self.cliente_seleccionado = None
+        self._notify_observers()
+
+    @trazado("viewmodel")
+    def refrescar(self) -> None:
+        """
+        Refresco automático (otro mostrador modificó la tabla). Respeta la
+        búsqueda activa en lugar de volver a la lista completa.
+        """
+        if self.termino_busqueda and not self.lista_completa:
+            self.buscar_clientes(self.termino_busqueda)
+        else:
+            self.sincronizar()
+
+    def crear_auto_refresco(self, widget: tk.Misc) -> Optional[AutoRefresher]:
+        """
+        Crea el refresco automático para la vista dada (None si no hay
+        caso de uso de tokens). La vista lo inicia y lo detiene.
+        """
+        if not self.obtener_tokens_usecase:
+            return None
+        return AutoRefresher(
+            widget,
+            obtener_tokens=lambda: self.obtener_tokens_usecase.execute(["Clientes"]),
+            on_cambio=lambda tablas: self.refrescar()
+        )
+
+    @trazado("viewmodel")
+    def precargar(self, tamano_pagina: int = 100) -> None:
+        """
+        Carga la primera página de clientes sin notificar a las vistas.
+        Pensado para ejecutarse en segundo plano durante el arranque.
+        """
+        if self.obtener_pagina_usecase:
+            clientes = self.obtener_pagina_usecase.execute(0, tamano_pagina)
+            self.lista_completa = len(clientes) < tamano_pagina
+        else:
+            clientes = self.obtener_clientes_usecase.execute()
+            self.lista_completa = True
+        self.clientes = sorted(clientes, key=_orden_cliente)
+        self._precargado = True
+
+    def consumir_precarga(self) -> bool:
+        """
+        Publica a las vistas los datos precargados (una sola vez).
+        Retorna False si no había precarga y la vista debe cargar en frío.
+        """
+        if not self._precargado:
+            return False
+        self._precargado = False
+        self._notify_observers()
+        return True
 
+    @trazado("viewmodel")
     def buscar_clientes(self, termino: str) -> None:
         """
         Busca clientes según un término de búsqueda.
         """
         try:
             self.clientes = self.buscar_clientes_usecase.execute(termino)
+            self.termino_busqueda = termino
+            self.lista_completa = False
             self._notify_observers()
         except Exception as e:
-            print(f"Error al buscar clientes: {e}")
+            logger.error("Error al buscar clientes: %s", e)
+
+    def exportar_clientes(self, path: str, on_progreso: Optional[Callable[[int], None]] = None) -> ReporteExportacion:
+        """
+        Exporta los clientes con la búsqueda activa (todos si no hay).
+        Bloqueante: la vista la ejecuta en segundo plano.
+        """
+        if not self.exportar_clientes_usecase:
+            raise Exception("Exportación no disponible.")
+        termino = "" if self.lista_completa else self.termino_busqueda
+        return self.exportar_clientes_usecase.execute(path, termino, on_progreso)
+
+    def cliente_por_id(self, id: int) -> Optional[Cliente]:
+        """
+        Búsqueda O(1) en la lista mostrada. El índice se reconstruye solo
+        cuando 'clientes' se reemplaza por otra lista.
+        """
+        if self._indice_de is not self.clientes:
+            self._indice = {cliente.id: cliente for cliente in self.clientes}
+            self._indice_de = self.clientes
+        return self._indice.get(id)
 
+    @trazado("viewmodel")
     def seleccionar_cliente(self, cliente: Optional[Cliente]) -> None:
         """
         Establece el cliente seleccionado (para el formulario).
@@ -93,6 +252,7 @@ class ClienteViewModel:
         self.cliente_seleccionado = cliente
         self._notify_observers()
 
+    @trazado("viewmodel")
     def guardar_cliente(
         self,
         id: Optional[int],
@@ -133,11 +293,12 @@ class ClienteViewModel:
         try:
             success = self.guardar_cliente_usecase.execute(cliente)
             if success:
-                self.cargar_clientes()
+                self.sincronizar()
             return success, "Cliente guardado exitosamente."
         except Exception as e:
             return False, f"Error al guardar: {e}"
 
+    @trazado("viewmodel")
     def eliminar_cliente(self, id: Optional[int]) -> bool:
         """
         Elimina un cliente.
@@ -148,11 +309,11 @@ class ClienteViewModel:
         try:
             success = self.eliminar_cliente_usecase.execute(id)
             if success:
-                self.cargar_clientes()  # Recargar la lista
+                self.sincronizar()  # Actualizar la lista (solo los cambios)
                 if self.cliente_seleccionado and self.cliente_seleccionado.id == id:
                     self.cliente_seleccionado = None
             self._notify_observers()
             return success
         except Exception as e:
-            print(f"Error al eliminar cliente: {e}")
+            logger.error("Error al eliminar cliente: %s", e)
             return False
\ No newline at end of file
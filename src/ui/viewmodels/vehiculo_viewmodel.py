@@ -1,13 +1,41 @@
 # src/ui/viewmodels/vehiculo_viewmodel.py
+import logging
 import tkinter as tk
 from tkinter import messagebox
-from typing import List, Optional, Callable, Tuple, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import List, Optional, Callable, Tuple, Dict, Any, TYPE_CHECKING
 from src.domain.models.vehiculo import Vehiculo, TipoVehiculo, EstadoVehiculo
+from src.domain.models.reserva import Reserva
 from src.domain.usecases.vehiculo_usecases import (
     ObtenerVehiculosUseCase, ObtenerTiposVehiculoUseCase, ObtenerEstadosVehiculoUseCase,
     GuardarVehiculoUseCase, EliminarVehiculoUseCase, ValidarVehiculoUseCase,
-    BuscarYFiltrarVehiculosUseCase
+    BuscarYFiltrarVehiculosUseCase, CargarSnapshotFlotaUseCase, SincronizarSnapshotFlotaUseCase,
+    SincronizarVehiculosUseCase, AjustarPreciosUseCase, CambiarEstadoVehiculosUseCase, RecargarVehiculosUseCase
 )
+from src.domain.usecases.sincronizacion_usecases import ObtenerTokensCambioUseCase
+from src.domain.usecases.reserva_usecases import CargarDisponibilidadUseCase
+from src.domain.usecases.exportacion_usecases import ExportarVehiculosUseCase
+from src.domain.models.reporte_exportacion import ReporteExportacion
+from src.ui.viewmodels.auto_refresher import AutoRefresher
+from src.utils.tracing import trazado
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    import numpy as np
+    from src.domain.services.calendario_flota import CalendarioFlota
+
+TABLAS_FLOTA = ["TiposVehiculo", "EstadosVehiculo", "Vehiculos"]
+# Solo con el calendario cargado: una base sin la migración m0003 no tiene la tabla
+TABLA_RESERVAS = "Reservas"
+
+def _orden_vehiculo(vehiculo: Vehiculo) -> Tuple[str, str, int]:
+    """
+    Orden de la flota completa, tanto al cargarla como al aplicar cambios
+    incrementales (la intercalación del ORDER BY de la BD no se reproduce en Python).
+    """
+    return (vehiculo.marca.casefold(), vehiculo.modelo.casefold(), vehiculo.id or 0)
 
 class VehiculoViewModel:
     def __init__(
@@ -18,7 +46,16 @@ class VehiculoViewModel:
         guardar_vehiculo_usecase: GuardarVehiculoUseCase,
         eliminar_vehiculo_usecase: EliminarVehiculoUseCase,
         validar_vehiculo_usecase: ValidarVehiculoUseCase,
-        buscar_y_filtrar_usecase: BuscarYFiltrarVehiculosUseCase
+        buscar_y_filtrar_usecase: BuscarYFiltrarVehiculosUseCase,
+        cargar_snapshot_usecase: Optional[CargarSnapshotFlotaUseCase] = None,
+        sincronizar_snapshot_usecase: Optional[SincronizarSnapshotFlotaUseCase] = None,
+        sincronizar_vehiculos_usecase: Optional[SincronizarVehiculosUseCase] = None,
+        obtener_tokens_usecase: Optional[ObtenerTokensCambioUseCase] = None,
+        cargar_disponibilidad_usecase: Optional[CargarDisponibilidadUseCase] = None,
+        ajustar_precios_usecase: Optional[AjustarPreciosUseCase] = None,
+        cambiar_estado_usecase: Optional[CambiarEstadoVehiculosUseCase] = None,
+        recargar_vehiculos_usecase: Optional[RecargarVehiculosUseCase] = None,
+        exportar_vehiculos_usecase: Optional[ExportarVehiculosUseCase] = None
     ):
         self.obtener_vehiculos_usecase = obtener_vehiculos_usecase
         self.obtener_tipos_usecase = obtener_tipos_usecase
@@ -27,6 +64,15 @@ class VehiculoViewModel:
         self.eliminar_vehiculo_usecase = eliminar_vehiculo_usecase
         self.validar_vehiculo_usecase = validar_vehiculo_usecase
         self.buscar_y_filtrar_usecase = buscar_y_filtrar_usecase
+        self.cargar_snapshot_usecase = cargar_snapshot_usecase
+        self.sincronizar_snapshot_usecase = sincronizar_snapshot_usecase
+        self.sincronizar_vehiculos_usecase = sincronizar_vehiculos_usecase
+        self.obtener_tokens_usecase = obtener_tokens_usecase
+        self.cargar_disponibilidad_usecase = cargar_disponibilidad_usecase
+        self.ajustar_precios_usecase = ajustar_precios_usecase
+        self.cambiar_estado_usecase = cambiar_estado_usecase
+        self.recargar_vehiculos_usecase = recargar_vehiculos_usecase
+        self.exportar_vehiculos_usecase = exportar_vehiculos_usecase
 
         # Estado
         self.vehiculos: List[Vehiculo] = []
@@ -37,6 +83,12 @@ class VehiculoViewModel:
         self.vehiculo_seleccionado: Optional[Vehiculo] = None
         self.filter_term: str = ""
         self.filter_estado_nombre: str = "Todos"
+        self.lista_completa: bool = False  # True si 'vehiculos' es la flota completa (sin filtro)
+        self._precargado: bool = False
+        self._indice: Dict[int, Vehiculo] = {}  # id -> vehículo de 'vehiculos'
+        self._indice_de: Optional[List[Vehiculo]] = None
+        self.calendario: Optional["CalendarioFlota"] = None  # Ocupación por día (se carga bajo demanda)
+        self._flota: List[Vehiculo] = []  # Flota completa, aunque 'vehiculos' esté filtrada
         self._observers: List[Callable[[], None]] = []
 
     def bind_to_updates(self, callback: Callable[[], None]):
@@ -46,53 +98,220 @@ class VehiculoViewModel:
         if callback in self._observers: self._observers.remove(callback)
 
     def _notify_observers(self):
-        print("ViewModel: Notificando observadores...")
+        logger.debug("Notificando observadores...")
         for callback in self._observers[:]:
             try: callback()
             except tk.TclError as e:
-                print(f"Error (tk.TclError) al notificar: {e}. Eliminando observador.")
+                logger.warning("Error (tk.TclError) al notificar: %s. Eliminando observador.", e)
                 if callback in self._observers: self._observers.remove(callback)
             except Exception as e:
-                print(f"Error (inesperado) al notificar: {e}")
+                logger.exception("Error (inesperado) al notificar: %s", e)
 
+    @trazado("viewmodel")
     def cargar_datos_iniciales(self):
-        print("ViewModel: Iniciando carga de datos iniciales...")
+        logger.debug("Iniciando carga de datos iniciales...")
         error_parcial = False
         try:
             self.tipos = self.obtener_tipos_usecase.execute()
             self.mapa_tipos = {tipo.id: tipo for tipo in self.tipos}
-            print(f"ViewModel: {len(self.tipos)} tipos cargados.")
+            logger.debug("%s tipos cargados.", len(self.tipos))
         except Exception as e:
-            print(f"Error crítico al cargar tipos: {e}"); error_parcial = True
+            logger.error("Error crítico al cargar tipos: %s", e); error_parcial = True
             self.tipos, self.mapa_tipos = [], {}
 
         try:
             self.estados = self.obtener_estados_usecase.execute()
             self.mapa_estados = {estado.id: estado for estado in self.estados}
-            print(f"ViewModel: {len(self.estados)} estados cargados.")
+            logger.debug("%s estados cargados.", len(self.estados))
         except Exception as e:
-            print(f"Error crítico al cargar estados: {e}"); error_parcial = True
+            logger.error("Error crítico al cargar estados: %s", e); error_parcial = True
             self.estados, self.mapa_estados = [], {}
 
         try:
             # CORRECCIÓN: Los mapas deben existir antes de llamar a esto
             if not error_parcial:
-                self.vehiculos = self.obtener_vehiculos_usecase.execute(self.mapa_tipos, self.mapa_estados)
-                print(f"ViewModel: {len(self.vehiculos)} vehículos cargados.")
+                self.vehiculos = sorted(self.obtener_vehiculos_usecase.execute(self.mapa_tipos, self.mapa_estados), key=_orden_vehiculo)
+                self.lista_completa = True
+                self._flota_actualizada()
+                logger.debug("%s vehículos cargados.", len(self.vehiculos))
             else:
                 self.vehiculos = []
         except Exception as e:
-            print(f"Error crítico al cargar vehículos: {e}"); error_parcial = True
+            logger.error("Error crítico al cargar vehículos: %s", e); error_parcial = True
             self.vehiculos = []
 
-        print("ViewModel: Carga inicial completada. Notificando...")
+        logger.debug("Carga inicial completada. Notificando...")
         self._notify_observers()
         if error_parcial: messagebox.showwarning("Error de Carga", "No se pudieron cargar todos los datos.")
 
+    @trazado("viewmodel")
+    def precargar(self):
+        """
+        Carga tipos, estados y vehículos sin notificar a las vistas.
+        Pensado para ejecutarse en segundo plano durante el arranque.
+        Con snapshot local, solo se descargan las tablas que cambiaron en el
+        servidor; sin él, tipos y estados se piden en paralelo y luego los
+        vehículos (necesitan ambos mapas).
+        """
+        if self.cargar_snapshot_usecase and self.sincronizar_snapshot_usecase:
+            snapshot, refrescadas = self.sincronizar_snapshot_usecase.execute(self.cargar_snapshot_usecase.execute())
+            logger.info("Snapshot local validado (tablas refrescadas: %s).", ', '.join(refrescadas) or 'ninguna')
+            tipos, estados, vehiculos = snapshot.tipos, snapshot.estados, snapshot.vehiculos
+            mapa_tipos = {tipo.id: tipo for tipo in tipos}
+            mapa_estados = {estado.id: estado for estado in estados}
+        else:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                futuro_tipos = executor.submit(self.obtener_tipos_usecase.execute)
+                futuro_estados = executor.submit(self.obtener_estados_usecase.execute)
+                tipos, estados = futuro_tipos.result(), futuro_estados.result()
+            mapa_tipos = {tipo.id: tipo for tipo in tipos}
+            mapa_estados = {estado.id: estado for estado in estados}
+            vehiculos = self.obtener_vehiculos_usecase.execute(mapa_tipos, mapa_estados)
+
+        self.tipos, self.mapa_tipos = tipos, mapa_tipos
+        self.estados, self.mapa_estados = estados, mapa_estados
+        self.vehiculos = sorted(vehiculos, key=_orden_vehiculo)
+        self.lista_completa = True
+        self._flota_actualizada()
+        self._precargado = True
+        logger.info("Precarga completada (%s tipos, %s estados, %s vehículos).", len(tipos), len(estados), len(vehiculos))
+
+    def consumir_precarga(self) -> bool:
+        """
+        Publica a las vistas los datos precargados (una sola vez).
+        Retorna False si no había precarga y la vista debe cargar en frío.
+        """
+        if not self._precargado:
+            return False
+        self._precargado = False
+        self._notify_observers()
+        return True
+
+    @trazado("viewmodel")
+    def sincronizar(self):
+        """
+        Aplica a la flota solo los cambios desde la última lectura. Si la lista
+        está filtrada o el seguimiento no está disponible, recarga todo.
+        """
+        cambios = None
+        if self.lista_completa and self.sincronizar_vehiculos_usecase:
+            try:
+                cambios = self.sincronizar_vehiculos_usecase.execute(self.mapa_tipos, self.mapa_estados)
+            except Exception as e:
+                logger.error("Error al sincronizar vehículos: %s", e)
+        if cambios is None:
+            self.cargar_datos_iniciales()
+            return
+        if cambios.vacio:
+            return
+
+        por_id = {vehiculo.id: vehiculo for vehiculo in self.vehiculos}
+        for vehiculo in cambios.modificados:
+            por_id[vehiculo.id] = vehiculo
+        for vehiculo_id in cambios.eliminados:
+            por_id.pop(vehiculo_id, None)
+        # Mismo orden que la carga completa
+        self.vehiculos = sorted(por_id.values(), key=_orden_vehiculo)
+        self._flota_actualizada()
+        logger.info("Sincronizados %s cambios y %s bajas.", len(cambios.modificados), len(cambios.eliminados))
+        if self.vehiculo_seleccionado and self.vehiculo_seleccionado.id in cambios.eliminados:
+            self.vehiculo_seleccionado = None
+        self._notify_observers()
+
+    @trazado("viewmodel")
+    def refrescar(self, tablas_cambiadas: List[str]):
+        """
+        Refresco automático (otro mostrador modificó la flota). Si cambiaron
+        tipos o estados se recargan los catálogos; el filtro activo se respeta.
+        Si cambiaron las reservas se recarga el calendario (si está en uso).
+        """
+        if TABLA_RESERVAS in tablas_cambiadas and self.calendario is not None:
+            try:
+                self.cargar_calendario(self.calendario.desde, self.calendario.dias)
+            except Exception as e:
+                logger.error("Error al recargar el calendario: %s", e)
+            if tablas_cambiadas == [TABLA_RESERVAS]:
+                self._notify_observers(); return
+        elif tablas_cambiadas == [TABLA_RESERVAS]:
+            return
+        if "TiposVehiculo" in tablas_cambiadas or "EstadosVehiculo" in tablas_cambiadas:
+            logger.debug("Cambiaron los catálogos, recargando flota.")
+            filtrado = not self.lista_completa
+            self.cargar_datos_iniciales()
+            if filtrado:
+                self.buscar_y_filtrar_vehiculos(self.filter_term, self.filter_estado_nombre)
+        elif self.lista_completa:
+            self.sincronizar()
+        else:
+            self.buscar_y_filtrar_vehiculos(self.filter_term, self.filter_estado_nombre)
+
+    def crear_auto_refresco(self, widget: tk.Misc) -> Optional[AutoRefresher]:
+        """Crea el refresco automático para la vista dada (None si no hay tokens)."""
+        if not self.obtener_tokens_usecase: return None
+        return AutoRefresher(
+            widget,
+            obtener_tokens=lambda: self.obtener_tokens_usecase.execute(self.tablas_observadas()),
+            on_cambio=self.refrescar
+        )
+
+    def tablas_observadas(self) -> List[str]:
+        """Tablas cuyo token sondea el refresco automático."""
+        return TABLAS_FLOTA + [TABLA_RESERVAS] if self.calendario is not None else list(TABLAS_FLOTA)
+
+    # --- Calendario de ocupación ---
+
+    def _flota_actualizada(self):
+        """'vehiculos' es la flota completa: se conserva para el calendario."""
+        self._flota = self.vehiculos
+        if self.calendario is not None:
+            self.calendario.actualizar_flota(self._flota)
+
+    @trazado("viewmodel")
+    def cargar_calendario(self, desde: Optional[date] = None, dias: int = 90) -> "CalendarioFlota":
+        """
+        Arma el calendario con la flota completa y las reservas activas desde
+        'desde' (hoy por defecto). Luego se mantiene con registrar_reserva /
+        quitar_reserva y con cada sincronización de la flota.
+        """
+        from src.domain.services.calendario_flota import CalendarioFlota # NumPy solo si se usa
+
+        if not self.cargar_disponibilidad_usecase:
+            raise Exception("Reservas no configuradas.")
+        desde = desde or date.today()
+        disponibilidad = self.cargar_disponibilidad_usecase.execute(desde)
+        if not self.lista_completa and not self._flota:
+            self._flota = self.obtener_vehiculos_usecase.execute(self.mapa_tipos, self.mapa_estados)
+        calendario = CalendarioFlota(desde, dias)
+        calendario.cargar(self._flota, disponibilidad.reservas())
+        self.calendario = calendario
+        logger.info("Calendario cargado (%s vehículos, %s días).", len(self._flota), calendario.dias)
+        return calendario
+
+    def registrar_reserva(self, reserva: Reserva):
+        if self.calendario is not None:
+            self.calendario.agregar(reserva)
+
+    def quitar_reserva(self, reserva_id: int):
+        if self.calendario is not None:
+            self.calendario.quitar(reserva_id)
+
+    def libres_por_dia(self, inicio: date, fin: date, tipo_nombre: str = "Todos") -> "np.ndarray":
+        """Vehículos libres por día en [inicio, fin), de un tipo o de todos."""
+        calendario = self.calendario or self.cargar_calendario()
+        tipo_obj = next((t for t in self.tipos if t.nombre_tipo == tipo_nombre), None)
+        return calendario.libres_por_dia(inicio, fin, tipo_obj.id if tipo_obj else None)
+
+    def libres_por_tipo(self, inicio: date, fin: date) -> Dict[str, "np.ndarray"]:
+        """{nombre de tipo: vehículos libres por día} en [inicio, fin); incluye los tipos sin vehículos libres."""
+        calendario = self.calendario or self.cargar_calendario()
+        por_id = calendario.libres_por_tipo(inicio, fin, [tipo.id for tipo in self.tipos])
+        return {tipo.nombre_tipo: por_id[tipo.id] for tipo in self.tipos}
+
+    @trazado("viewmodel")
     def buscar_y_filtrar_vehiculos(self, termino: str, estado_nombre: str):
         self.filter_term = termino.strip()
         self.filter_estado_nombre = estado_nombre
-        print(f"ViewModel: Buscando/Filtrando - Termino: '{self.filter_term}', Estado: '{estado_nombre}'")
+        logger.debug("Buscando/Filtrando - Termino: '%s', Estado: '%s'", self.filter_term, estado_nombre)
 
         estado_id: Optional[int] = None
         if estado_nombre != "Todos":
@@ -102,23 +321,46 @@ class VehiculoViewModel:
 
         try:
             self.vehiculos = self.buscar_y_filtrar_usecase.execute(self.filter_term, estado_id, self.mapa_tipos, self.mapa_estados)
+            self.lista_completa = not self.filter_term and estado_id is None
+            if self.lista_completa: self._flota_actualizada()
         except Exception as e:
-            print(f"Error al buscar/filtrar: {e}"); self.vehiculos = []
+            logger.error("Error al buscar/filtrar: %s", e); self.vehiculos = []
         self._notify_observers()
 
+    def exportar_vehiculos(self, path: str, on_progreso: Optional[Callable[[int], None]] = None) -> ReporteExportacion:
+        """
+        Exporta la flota con la búsqueda y el filtro de estado activos.
+        Bloqueante: la vista la ejecuta en segundo plano.
+        """
+        if not self.exportar_vehiculos_usecase:
+            raise Exception("Exportación no disponible.")
+        estado_obj = next((e for e in self.estados if e.nombre_estado == self.filter_estado_nombre), None)
+        return self.exportar_vehiculos_usecase.execute(path, self.filter_term, estado_obj.id if estado_obj else None, on_progreso)
+
+    def vehiculo_por_id(self, vehiculo_id: int) -> Optional[Vehiculo]:
+        """Búsqueda O(1); el índice se reconstruye solo si 'vehiculos' cambió de lista."""
+        if self._indice_de is not self.vehiculos:
+            self._indice = {vehiculo.id: vehiculo for vehiculo in self.vehiculos}
+            self._indice_de = self.vehiculos
+        return self._indice.get(vehiculo_id)
+
+    @trazado("viewmodel")
     def seleccionar_vehiculo(self, vehiculo: Optional[Vehiculo]):
         # vvv CORRECCIÓN AQUÍ vvv
         # Si la selección es la misma que ya tenemos, no hacemos nada.
         # Esto rompe el bucle infinito de notificación (View -> VM -> View).
-        if self.vehiculo_seleccionado == vehiculo:
-            print(f"ViewModel: Selección redundante ignorada ({vehiculo.placa if vehiculo else 'None'}).")
+        # El repositorio entrega una única instancia por fila (mapa de
+        # identidad), así que basta comparar identidad.
+        if self.vehiculo_seleccionado is vehiculo:
+            logger.debug("Selección redundante ignorada (%s).", vehiculo.placa if vehiculo else 'None')
             return
         # ^^^ FIN DE LA CORRECCIÓN ^^^
         
         self.vehiculo_seleccionado = vehiculo
-        print(f"ViewModel: Vehículo seleccionado: {vehiculo.placa if vehiculo else 'None'}")
+        logger.debug("Vehículo seleccionado: %s", vehiculo.placa if vehiculo else 'None')
         self._notify_observers()
 
+    @trazado("viewmodel")
     def guardar_vehiculo(self, id: Optional[int], data_dict: Dict[str, Any]) -> Tuple[bool, str]:
         is_valid, error_message = self.validar_vehiculo_usecase.execute(data_dict)
         if not is_valid: return False, error_message
@@ -139,11 +381,12 @@ class VehiculoViewModel:
             )
             success = self.guardar_vehiculo_usecase.execute(vehiculo)
             if success:
-                self.cargar_datos_iniciales(); return True, "Vehículo guardado."
+                self.sincronizar(); return True, "Vehículo guardado."
             return False, "Error al guardar en BD."
         except ValueError as e: return False, f"Datos inválidos: {e}"
-        except Exception as e: print(f"Error inesperado al guardar: {e}"); return False, f"Error: {e}"
+        except Exception as e: logger.exception("Error inesperado al guardar: %s", e); return False, f"Error: {e}"
 
+    @trazado("viewmodel")
     def eliminar_vehiculo(self, id: Optional[int]) -> bool:
         if id is None: return False
         try:
@@ -151,8 +394,56 @@ class VehiculoViewModel:
             if success:
                 if self.vehiculo_seleccionado and self.vehiculo_seleccionado.id == id:
                     self.vehiculo_seleccionado = None
-                self.cargar_datos_iniciales()
+                self.sincronizar()
             return success
         except Exception as e:
-            print(f"Error al eliminar: {e}"); return False
+            logger.error("Error al eliminar: %s", e); return False
+
+    # --- Operaciones masivas ---
 
+    @trazado("viewmodel")
+    def ajustar_precios(self, porcentaje: float, tipo_nombre: str = "Todos", anio_desde: Optional[int] = None,
+                        anio_hasta: Optional[int] = None, marca: str = "") -> Tuple[bool, str]:
+        if not self.ajustar_precios_usecase: return False, "Operación no disponible."
+        tipo_obj = next((t for t in self.tipos if t.nombre_tipo == tipo_nombre), None)
+        if tipo_nombre != "Todos" and not tipo_obj: return False, "Tipo inválido."
+        try:
+            ids = self.ajustar_precios_usecase.execute(porcentaje, tipo_obj.id if tipo_obj else None, anio_desde, anio_hasta, marca or None)
+        except ValueError as e: return False, str(e)
+        except Exception as e: logger.error("Error al ajustar precios: %s", e); return False, f"Error: {e}"
+        self._aplicar_actualizados(ids)
+        return True, f"Precio actualizado en {len(ids)} vehículo(s)."
+
+    @trazado("viewmodel")
+    def cambiar_estado_vehiculos(self, vehiculo_ids: List[int], estado_nombre: str,
+                                 estado_origen_nombre: Optional[str] = None) -> Tuple[bool, str]:
+        if not self.cambiar_estado_usecase: return False, "Operación no disponible."
+        estado_obj = next((e for e in self.estados if e.nombre_estado == estado_nombre), None)
+        origen_obj = next((e for e in self.estados if e.nombre_estado == estado_origen_nombre), None)
+        if not estado_obj or (estado_origen_nombre and not origen_obj): return False, "Estado inválido."
+        try:
+            ids = self.cambiar_estado_usecase.execute(vehiculo_ids, estado_obj.id, origen_obj.id if origen_obj else None)
+        except Exception as e: logger.error("Error al cambiar estados: %s", e); return False, f"Error: {e}"
+        self._aplicar_actualizados(ids)
+        return True, f"{len(ids)} vehículo(s) pasaron a '{estado_nombre}'."
+
+    def _aplicar_actualizados(self, vehiculo_ids: List[int]):
+        """
+        Refresco incremental tras una operación masiva: relee solo los
+        vehículos afectados (en un lote) y notifica una vez.
+        """
+        if not vehiculo_ids: return
+        if not self.recargar_vehiculos_usecase:
+            self.sincronizar(); return
+        try:
+            recargados = self.recargar_vehiculos_usecase.execute(vehiculo_ids, self.mapa_tipos, self.mapa_estados)
+        except Exception as e:
+            logger.error("Error al releer vehículos: %s", e); self.cargar_datos_iniciales(); return
+        if not self.lista_completa:
+            # Con filtro de estado los afectados pueden entrar o salir de la lista
+            self.buscar_y_filtrar_vehiculos(self.filter_term, self.filter_estado_nombre); return
+        # El mapa de identidad actualizó las instancias en el lugar; se reemplazan por si alguna era nueva
+        self.vehiculos = [recargados.get(vehiculo.id, vehiculo) for vehiculo in self.vehiculos]
+        self._flota_actualizada()
+        logger.debug("%s vehículos actualizados en bloque.", len(recargados))
+        self._notify_observers()
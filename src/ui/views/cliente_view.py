@@ -1,10 +1,16 @@
 # src/ui/views/cliente_view.py
 
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 from typing import Optional
 from src.domain.models.cliente import Cliente
 from src.ui.viewmodels.cliente_viewmodel import ClienteViewModel
+from src.ui.utils.exportar import exportar_con_dialogo
+from src.utils.tracing import trazado_ui
+
+logger = logging.getLogger(__name__)
+
 # ¡LA IMPORTACIÓN CIRCULAR HA SIDO ELIMINADA DE AQUÍ!
 
 class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
@@ -18,6 +24,7 @@ class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
         
         # Variables de control
         self.selected_id: Optional[int] = None
+        self._cliente_en_formulario: Optional[Cliente] = None
         self.nombre_var = tk.StringVar()
         self.apellido_var = tk.StringVar()
         self.dni_var = tk.StringVar()
@@ -49,8 +56,17 @@ class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
         # Manejar el cierre de la ventana
         self.bind("<Destroy>", self.on_destroy)
         
-        # Carga inicial de datos
-        self.view_model.cargar_clientes()
+        # Carga inicial de datos (usa la precarga del arranque si existe)
+        if not self.view_model.consumir_precarga():
+            self.view_model.cargar_clientes()
+        elif not self.view_model.lista_completa:
+            # Se pintó la primera página; el resto se lee sin bloquear Tk
+            self.view_model.completar_en_segundo_plano(self)
+
+        # Refresco automático con los cambios de otros mostradores
+        self.auto_refresco = self.view_model.crear_auto_refresco(self)
+        if self.auto_refresco:
+            self.auto_refresco.iniciar()
         
     def _create_widgets(self):
         # 'self' es el Frame principal ahora
@@ -115,6 +131,8 @@ class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
         search_entry = ttk.Entry(search_frame, textvariable=self.search_var)
         search_entry.grid(row=0, column=1, sticky="ew")
         search_entry.bind('<KeyRelease>', self.on_search)
+        self.export_button = ttk.Button(search_frame, text="Exportar...", command=self.on_export)
+        self.export_button.grid(row=0, column=2, padx=(10,0))
         
         # Treeview
         columns = ("ID", "Nombre", "Apellido", "DNI", "Licencia", "Teléfono", "Email", "Distrito")
@@ -141,6 +159,7 @@ class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
 
     # --- Métodos de UI (Notifican al ViewModel) ---
 
+    @trazado_ui()
     def on_save(self):
         success, message = self.view_model.guardar_cliente(
             id=self.selected_id,
@@ -159,6 +178,7 @@ class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
         else:
             messagebox.showerror("Error de Validación", message, parent=self.master)
 
+    @trazado_ui()
     def on_delete(self):
         if not self.selected_id:
             messagebox.showwarning("Advertencia", "Seleccione un cliente para eliminar.", parent=self.master)
@@ -172,20 +192,27 @@ class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
                 messagebox.showerror("Error", "No se pudo eliminar el cliente.", parent=self.master)
 
     def on_clear(self):
+        self._llenar_formulario(None)
         self.view_model.seleccionar_cliente(None)
 
+    @trazado_ui()
     def on_search(self, event=None):
         search_term = self.search_var.get()
         self.view_model.buscar_clientes(search_term)
 
+    def on_export(self):
+        exportar_con_dialogo(self.master, self.export_button, "clientes.csv", self.view_model.exportar_clientes)
+
+    @trazado_ui()
     def on_select_item(self, event=None):
         selection = self.tree.selection()
         if selection:
             item = self.tree.item(selection[0])
             selected_id = int(item['values'][0])
             
-            cliente_obj = next((c for c in self.view_model.clientes if c.id == selected_id), None)
-            if cliente_obj:
+            cliente_obj = self.view_model.cliente_por_id(selected_id)
+            # Ignorar la reselección que hace update_view tras un refresco (evita el bucle View -> VM -> View)
+            if cliente_obj and cliente_obj is not self.view_model.cliente_seleccionado:
                 self.view_model.seleccionar_cliente(cliente_obj)
         
     def on_destroy(self, event):
@@ -193,27 +220,32 @@ class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
         Maneja el cierre de la ventana Toplevel (evento <Destroy>).
         """
         if event.widget == self:
-            print("ClienteView destruida, dándose de baja.")
+            logger.debug("ClienteView destruida, dándose de baja.")
+            if self.auto_refresco:
+                self.auto_refresco.detener()
             if self.view_model:
                 try:
                     self.view_model.remove_observer(self.update_view)
                 except Exception as e:
-                    print(f"Error al darse de baja de ClienteViewModel: {e}")
+                    logger.error("Error al darse de baja de ClienteViewModel: %s", e)
 
     # --- Métodos de Actualización (Llamados por el ViewModel) ---
 
+    @trazado_ui()
     def update_view(self):
         """
         Actualiza la vista (Treeview y Formulario) cuando el
         ViewModel notifica un cambio de estado.
         """
-        print("ClienteView: Recibida notificación, actualizando UI...")
+        logger.debug("Recibida notificación, actualizando UI...")
         try:
-            # Actualizar el Treeview
+            # Actualizar el Treeview (conservando la selección y el scroll)
+            current_selection = self.tree.selection()
+            scroll = self.tree.yview()[0]
             self.tree.delete(*self.tree.get_children())
             if self.view_model.clientes:
                 for cliente in self.view_model.clientes:
-                    self.tree.insert("", "end", values=(
+                    self.tree.insert("", "end", iid=cliente.id, values=(
                         cliente.id,
                         cliente.nombre,
                         cliente.apellido,
@@ -223,33 +255,32 @@ class ClienteView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
                         cliente.email or "",
                         cliente.distrito or ""
                     ))
-            
-            # Actualizar el Formulario
+            self.tree.yview_moveto(scroll)
+
+            # Actualizar el Formulario solo si cambió la selección: un refresco
+            # automático no debe pisar lo que el usuario está escribiendo
             cliente = self.view_model.cliente_seleccionado
-            if cliente:
-                self.selected_id = cliente.id
-                self.nombre_var.set(cliente.nombre)
-                self.apellido_var.set(cliente.apellido)
-                self.dni_var.set(cliente.dni)
-                self.licencia_var.set(cliente.licencia)
-                self.telefono_var.set(cliente.telefono or "")
-                self.email_var.set(cliente.email or "")
-                self.direccion_var.set(cliente.direccion or "")
-                self.distrito_var.set(cliente.distrito or "")
+            if cliente is not self._cliente_en_formulario:
+                self._llenar_formulario(cliente)
+
+            if cliente and self.tree.exists(cliente.id):
+                if current_selection != (str(cliente.id),):
+                    self.tree.selection_set(cliente.id)
             else:
-                self.selected_id = None
-                self.nombre_var.set("")
-                self.apellido_var.set("")
-                self.dni_var.set("")
-                self.licencia_var.set("")
-                self.telefono_var.set("")
-                self.email_var.set("")
-                self.direccion_var.set("")
-                self.distrito_var.set("")
-                
                 for item in self.tree.selection():
                     self.tree.selection_remove(item)
-            print("ClienteView: Actualización UI completada.")
+            logger.debug("Actualización UI completada.")
         except Exception as e:
-            print(f"Error fatal durante ClienteView.update_view: {e}")
+            logger.exception("Error fatal durante ClienteView.update_view: %s", e)
 
+    def _llenar_formulario(self, cliente: Optional[Cliente]):
+        self._cliente_en_formulario = cliente
+        self.selected_id = cliente.id if cliente else None
+        self.nombre_var.set(cliente.nombre if cliente else "")
+        self.apellido_var.set(cliente.apellido if cliente else "")
+        self.dni_var.set(cliente.dni if cliente else "")
+        self.licencia_var.set(cliente.licencia if cliente else "")
+        self.telefono_var.set((cliente.telefono or "") if cliente else "")
+        self.email_var.set((cliente.email or "") if cliente else "")
+        self.direccion_var.set((cliente.direccion or "") if cliente else "")
+        self.distrito_var.set((cliente.distrito or "") if cliente else "")
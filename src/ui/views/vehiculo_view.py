@@ -1,14 +1,21 @@
 # src/ui/views/vehiculo_view.py
 # (Versión consolidada y verificada - CORRIGE HERENCIA, CIERRE y CARGA)
+import logging
 import tkinter as tk
 from tkinter import ttk, messagebox
 import os
-from typing import Optional, Dict, Tuple
-from PIL import Image, ImageTk
+from typing import Optional, Dict, Tuple, TYPE_CHECKING
 from src.domain.models.vehiculo import Vehiculo
 from src.ui.viewmodels.vehiculo_viewmodel import VehiculoViewModel
 from src.ui.utils.image_utils import ImageManager # <-- Importado   
 from src.ui.theme import PALETTE
+from src.ui.utils.exportar import exportar_con_dialogo
+from src.utils.tracing import trazado_ui
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from PIL import ImageTk # Solo para anotaciones; PIL se carga en ImageManager
 
 class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
     def __init__(self, master, viewmodel: VehiculoViewModel):
@@ -26,13 +33,18 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
         self.imagen_path_var = tk.StringVar()
         self.search_var = tk.StringVar(); self.filter_var = tk.StringVar(value="Todos")
         self._inicializando = True
-        self._current_image_tk: Optional[ImageTk.PhotoImage] = None # Para mantener referencia
+        self._current_image_tk: Optional["ImageTk.PhotoImage"] = None # Para mantener referencia
 
         self.create_widgets()
         self.view_model.bind_to_updates(self.update_ui)
-        self.view_model.cargar_datos_iniciales()
+        if not self.view_model.consumir_precarga(): # Datos del arranque, si existen
+            self.view_model.cargar_datos_iniciales()
         self._inicializando = False
 
+        # Refresco automático con los cambios de otros mostradores
+        self.auto_refresco = self.view_model.crear_auto_refresco(self)
+        if self.auto_refresco: self.auto_refresco.iniciar()
+
         self.bind("<Destroy>", self.on_destroy)
 
     def create_widgets(self):
@@ -104,6 +116,8 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
         ttk.Label(filter_search_frame, text="Filtrar estado:").grid(row=0, column=2, padx=(10,5))
         self.filter_combo = ttk.Combobox(filter_search_frame, textvariable=self.filter_var, state="readonly"); self.filter_combo.grid(row=0, column=3, sticky="ew")
         self.filter_combo.bind('<<ComboboxSelected>>', self.on_search_or_filter)
+        self.export_button = ttk.Button(filter_search_frame, text="Exportar...", command=self.on_export)
+        self.export_button.grid(row=0, column=4, padx=(10,0))
         
         columns = ("ID", "Marca", "Modelo", "Año", "Placa", "Tipo", "Estado", "Precio/Día")
         self.tree = ttk.Treeview(list_frame, columns=columns, show="headings", height=15)
@@ -122,17 +136,19 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
 
     def on_destroy(self, event):
         if event.widget == self:
-            print("VehiculoView: Iniciando destrucción...")
+            logger.debug("Iniciando destrucción...")
             try:
+                if getattr(self, 'auto_refresco', None): self.auto_refresco.detener()
                 if hasattr(self, 'view_model') and self.view_model:
                      self.view_model.remove_observer(self.update_ui)
-                     print("VehiculoView: Observador eliminado.")
+                     logger.debug("Observador eliminado.")
                 if hasattr(self, 'image_manager') and self.image_manager:
                    self.image_manager.clear_cache() # <-- Activado
-                   print("VehiculoView: Caché de imagen limpiada.")
+                   logger.debug("Caché de imagen limpiada.")
             except Exception as e:
-                print(f"Error durante on_destroy en VehiculoView: {e}")
+                logger.error("Error durante on_destroy en VehiculoView: %s", e)
 
+    @trazado_ui()
     def on_save(self):
         data_dict = {
             'marca': self.marca_var.get(), 'modelo': self.modelo_var.get(),
@@ -145,6 +161,7 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
         if success: messagebox.showinfo("Éxito", message, parent=self); self.clear_form()
         else: messagebox.showerror("Error", message, parent=self)
 
+    @trazado_ui()
     def on_delete(self):
         if not self.selected_id: messagebox.showwarning("Advertencia", "Seleccione vehículo.", parent=self); return
         if messagebox.askyesno("Confirmar", "¿Eliminar este vehículo?", parent=self):
@@ -154,19 +171,24 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
 
     def clear_form(self): self.view_model.seleccionar_vehiculo(None)
 
+    @trazado_ui()
     def on_select_item(self, event=None):
         selection = self.tree.selection()
         if selection:
             try:
                 selected_id = int(selection[0]) # IID es el ID del vehículo
-                vehiculo_obj = next((v for v in self.view_model.vehiculos if v.id == selected_id), None)
+                vehiculo_obj = self.view_model.vehiculo_por_id(selected_id)
                 if vehiculo_obj: self.view_model.seleccionar_vehiculo(vehiculo_obj)
-            except ValueError: print(f"Error: IID no válido: {selection[0]}")
+            except ValueError: logger.warning("IID no válido: %s", selection[0])
 
+    @trazado_ui()
     def on_search_or_filter(self, event=None):
         if self._inicializando: return
         self.view_model.buscar_y_filtrar_vehiculos(self.search_var.get(), self.filter_var.get())
 
+    def on_export(self):
+        exportar_con_dialogo(self.master, self.export_button, "vehiculos.csv", self.view_model.exportar_vehiculos)
+
     def on_tipo_selected(self, event=None):
         tipo_obj = next((t for t in self.view_model.tipos if t.nombre_tipo == self.tipo_var.get()), None)
         self.garantia_var.set(f"S/ {tipo_obj.garantia_base:.2f}" if tipo_obj else "S/ 0.00")
@@ -195,21 +217,22 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
          else:
              self.image_preview_label.config(image=None, text="Error: No Mgr")
 
+    @trazado_ui()
     def update_ui(self):
-        print("VehiculoView: Recibida notificación, actualizando UI...")
-        if not self.winfo_exists(): print("VehiculoView: UI destruida, cancelando."); return
+        logger.debug("Recibida notificación, actualizando UI...")
+        if not self.winfo_exists(): logger.debug("UI destruida, cancelando."); return
 
         try:
             nombres_tipos = tuple(t.nombre_tipo for t in self.view_model.tipos if hasattr(t, 'nombre_tipo'))
             if self.tipo_combo['values'] != nombres_tipos: self.tipo_combo['values'] = nombres_tipos
-        except Exception as e: print(f"Error actualizando combo Tipos: {e}")
+        except Exception as e: logger.error("Error actualizando combo Tipos: %s", e)
 
         try:
             nombres_estados = tuple(e.nombre_estado for e in self.view_model.estados if hasattr(e, 'nombre_estado'))
             if self.estado_combo['values'] != nombres_estados: self.estado_combo['values'] = nombres_estados
             valores_filtro = ("Todos",) + nombres_estados
             if self.filter_combo['values'] != valores_filtro: self.filter_combo['values'] = valores_filtro
-        except Exception as e: print(f"Error actualizando combo Estados/Filtro: {e}")
+        except Exception as e: logger.error("Error actualizando combo Estados/Filtro: %s", e)
 
         try:
             current_selection = self.tree.selection()
@@ -226,18 +249,18 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
                 ))
             if current_selection and self.tree.exists(current_selection[0]):
                  self.tree.selection_set(current_selection[0])
-        except Exception as e: print(f"Error crítico actualizando Treeview: {e}")
+        except Exception as e: logger.exception("Error crítico actualizando Treeview: %s", e)
 
         try:
             if self.filter_var.get() != self.view_model.filter_estado_nombre:
                  self.filter_var.set(self.view_model.filter_estado_nombre)
-        except Exception as e: print(f"Error actualizando var filtro: {e}")
+        except Exception as e: logger.error("Error actualizando var filtro: %s", e)
 
         vehiculo_sel = self.view_model.vehiculo_seleccionado
         if vehiculo_sel:
             if self.selected_id != vehiculo_sel.id:
                 self.selected_id = vehiculo_sel.id
-                print(f"VehiculoView: Rellenando formulario para ID {self.selected_id}")
+                logger.debug("Rellenando formulario para ID %s", self.selected_id)
                 self.marca_var.set(getattr(vehiculo_sel, 'marca', '')); self.modelo_var.set(getattr(vehiculo_sel, 'modelo', ''))
                 self.anio_var.set(str(getattr(vehiculo_sel, 'anio', ''))); self.placa_var.set(getattr(vehiculo_sel, 'placa', ''))
                 self.tipo_var.set(getattr(getattr(vehiculo_sel, 'tipo', None), 'nombre_tipo', ''))
@@ -255,7 +278,7 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
                     self.tree.selection_set(sel_id_str); self.tree.focus(sel_id_str); self.tree.see(sel_id_str)
         else:
              if self.selected_id is not None:
-                print("VehiculoView: Limpiando formulario.")
+                logger.debug("Limpiando formulario.")
                 self.selected_id = None
                 self.marca_var.set(""); self.modelo_var.set(""); self.anio_var.set("")
                 self.placa_var.set(""); self.tipo_var.set(""); self.estado_var.set("")
@@ -264,5 +287,5 @@ class VehiculoView(ttk.Frame): # <-- CORREGIDO: Heredar de ttk.Frame
                 self.imagen_label.config(text="Sin imagen")
                 self._show_image_preview(None) # <-- Reactivado
                 if self.tree.selection(): self.tree.selection_remove(self.tree.selection()[0])
-        print("VehiculoView: Actualización UI completada.")
+        logger.debug("Actualización UI completada.")
 
@@ -0,0 +1,167 @@
+# src/utils/consultas.py
+#
+# Conteo de consultas por alcance, para fijar presupuestos de viajes a la base
+# y detectar N+1 (la misma forma de consulta repetida dentro de una acción).
+#
+#   with contar_consultas() as conteo:
+#       viewmodel.guardar_vehiculo(None, datos)
+#   print(conteo.resumen())
+#
+#   with assert_max_queries(2):           # también como decorador
+#       usecase.execute(vehiculo)
+#
+# Los DataSource marcan sus métodos execute_* con @contado. Sin alcances
+# abiertos, @contado solo comprueba una lista vacía por llamada. Los alcances
+# son globales (no por hilo): también cuentan lo que lanza la acción en hilos
+# de fondo, y cualquier otra consulta concurrente (p. ej. el auto-refresco).
+# Se cuentan llamadas al DataSource, incluidas las que responde la caché.
+#
+# Auditoría en desarrollo: con QUERY_AUDIT=1 cada manejador de una Vista
+# (@trazado_ui) es un alcance, y al terminar se registra un aviso si alguna
+# forma de consulta se repitió QUERY_AUDIT_REPEAT veces o más (2 por defecto)
+# o si la acción superó QUERY_AUDIT_MAX consultas.
+
+import logging
+import os
+import re
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Callable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_alcances: List["ConteoConsultas"] = []
+_lock = threading.Lock()
+
+_LITERAL_TEXTO = re.compile(r"N?'(?:[^']|'')*'")
+_LITERAL_NUMERO = re.compile(r"\b\d+(?:\.\d+)?\b")
+_LISTA_IN = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+
+@lru_cache(maxsize=2048)
+def normalizar_sql(query: str) -> str:
+    """
+    Forma de una consulta: sin espacios de más, con los literales reemplazados
+    por '?' y las listas IN (?, ?, ...) colapsadas, para agrupar las que solo
+    difieren en valores.
+    """
+    forma = " ".join(str(query).split())
+    forma = _LITERAL_TEXTO.sub("?", forma)
+    forma = _LITERAL_NUMERO.sub("?", forma)
+    return _LISTA_IN.sub("IN (...)", forma)
+
+class ConteoConsultas:
+    """Llamadas al DataSource registradas mientras el alcance estuvo abierto."""
+
+    def __init__(self, nombre: str = ""):
+        self.nombre = nombre
+        self.por_forma: Counter = Counter()
+        self._lock = threading.Lock()
+
+    @property
+    def total(self) -> int:
+        return sum(self.por_forma.values())
+
+    def registrar(self, forma: str) -> None:
+        with self._lock:
+            self.por_forma[forma] += 1
+
+    def repetidas(self, minimo: int = 2) -> List[Tuple[str, int]]:
+        """Formas ejecutadas 'minimo' veces o más, de la más repetida a la menos."""
+        return [(forma, veces) for forma, veces in self.por_forma.most_common() if veces >= minimo]
+
+    def resumen(self, limite: int = 20) -> str:
+        titulo = f"'{self.nombre}': " if self.nombre else ""
+        lineas = [f"{titulo}{self.total} consulta(s), {len(self.por_forma)} forma(s) distinta(s)"]
+        for forma, veces in self.por_forma.most_common(limite):
+            lineas.append(f"  {veces:4d} x {forma[:160]}")
+        if len(self.por_forma) > limite:
+            lineas.append(f"  ... y {len(self.por_forma) - limite} forma(s) más")
+        return "\n".join(lineas)
+
+def _registrar(query: str) -> None:
+    forma = normalizar_sql(query)
+    for conteo in list(_alcances):
+        conteo.registrar(forma)
+
+def contado(forma: Optional[Callable[..., str]] = None):
+    """
+    Decorador para los métodos de un DataSource: cada llamada suma una
+    consulta a los alcances abiertos. Por defecto la consulta es el primer
+    argumento; 'forma' recibe los mismos parámetros que el método y retorna
+    el texto a agrupar (p. ej. "GET api/vehiculos/7" en el cliente HTTP).
+    """
+    def decorador(funcion):
+        @wraps(funcion)
+        def envoltura(*a, **k):
+            if _alcances:
+                _registrar(forma(*a, **k) if forma else a[1] if len(a) > 1 else k.get("query", ""))
+            return funcion(*a, **k)
+        return envoltura
+    return decorador
+
+@contextmanager
+def contar_consultas(nombre: str = "") -> Iterator[ConteoConsultas]:
+    """Abre un alcance y entrega su ConteoConsultas (se llena hasta salir del bloque)."""
+    conteo = ConteoConsultas(nombre)
+    with _lock:
+        _alcances.append(conteo)
+    try:
+        yield conteo
+    finally:
+        with _lock:
+            _alcances.remove(conteo)
+
+@contextmanager
+def assert_max_queries(n: int, repeticiones: Optional[int] = None, nombre: str = "") -> Iterator[ConteoConsultas]:
+    """
+    Falla (AssertionError, con el resumen por forma) si el bloque hace más de
+    'n' consultas o, con 'repeticiones', si alguna forma se repite más veces.
+    """
+    with contar_consultas(nombre) as conteo:
+        yield conteo
+    if conteo.total > n:
+        raise AssertionError(f"Se esperaban como máximo {n} consultas y hubo {conteo.total}.\n{conteo.resumen()}")
+    if repeticiones is not None:
+        excedidas = conteo.repetidas(repeticiones + 1)
+        if excedidas:
+            forma, veces = excedidas[0]
+            raise AssertionError(
+                f"Consulta repetida {veces} veces (máximo {repeticiones}), posible N+1: {forma}\n{conteo.resumen()}")
+
+# --- Auditoría en desarrollo ---
+
+def _entero_env(nombre: str, defecto: Optional[int]) -> Optional[int]:
+    valor = os.environ.get(nombre, "").strip()
+    return int(valor) if valor else defecto
+
+auditoria_activa = os.environ.get("QUERY_AUDIT", "").lower() in ("1", "true", "si", "sí")
+REPETICION_AVISO = _entero_env("QUERY_AUDIT_REPEAT", 2)
+MAXIMO_AVISO = _entero_env("QUERY_AUDIT_MAX", None)
+
+class _AlcanceNulo:
+    __slots__ = ()
+
+    def __enter__(self):
+        return None
+
+    def __exit__(self, *exc):
+        return False
+
+_NULO = _AlcanceNulo()
+
+@contextmanager
+def _auditoria(nombre: str) -> Iterator[ConteoConsultas]:
+    with contar_consultas(nombre) as conteo:
+        yield conteo
+    for forma, veces in conteo.repetidas(REPETICION_AVISO):
+        logger.warning("Acción '%s': la misma consulta %d veces (¿N+1?): %s", nombre, veces, forma[:200])
+    if MAXIMO_AVISO is not None and conteo.total > MAXIMO_AVISO:
+        logger.warning("Acción '%s': %d consultas (máximo %d)\n%s", nombre, conteo.total, MAXIMO_AVISO, conteo.resumen())
+    elif conteo.total:
+        logger.debug("%s", conteo.resumen())
+
+def auditar(nombre: str):
+    """Alcance de una acción del usuario; no hace nada si QUERY_AUDIT está desactivado."""
+    return _auditoria(nombre) if auditoria_activa else _NULO
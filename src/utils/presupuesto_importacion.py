@@ -0,0 +1,71 @@
+# src/utils/presupuesto_importacion.py
+#
+# Medición del costo de importar el módulo de arranque con
+# 'python -X importtime', compartida por "python cli.py import-budget" y por
+# tests/test_import_budget.py: el arranque no debe pasar de IMPORT_BUDGET_MS
+# ni cargar módulos que deben ser perezosos (driver de BD, PIL, vistas...).
+
+import os
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from typing import Iterable, List, Optional, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+PRESUPUESTO_MS_DEFECTO = 150.0
+PROHIBIDOS_DEFECTO = ["pyodbc", "PIL", "numpy", "pandas", "src.ui.views", "src.data.repositories"]
+
+@dataclass
+class MedicionImportacion:
+    """Resultado de importar un módulo con -X importtime."""
+    modulo: str
+    total_us: int = 0
+    tiempos: List[Tuple[int, str, bool]] = field(default_factory=list)  # (acumulado_us, módulo, es_raíz)
+
+    @property
+    def total_ms(self) -> float:
+        return self.total_us / 1000
+
+    @property
+    def importados(self) -> List[str]:
+        return [nombre for _, nombre, _ in self.tiempos]
+
+    def prohibidos(self, prefijos: Iterable[str]) -> List[str]:
+        """Módulos importados que coinciden con (o están dentro de) algún prefijo."""
+        prefijos = list(prefijos)
+        return sorted({
+            nombre for nombre in self.importados
+            if any(nombre == p or nombre.startswith(p + ".") for p in prefijos)
+        })
+
+    def mas_lentos(self, cantidad: int) -> List[Tuple[int, str]]:
+        return [(us, nombre) for us, nombre, _ in sorted(self.tiempos, reverse=True)[:cantidad]]
+
+def presupuesto_ms() -> float:
+    return float(os.environ.get("IMPORT_BUDGET_MS") or PRESUPUESTO_MS_DEFECTO)
+
+def parsear_importtime(salida: str, modulo: str) -> MedicionImportacion:
+    """Interpreta el stderr de -X importtime: "import time: <self us> | <cumulative us> | <módulo>"."""
+    medicion = MedicionImportacion(modulo)
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:"):
+            continue
+        partes = linea[len("import time:"):].split("|")
+        if len(partes) != 3 or not partes[1].strip().isdigit():
+            continue # Cabecera
+        nombre = partes[2]
+        # Los módulos de nivel superior tienen un solo espacio de indentación
+        medicion.tiempos.append((int(partes[1]), nombre.strip(), not nombre[1:].startswith(" ")))
+    medicion.total_us = next((us for us, nombre, raiz in medicion.tiempos if raiz and nombre == modulo), 0)
+    return medicion
+
+def medir_importacion(modulo: str = "main", cwd: Optional[str] = None) -> MedicionImportacion:
+    """Importa 'modulo' en un intérprete nuevo; lanza RuntimeError si la importación falla."""
+    proceso = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {modulo}"],
+        capture_output=True, text=True, cwd=cwd or RAIZ
+    )
+    if proceso.returncode != 0:
+        raise RuntimeError(f"No se pudo importar '{modulo}':\n{proceso.stderr[-2000:]}")
+    return parsear_importtime(proceso.stderr, modulo)
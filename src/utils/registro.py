@@ -0,0 +1,132 @@
+# src/utils/registro.py
+#
+# Configuración central de logging para main.py y cli.py. Cada módulo usa
+# logging.getLogger(__name__) con formato perezoso:
+#
+#   logger.debug("Buscando '%s' (estado %s)", termino, estado)
+#
+# Así el mensaje solo se arma si algún handler lo va a emitir.
+#
+# Variables de entorno (todas opcionales):
+#   LOG_LEVEL    Nivel raíz (INFO por defecto).
+#   LOG_LEVELS   Niveles por módulo: "src.ui=DEBUG,src.data.repositories=WARNING".
+#   LOG_FILE     Archivo (rotativo) además de la consola.
+#   LOG_FORMAT   "texto" (por defecto) o "json", una línea JSON por registro.
+#   APP_ENV      "production" descarta DEBUG globalmente con logging.disable():
+#                logger.debug() retorna tras comparar un entero, sin crear
+#                el LogRecord ni formatear nada, aunque LOG_LEVELS pida DEBUG.
+#
+# Con 'en_cola' (por defecto si hay LOG_FILE) los handlers reales corren en
+# un hilo de QueueListener: el hilo de Tk solo encola el registro y nunca
+# espera a la consola ni al disco.
+
+import atexit
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import logging.handlers
+
+FORMATO_TEXTO = "%(asctime)s %(levelname)s %(name)s: %(message)s"
+
+# Atributos estándar de LogRecord; el resto llegó por 'extra=' y va al JSON
+_ATRIBUTOS_RECORD = set(vars(logging.LogRecord("", 0, "", 0, "", (), None))) | {"message", "asctime"}
+
+_listener: Optional["logging.handlers.QueueListener"] = None
+
+class FormatoJson(logging.Formatter):
+    """Una línea JSON por registro, con los campos pasados en 'extra='."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        datos = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "nivel": record.levelname,
+            "logger": record.name,
+            "hilo": record.threadName,
+            "msg": record.getMessage(),
+        }
+        datos.update({k: v for k, v in vars(record).items() if k not in _ATRIBUTOS_RECORD})
+        if record.exc_info:
+            datos["exc"] = self.formatException(record.exc_info)
+        return json.dumps(datos, ensure_ascii=False, default=str)
+
+def _nivel(nombre: str) -> int:
+    nivel = logging.getLevelName(nombre.strip().upper())
+    if not isinstance(nivel, int):
+        raise ValueError(f"Nivel de log desconocido: '{nombre}'")
+    return nivel
+
+def niveles_por_modulo(texto: str) -> Dict[str, int]:
+    """Interpreta LOG_LEVELS ("modulo=NIVEL,otro=NIVEL")."""
+    niveles = {}
+    for parte in filter(None, (p.strip() for p in texto.split(","))):
+        modulo, separador, nivel = parte.partition("=")
+        if not separador:
+            raise ValueError(f"LOG_LEVELS: se esperaba 'modulo=NIVEL' y llegó '{parte}'")
+        niveles[modulo.strip()] = _nivel(nivel)
+    return niveles
+
+def configurar_logging(nivel: Optional[str] = None, niveles: Optional[Dict[str, int]] = None,
+                       archivo: Optional[str] = None, formato: Optional[str] = None,
+                       en_cola: Optional[bool] = None, produccion: Optional[bool] = None,
+                       stream=None) -> None:
+    """
+    Configura el logger raíz. Los argumentos explícitos tienen prioridad sobre
+    las variables de entorno. Puede llamarse de nuevo: reemplaza la
+    configuración anterior (y detiene su QueueListener).
+    """
+    # logging.handlers (socket, pickle...) solo se importa al configurar: ver import-budget
+    import logging.handlers
+    import queue
+
+    global _listener
+    nivel = nivel or os.environ.get("LOG_LEVEL", "INFO")
+    niveles = niveles if niveles is not None else niveles_por_modulo(os.environ.get("LOG_LEVELS", ""))
+    archivo = archivo or os.environ.get("LOG_FILE") or None
+    formato = (formato or os.environ.get("LOG_FORMAT", "texto")).lower()
+    if en_cola is None:
+        en_cola = archivo is not None
+    if produccion is None:
+        produccion = os.environ.get("APP_ENV", "").lower() in ("production", "produccion", "prod")
+
+    formateador = FormatoJson() if formato == "json" else logging.Formatter(FORMATO_TEXTO)
+    handlers: List[logging.Handler] = [logging.StreamHandler(stream or sys.stderr)]
+    if archivo:
+        handlers.append(logging.handlers.RotatingFileHandler(
+            archivo, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"))
+    for handler in handlers:
+        handler.setFormatter(formateador)
+
+    detener_logging()
+    raiz = logging.getLogger()
+    for handler in list(raiz.handlers):
+        raiz.removeHandler(handler)
+        handler.close()
+    raiz.setLevel(_nivel(nivel))
+
+    if en_cola:
+        cola: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        raiz.addHandler(logging.handlers.QueueHandler(cola))
+        _listener = logging.handlers.QueueListener(cola, *handlers, respect_handler_level=True)
+        _listener.start()
+    else:
+        for handler in handlers:
+            raiz.addHandler(handler)
+
+    for modulo, nivel_modulo in niveles.items():
+        logging.getLogger(modulo).setLevel(nivel_modulo)
+
+    # Guardia de producción: corta DEBUG antes de que exista el LogRecord
+    logging.disable(logging.DEBUG if produccion else logging.NOTSET)
+
+def detener_logging() -> None:
+    """Vacía la cola y detiene el hilo del QueueListener, si hay uno."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(detener_logging)
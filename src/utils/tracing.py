@@ -0,0 +1,224 @@
+# src/utils/tracing.py
+#
+# Trazas de rendimiento de punta a punta: Vista -> ViewModel -> caso de uso ->
+# repositorio -> DataSource, exportadas en formato Chrome trace-event (JSON)
+# para abrirlas en https://ui.perfetto.dev o chrome://tracing.
+#
+# Se activa con la variable de entorno TRACE_FILE=<ruta.json> (el archivo se
+# escribe al cerrar la aplicación) o llamando a activar(). Desactivado, span()
+# retorna un contexto nulo compartido y @trazado solo agrega una comprobación
+# de bandera por llamada.
+#
+#   with span("hidratar", "repo", filas=len(rows)):
+#       ...
+#
+#   @trazado("usecase")
+#   def execute(self, ...): ...
+#
+#   @trazado_ui()            # además marca cuándo Tk quedó ocioso
+#   def on_search(self): ...
+
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from functools import wraps
+from typing import Any, Callable, Dict, List, Optional
+from src.utils.consultas import auditar
+
+logger = logging.getLogger(__name__)
+
+MAX_EVENTOS = 1_000_000  # ~200 MB en memoria en el peor caso; luego se descartan
+
+_activo = False
+_ruta: Optional[str] = None
+_eventos: List[Dict[str, Any]] = []
+_descartados = 0
+_hilos: Dict[int, str] = {}
+_pid = os.getpid()
+_origen = time.perf_counter_ns()
+
+def _ahora_us() -> float:
+    return (time.perf_counter_ns() - _origen) / 1000
+
+def _registrar(evento: Dict[str, Any]) -> None:
+    global _descartados
+    tid = evento["tid"]
+    if tid not in _hilos:
+        _hilos[tid] = threading.current_thread().name
+    # list.append es atómico con el GIL: no hace falta lock entre hilos
+    if len(_eventos) < MAX_EVENTOS:
+        _eventos.append(evento)
+    else:
+        _descartados += 1
+
+class _SpanNulo:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **args) -> None:
+        pass
+
+_NULO = _SpanNulo()
+
+class _Span:
+    __slots__ = ("nombre", "categoria", "args", "inicio")
+
+    def __init__(self, nombre: str, categoria: str, args: Dict[str, Any]):
+        self.nombre = nombre
+        self.categoria = categoria
+        self.args = args
+
+    def __enter__(self):
+        self.inicio = _ahora_us()
+        return self
+
+    def set(self, **args) -> None:
+        """Agrega argumentos conocidos al terminar (p. ej. filas leídas)."""
+        self.args.update(args)
+
+    def __exit__(self, tipo, valor, traza):
+        fin = _ahora_us()
+        if tipo is not None:
+            self.args["error"] = tipo.__name__
+        _registrar({
+            "name": self.nombre, "cat": self.categoria, "ph": "X",
+            "ts": self.inicio, "dur": fin - self.inicio,
+            "pid": _pid, "tid": threading.get_ident(), "args": self.args,
+        })
+        return False
+
+# --- API ---
+
+def activo() -> bool:
+    return _activo
+
+def activar(ruta: Optional[str] = None) -> None:
+    """Empieza a registrar eventos; 'ruta' es el destino por defecto de exportar()."""
+    global _activo, _ruta
+    _activo = True
+    if ruta:
+        _ruta = ruta
+
+def desactivar() -> None:
+    global _activo
+    _activo = False
+
+def limpiar() -> None:
+    global _descartados
+    _eventos.clear()
+    _descartados = 0
+
+def span(nombre: str, categoria: str = "app", **args):
+    """Context manager que mide el bloque; no hace nada si la traza está desactivada."""
+    if not _activo:
+        return _NULO
+    return _Span(nombre, categoria, args)
+
+def instante(nombre: str, categoria: str = "app", **args) -> None:
+    """Marca un instante (sin duración) en la línea del hilo actual."""
+    if _activo:
+        _registrar({
+            "name": nombre, "cat": categoria, "ph": "i", "s": "t",
+            "ts": _ahora_us(), "pid": _pid, "tid": threading.get_ident(), "args": args,
+        })
+
+def trazado(categoria: str, nombre: Optional[str] = None,
+            argumentos: Optional[Callable[..., Dict[str, Any]]] = None):
+    """
+    Decorador: mide cada llamada como un span con el nombre calificado de la
+    función. 'argumentos' recibe los mismos parámetros que la función y
+    retorna los args del evento; solo se evalúa con la traza activa.
+    """
+    def decorador(funcion):
+        etiqueta = nombre or funcion.__qualname__
+
+        @wraps(funcion)
+        def envoltura(*a, **k):
+            if not _activo:
+                return funcion(*a, **k)
+            with _Span(etiqueta, categoria, argumentos(*a, **k) if argumentos else {}):
+                return funcion(*a, **k)
+        return envoltura
+    return decorador
+
+def trazado_ui(nombre: Optional[str] = None):
+    """
+    Decorador para manejadores de una Vista (métodos de un widget Tk). Además
+    del span del manejador, registra "tk.hasta_idle": el tiempo desde que el
+    manejador retorna hasta que Tk vacía su cola (redibujo del Treeview,
+    geometría), que no aparece dentro de ningún otro span. Con QUERY_AUDIT
+    el manejador es además el alcance de la auditoría de consultas.
+    """
+    def decorador(funcion):
+        etiqueta = nombre or funcion.__qualname__
+
+        @wraps(funcion)
+        def envoltura(widget, *a, **k):
+            with auditar(etiqueta):
+                if not _activo:
+                    return funcion(widget, *a, **k)
+                try:
+                    with _Span(etiqueta, "view", {}):
+                        return funcion(widget, *a, **k)
+                finally:
+                    marcar_idle(widget, etiqueta)
+        return envoltura
+    return decorador
+
+def args_sql(_datasource, query: str, *_args, **_kwargs) -> Dict[str, Any]:
+    """'argumentos' para los métodos execute_* de un DataSource: la consulta resumida."""
+    return {"sql": " ".join(str(query).split())[:300]}
+
+def marcar_idle(widget, origen: str = "") -> None:
+    """Registra el tramo entre ahora y el próximo momento ocioso de Tk."""
+    if not _activo:
+        return
+    desde = _ahora_us()
+
+    def _idle():
+        _registrar({
+            "name": "tk.hasta_idle", "cat": "tk", "ph": "X",
+            "ts": desde, "dur": _ahora_us() - desde,
+            "pid": _pid, "tid": threading.get_ident(), "args": {"origen": origen},
+        })
+    try:
+        widget.after_idle(_idle)
+    except Exception:
+        pass  # Widget destruido (p. ej. al cerrar la ventana)
+
+def exportar(ruta: Optional[str] = None) -> int:
+    """Escribe los eventos registrados como JSON de Chrome trace-event. Retorna cuántos."""
+    ruta = ruta or _ruta
+    if not ruta:
+        raise ValueError("No se indicó el archivo de traza (TRACE_FILE).")
+    eventos = list(_eventos)
+    metadatos = [{"name": "process_name", "ph": "M", "pid": _pid, "args": {"name": "DriveFlow"}}]
+    metadatos += [
+        {"name": "thread_name", "ph": "M", "pid": _pid, "tid": tid, "args": {"name": nombre}}
+        for tid, nombre in list(_hilos.items())
+    ]
+    with open(ruta, "w", encoding="utf-8") as archivo:
+        json.dump({"traceEvents": metadatos + eventos, "displayTimeUnit": "ms"}, archivo, default=str)
+    if _descartados:
+        logger.warning("Traza: se descartaron %d eventos (límite %d)", _descartados, MAX_EVENTOS)
+    logger.info("Traza escrita en %s (%d eventos)", ruta, len(eventos))
+    return len(eventos)
+
+def _exportar_al_salir() -> None:
+    if _eventos:
+        try:
+            exportar()
+        except OSError as e:
+            logger.error("No se pudo escribir la traza: %s", e)
+
+if os.environ.get("TRACE_FILE"):
+    activar(os.environ["TRACE_FILE"])
+    atexit.register(_exportar_al_salir)
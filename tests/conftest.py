@@ -0,0 +1,31 @@
+# tests/conftest.py
+#
+# Fixtures comunes: una base SQLite en memoria con el esquema migrado y datos
+# sintéticos (los mismos que usan los benchmarks), sin SQL Server ni Tk.
+
+import os
+import sys
+
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+from benchmarks.datos_sinteticos import crear_base  # noqa: E402
+
+@pytest.fixture
+def datasource():
+    """SQLiteDataSource nuevo con 50 clientes y 50 vehículos."""
+    ds = crear_base(50, 50, semilla=7)
+    yield ds
+    ds.close()
+
+@pytest.fixture
+def repos_vehiculo(datasource):
+    """(vehiculo_repo, tipo_repo, estado_repo) sobre la base de prueba."""
+    from src.data.repositories.estado_vehiculo_repository_impl import EstadoVehiculoRepositoryImpl
+    from src.data.repositories.tipo_vehiculo_repository_impl import TipoVehiculoRepositoryImpl
+    from src.data.repositories.vehiculo_repository_impl import VehiculoRepositoryImpl
+    tipo_repo, estado_repo = TipoVehiculoRepositoryImpl(datasource), EstadoVehiculoRepositoryImpl(datasource)
+    return VehiculoRepositoryImpl(datasource, tipo_repo, estado_repo), tipo_repo, estado_repo
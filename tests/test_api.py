@@ -0,0 +1,82 @@
+# tests/test_api.py
+#
+# El servicio (Django + SQLite en un hilo) contra ApiClient, como lo usan los
+# mostradores: GET condicionales con ETag/304 y escrituras por los casos de uso.
+
+import threading
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+import pytest
+
+pytest.importorskip("django")
+
+from src.api import vistas  # noqa: E402
+from src.api.servicio import Servicio, configurar_django, es_loopback, servir  # noqa: E402
+from src.data.datasources.api_client import ApiClient, ApiError  # noqa: E402
+
+class _Silencioso(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def api(datasource):
+    configurar_django()
+    from django.core.wsgi import get_wsgi_application
+    vistas.instalar(Servicio(datasource, tokens_ttl=0))
+    servidor = make_server("127.0.0.1", 0, get_wsgi_application(), handler_class=_Silencioso)
+    hilo = threading.Thread(target=servidor.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    hilo.start()
+    cliente = ApiClient(f"http://127.0.0.1:{servidor.server_port}", timeout=10)
+    yield cliente
+    servidor.shutdown()
+    servidor.server_close()
+
+def test_get_condicional_reutiliza_con_304(api):
+    tipos = api.get("api/tipos")
+    assert tipos and api.cache_stats()["misses"] == 1
+    assert api.get("api/tipos") is tipos            # 304: los mismos datos, sin cuerpo
+    assert (api.hits, api.misses) == (1, 1)
+    # Otra URL (otros parámetros) es otra entrada
+    api.get("api/vehiculos", {"buscar": "a"})
+    assert (api.hits, api.misses) == (1, 2)
+
+def test_escritura_cambia_el_etag(api):
+    vehiculos = api.get("api/vehiculos")
+    precio = {v["id"]: v["precio_por_dia"] for v in vehiculos}
+    ids = api.enviar("POST", "api/vehiculos/precios", {"factor": 1.1})["ids"]
+    assert sorted(ids) == sorted(precio)
+    nuevos = api.get("api/vehiculos")               # 200: el token de Vehiculos cambió
+    assert (api.hits, api.misses) == (0, 2)
+    assert all(v["precio_por_dia"] == pytest.approx(precio[v["id"]] * 1.1, abs=0.01) for v in nuevos)
+
+@pytest.mark.parametrize("cuerpo", [{}, {"factor": "diez"}, {"factor": "nan"}, {"factor": 0},
+                                    {"factor": 1.1, "anio_desde": 2024, "anio_hasta": 2020}, {"factor": 1.1, "tipo_id": "x"}])
+def test_ajuste_de_precios_validado(api, cuerpo):
+    with pytest.raises(ApiError) as error:
+        api.enviar("POST", "api/vehiculos/precios", cuerpo)
+    assert error.value.status == 400
+
+@pytest.mark.parametrize("cuerpo", [{"ids": [1]}, {"ids": [1], "estado_id": None}, {"ids": [1], "estado_id": "x"},
+                                    {"ids": [1], "estado_id": 2, "estado_origen_id": "x"},
+                                    {"ids": ["x"], "estado_id": 2}, {"ids": 1, "estado_id": 2}])
+def test_cambio_de_estado_validado(api, cuerpo):
+    with pytest.raises(ApiError) as error:
+        api.enviar("POST", "api/vehiculos/estado", cuerpo)
+    assert error.value.status == 400
+
+def test_cambio_de_estado_desde_el_estado_origen(api):
+    # Vehículo 3 está En Mantenimiento (3): solo cambia el que parte del estado origen
+    ids = api.enviar("POST", "api/vehiculos/estado", {"ids": [1, 2, 3], "estado_id": "1", "estado_origen_id": "3"})["ids"]
+    assert ids == [3]
+
+@pytest.mark.parametrize("host,local", [
+    ("127.0.0.1", True), ("127.0.1.1", True), ("localhost", True), ("::1", True), ("[::1]", True),
+    ("0.0.0.0", False), ("::", False), ("192.168.1.10", False), ("servidor", False),
+])
+def test_es_loopback(host, local):
+    assert es_loopback(host) is local
+
+def test_servir_en_la_red_exige_token(datasource):
+    with pytest.raises(ValueError, match="API_TOKEN"):
+        servir(Servicio(datasource), "0.0.0.0", 0)
+
@@ -0,0 +1,93 @@
+# tests/test_calendario_flota.py
+
+import random
+from datetime import timedelta
+
+import numpy as np
+import pytest
+
+from src.domain.services.calendario_flota import CalendarioFlota
+from src.domain.services.disponibilidad_flota import DisponibilidadFlota
+from tests.test_disponibilidad import ALQUILADO, DISPONIBLE, HOY, SEDAN, SUV, _reserva, _vehiculo
+
+def _dia(n):
+    return HOY + timedelta(days=n)
+
+def _flota(rng, cantidad=12):
+    return [_vehiculo(i, rng.choice([SEDAN, SUV]), ALQUILADO if rng.random() < 0.2 else DISPONIBLE)
+            for i in range(1, cantidad + 1)]
+
+def _esperado_por_dia(vehiculos, arbol, inicio, fin, tipo_id=None):
+    """Vehículos libres cada día según DisponibilidadFlota, día por día."""
+    return np.array([
+        len(arbol.vehiculos_libres(vehiculos, _dia(d), _dia(d + 1), tipo_id=tipo_id))
+        for d in range((inicio - HOY).days, (fin - HOY).days)
+    ])
+
+@pytest.mark.parametrize("semilla", range(4))
+def test_igual_a_disponibilidad_flota(semilla):
+    rng = random.Random(semilla)
+    vehiculos = _flota(rng)
+    calendario = CalendarioFlota(HOY, dias=30)
+    arbol = DisponibilidadFlota()
+    calendario.cargar(vehiculos, [])
+    activas = []
+    for reserva_id in range(1, 150):
+        if activas and rng.random() < 0.3:
+            reserva = activas.pop(rng.randrange(len(activas)))
+            assert calendario.quitar(reserva.id).id == reserva.id
+            arbol.quitar(reserva.id)
+        else:
+            # Se admiten solapamientos (datos heredados) y reservas más allá del horizonte
+            reserva = _reserva(reserva_id, rng.randrange(1, 13), rng.randrange(0, 50), rng.randrange(1, 8))
+            calendario.agregar(reserva)
+            arbol.agregar(reserva)
+            activas.append(reserva)
+        inicio = _dia(rng.randrange(0, 55))
+        fin = inicio + timedelta(days=rng.randrange(1, 10))
+        tipo_id = rng.choice([None, SEDAN.id, SUV.id])
+        assert calendario.libres_por_dia(inicio, fin, tipo_id).tolist() == \
+            _esperado_por_dia(vehiculos, arbol, inicio, fin, tipo_id).tolist()
+        assert [v.id for v in calendario.vehiculos_libres(inicio, fin, tipo_id)] == \
+            [v.id for v in arbol.vehiculos_libres(vehiculos, inicio, fin, tipo_id=tipo_id)]
+
+def test_libres_por_tipo_suma_por_tipo():
+    vehiculos = [_vehiculo(1), _vehiculo(2), _vehiculo(3, SUV), _vehiculo(4, SUV, ALQUILADO)]
+    calendario = CalendarioFlota(HOY, dias=10)
+    calendario.cargar(vehiculos, [_reserva(1, 1, 1, 2), _reserva(2, 3, 0, 1)])
+    por_tipo = calendario.libres_por_tipo(HOY, _dia(4), tipo_ids=[99])
+    assert por_tipo[SEDAN.id].tolist() == [2, 1, 1, 2]
+    assert por_tipo[SUV.id].tolist() == [0, 1, 1, 1]   # El alquilado no cuenta
+    assert por_tipo[99].tolist() == [0, 0, 0, 0]
+    assert calendario.fechas(HOY, _dia(4)) == [_dia(d) for d in range(4)]
+
+def test_quitar_conserva_reservas_solapadas():
+    calendario = CalendarioFlota(HOY, dias=10)
+    calendario.cargar([_vehiculo(1)], [_reserva(1, 1, 0, 4), _reserva(2, 1, 2, 4)])
+    calendario.quitar(1)
+    assert calendario.libres_por_dia(HOY, _dia(6)).tolist() == [1, 1, 0, 0, 0, 0]
+    assert calendario.quitar(1) is None
+
+def test_amplia_el_horizonte_y_valida_ventanas():
+    calendario = CalendarioFlota(HOY, dias=5)
+    calendario.cargar([_vehiculo(1)], [])
+    calendario.agregar(_reserva(1, 1, 7, 2))
+    assert calendario.hasta >= _dia(9)
+    assert calendario.libres_por_dia(_dia(6), _dia(10)).tolist() == [1, 0, 0, 1]
+    assert calendario.libres_por_dia(_dia(40), _dia(42)).tolist() == [1, 1]
+    vehiculos, ocupado = calendario.ocupacion(_dia(6), _dia(10))
+    assert [v.id for v in vehiculos] == [1] and ocupado.tolist() == [[False, True, True, False]]
+    with pytest.raises(ValueError):
+        calendario.libres_por_dia(_dia(3), _dia(3))
+    with pytest.raises(ValueError):
+        calendario.libres_por_dia(_dia(-1), _dia(2))
+    with pytest.raises(ValueError):
+        CalendarioFlota(HOY, dias=0)
+
+def test_actualizar_flota_conserva_reservas():
+    calendario = CalendarioFlota(HOY, dias=10)
+    calendario.cargar([_vehiculo(1)], [_reserva(1, 2, 0, 3)])   # Vehículo 2 aún no cargado
+    assert calendario.libres_por_dia(HOY, _dia(3)).tolist() == [1, 1, 1]
+    calendario.actualizar_flota([_vehiculo(1), _vehiculo(2, SUV)])
+    assert calendario.libres_por_dia(HOY, _dia(3), tipo_id=SUV.id).tolist() == [0, 0, 0]
+    assert [v.id for v in calendario.vehiculos_libres(HOY, _dia(3))] == [1]
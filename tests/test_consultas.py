@@ -0,0 +1,97 @@
+# tests/test_consultas.py
+#
+# Presupuestos de consultas de las acciones de la UI sobre SQLite: si un
+# cambio agrega viajes a la base (p. ej. un N+1), estos tests lo detectan.
+
+import pytest
+
+from src.utils.consultas import assert_max_queries, contar_consultas, normalizar_sql
+
+@pytest.fixture
+def entorno():
+    from benchmarks.run import Entorno
+    entorno = Entorno(50, 50, 7)
+    yield entorno
+    entorno.datasource.close()
+
+@pytest.fixture
+def vm_vehiculos(entorno):
+    vm = entorno.viewmodel_vehiculos()
+    vm.cargar_datos_iniciales()
+    return vm
+
+def _datos_vehiculo(vm, **campos):
+    return {"marca": "Kia", "modelo": "Rio", "anio": "2022", "placa": "ZZZ-999", "tipo_nombre": vm.tipos[0].nombre_tipo,
+            "estado_nombre": vm.estados[0].nombre_estado, "precio_por_dia": "120", "kilometraje": "", **campos}
+
+# --- Presupuestos ---
+
+def test_guardar_y_eliminar_vehiculo(vm_vehiculos):
+    # Escritura + recarga de tipos, estados y vehículos (sin seguimiento de cambios)
+    with assert_max_queries(4, repeticiones=1):
+        assert vm_vehiculos.guardar_vehiculo(None, _datos_vehiculo(vm_vehiculos)) == (True, "Vehículo guardado.")
+    nuevo = next(v for v in vm_vehiculos.vehiculos if v.placa == "ZZZ-999")
+    with assert_max_queries(4, repeticiones=1):
+        assert vm_vehiculos.guardar_vehiculo(nuevo.id, _datos_vehiculo(vm_vehiculos, precio_por_dia="130"))[0]
+    with assert_max_queries(4, repeticiones=1):
+        assert vm_vehiculos.eliminar_vehiculo(nuevo.id)
+
+def test_datos_invalidos_no_consultan(vm_vehiculos):
+    with assert_max_queries(0):
+        ok, _ = vm_vehiculos.guardar_vehiculo(None, _datos_vehiculo(vm_vehiculos, anio="1800"))
+    assert not ok
+
+def test_guardar_y_eliminar_cliente(entorno):
+    vm = entorno.viewmodel_clientes()
+    vm.cargar_clientes()
+    with assert_max_queries(2, repeticiones=1):
+        ok, _ = vm.guardar_cliente(None, "Ana", "Díaz", "00000001", "Q1", "", "", "", "")
+    assert ok
+    nuevo = next(c for c in vm.clientes if c.dni == "00000001")
+    with assert_max_queries(2, repeticiones=1):
+        assert vm.eliminar_cliente(nuevo.id)
+
+# --- assert_max_queries y contar_consultas ---
+
+def test_assert_max_queries_informa_el_exceso(datasource):
+    with pytest.raises(AssertionError, match="como máximo 1 consultas y hubo 2"):
+        with assert_max_queries(1):
+            datasource.execute_query("SELECT 1", cache=False)
+            datasource.execute_query("SELECT 2", cache=False)
+
+def test_assert_max_queries_detecta_repeticiones(datasource):
+    @assert_max_queries(10, repeticiones=2)
+    def n_mas_uno():
+        for vehiculo_id in (1, 2, 3):
+            datasource.execute_query("SELECT Placa FROM Vehiculos WHERE VehiculoID = ?", [vehiculo_id])
+    with pytest.raises(AssertionError, match="repetida 3 veces"):
+        n_mas_uno()
+
+def test_alcances_anidados(datasource):
+    with contar_consultas("externo") as externo:
+        datasource.execute_query("SELECT 1")
+        with contar_consultas("interno") as interno:
+            datasource.execute_non_query("UPDATE Vehiculos SET Kilometraje = 1 WHERE VehiculoID = 1")
+    datasource.execute_query("SELECT 1")
+    assert (externo.total, interno.total) == (2, 1)
+    assert "'externo': 2 consulta(s), 2 forma(s) distinta(s)" in externo.resumen()
+
+# --- normalizar_sql ---
+
+@pytest.mark.parametrize("sql, forma", [
+    ("SELECT  *\n  FROM Vehiculos\tWHERE VehiculoID = 7", "SELECT * FROM Vehiculos WHERE VehiculoID = ?"),
+    ("SELECT * FROM Clientes WHERE DNI = '12345678' AND Nombre = N'José'",
+     "SELECT * FROM Clientes WHERE DNI = ? AND Nombre = ?"),
+    ("SELECT * FROM Clientes WHERE Apellido = 'O''Brien'", "SELECT * FROM Clientes WHERE Apellido = ?"),
+    ("UPDATE Vehiculos SET PrecioPorDia = PrecioPorDia * 1.05", "UPDATE Vehiculos SET PrecioPorDia = PrecioPorDia * ?"),
+    ("SELECT * FROM Vehiculos WHERE VehiculoID IN (?, ?, ?)", "SELECT * FROM Vehiculos WHERE VehiculoID IN (...)"),
+    ("SELECT * FROM Vehiculos WHERE VehiculoID in(?,?)", "SELECT * FROM Vehiculos WHERE VehiculoID IN (...)"),
+    ("SELECT * FROM Vehiculos WHERE VehiculoID IN (1, 2, 3)", "SELECT * FROM Vehiculos WHERE VehiculoID IN (...)"),
+    ("SELECT TOP (5000) Col2 FROM T2", "SELECT TOP (?) Col2 FROM T2"),
+])
+def test_normalizar_sql(sql, forma):
+    assert normalizar_sql(sql) == forma
+
+def test_misma_forma_con_distintos_valores():
+    assert normalizar_sql("SELECT * FROM T WHERE Id IN (?, ?)") == normalizar_sql("SELECT * FROM T WHERE Id IN (?,?,?,?)")
+    assert normalizar_sql("SELECT * FROM T WHERE A = 'x'") != normalizar_sql("SELECT * FROM U WHERE A = 'x'")
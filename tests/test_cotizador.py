@@ -0,0 +1,81 @@
+# tests/test_cotizador.py
+
+import random
+from dataclasses import replace
+from datetime import date, timedelta
+
+import pytest
+
+from src.domain.models.tarifa import ReglasTarifa, Temporada
+from src.domain.services.cotizador import Cotizador, compilar
+from tests.test_disponibilidad import SEDAN, SUV, _vehiculo
+
+LUNES = date(2030, 4, 29)
+
+def _suma_factores_lenta(reglas, inicio, fin):
+    """Referencia día por día con datetime.weekday()."""
+    suma, dia = 0.0, inicio
+    while dia < fin:
+        factor = reglas.recargo_fin_de_semana if dia.weekday() >= 5 else 1.0
+        temporadas = [t.multiplicador for t in reglas.temporadas if t.inicio <= dia < t.fin]
+        suma += factor * max(temporadas + [1.0])
+        dia += timedelta(days=1)
+    return suma
+
+def test_descuento_del_mayor_minimo_alcanzado():
+    # El mínimo mayor manda aunque su descuento sea menor (p. ej. tarifa mensual especial)
+    reglas = ReglasTarifa(descuentos_duracion=((28, 0.05), (7, 0.10), (3, 0.02)))
+    assert [reglas.descuento_para(d) for d in (1, 3, 6, 7, 27, 28, 90)] == [0.0, 0.02, 0.02, 0.10, 0.10, 0.05, 0.05]
+    with pytest.raises(ValueError):
+        ReglasTarifa(descuentos_duracion=((0, 0.1),))
+
+def test_semana_con_fin_de_semana_y_temporada():
+    reglas = ReglasTarifa(
+        recargo_fin_de_semana=1.5,
+        temporadas=(Temporada(LUNES + timedelta(days=4), LUNES + timedelta(days=6), 2.0, "Feriado"),
+                    Temporada(LUNES, LUNES + timedelta(days=5), 1.2)),
+        descuentos_duracion=((7, 0.10),),
+    )
+    compiladas = compilar(reglas, LUNES, LUNES + timedelta(days=7))
+    # lun-jue 1.2, vie 2.0 (gana la mayor), sáb 1.5 x 2.0, dom 1.5
+    assert compiladas.dias == 7
+    assert compiladas.suma_factores == pytest.approx(4 * 1.2 + 2.0 + 3.0 + 1.5)
+    assert compiladas.descuento == 0.10
+    with pytest.raises(ValueError):
+        compilar(reglas, LUNES, LUNES)
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_compilar_igual_a_calculo_por_dia(semilla):
+    rng = random.Random(semilla)
+    for _ in range(40):
+        temporadas = []
+        for _ in range(rng.randrange(0, 4)):
+            inicio = LUNES + timedelta(days=rng.randrange(-10, 40))
+            temporadas.append(Temporada(inicio, inicio + timedelta(days=rng.randrange(1, 15)),
+                                        round(rng.uniform(0.5, 2.5), 2)))
+        reglas = ReglasTarifa(recargo_fin_de_semana=round(rng.uniform(1, 2), 2), temporadas=tuple(temporadas))
+        inicio = LUNES + timedelta(days=rng.randrange(0, 30))
+        fin = inicio + timedelta(days=rng.randrange(1, 35))
+        assert compilar(reglas, inicio, fin).suma_factores == pytest.approx(_suma_factores_lenta(reglas, inicio, fin))
+
+def test_cotizar_flota_y_ranking():
+    vehiculos = [replace(_vehiculo(1), precio_por_dia=120.0), _vehiculo(2, SUV), _vehiculo(3)]
+    reglas = ReglasTarifa(descuentos_duracion=((3, 0.10),), multiplicadores_tipo=((SUV.id, 1.5),), factor_garantia=2.0)
+    resultado = Cotizador(reglas).cotizar(vehiculos, LUNES, LUNES + timedelta(days=3))
+    assert resultado.subtotal.tolist() == [360.0, 450.0, 300.0]
+    assert resultado.descuento.tolist() == [36.0, 45.0, 30.0]
+    assert resultado.total.tolist() == [324.0, 405.0, 270.0]
+    assert resultado.garantia.tolist() == [SEDAN.garantia_base * 2, SUV.garantia_base * 2, SEDAN.garantia_base * 2]
+    assert [v.id for v, _ in resultado.ranking()] == [3, 1, 2]
+    assert [v.id for v, _ in resultado.ranking(limite=1, descendente=True)] == [2]
+
+    cotizacion = Cotizador(reglas).cotizar_vehiculo(vehiculos[1], LUNES, LUNES + timedelta(days=3))
+    assert (cotizacion.vehiculo_id, cotizacion.dias, cotizacion.total) == (2, 3, 405.0)
+    assert len(Cotizador().cotizar([], LUNES, LUNES + timedelta(days=1))) == 0
+
+def test_compilar_usa_la_cache():
+    reglas = ReglasTarifa(recargo_fin_de_semana=1.37)
+    antes = Cotizador.cache_info().hits
+    Cotizador(reglas).cotizar([_vehiculo(1)], LUNES, LUNES + timedelta(days=9))
+    Cotizador(ReglasTarifa(recargo_fin_de_semana=1.37)).cotizar([_vehiculo(2, SUV)], LUNES, LUNES + timedelta(days=9))
+    assert Cotizador.cache_info().hits == antes + 1
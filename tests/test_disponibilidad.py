@@ -0,0 +1,100 @@
+# tests/test_disponibilidad.py
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from src.domain.models.estado_vehiculo import EstadoVehiculo
+from src.domain.models.reserva import ESTADO_CANCELADA, Reserva
+from src.domain.models.tipo_vehiculo import TipoVehiculo
+from src.domain.models.vehiculo import Vehiculo
+from src.domain.services.arbol_intervalos import ArbolIntervalos
+from src.domain.services.disponibilidad_flota import DisponibilidadFlota
+
+def _solapados_fuerza_bruta(intervalos, inicio, fin):
+    return sorted(i for i in intervalos if i[0] < fin and inicio < i[1])
+
+def _altura_valida(arbol) -> bool:
+    def revisar(nodo):
+        if nodo is None:
+            return 0
+        izq, der = revisar(nodo.izq), revisar(nodo.der)
+        assert abs(izq - der) <= 1, "árbol desbalanceado"
+        assert nodo.max_fin == max([nodo.fin] + [h.max_fin for h in (nodo.izq, nodo.der) if h is not None])
+        return 1 + max(izq, der)
+    revisar(arbol._raiz)
+    return True
+
+@pytest.mark.parametrize("semilla", range(5))
+def test_arbol_igual_a_fuerza_bruta(semilla):
+    rng = random.Random(semilla)
+    arbol, intervalos = ArbolIntervalos(), []
+    for paso in range(600):
+        if intervalos and rng.random() < 0.3:
+            intervalo = intervalos.pop(rng.randrange(len(intervalos)))
+            assert arbol.eliminar(*intervalo)
+        else:
+            inicio = rng.randrange(0, 200)
+            intervalo = (inicio, inicio + rng.randrange(1, 15), paso)
+            arbol.insertar(*intervalo)
+            intervalos.append(intervalo)
+        a = rng.randrange(0, 210)
+        b = a + rng.randrange(1, 20)
+        esperado = _solapados_fuerza_bruta(intervalos, a, b)
+        assert sorted(arbol.solapados(a, b)) == esperado
+        assert arbol.hay_solapamiento(a, b) == bool(esperado)
+    assert len(arbol) == len(intervalos)
+    assert sorted(arbol) == sorted(intervalos)
+    assert _altura_valida(arbol)
+
+def test_construir_equivale_a_insertar():
+    rng = random.Random(9)
+    intervalos = [(i, i + rng.randrange(1, 5), i) for i in (rng.randrange(100) for _ in range(300))]
+    arbol = ArbolIntervalos(intervalos)
+    assert _altura_valida(arbol)
+    for a in range(0, 110, 3):
+        assert sorted(arbol.solapados(a, a + 4)) == _solapados_fuerza_bruta(intervalos, a, a + 4)
+
+def test_intervalos_semiabiertos_y_duplicados():
+    arbol = ArbolIntervalos([(1, 5, "a"), (1, 5, "b")])
+    assert not arbol.hay_solapamiento(5, 8) and not arbol.hay_solapamiento(0, 1)
+    assert arbol.eliminar(1, 5, "b") and not arbol.eliminar(1, 5, "b")
+    assert arbol.solapados(4, 6) == [(1, 5, "a")]
+    with pytest.raises(ValueError):
+        arbol.insertar(3, 3)
+
+# --- DisponibilidadFlota ---
+
+HOY = date(2030, 5, 1)
+DISPONIBLE, ALQUILADO = EstadoVehiculo(1, "Disponible"), EstadoVehiculo(2, "Alquilado")
+SEDAN, SUV = TipoVehiculo(1, "Sedán", 800.0), TipoVehiculo(2, "SUV", 1500.0)
+
+def _vehiculo(vehiculo_id, tipo=SEDAN, estado=DISPONIBLE):
+    return Vehiculo(id=vehiculo_id, marca="Kia", modelo="Rio", anio=2020, placa=f"ABC-{vehiculo_id:03d}",
+                    tipo=tipo, estado=estado, precio_por_dia=100.0)
+
+def _reserva(reserva_id, vehiculo_id, desde, dias, estado="Activa"):
+    inicio = HOY + timedelta(days=desde)
+    return Reserva(id=reserva_id, cliente_id=1, vehiculo_id=vehiculo_id, fecha_inicio=inicio,
+                   fecha_fin=inicio + timedelta(days=dias), estado=estado)
+
+def test_disponibilidad_por_vehiculo():
+    flota = DisponibilidadFlota([_reserva(1, 10, 0, 3), _reserva(2, 10, 5, 2), _reserva(3, 11, 0, 1, ESTADO_CANCELADA)])
+    assert not flota.esta_libre(10, HOY + timedelta(days=2), HOY + timedelta(days=4))
+    assert flota.esta_libre(10, HOY + timedelta(days=3), HOY + timedelta(days=5))  # Entre las dos reservas
+    assert flota.esta_libre(11, HOY, HOY + timedelta(days=1))                        # Solo tenía una cancelada
+    assert [r.id for r in flota.conflictos(10, HOY, HOY + timedelta(days=10))] == [1, 2]
+
+    flota.agregar(_reserva(4, 11, 0, 2))
+    assert not flota.esta_libre(11, HOY, HOY + timedelta(days=1))
+    assert flota.quitar(4).id == 4 and flota.quitar(4) is None
+    assert flota.esta_libre(11, HOY, HOY + timedelta(days=1))
+
+def test_vehiculos_libres_filtra_tipo_estado_y_reservas():
+    vehiculos = [_vehiculo(1), _vehiculo(2), _vehiculo(3, SUV), _vehiculo(4, estado=ALQUILADO)]
+    flota = DisponibilidadFlota([_reserva(1, 2, 0, 4)])
+    inicio, fin = HOY + timedelta(days=1), HOY + timedelta(days=2)
+    assert [v.id for v in flota.vehiculos_libres(vehiculos, inicio, fin)] == [1, 3]
+    assert [v.id for v in flota.vehiculos_libres(vehiculos, inicio, fin, tipo_id=SUV.id)] == [3]
+    assert [v.id for v in flota.vehiculos_libres(vehiculos, inicio, fin, estado_nombre=None)] == [1, 3, 4]
@@ -0,0 +1,134 @@
+# tests/test_exportacion.py
+#
+# Exportación en streaming: de SQLite al archivo (CSV y, con pyarrow, Parquet)
+# por los casos de uso, y el archivo temporal que se renombra al terminar.
+
+import csv
+import sys
+
+import pytest
+
+from src.data.repositories.archivo_tabular_repository_impl import ArchivoTabularRepositoryImpl
+from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
+from src.domain.usecases.exportacion_usecases import ExportarClientesUseCase, ExportarVehiculosUseCase
+
+COLUMNAS = ["ID", "Nombre", "Nota"]
+
+def _leer_csv(path):
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        return list(csv.reader(f))
+
+def _esperado_vehiculos(datasource, where="", params=()):
+    """Filas de la BD con Tipo y Estado por nombre, como CSV (texto)."""
+    return [[str(v) if v is not None else "" for v in fila] for fila in datasource.execute_query(f"""
+        SELECT v.VehiculoID, v.Marca, v.Modelo, v.Anio, v.Placa, t.NombreTipo, e.NombreEstado,
+               v.PrecioPorDia, v.Kilometraje, v.ImagenPath
+        FROM Vehiculos v
+        JOIN TiposVehiculo t ON t.TipoID = v.TipoID
+        JOIN EstadosVehiculo e ON e.EstadoID = v.EstadoID
+        {where}
+        ORDER BY v.Marca, v.Modelo
+    """, params)]
+
+def _exportar_vehiculos(repos_vehiculo):
+    vehiculo_repo, tipo_repo, estado_repo = repos_vehiculo
+    return ExportarVehiculosUseCase(vehiculo_repo, tipo_repo, estado_repo, ArchivoTabularRepositoryImpl())
+
+def test_vehiculos_a_csv_con_tipo_y_estado_por_nombre(tmp_path, datasource, repos_vehiculo):
+    path = str(tmp_path / "flota.csv")
+    progreso = []
+    reporte = _exportar_vehiculos(repos_vehiculo).execute(path, on_progreso=progreso.append)
+    encabezado, *filas = _leer_csv(path)
+    assert encabezado == ["VehiculoID", "Marca", "Modelo", "Anio", "Placa", "Tipo", "Estado",
+                          "PrecioPorDia", "Kilometraje", "ImagenPath"]
+    assert filas == _esperado_vehiculos(datasource)
+    assert reporte.filas == len(filas) == 50 and progreso == [50]
+    assert next(f for f in filas if f[0] == "3")[6] == "En Mantenimiento"
+    assert not (tmp_path / "flota.csv.tmp").exists()
+
+def test_vehiculos_filtrados_por_estado(tmp_path, datasource, repos_vehiculo):
+    path = str(tmp_path / "mantenimiento.csv")
+    reporte = _exportar_vehiculos(repos_vehiculo).execute(path, estado_id=3)
+    _, *filas = _leer_csv(path)
+    assert filas == _esperado_vehiculos(datasource, "WHERE v.EstadoID = ?", (3,))
+    assert reporte.filas == len(filas) and {f[6] for f in filas} == {"En Mantenimiento"}
+
+def test_clientes_a_csv_con_busqueda(tmp_path, datasource):
+    repo = ClienteRepositoryImpl(datasource)
+    dni = datasource.execute_query("SELECT DNI FROM Clientes ORDER BY ClienteID LIMIT 1")[0][0]
+    path = str(tmp_path / "clientes.csv")
+    reporte = ExportarClientesUseCase(repo, ArchivoTabularRepositoryImpl()).execute(path, f"  {dni} ")
+    encabezado, *filas = _leer_csv(path)
+    assert encabezado[:4] == ["ClienteID", "Nombre", "Apellido", "DNI"]
+    assert reporte.filas == len(filas) >= 1 and all(dni in f[3] for f in filas)
+
+def test_exportacion_vacia_deja_solo_el_encabezado(tmp_path):
+    path = tmp_path / "vacio.csv"
+    assert ArchivoTabularRepositoryImpl().exportar(str(path), COLUMNAS, []) == 0
+    assert _leer_csv(path) == [COLUMNAS]
+
+def test_por_lotes_informa_el_progreso(tmp_path):
+    path = tmp_path / "lotes.csv"
+    progreso = []
+    filas = ((i, f"n{i}", None) for i in range(5))
+    assert ArchivoTabularRepositoryImpl().exportar(str(path), COLUMNAS, filas, tamano_lote=2, on_lote=progreso.append) == 5
+    assert progreso == [2, 4, 5]
+    assert _leer_csv(path)[1:] == [[str(i), f"n{i}", ""] for i in range(5)]
+
+def test_error_a_medias_conserva_el_archivo_anterior(tmp_path):
+    path = tmp_path / "flota.csv"
+    path.write_text("anterior\n", encoding="utf-8")
+
+    def _filas():
+        yield (1, "a", None)
+        raise RuntimeError("se cayó la conexión")
+
+    with pytest.raises(RuntimeError):
+        ArchivoTabularRepositoryImpl().exportar(str(path), COLUMNAS, _filas(), tamano_lote=1)
+    assert path.read_text(encoding="utf-8") == "anterior\n"
+    assert not (tmp_path / "flota.csv.tmp").exists()
+
+def test_formato_no_soportado(tmp_path):
+    with pytest.raises(ValueError, match="Formato no soportado"):
+        ArchivoTabularRepositoryImpl().exportar(str(tmp_path / "flota.xlsx"), COLUMNAS, [])
+    assert list(tmp_path.iterdir()) == []
+
+def test_parquet_sin_pyarrow_no_deja_temporal(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "pyarrow", None)   # import pyarrow -> ImportError
+    with pytest.raises(Exception, match="pyarrow"):
+        ArchivoTabularRepositoryImpl().exportar(str(tmp_path / "flota.parquet"), COLUMNAS, [(1, "a", None)])
+    assert list(tmp_path.iterdir()) == []
+
+# --- Parquet (pyarrow opcional) ---
+
+def test_vehiculos_a_parquet(tmp_path, datasource, repos_vehiculo):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "flota.parquet")
+    reporte = _exportar_vehiculos(repos_vehiculo).execute(path)
+    tabla = pq.read_table(path)
+    assert tabla.column_names[5:7] == ["Tipo", "Estado"]
+    filas = [[str(v) if v is not None else "" for v in fila.values()] for fila in tabla.to_pylist()]
+    assert filas == _esperado_vehiculos(datasource)
+    assert reporte.filas == tabla.num_rows == 50
+    assert not (tmp_path / "flota.parquet.tmp").exists()
+
+def test_parquet_esquema_del_primer_lote(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "lotes.parquet")
+    # Nota es toda NULL en el primer lote: se guarda como texto y admite los siguientes
+    filas = [(1, "a", None), (2, "b", None), (3, "c", "x"), (4, None, "y"), (5, "e", None)]
+    assert ArchivoTabularRepositoryImpl().exportar(path, COLUMNAS, filas, tamano_lote=2) == 5
+    archivo = pq.ParquetFile(path)
+    assert archivo.schema_arrow == pa.schema([("ID", pa.int64()), ("Nombre", pa.string()), ("Nota", pa.string())])
+    assert archivo.metadata.num_row_groups == 3   # Un row group por lote
+    assert [tuple(f.values()) for f in archivo.read().to_pylist()] == filas
+
+def test_parquet_vacio_guarda_el_esquema(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = str(tmp_path / "vacio.parquet")
+    assert ArchivoTabularRepositoryImpl().exportar(path, COLUMNAS, []) == 0
+    tabla = pq.read_table(path)
+    assert tabla.num_rows == 0
+    assert tabla.schema == pa.schema([(c, pa.string()) for c in COLUMNAS])
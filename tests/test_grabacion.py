@@ -0,0 +1,72 @@
+# tests/test_grabacion.py
+
+import json
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import pytest
+
+from benchmarks.datos_sinteticos import crear_base
+from src.data.datasources.grabacion import _codificar, _decodificar, grabar, leer_grabacion
+from src.data.datasources.reproduccion import comparar, reproducir
+
+CONTAR = "SELECT COUNT(*) FROM Vehiculos WHERE Anio >= ?"
+LISTAR = "SELECT VehiculoID, Placa FROM Vehiculos ORDER BY VehiculoID"
+ACTUALIZAR = "UPDATE Vehiculos SET Kilometraje = ? WHERE VehiculoID = ?"
+INSERTAR_TIPO = "INSERT INTO TiposVehiculo (NombreTipo, GarantiaBase) VALUES (?, ?)"
+INSERTAR_ROTO = "INSERT INTO TablaInexistente (Columna) VALUES (?)"
+RETORNAR = "UPDATE Vehiculos SET Kilometraje = Kilometraje WHERE VehiculoID <= ? RETURNING VehiculoID"
+
+def _cargar(ds):
+    """Una llamada de cada operación; el INSERT roto falla (execute_insert retorna None)."""
+    assert ds.execute_query(CONTAR, [2000])
+    assert ds.execute_query(CONTAR, [2010], cache=False)
+    assert len(list(ds.iter_query(LISTAR, batch_size=7))) == 50
+    assert ds.execute_non_query(ACTUALIZAR, [1234, 1]) is True
+    assert ds.execute_insert(INSERTAR_TIPO, ["Camión", 3000.0]) is not None
+    assert ds.execute_insert(INSERTAR_ROTO, ["x"]) is None
+    assert len(ds.execute_returning(RETORNAR, [3])) == 3
+    assert ds.execute_many(ACTUALIZAR, [(10, 2), (20, 3)]) == 2
+
+@pytest.fixture
+def grabacion(tmp_path, datasource):
+    ruta = str(tmp_path / "carga.jsonl.gz")
+    grabador = grabar(datasource, ruta)
+    assert grabar(grabador, ruta) is grabador
+    _cargar(grabador)
+    grabador.cerrar_grabacion()
+    return leer_grabacion(ruta)
+
+def test_graba_cada_operacion(grabacion):
+    assert grabacion.cabecera["dialecto"] == "sqlite"
+    assert [e["op"] for e in grabacion.eventos] == ["q", "q", "it", "n", "i", "i", "r", "m"]
+    # Cada SQL una sola vez, referenciado por número
+    assert sorted(grabacion.sentencias.values()) == sorted({CONTAR, LISTAR, ACTUALIZAR, INSERTAR_TIPO, INSERTAR_ROTO, RETORNAR})
+    errores = [grabacion.sentencias[e["s"]] for e in grabacion.eventos if e.get("e")]
+    assert errores == [INSERTAR_ROTO]
+    consulta, sin_cache, recorrido = grabacion.eventos[:3]
+    assert consulta["p"] == [2000] and consulta["n"] == 1 and "c" not in consulta
+    assert sin_cache["c"] == 0
+    assert (recorrido["n"], recorrido["b"]) == (50, 7)
+    assert grabacion.eventos[6]["n"] == 3
+    assert grabacion.eventos[7]["p"] == [[10, 2], [20, 3]]
+
+def test_reproduce_contra_otra_base(grabacion):
+    copia = crear_base(50, 50, semilla=7)
+    try:
+        lecturas = reproducir(copia, grabacion, velocidad=0)
+        assert (lecturas["consultas"], lecturas["omitidas"], lecturas["errores"]) == (3, 5, 0)
+        completo = reproducir(copia, grabacion, velocidad=0, hilos=3, con_escrituras=True)
+        assert (completo["consultas"], completo["omitidas"], completo["errores"]) == (8, 0, 1)
+        fallida = [s for s in completo["sentencias"].values() if s["errores"]]
+        assert [s["sql"] for s in fallida] == [INSERTAR_ROTO]
+        assert set(completo["operaciones"]) == {"execute_query", "iter_query", "execute_non_query",
+                                                "execute_insert", "execute_returning", "execute_many"}
+    finally:
+        copia.close()
+    filas = comparar(completo, completo)
+    assert filas and not any(f["regresion"] for f in filas)
+
+def test_parametros_conservan_su_tipo():
+    params = [datetime(2030, 5, 1, 10, 30), date(2030, 5, 1), time(8, 15), Decimal("12.50"), b"\x00\xff", "texto", 7, None]
+    assert _decodificar(json.loads(json.dumps(params, default=_codificar))) == params
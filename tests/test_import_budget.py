@@ -0,0 +1,46 @@
+# tests/test_import_budget.py
+#
+# El arranque (import main) debe caber en IMPORT_BUDGET_MS y no cargar los
+# módulos pesados que se importan de forma perezosa. Misma medición que
+# "python cli.py import-budget".
+
+import pytest
+
+from src.utils.presupuesto_importacion import (
+    PROHIBIDOS_DEFECTO, medir_importacion, parsear_importtime, presupuesto_ms,
+)
+
+SALIDA = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 |   _io
+import time:       900 |       1500 |   src.utils.tracing
+import time:       300 |        300 |     src.utils.consultas
+import time:      4000 |      12000 | main
+import time:        50 |         50 | otro
+"""
+
+def test_parsear_importtime():
+    medicion = parsear_importtime(SALIDA, "main")
+    assert medicion.total_ms == 12.0
+    assert medicion.importados == ["_io", "src.utils.tracing", "src.utils.consultas", "main", "otro"]
+    assert medicion.mas_lentos(1) == [(12000, "main")]
+    assert medicion.prohibidos(["src.utils"]) == ["src.utils.consultas", "src.utils.tracing"]
+    assert medicion.prohibidos(["src.util"]) == []
+
+def test_parsear_importtime_sin_el_modulo():
+    assert parsear_importtime("", "main").total_us == 0
+
+@pytest.fixture(scope="module")
+def medicion_main():
+    try:
+        return medir_importacion("main")
+    except RuntimeError as e:
+        pytest.fail(str(e))
+
+def test_main_no_importa_modulos_perezosos(medicion_main):
+    assert medicion_main.prohibidos(PROHIBIDOS_DEFECTO) == []
+
+def test_main_cabe_en_el_presupuesto(medicion_main):
+    limite = presupuesto_ms()
+    lentos = ", ".join(f"{nombre} {us / 1000:.1f} ms" for us, nombre in medicion_main.mas_lentos(5))
+    assert medicion_main.total_ms <= limite, f"import main: {medicion_main.total_ms:.1f} ms > {limite:.0f} ms ({lentos})"
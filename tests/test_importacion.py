@@ -0,0 +1,59 @@
+# tests/test_importacion.py
+
+import csv
+
+import pytest
+
+from src.data.repositories.archivo_tabular_repository_impl import ArchivoTabularRepositoryImpl
+from src.data.repositories.cliente_repository_impl import ClienteRepositoryImpl
+from src.domain.usecases.importacion_usecases import IMP_BD, IMP_DNI_REPETIDO, ImportarClientesUseCase, _ImportarUseCase
+
+COLUMNAS = ["Nombre", "Apellido", "DNI", "Licencia", "Email"]
+
+def _csv(path, filas, separador=","):
+    with open(path, "w", newline="", encoding="utf-8-sig") as f:
+        writer = csv.writer(f, delimiter=separador)
+        writer.writerow(COLUMNAS)
+        writer.writerows(filas)
+    return str(path)
+
+def _rechazos(path):
+    with open(path, encoding="utf-8-sig") as f:
+        return [(fila["dni"], fila["codigo"]) for fila in csv.DictReader(f)]
+
+class _ClientesConFalla(ClienteRepositoryImpl):
+    """La BD rechaza cualquier fila con nombre 'Falla'."""
+    def insert_many(self, filas):
+        if any(fila[0] == "Falla" for fila in filas):
+            raise Exception("violación de restricción")
+        return super().insert_many(filas)
+
+@pytest.mark.parametrize("separador", [",", ";", "\t", "|"])
+def test_detecta_separador_del_encabezado(tmp_path, separador):
+    path = _csv(tmp_path / "clientes.csv", [["Ana", "Díaz; Ruiz", "00000001", "Q1", "ana@correo.pe"]], separador)
+    lote, = ArchivoTabularRepositoryImpl().leer_por_lotes(path, 100)
+    assert list(lote.columns) == ["nombre", "apellido", "dni", "licencia", "email"]
+    assert lote.iloc[0].tolist() == ["Ana", "Díaz; Ruiz", "00000001", "Q1", "ana@correo.pe"]
+
+def test_una_sola_columna(tmp_path):
+    path = tmp_path / "placas.csv"
+    path.write_text("placa\nABC-123\n", encoding="utf-8")
+    lote, = ArchivoTabularRepositoryImpl().leer_por_lotes(str(path), 100)
+    assert lote["placa"].tolist() == ["ABC-123"]
+
+def test_clave_rechazada_por_la_bd_no_cuenta_como_vista(tmp_path, datasource):
+    path = _csv(tmp_path / "clientes.csv", [
+        ["Falla", "Uno", "00000001", "Q1", ""],   # Lote 1: la BD la rechaza
+        ["Beto", "Dos", "00000002", "Q2", ""],
+        ["Carla", "Tres", "00000001", "Q3", ""],  # Lote 2: mismo DNI, debe insertarse
+        ["Dora", "Cuatro", "00000002", "Q4", ""], # Lote 2: repetida de una insertada
+    ])
+    repo = _ClientesConFalla(datasource)
+    reporte = ImportarClientesUseCase(repo, ArchivoTabularRepositoryImpl()).execute(path, tamano_lote=2)
+    assert (reporte.leidas, reporte.insertadas, reporte.rechazadas) == (4, 2, 2)
+    assert _rechazos(reporte.archivo_rechazos) == [("00000001", IMP_BD), ("00000002", IMP_DNI_REPETIDO)]
+    assert repo.existing_dnis(["00000001", "00000002"]) == {"00000001", "00000002"}
+
+def test_importar_usecase_es_abstracto():
+    with pytest.raises(TypeError):
+        _ImportarUseCase(ArchivoTabularRepositoryImpl())
@@ -0,0 +1,23 @@
+# tests/test_migraciones.py
+
+from src.data import migrations
+from src.data.datasources.sqlite_datasource import SQLiteDataSource
+from src.data.migrations import m0002_indices_busqueda
+
+def test_migraciones_completas_en_sqlite():
+    datasource = SQLiteDataSource(":memory:")
+    assert migrations.aplicar_migraciones(datasource) == [m.VERSION for m in migrations.MIGRACIONES]
+    assert migrations.aplicar_migraciones(datasource) == []
+    assert datasource.column_exists("Vehiculos", "PlacaBusq")
+
+def test_reintentar_tras_fallo_a_mitad_de_m0002():
+    datasource = SQLiteDataSource(":memory:")
+    # Como si la migración 2 hubiera fallado después de agregar las dos primeras columnas
+    for tabla, columna, sentencia in m0002_indices_busqueda.SQL_SQLITE[:2]:
+        assert datasource.execute_non_query(sentencia)
+    assert migrations.version_actual(datasource) == 0
+
+    assert 2 in migrations.aplicar_migraciones(datasource)
+    for tabla, columna, _ in m0002_indices_busqueda.COLUMNAS:
+        assert datasource.column_exists(tabla, columna)
+    assert migrations.version_actual(datasource) == migrations.MIGRACIONES[-1].VERSION
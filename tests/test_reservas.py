@@ -0,0 +1,42 @@
+# tests/test_reservas.py
+
+from datetime import date
+
+import pytest
+
+from src.data.repositories.reserva_repository_impl import ReservaRepositoryImpl
+from src.data.datasources.errores import DataSourceError
+from src.domain.models.reserva import Reserva
+from src.domain.usecases.reserva_usecases import CargarDisponibilidadUseCase, CrearReservaUseCase
+
+@pytest.fixture
+def reserva_repo(datasource):
+    return ReservaRepositoryImpl(datasource)
+
+def _reserva(inicio, fin, vehiculo_id=1):
+    return Reserva(id=None, cliente_id=1, vehiculo_id=vehiculo_id, fecha_inicio=inicio, fecha_fin=fin)
+
+def test_create_retorna_none_si_se_solapa(reserva_repo):
+    assert reserva_repo.create(_reserva(date(2030, 1, 1), date(2030, 1, 5))) is not None
+    assert reserva_repo.create(_reserva(date(2030, 1, 4), date(2030, 1, 8))) is None
+    assert reserva_repo.create(_reserva(date(2030, 1, 5), date(2030, 1, 8))) is not None  # Contigua
+
+def test_create_lanza_ante_un_error_de_bd(reserva_repo, datasource):
+    datasource.close()  # Conexión perdida
+    with pytest.raises(DataSourceError):
+        reserva_repo.create(_reserva(date(2030, 1, 1), date(2030, 1, 5)))
+
+def test_crear_reserva_distingue_solapamiento_de_error(reserva_repo, datasource):
+    disponibilidad = CargarDisponibilidadUseCase(reserva_repo).execute(date(2029, 1, 1))
+    usecase = CrearReservaUseCase(reserva_repo, disponibilidad)
+    assert usecase.execute(_reserva(date(2030, 2, 1), date(2030, 2, 3))).id is not None
+
+    # Otro mostrador se adelantó: la memoria no lo sabe, la BD sí
+    otro = ReservaRepositoryImpl(datasource)
+    otro.create(_reserva(date(2030, 3, 1), date(2030, 3, 4)))
+    with pytest.raises(ValueError, match="ya no está libre"):
+        usecase.execute(_reserva(date(2030, 3, 2), date(2030, 3, 5)))
+
+    datasource.close()
+    with pytest.raises(DataSourceError):
+        usecase.execute(_reserva(date(2030, 4, 1), date(2030, 4, 3)))
@@ -0,0 +1,132 @@
+# tests/test_sincronizacion.py
+
+import pytest
+
+from src.data.repositories import seguimiento_cambios
+from src.data.repositories.sincronizacion_repository_impl import SincronizacionRepositoryImpl
+from src.data.repositories.seguimiento_cambios import SeguimientoCambios
+from src.domain.models.cambios import RETENCION_ELIMINACIONES_DIAS
+from src.domain.usecases.mantenimiento_usecases import PurgarEliminacionesUseCase
+from src.ui.viewmodels.auto_refresher import AutoRefresher
+
+class DataSourceFalso:
+    """Responde lo mínimo que SeguimientoCambios pide a SQL Server."""
+    dialect = "mssql"
+
+    def __init__(self):
+        self.limite = 100
+        self.consultas = []
+
+    def execute_query(self, query, params=None, cache=True):
+        self.consultas.append(query)
+        if "COL_LENGTH" in query:
+            return [(1,)]
+        if "MIN_ACTIVE_ROWVERSION" in query:
+            return [(self.limite,)]
+        if "FROM Eliminaciones" in query:
+            return [(7,)]
+        return [("fila",)]
+
+@pytest.fixture
+def reloj(monkeypatch):
+    ahora = {"t": 1000.0}
+    monkeypatch.setattr(seguimiento_cambios.time, "monotonic", lambda: ahora["t"])
+    return ahora
+
+def test_leer_cambios_dentro_de_la_retencion(reloj):
+    seguimiento = SeguimientoCambios(DataSourceFalso(), "Vehiculos")
+    seguimiento.iniciar()
+    reloj["t"] += 86400
+    cambios = seguimiento.leer_cambios("SELECT VehiculoID", lambda fila: fila[0])
+    assert cambios.modificados == ["fila"] and cambios.eliminados == [7]
+    assert seguimiento.ultima_version == 99
+
+def test_marca_de_agua_vencida_pide_recarga_completa(reloj):
+    datasource = DataSourceFalso()
+    seguimiento = SeguimientoCambios(datasource, "Vehiculos")
+    seguimiento.iniciar()
+    reloj["t"] += RETENCION_ELIMINACIONES_DIAS * 86400
+    antes = len(datasource.consultas)
+    assert seguimiento.leer_cambios("SELECT VehiculoID", lambda fila: fila[0]) is None
+    assert len(datasource.consultas) == antes  # No consultó lápidas que pudieron purgarse
+
+def test_cada_lectura_renueva_la_vigencia(reloj):
+    seguimiento = SeguimientoCambios(DataSourceFalso(), "Vehiculos")
+    seguimiento.iniciar()
+    for _ in range(RETENCION_ELIMINACIONES_DIAS + 2):
+        reloj["t"] += 86400
+        assert seguimiento.leer_cambios("SELECT VehiculoID", lambda fila: fila[0]) is not None
+
+class RepositorioFalso:
+    def __init__(self):
+        self.llamadas = []
+
+    def purge_tombstones(self, retencion_dias):
+        self.llamadas.append(retencion_dias)
+        return 3
+
+def test_purgar_respeta_la_retencion_minima():
+    repo = RepositorioFalso()
+    usecase = PurgarEliminacionesUseCase(repo)
+    assert usecase.execute() == 3
+    assert usecase.execute(30) == 3
+    with pytest.raises(ValueError):
+        usecase.execute(RETENCION_ELIMINACIONES_DIAS - 1)
+    assert repo.llamadas == [RETENCION_ELIMINACIONES_DIAS, 30]
+
+# --- Tokens de tablas que aún no existen (migración m0003 pendiente) ---
+
+class CatalogoFalso:
+    """SQL Server sin la tabla Reservas: el UNION ALL fallaría si la incluyera."""
+    dialect = "mssql"
+
+    def __init__(self):
+        self.consultas = []
+
+    def execute_query(self, query, params=None, cache=True):
+        self.consultas.append(query)
+        if "sys.tables" in query:
+            return [("TiposVehiculo",), ("EstadosVehiculo",), ("Vehiculos",), ("Clientes",)]
+        if "sys.columns" in query:
+            return []
+        if "Reservas" in query:
+            return None # Invalid object name 'Reservas'
+        return [(query.split("'")[1], 10, 77)]
+
+def test_tokens_omiten_tablas_inexistentes_sql_server():
+    datasource = CatalogoFalso()
+    repo = SincronizacionRepositoryImpl(datasource)
+    assert repo.get_change_tokens(["Vehiculos", "Reservas"]) == {"Vehiculos": (10, 77)}
+    assert "Reservas" not in datasource.consultas[-1]
+
+def test_tokens_omiten_tablas_inexistentes_sqlite(datasource):
+    datasource.execute_non_query("DROP TABLE Reservas")
+    tokens = SincronizacionRepositoryImpl(datasource).get_change_tokens(["Vehiculos", "Reservas"])
+    assert list(tokens) == ["Vehiculos"]
+
+def test_reservas_solo_se_sondean_con_el_calendario():
+    from benchmarks.run import Entorno
+    from src.data.repositories.reserva_repository_impl import ReservaRepositoryImpl
+    from src.domain.usecases.reserva_usecases import CargarDisponibilidadUseCase
+    from src.ui.viewmodels.vehiculo_viewmodel import TABLAS_FLOTA
+    entorno = Entorno(20, 20, 7)
+    try:
+        vm = entorno.viewmodel_vehiculos()
+        vm.cargar_disponibilidad_usecase = CargarDisponibilidadUseCase(ReservaRepositoryImpl(entorno.datasource))
+        vm.cargar_datos_iniciales()
+        assert vm.tablas_observadas() == TABLAS_FLOTA
+        vm.cargar_calendario()
+        assert vm.tablas_observadas() == TABLAS_FLOTA + ["Reservas"]
+    finally:
+        entorno.datasource.close()
+
+def test_tabla_nueva_en_el_sondeo_no_es_un_cambio():
+    cambios = []
+    refresco = AutoRefresher(None, obtener_tokens=dict, on_cambio=cambios.append)
+    refresco._activo = True
+    refresco._programar = lambda: None
+    refresco._on_tokens({"Vehiculos": (1, 1)})
+    refresco._on_tokens({"Vehiculos": (1, 1), "Reservas": (5, 5)})
+    assert cambios == []
+    refresco._on_tokens({"Vehiculos": (1, 2), "Reservas": (5, 5)})
+    assert cambios == [["Vehiculos"]]
@@ -0,0 +1,27 @@
+# tests/test_sqlite_datasource.py
+
+from src.data.datasources.sqlite_datasource import SQLiteDataSource, traducir
+
+def test_traducir_paginacion_invierte_offset_y_limite():
+    query, params = traducir("SELECT * FROM Clientes ORDER BY Apellido OFFSET ? ROWS FETCH NEXT ? ROWS ONLY", ["x", 40, 20])
+    assert query == "SELECT * FROM Clientes ORDER BY Apellido LIMIT ? OFFSET ?"
+    assert params == ("x", 20, 40)
+
+def test_traducir_paginacion_sin_importar_mayusculas_ni_espacios():
+    query, params = traducir("SELECT 1 offset ?  rows\n fetch next ? rows only", (0, 10))
+    assert query == "SELECT 1 LIMIT ? OFFSET ?" and params == (10, 0)
+
+def test_traducir_isnull():
+    query, params = traducir("SELECT ISNULL(Direccion, ''), isnull (Distrito, '') FROM Clientes", None)
+    assert query == "SELECT IFNULL(Direccion, ''), IFNULL(Distrito, '') FROM Clientes"
+    assert params == ()
+
+def test_traducir_no_toca_otras_consultas():
+    assert traducir("SELECT MiISNULLx FROM T WHERE a = ?", [1]) == ("SELECT MiISNULLx FROM T WHERE a = ?", (1,))
+
+def test_paginacion_traducida_contra_sqlite():
+    datasource = SQLiteDataSource(":memory:")
+    datasource.execute_many("INSERT INTO EstadosVehiculo (NombreEstado) VALUES (?)", [(f"E{i}",) for i in range(10)])
+    filas = datasource.execute_query(
+        "SELECT NombreEstado FROM EstadosVehiculo ORDER BY EstadoID OFFSET ? ROWS FETCH NEXT ? ROWS ONLY", (3, 2))
+    assert filas == [("E3",), ("E4",)]
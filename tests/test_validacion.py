@@ -0,0 +1,114 @@
+# tests/test_validacion.py
+#
+# La validación de un registro (ValidarClienteUseCase / ValidarVehiculoUseCase,
+# la del formulario) y la vectorizada (importaciones) deben dar el mismo código
+# de error fila por fila.
+
+import random
+import re
+
+import pandas as pd
+import pytest
+
+from src.domain.services import validacion as v
+from src.domain.usecases.cliente_usecases import ValidarClienteUseCase
+from src.domain.usecases.vehiculo_usecases import ValidarVehiculoUseCase
+
+# Regla de email anterior a services/validacion.py
+RE_EMAIL_ANTERIOR = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+
+EMAILS = [
+    "ana@correo.pe", "a.b+c@sub.dominio.com", "x_y%z@a-b.io", "a@b..co", ".a@b.co", "A@B.CO",
+    "ana@correo", "ana correo@x.pe", "ana@correo.p", "@x.pe", "ana@@x.pe", "ñandu@x.pe",
+    "ana@x.pe1", "ana@x.p-e", "ana@x.pé", "ana@", "",
+]
+
+CLIENTE_VALORES = {
+    "nombre": ["Ana", "", "   ", None, "José María"],
+    "apellido": ["Pérez", "", None],
+    "dni": ["12345678", "1234567", "123456789", "1234567a", " 12345678 ", "", "١٢٣٤٥٦٧٨", "+1234567", "12 45678"],
+    "licencia": ["Q12345678", "", " "],
+    "email": EMAILS + [None, "   "],
+}
+
+VEHICULO_VALORES = {
+    "marca": ["Toyota", "", None],
+    "modelo": ["Yaris", " "],
+    "placa": ["ABC-123", ""],
+    "tipo_nombre": ["Sedán", ""],
+    "estado_nombre": ["Disponible", None],
+    "precio_por_dia": ["100", "99.90", "0", "0.00", "-5", "+5", ".5", "5.", "1e3", "abc", "", "inf", "nan", " 80 "],
+    "anio": ["2020", "1900", "1899", "2050", "2051", "-2020", "+2020", "20.0", "dos mil", "", " 2021 "],
+    "kilometraje": ["", None, "   ", "0", "150000", "-1", "+10", "1.5", "diez", "1e3"],
+}
+
+def _codigo(ok, texto):
+    """(válido, mensaje) del caso de uso -> mensaje comparable con el de la forma vectorizada."""
+    return None if ok else texto
+
+def _comparar(filas, validar_uno, validar_lote):
+    lote = pd.DataFrame(filas, dtype=object)
+    codigos = validar_lote(lote)
+    assert list(codigos.index) == list(lote.index)
+    for fila, codigo in zip(filas, codigos.tolist()):
+        assert _codigo(*validar_uno(fila)) == v.mensaje(codigo), fila
+    return codigos.tolist()
+
+def _aleatorias(valores, cantidad, semilla):
+    """Filas al azar; cada campo conserva su primer valor (válido) 3 de cada 4 veces para llegar a todas las reglas."""
+    rng = random.Random(semilla)
+    return [{campo: opciones[0] if rng.random() < 0.75 else rng.choice(opciones) for campo, opciones in valores.items()}
+            for _ in range(cantidad)]
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_clientes_aleatorios_igual_codigo(semilla):
+    _comparar(_aleatorias(CLIENTE_VALORES, 400, semilla), ValidarClienteUseCase().execute, v.validar_clientes_lote)
+
+@pytest.mark.parametrize("semilla", range(3))
+def test_vehiculos_aleatorios_igual_codigo(semilla):
+    _comparar(_aleatorias(VEHICULO_VALORES, 400, semilla), ValidarVehiculoUseCase().execute, v.validar_vehiculos_lote)
+
+def _cliente(**campos):
+    return {"nombre": "Ana", "apellido": "Pérez", "dni": "12345678", "licencia": "Q1", **campos}
+
+def _vehiculo(**campos):
+    return {"marca": "Kia", "modelo": "Rio", "placa": "ABC-123", "tipo_nombre": "Sedán",
+            "estado_nombre": "Disponible", "precio_por_dia": "100", "anio": "2020", **campos}
+
+def test_casos_borde_de_clientes():
+    casos = [
+        (_cliente(), ""),
+        (_cliente(dni="1234567"), v.CLIENTE_DNI),
+        (_cliente(dni="123456789"), v.CLIENTE_DNI),
+        (_cliente(dni="١٢٣٤٥٦٧٨"), v.CLIENTE_DNI),          # Dígitos no ASCII
+        (_cliente(dni=" 12345678 "), ""),
+        (_cliente(dni="", email="mal"), v.CLIENTE_OBLIGATORIOS),  # El primero que falla gana
+        (_cliente(email=None, telefono=None), ""),           # Opcionales en blanco
+        (_cliente(email="   "), ""),
+    ]
+    filas, esperados = zip(*casos)
+    assert _comparar(list(filas), ValidarClienteUseCase().execute, v.validar_clientes_lote) == list(esperados)
+
+def test_casos_borde_de_vehiculos():
+    casos = [
+        (_vehiculo(), ""),
+        (_vehiculo(anio="1899"), v.VEHICULO_ANIO),
+        (_vehiculo(anio="1900"), ""),
+        (_vehiculo(anio="2050"), ""),
+        (_vehiculo(anio="2051"), v.VEHICULO_ANIO),
+        (_vehiculo(precio_por_dia="0"), v.VEHICULO_PRECIO),
+        (_vehiculo(precio_por_dia="-10.5"), v.VEHICULO_PRECIO),
+        (_vehiculo(precio_por_dia="0.01"), ""),
+        (_vehiculo(kilometraje="-1"), v.VEHICULO_KM),
+        (_vehiculo(kilometraje="0"), ""),
+        (_vehiculo(kilometraje=None), ""),
+        (_vehiculo(kilometraje="  "), ""),
+        (_vehiculo(marca="", anio="1"), v.VEHICULO_OBLIGATORIO["marca"]),
+    ]
+    filas, esperados = zip(*casos)
+    assert _comparar(list(filas), ValidarVehiculoUseCase().execute, v.validar_vehiculos_lote) == list(esperados)
+
+@pytest.mark.parametrize("email", EMAILS)
+def test_email_igual_a_la_regla_anterior(email):
+    esperado = "" if not email or re.match(RE_EMAIL_ANTERIOR, email) else v.CLIENTE_EMAIL
+    assert _comparar([_cliente(email=email)], ValidarClienteUseCase().execute, v.validar_clientes_lote) == [esperado]
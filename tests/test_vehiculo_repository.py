@@ -0,0 +1,125 @@
+# tests/test_vehiculo_repository.py
+
+import pytest
+
+from src.data.repositories.vehiculo_repository_impl import VehiculoRepositoryImpl
+
+def _con_imagen(datasource, ids):
+    for vehiculo_id in ids:
+        datasource.execute_non_query("UPDATE Vehiculos SET ImagenPath = ? WHERE VehiculoID = ?",
+                                     (f"vehiculo_{vehiculo_id}.png", vehiculo_id))
+
+def test_clear_imagen_paths_cuenta_solo_las_filas_cambiadas(datasource, repos_vehiculo):
+    vehiculo_repo, _, _ = repos_vehiculo
+    _con_imagen(datasource, [1, 2, 3])
+    # Entre la auditoría y la limpieza: uno se borró y otro ya no tiene imagen
+    datasource.execute_non_query("DELETE FROM Vehiculos WHERE VehiculoID = 2")
+    datasource.execute_non_query("UPDATE Vehiculos SET ImagenPath = NULL WHERE VehiculoID = 3")
+
+    assert vehiculo_repo.clear_imagen_paths([1, 2, 3, 4]) == 1
+    assert datasource.execute_query("SELECT ImagenPath FROM Vehiculos WHERE VehiculoID = 1", cache=False) == [(None,)]
+
+def test_clear_imagen_paths_por_lotes(datasource, repos_vehiculo):
+    vehiculo_repo, _, _ = repos_vehiculo
+    ids = list(range(1, 51))
+    _con_imagen(datasource, ids)
+    assert vehiculo_repo.clear_imagen_paths(ids + list(range(1000, 3500))) == 50
+
+def _filas(datasource, query, params=None):
+    return datasource.execute_query(query, params, cache=False)
+
+def test_bulk_update_price_filtra_y_redondea(datasource, repos_vehiculo):
+    vehiculo_repo, _, _ = repos_vehiculo
+    antes = dict(_filas(datasource, "SELECT VehiculoID, PrecioPorDia FROM Vehiculos"))
+    esperados = {fila[0] for fila in _filas(datasource, "SELECT VehiculoID FROM Vehiculos WHERE TipoID = 5 AND Anio >= 2015")}
+    assert esperados
+
+    ids = vehiculo_repo.bulk_update_price(1.1, tipo_id=5, anio_desde=2015)
+    assert sorted(ids) == sorted(esperados)
+    for vehiculo_id, precio in _filas(datasource, "SELECT VehiculoID, PrecioPorDia FROM Vehiculos"):
+        assert precio == (round(antes[vehiculo_id] * 1.1, 2) if vehiculo_id in esperados else antes[vehiculo_id])
+    assert vehiculo_repo.bulk_update_price(1.1, marca="  marca inexistente ") == []
+
+def test_bulk_update_estado_solo_desde_el_estado_origen(datasource, repos_vehiculo):
+    vehiculo_repo, _, _ = repos_vehiculo
+    estados = dict(_filas(datasource, "SELECT VehiculoID, EstadoID FROM Vehiculos WHERE VehiculoID <= 6"))
+    # 3 está en mantenimiento: no cambia con estado_origen_id=1; los duplicados y None se ignoran
+    ids = vehiculo_repo.bulk_update_estado([1, 2, 3, 3, None, 999], 2, estado_origen_id=1)
+    assert sorted(ids) == [1, 2] and estados[3] == 3
+    # Los que ya están en el estado destino no cuentan
+    assert sorted(vehiculo_repo.bulk_update_estado([1, 2, 3], 2)) == [3]
+    assert vehiculo_repo.bulk_update_estado([], 2) == []
+    assert _filas(datasource, "SELECT EstadoID FROM Vehiculos WHERE VehiculoID IN (1, 2, 3)") == [(2,), (2,), (2,)]
+
+class DataSourceSQLServerFalso:
+    """Guarda las sentencias de execute_returning (el SQL de SQL Server no corre sobre SQLite)."""
+    dialect = "mssql"
+
+    def __init__(self):
+        self.sentencias = []
+
+    def execute_returning(self, query, params=None):
+        self.sentencias.append(query)
+        return [(1,)]
+
+@pytest.mark.parametrize("operacion", [
+    lambda repo: repo.bulk_update_price(1.05, tipo_id=1),
+    lambda repo: repo.bulk_update_estado([1, 2], 3, estado_origen_id=1),
+])
+def test_output_con_into_en_sql_server(operacion):
+    # Vehiculos tiene triggers (m0001): OUTPUT sin INTO daría el error 334
+    datasource = DataSourceSQLServerFalso()
+    assert operacion(VehiculoRepositoryImpl(datasource, None, None)) == [1]
+    sentencia, = datasource.sentencias
+    assert sentencia.startswith("DECLARE @ids TABLE (VehiculoID INT); UPDATE Vehiculos SET ")
+    assert "OUTPUT inserted.VehiculoID INTO @ids WHERE " in sentencia
+    assert sentencia.endswith("; SELECT VehiculoID FROM @ids")
+
+def test_clear_imagen_paths_usa_output_into_en_sql_server():
+    datasource = DataSourceSQLServerFalso()
+    # Un lote por cada 1000 ids (límite de parámetros de SQL Server); cada lote reporta una fila limpiada
+    assert VehiculoRepositoryImpl(datasource, None, None).clear_imagen_paths(list(range(1, 2501))) == 3
+    assert len(datasource.sentencias) == 3
+    for sentencia in datasource.sentencias:
+        assert "SET ImagenPath = NULL OUTPUT inserted.VehiculoID INTO @ids WHERE VehiculoID IN (" in sentencia
+        assert sentencia.endswith("; SELECT VehiculoID FROM @ids")
+
+def test_save_revertir_y_guardar_de_nuevo(datasource, repos_vehiculo, monkeypatch):
+    vehiculo_repo, tipo_repo, estado_repo = repos_vehiculo
+    tipos = {t.id: t for t in tipo_repo.get_all()}
+    estados = {e.id: e for e in estado_repo.get_all()}
+    vehiculo = vehiculo_repo.get_by_id(1, tipos, estados)
+    original = vehiculo.precio_por_dia
+
+    enviadas = []
+    execute_non_query = datasource.execute_non_query
+    def _registrar(query, params=None):
+        enviadas.append((query, params))
+        return execute_non_query(query, params)
+    monkeypatch.setattr(datasource, "execute_non_query", _registrar)
+
+    vehiculo.precio_por_dia = original + 10
+    assert vehiculo_repo.save(vehiculo)
+    assert enviadas == [("UPDATE Vehiculos SET PrecioPorDia=? WHERE VehiculoID=?", (original + 10, 1))]
+
+    # Volver al valor leído: la BD tiene el nuevo, así que debe enviarse otra vez
+    vehiculo.precio_por_dia = original
+    assert vehiculo_repo.save(vehiculo)
+    assert enviadas[1:] == [("UPDATE Vehiculos SET PrecioPorDia=? WHERE VehiculoID=?", (original, 1))]
+
+    assert vehiculo_repo.save(vehiculo)   # Sin cambios: ningún viaje a la BD
+    assert len(enviadas) == 2
+    assert _filas(datasource, "SELECT PrecioPorDia FROM Vehiculos WHERE VehiculoID = 1") == [(original,)]
+
+def test_lectura_tras_save_refleja_la_bd(datasource, repos_vehiculo):
+    vehiculo_repo, tipo_repo, estado_repo = repos_vehiculo
+    tipos = {t.id: t for t in tipo_repo.get_all()}
+    estados = {e.id: e for e in estado_repo.get_all()}
+    vehiculo = vehiculo_repo.get_by_id(1, tipos, estados)
+    original = vehiculo.precio_por_dia
+    vehiculo.precio_por_dia = original + 10
+    assert vehiculo_repo.save(vehiculo)
+    # Otro mostrador devuelve la fila a lo que se leyó al principio
+    datasource.execute_non_query("UPDATE Vehiculos SET PrecioPorDia = ? WHERE VehiculoID = 1", (original,))
+    assert vehiculo_repo.get_by_id(1, tipos, estados) is vehiculo
+    assert vehiculo.precio_por_dia == original
@@ -0,0 +1,107 @@
+# tests/test_viewmodels.py
+#
+# ViewModels sin Tk: un widget falso ejecuta los after() de run_in_background.
+
+import time
+
+import pytest
+
+from benchmarks.run import Entorno
+from src.domain.models.cambios import Cambios
+
+class WidgetFalso:
+    """Lo mínimo de tk.Misc que usa run_in_background."""
+    def __init__(self):
+        self.pendientes = []
+
+    def winfo_exists(self):
+        return True
+
+    def after(self, ms, funcion):
+        self.pendientes.append(funcion)
+
+    def procesar(self, limite=5.0):
+        """Corre los after() pendientes hasta que no quede ninguno (como mainloop)."""
+        fin = time.monotonic() + limite
+        while self.pendientes:
+            assert time.monotonic() < fin, "La tarea en segundo plano no terminó"
+            self.pendientes.pop(0)()
+            time.sleep(0.001)
+
+@pytest.fixture
+def entorno():
+    entorno = Entorno(40, 20, 7)
+    yield entorno
+    entorno.datasource.close()
+
+def test_clientes_se_completan_en_segundo_plano(entorno):
+    vm = entorno.viewmodel_clientes()
+    primera = vm.obtener_clientes_usecase.execute()[:10]
+    vm.clientes = primera
+    notificaciones = []
+    vm.bind_to_updates(lambda: notificaciones.append(len(vm.clientes)))
+
+    widget = WidgetFalso()
+    vm.completar_en_segundo_plano(widget)
+    assert vm.clientes is primera   # Nada cambia hasta que Tk procesa el resultado
+    widget.procesar()
+    assert notificaciones == [40] and vm.lista_completa
+
+def test_busqueda_durante_la_carga_no_se_pisa(entorno):
+    vm = entorno.viewmodel_clientes()
+    widget = WidgetFalso()
+    vm.completar_en_segundo_plano(widget)
+    vm.buscar_clientes("a")
+    encontrados = vm.clientes
+    widget.procesar()
+    assert vm.clientes is encontrados and vm.termino_busqueda == "a"
+
+# --- Orden de la carga completa y de la sincronización incremental ---
+
+class SincronizacionFalsa:
+    """Entrega los cambios que el test prepara (SQLite no tiene rowversion)."""
+    def __init__(self):
+        self.cambios = Cambios()
+
+    def execute(self, *args):
+        cambios, self.cambios = self.cambios, Cambios()
+        return cambios
+
+def _insertar_cliente(entorno, apellido, dni):
+    return entorno.datasource.execute_insert(
+        "INSERT INTO Clientes (Nombre, Apellido, DNI, Licencia, Telefono, Email, Direccion, Distrito) "
+        "VALUES (?, ?, ?, ?, '', '', '', '')", ("Ana", apellido, dni, f"Q{dni}"))
+
+def test_sincronizar_clientes_conserva_el_orden_de_la_carga(entorno):
+    # Minúsculas y tildes: el ORDER BY binario de SQLite las ordena distinto que casefold()
+    for i, apellido in enumerate(["de la Cruz", "álvarez", "Zapata", "ñuflo"]):
+        _insertar_cliente(entorno, apellido, f"9000000{i}")
+    vm = entorno.viewmodel_clientes()
+    vm.sincronizar_clientes_usecase = sincronizacion = SincronizacionFalsa()
+    vm.cargar_clientes()
+    orden = [c.id for c in vm.clientes]
+
+    sincronizacion.cambios = Cambios(modificados=[vm.clientes[0], vm.clientes[-1]])
+    vm.sincronizar()
+    assert [c.id for c in vm.clientes] == orden
+
+    nuevo = _insertar_cliente(entorno, "del Valle", "90000009")
+    sincronizacion.cambios = Cambios(modificados=[entorno.repo_clientes().get_by_id(nuevo)])
+    vm.sincronizar()
+    sincronizado = [c.id for c in vm.clientes]
+    vm.cargar_clientes()
+    assert sincronizado == [c.id for c in vm.clientes]
+
+def test_sincronizar_vehiculos_conserva_el_orden_de_la_carga(entorno):
+    for i, marca in enumerate(["bmw", "Škoda", "audi"]):
+        entorno.datasource.execute_non_query(
+            "INSERT INTO Vehiculos (Marca, Modelo, Anio, Placa, TipoID, EstadoID, PrecioPorDia) VALUES (?, 'X', 2020, ?, 1, 1, 100)",
+            (marca, f"ZZZ-90{i}"))
+    vm = entorno.viewmodel_vehiculos()
+    vm.sincronizar_vehiculos_usecase = sincronizacion = SincronizacionFalsa()
+    vm.cargar_datos_iniciales()
+    orden = [v.id for v in vm.vehiculos]
+
+    sincronizacion.cambios = Cambios(modificados=[vm.vehiculos[0]], eliminados=[vm.vehiculos[1].id])
+    vm.sincronizar()
+    assert [v.id for v in vm.vehiculos] == orden[:1] + orden[2:]